@@ -5,13 +5,13 @@ import datetime
 import threading
 import os
 import re
-import boto3
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 from ocs_ci.framework import config
 
 
-from ocs_ci.ocs.bucket_utils import delete_all_objects_in_batches
 from ocs_ci.ocs.constants import (
     CLEANUP_YAML,
     TEMPLATE_CLEANUP_DIR,
@@ -28,6 +28,7 @@ from ocs_ci.utility.aws import (
     StackStatusError,
     terminate_rhel_workers,
 )
+from ocs_ci.utility.aws_cleanup import CleanupReport
 
 from ocs_ci.cleanup.aws import defaults
 
@@ -314,34 +315,56 @@ def cluster_cleanup():
         p.join()
 
 
-def delete_buckets(bucket_prefix, hours):
+def delete_buckets(
+    bucket_prefix,
+    hours,
+    max_workers=defaults.MAX_PARALLEL_RESOURCE_DELETIONS,
+    report=None,
+):
     """
-    Delete the S3 buckets with given prefix
+    Delete the S3 buckets with given prefix, with all their objects, object
+    versions and delete markers
 
     Args:
         bucket_prefix (dict): Bucket prefix as key and maximum hours to run/exist as value
         hours (int): hours older than this will be considered to delete
+        max_workers (int): max number of buckets deleted at once
+        report (CleanupReport): report to record the deleted and failed buckets into
+
+    Returns:
+        list: buckets which failed to be deleted
 
     """
     aws = AWS()
     buckets_to_delete = aws.get_buckets_to_delete(bucket_prefix, hours)
     logger.info(f"buckets to delete: {buckets_to_delete}")
-    buckets_deletion_failed = []
-    for bucket_name in buckets_to_delete:
-        try:
-            bucket = boto3.resource("s3").Bucket(bucket_name)
-            try:
-                delete_all_objects_in_batches(
-                    s3_resource=boto3.resource("s3"), bucket_name=bucket_name
-                )
-                bucket.object_versions.all().delete()
-            except Exception as e:
-                logger.error(f"failed to list object in bucket {bucket_name} err:{e}")
-            bucket.delete()
-        except Exception as e:
-            logger.error(e)
-            buckets_deletion_failed.append(bucket_name)
-    return buckets_deletion_failed
+    engine = aws.get_cleanup_engine(max_workers=max_workers, report=report)
+    return engine.delete_buckets(buckets_to_delete)
+
+
+def cleanup_cluster(cluster, upi, failed_deletions, report):
+    """
+    Cleanup the cluster and record the result into the report
+
+    Args:
+        cluster (str): Cluster id (cluster name with the random suffix)
+        upi (bool): True for UPI cluster, False otherwise
+        failed_deletions (list): list of clusters we failed to delete
+        report (CleanupReport): report of the cleanup
+
+    """
+    cluster_name = cluster.rsplit("-", 1)[0]
+    logger.info(f"Deleting {'UPI ' if upi else ''}cluster {cluster_name}")
+    start = time.monotonic()
+    try:
+        cleanup(cluster_name, cluster, upi, failed_deletions)
+    except Exception as e:
+        logger.error(f"Failed to cleanup cluster {cluster}: {e}")
+        if cluster_name not in failed_deletions:
+            failed_deletions.append(cluster_name)
+        report.add("cluster", cluster, "failed", time.monotonic() - start, str(e))
+        return
+    report.add("cluster", cluster, "deleted", time.monotonic() - start)
 
 
 def aws_cleanup():
@@ -400,6 +423,21 @@ def aws_cleanup():
         required=False,
         help="The name of the cluster to delete from AWS",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        action="store",
+        required=False,
+        default=defaults.MAX_PARALLEL_CLUSTER_CLEANUPS,
+        help="Max number of clusters destroyed at once",
+    )
+    parser.add_argument(
+        "--report",
+        action="store",
+        required=False,
+        default=defaults.CLEANUP_REPORT_FILE,
+        help="Path of the JSON report of the deleted and failed resources",
+    )
     bucket_group = parser.add_argument_group("S3 Bucket Sweeping Options")
     bucket_group.add_argument(
         "--sweep-buckets", action="store_true", help="Deleting S3 buckets."
@@ -412,9 +450,11 @@ def aws_cleanup():
             if args.hours is not None
             else defaults.DEFAULT_BUCKET_RUNNING_TIME
         )
+        report = CleanupReport()
         buckets_deletion_failed = delete_buckets(
-            defaults.BUCKET_PREFIXES_SPECIAL_RULES, bucket_hours
+            defaults.BUCKET_PREFIXES_SPECIAL_RULES, bucket_hours, report=report
         )
+        report.write(args.report)
         assert (
             len(buckets_deletion_failed) == 0
         ), f"No all buckets deleted\n buckets_deletion_failed={buckets_deletion_failed}"
@@ -452,28 +492,18 @@ def aws_cleanup():
     else:
         logger.info("Deleting clusters: %s", clusters_to_delete)
         get_openshift_installer()
-    procs = []
     failed_deletions = []
-    for cluster in clusters_to_delete:
-        cluster_name = cluster.rsplit("-", 1)[0]
-        logger.info(f"Deleting cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, False, failed_deletions)
-        )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
-    for cluster in cf_clusters_to_delete:
-        cluster_name = cluster.rsplit("-", 1)[0]
-        logger.info(f"Deleting UPI cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, True, failed_deletions)
-        )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
+    report = CleanupReport()
+    # IPI clusters are destroyed before UPI clusters, as before
+    for clusters, upi in ((clusters_to_delete, False), (cf_clusters_to_delete, True)):
+        if not clusters:
+            continue
+        with ThreadPoolExecutor(
+            max_workers=min(args.max_workers, len(clusters))
+        ) as executor:
+            for cluster in clusters:
+                executor.submit(cleanup_cluster, cluster, upi, failed_deletions, report)
+    report.write(args.report)
     logger.info("Remaining clusters: %s", remaining_clusters)
     filename = "failed_cluster_deletions.txt"
     content = "None\n"
@@ -18,6 +18,11 @@ CLUSTER_PREFIXES_SPECIAL_RULES = {
     "lr5": 120,
 }
 MINIMUM_CLUSTER_RUNNING_TIME = 10
+# max number of clusters destroyed at once
+MAX_PARALLEL_CLUSTER_CLEANUPS = 5
+# max number of buckets or stacks deleted at once
+MAX_PARALLEL_RESOURCE_DELETIONS = 8
+CLEANUP_REPORT_FILE = "aws_cleanup_report.json"
 CONFIRMATION_ANSWER = "yes-i-am-sure-i-want-to-proceed"
 
 BUCKET_PREFIXES_SPECIAL_RULES = {
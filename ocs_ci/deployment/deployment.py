@@ -165,6 +165,7 @@ from ocs_ci.utility.deployment import (
     get_and_apply_idms_from_catalog,
     workaround_mark_disks_as_ssd,
 )
+from ocs_ci.utility.cluster_facts import invalidate_cluster_facts
 from ocs_ci.utility.flexy import load_cluster_info
 from ocs_ci.utility.networking import (
     annotate_worker_nodes_with_mon_ip,
@@ -964,6 +965,7 @@ class Deployment(object):
             log_cli_level (str): log level for installer (default: DEBUG)
         """
         self.do_deploy_ocp(log_cli_level)
+        invalidate_cluster_facts("OCP deployment")
 
         if config.ENV_DATA.get("workaround_mark_disks_as_ssd"):
             workaround_mark_disks_as_ssd()
@@ -1047,6 +1049,7 @@ class Deployment(object):
         if config.DEPLOYMENT.get("unique_rack_node_labels"):
             create_unique_rack_labels()
         self.do_deploy_ocs()
+        invalidate_cluster_facts("ODF deployment")
         self.do_deploy_rdr()
         self.do_deploy_mce()
         self.do_deploy_cnv()
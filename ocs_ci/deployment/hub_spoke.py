@@ -88,6 +88,7 @@ from ocs_ci.utility.utils import (
     get_registry_svc,
 )
 from ocs_ci.utility.aws import AWS, get_unused_vpc_cidr, get_cluster_region
+from ocs_ci.utility.cluster_facts import invalidate_cluster_facts
 from botocore.exceptions import ClientError
 from ocs_ci.ocs.resources.storage_client import StorageClient
 from ocs_ci.utility.ssl_certs import (
@@ -2501,6 +2502,9 @@ class HypershiftHostedOCP(
                         and nodepool_status.lower() != "true"
                     ):
                         logger.info(f"Hosted cluster '{self.name}' upgrade completed")
+                        invalidate_cluster_facts(
+                            reason=f"hosted cluster {self.name} upgraded"
+                        )
                         return True
 
         except TimeoutExpiredError:
@@ -0,0 +1,529 @@
+"""
+Asynchronous logging pipeline.
+
+Log files are written by a dedicated writer thread, so disk I/O and
+compression don't block the tests, and background threads (health tracker,
+monitors, background operations) don't contend for the locks of the file
+handlers:
+
+ * AsyncFileHandler only puts a copy of the record with the rendered message
+   into the queue of the LogWriter, the writer thread formats the record and
+   writes it into the (optionally gzip or zstd compressed) file
+ * per-test log files created by pytest-logger are switched to
+   AsyncFileHandler when the test starts (see attach_test_handlers)
+ * command outputs larger than the configured size are saved into side files
+   in the log directory and only their beginning is logged together with the
+   path of the side file (see capture_output)
+
+When the queue is full, records below WARNING are dropped, more severe records
+wait for the writer. Numbers of written and dropped records and the max
+backlog of the queue are logged when the pipeline stops.
+"""
+
+import copy
+import gzip
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+import traceback
+
+from ocs_ci.framework import config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+log = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+OUTPUTS_DIR = "command_outputs"
+DEFAULT_QUEUE_SIZE = 100000
+# seconds between flushes of the written files
+FLUSH_INTERVAL = 1
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def open_log_file(path, mode="a", compression=None):
+    """
+    Open the log file for writing of encoded lines
+
+    Args:
+        path (str): Path of the file including the compression suffix
+        mode (str): 'a' or 'w'
+        compression (str): None, 'gzip' or 'zstd'
+
+    Returns:
+        file: Binary file object
+
+    """
+    if compression == "gzip":
+        return gzip.open(path, f"{mode}b")
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().stream_writer(open(path, f"{mode}b"))
+    return open(path, f"{mode}b")
+
+
+class LogWriter(object):
+    """
+    Writer thread serving the queue of the asynchronous log handlers and side
+    files of command outputs
+    """
+
+    def __init__(
+        self,
+        max_queue_size=DEFAULT_QUEUE_SIZE,
+        compression=None,
+        output_dir=None,
+        output_max_size=None,
+    ):
+        """
+        Args:
+            max_queue_size (int): Max number of queued records
+            compression (str): Compression of the log files and side files,
+                None, 'gzip' or 'zstd'
+            output_dir (str): Directory of the side files of command outputs
+            output_max_size (int): Max number of characters of the command
+                output written into the log, larger outputs are saved into
+                side files, no limit if None
+
+        """
+        if compression == "zstd" and zstandard is None:
+            log.warning("zstandard module is not installed, using gzip compression")
+            compression = "gzip"
+        self.compression = compression
+        self.output_dir = output_dir
+        self.output_max_size = output_max_size
+        self.queue = queue.Queue(max_queue_size)
+        self.written = 0
+        self.dropped = 0
+        self.max_backlog = 0
+        self.side_files = 0
+        self._output_counter = itertools.count(1)
+        # handlers with data written since the last flush
+        self._dirty = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self):
+        return self._thread.is_alive()
+
+    def submit(self, func, *args, block=True):
+        """
+        Queue the task for the writer thread, the task is run directly if the
+        writer already stopped
+
+        Args:
+            func (callable): Function run by the writer thread
+            args: Arguments of the function
+            block (bool): Wait for a free slot if the queue is full, otherwise
+                the task is dropped
+
+        Returns:
+            bool: False if the task was dropped
+
+        """
+        if not self.alive:
+            func(*args)
+            return True
+        try:
+            self.queue.put((func, args), block=block)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        backlog = self.queue.qsize()
+        if backlog > self.max_backlog:
+            self.max_backlog = backlog
+        return True
+
+    def mark_dirty(self, handler):
+        """
+        Args:
+            handler (AsyncFileHandler): Handler with data to be flushed
+
+        """
+        self._dirty.add(handler)
+        self.written += 1
+
+    def forget(self, handler):
+        """
+        Args:
+            handler (AsyncFileHandler): Closed handler
+
+        """
+        self._dirty.discard(handler)
+
+    def _flush_streams(self):
+        for handler in list(self._dirty):
+            handler.flush_stream()
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+
+    def _run(self):
+        while True:
+            try:
+                task = self.queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                self._flush_streams()
+                continue
+            if task is None:
+                self._flush_streams()
+                return
+            func, args = task
+            try:
+                func(*args)
+            except Exception:
+                # logging from the writer thread could block on the full queue
+                traceback.print_exc()
+            if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+                self._flush_streams()
+
+    def flush(self, timeout=60):
+        """
+        Wait until the queued records are written and flushed
+
+        Args:
+            timeout (float): Max seconds to wait
+
+        Returns:
+            bool: True if all queued records were written
+
+        """
+        done = threading.Event()
+
+        def flushed():
+            self._flush_streams()
+            done.set()
+
+        self.submit(flushed)
+        return done.wait(timeout)
+
+    def stop(self, timeout=60):
+        """
+        Write all queued records and stop the writer thread
+
+        Args:
+            timeout (float): Max seconds to wait for the writer
+
+        """
+        if self.alive:
+            self.queue.put(None)
+            self._thread.join(timeout)
+
+    def save_output(self, output, name="stdout"):
+        """
+        Save the command output into a side file
+
+        Args:
+            output (str): Output of the command
+            name (str): Name of the output used in the file name
+
+        Returns:
+            str: Path of the side file
+
+        """
+        path = os.path.join(
+            self.output_dir,
+            f"{next(self._output_counter):06d}-{name}.txt"
+            f"{COMPRESSION_SUFFIXES[self.compression]}",
+        )
+        self.submit(self._write_file, path, output)
+        return path
+
+    def _write_file(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open_log_file(path, "w", self.compression) as fd:
+            fd.write(data.encode("utf-8", "backslashreplace"))
+        with self._lock:
+            self.side_files += 1
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Numbers of written, dropped and currently queued records,
+                max backlog of the queue and number of side files
+
+        """
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "backlog": self.queue.qsize(),
+            "max_backlog": self.max_backlog,
+            "side_files": self.side_files,
+        }
+
+
+class AsyncFileHandler(logging.FileHandler):
+    """
+    File handler whose file is written by the LogWriter thread
+    """
+
+    def __init__(self, filename, writer, mode="a"):
+        """
+        Args:
+            filename (str): Path of the log file, suffix of the compression
+                is added
+            writer (LogWriter): Writer of the file
+            mode (str): 'a' or 'w'
+
+        """
+        self.writer = writer
+        self.compression = writer.compression
+        suffix = COMPRESSION_SUFFIXES[self.compression]
+        if not filename.endswith(suffix):
+            filename = f"{filename}{suffix}"
+        super().__init__(filename, mode=mode, delay=True)
+
+    def _open(self):
+        return open_log_file(self.baseFilename, self.mode, self.compression)
+
+    def prepare(self, record):
+        """
+        Copy the record with the message and traceback rendered, so the
+        record doesn't refer to mutable arguments and frames of the caller
+
+        Args:
+            record (logging.LogRecord): Record
+
+        Returns:
+            logging.LogRecord: Prepared copy
+
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        try:
+            self.writer.submit(
+                self.write_record,
+                self.prepare(record),
+                block=record.levelno >= logging.WARNING,
+            )
+        except Exception:
+            self.handleError(record)
+
+    def write_record(self, record):
+        """
+        Format and write the record, called by the writer thread
+
+        Args:
+            record (logging.LogRecord): Prepared record
+
+        """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            line = f"{self.format(record)}{self.terminator}"
+            self.stream.write(line.encode("utf-8", "backslashreplace"))
+            self.writer.mark_dirty(self)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        # the writer thread flushes the file periodically
+        pass
+
+    def flush_stream(self):
+        """
+        Flush the file, called by the writer thread
+        """
+        if self.stream is not None:
+            self.stream.flush()
+
+    def _close_stream(self):
+        self.writer.forget(self)
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            stream.close()
+
+    def close(self):
+        logging.Handler.close(self)
+        self.writer.submit(self._close_stream)
+
+
+def get_log_writer():
+    """
+    Returns:
+        LogWriter: Writer of the running pipeline, None if not started
+
+    """
+    return _writer
+
+
+def start_log_pipeline(
+    max_queue_size=DEFAULT_QUEUE_SIZE,
+    compression=None,
+    output_dir=None,
+    output_max_size=None,
+):
+    """
+    Start the writer thread, the existing file handlers of the root logger
+    are switched to AsyncFileHandler. No-op if the pipeline already runs.
+
+    Args:
+        max_queue_size (int): Max number of queued records
+        compression (str): None, 'gzip' or 'zstd'
+        output_dir (str): Directory of the side files of command outputs
+        output_max_size (int): Max number of characters of the logged
+            command output
+
+    Returns:
+        LogWriter: The writer
+
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = LogWriter(
+                max_queue_size, compression, output_dir, output_max_size
+            )
+            root = logging.getLogger()
+            for handler in list(root.handlers):
+                replace_file_handler(handler, root)
+    return _writer
+
+
+def start_configured_log_pipeline(log_dir):
+    """
+    Start the pipeline if enabled by RUN['async_logging']
+
+    Args:
+        log_dir (str): Log directory of the run, side files of command
+            outputs are saved into its OUTPUTS_DIR subdirectory
+
+    Returns:
+        LogWriter: The writer, None if not enabled
+
+    """
+    if not config.RUN.get("async_logging"):
+        return None
+    return start_log_pipeline(
+        max_queue_size=config.RUN.get("log_queue_size") or DEFAULT_QUEUE_SIZE,
+        compression=config.RUN.get("log_compression"),
+        output_dir=os.path.join(log_dir, OUTPUTS_DIR),
+        output_max_size=config.RUN.get("log_output_max_size"),
+    )
+
+
+def stop_log_pipeline(timeout=60):
+    """
+    Write all queued records and stop the writer thread
+
+    Args:
+        timeout (float): Max seconds to wait for the writer
+
+    Returns:
+        dict: Final statistics of the writer, None if it wasn't running
+
+    """
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
+        return None
+    stats = writer.get_stats()
+    message = (
+        f"Log pipeline: {stats['written']} records written, {stats['dropped']} "
+        f"dropped, max backlog {stats['max_backlog']}, {stats['side_files']} "
+        f"command outputs saved"
+    )
+    if stats["dropped"]:
+        log.warning(message)
+    else:
+        log.info(message)
+    writer.stop(timeout)
+    return writer.get_stats()
+
+
+def replace_file_handler(handler, logger=None):
+    """
+    Replace the file handler by AsyncFileHandler appending to the same file
+    (records logged before the replacement are kept)
+
+    Args:
+        handler (logging.Handler): Handler to replace, other than file
+            handlers are returned unchanged
+        logger (logging.Logger): Logger of the handler, 'logger' attribute of
+            the handler (set by pytest-logger) is used if not specified
+
+    Returns:
+        logging.Handler: The new handler
+
+    """
+    writer = _writer
+    if writer is None or type(handler) is not logging.FileHandler:
+        return handler
+    logger = logger or getattr(handler, "logger", None)
+    new_handler = AsyncFileHandler(handler.baseFilename, writer)
+    new_handler.setFormatter(handler.formatter)
+    new_handler.setLevel(handler.level)
+    for log_filter in handler.filters:
+        new_handler.addFilter(log_filter)
+    if logger is not None:
+        new_handler.logger = logger
+        logger.addHandler(new_handler)
+        logger.removeHandler(handler)
+    handler.close()
+    return new_handler
+
+
+def attach_test_handlers(item):
+    """
+    Switch per-test log files of pytest-logger to the pipeline, no-op if the
+    pipeline doesn't run or the handlers were already switched
+
+    Args:
+        item (pytest.Item): Test item
+
+    """
+    state = getattr(item, "_logger", None)
+    if _writer is None or state is None or getattr(state, "async_logging", False):
+        return
+    state.handlers[:] = [replace_file_handler(handler) for handler in state.handlers]
+    state.async_logging = True
+
+
+def capture_output(output, full_output=None, name="stdout"):
+    """
+    Bound the size of the command output written into the log, larger output
+    is saved into a side file by the writer thread
+
+    Args:
+        output (str): Output to be logged
+        full_output (str): Output saved into the side file, output is used if
+            not specified
+        name (str): Name of the output used in the side file name
+
+    Returns:
+        str: Output to be logged
+
+    """
+    writer = _writer
+    if (
+        writer is None
+        or not writer.output_max_size
+        or not writer.output_dir
+        or len(output) <= writer.output_max_size
+    ):
+        return output
+    path = writer.save_output(full_output or output, name)
+    return (
+        f"{output[:writer.output_max_size]}\n... [{len(output)} characters, "
+        f"full output saved to {path}]"
+    )
@@ -18,6 +18,10 @@ from junitparser import JUnitXml
 import ocs_ci.utility.memory
 from ocs_ci.framework import config as ocsci_config
 from ocs_ci.framework.logger_factory import set_log_record_factory
+from ocs_ci.framework.log_pipeline import (
+    start_configured_log_pipeline,
+    stop_log_pipeline,
+)
 from ocs_ci.framework.exceptions import (
     ClusterNameLengthError,
     ClusterNameNotProvidedError,
@@ -46,6 +50,7 @@ from ocs_ci.utility.utils import (
     get_ocs_build_number,
     get_testrun_name,
     load_config_file,
+    ocsci_log_path,
     create_stats_dir,
     create_kubeconfig,
 )
@@ -60,6 +65,8 @@ from ocs_ci.utility.memory import (
     stop_monitor_memory,
     get_peak_sum_mem,
 )
+from ocs_ci.utility.exec_transport import set_transport, start_configured_transport
+from ocs_ci.utility.result_store import get_result_store
 from ocs_ci.ocs import constants
 from psutil._common import bytes2human
 
@@ -402,6 +409,45 @@ def pytest_addoption(parser):
         dest="kubeconfig",
         help=("Kubeconfig location which will be loaded as environmental variable"),
     )
+    parser.addoption(
+        "--record-exec",
+        dest="record_exec",
+        help=(
+            "Record all executed commands and their results into the given "
+            "archive (.jsonl.gz), see ocs_ci/utility/exec_transport.py"
+        ),
+    )
+    parser.addoption(
+        "--replay-exec",
+        dest="replay_exec",
+        help=(
+            "Serve results of the commands from the archive created by "
+            "--record-exec instead of executing them"
+        ),
+    )
+    parser.addoption(
+        "--replay-exec-latency",
+        dest="replay_exec_latency",
+        action="store_true",
+        default=False,
+        help="Keep the recorded latencies of the commands during replay",
+    )
+    parser.addoption(
+        "--async-logging",
+        dest="async_logging",
+        action="store_true",
+        default=False,
+        help=(
+            "Write the log files by a background writer thread, see "
+            "ocs_ci/framework/log_pipeline.py"
+        ),
+    )
+    parser.addoption(
+        "--log-compression",
+        dest="log_compression",
+        choices=["gzip", "zstd"],
+        help="Compress the log files written with --async-logging",
+    )
     parser.addoption(
         "--skip-rpm-go-version-collection",
         dest="skip_rpm_go_version_collection",
@@ -440,6 +486,8 @@ def pytest_configure(config):
 
         if not (config.getoption("--help") or config.getoption("collectonly")):
             process_cluster_cli_params(config)
+            start_configured_transport()
+            start_configured_log_pipeline(ocsci_log_path())
             auto_configure_acm()
             auto_configure_submariner()
             config_file = os.path.expanduser(
@@ -565,6 +613,19 @@ def gather_version_info_for_report(config):
             )
 
 
+def pytest_unconfigure(config):
+    """
+    Close the record/replay transport of the executed commands and write the
+    remaining records of the asynchronous logging pipeline
+
+    Args:
+        config (pytest.config): Pytest config object
+
+    """
+    set_transport(None)
+    stop_log_pipeline()
+
+
 def get_cli_param(config, name_of_param, default=None):
     """
     This is helper function which store cli parameter in RUN section in
@@ -719,6 +780,19 @@ def process_cluster_cli_params(config):
     log_utilization = get_cli_param(config, "log_cluster_utilization")
     if log_utilization:
         ocsci_config.RUN["log_utilization"] = True
+    record_exec = get_cli_param(config, "record_exec")
+    if record_exec:
+        ocsci_config.RUN["exec_record_file"] = os.path.expanduser(record_exec)
+    replay_exec = get_cli_param(config, "replay_exec")
+    if replay_exec:
+        ocsci_config.RUN["exec_replay_file"] = os.path.expanduser(replay_exec)
+    if get_cli_param(config, "replay_exec_latency"):
+        ocsci_config.RUN["exec_replay_latency"] = True
+    if get_cli_param(config, "async_logging"):
+        ocsci_config.RUN["async_logging"] = True
+    log_compression = get_cli_param(config, "log_compression")
+    if log_compression:
+        ocsci_config.RUN["log_compression"] = log_compression
     upgrade_ocs_version = get_cli_param(config, "upgrade_ocs_version")
     if upgrade_ocs_version:
         ocsci_config.UPGRADE["upgrade_ocs_version"] = upgrade_ocs_version
@@ -1288,6 +1362,12 @@ def pytest_runtest_teardown(item):
             columns=report_columns,
         )
         df_report_line.reset_index(drop=True, inplace=True)
+        get_result_store().record_memory(
+            item.nodeid,
+            df_ram_max[constants.RAM].values[0],
+            df_virt_max[constants.VIRT].values[0],
+            leaked_ram,
+        )
         ocsci_config.RUN["memory"] = pd.concat(
             [
                 ocsci_config.RUN["memory"],
@@ -8,7 +8,19 @@ from ocs_ci.utility.utils import (
     save_reports,
     ocsci_log_path,
 )
+from ocs_ci.utility.call_stats import (
+    CALL_STATS_FILE,
+    get_call_stats,
+    reset_call_stats,
+)
+from ocs_ci.utility.result_store import (
+    RESULTS_FILE,
+    get_result_store,
+    reset_result_store,
+)
 from ocs_ci.framework import config as ocsci_config
+from ocs_ci.framework.log_pipeline import attach_test_handlers
+from ocs_ci.ocs.s3_operations import get_s3_stats
 from ocs_ci.framework import GlobalVariables as GV
 
 
@@ -46,6 +58,93 @@ def pytest_html_results_table_row(report, cells):
                 )
 
 
+@pytest.mark.optionalhook
+def pytest_html_results_summary(prefix, summary, postfix):
+    """
+    Add tests spending the most time in external calls to the summary
+    """
+    if not get_call_stats().enabled:
+        return
+    report = get_call_stats().get_report(top=10)
+    if not report["tests"]:
+        return
+    rows = [
+        html.tr(
+            html.td(test["nodeid"]),
+            html.td(f"{test['total']:.1f}"),
+            html.td(
+                ", ".join(
+                    f"{family['family']} ({family['count']}x, {family['total']:.1f}s)"
+                    for family in test["families"][:3]
+                )
+            ),
+            html.td(
+                ", ".join(
+                    f"{caller['caller']} ({caller['total']:.1f}s)"
+                    for caller in test["callers"][:3]
+                )
+            ),
+        )
+        for test in report["tests"]
+    ]
+    postfix.extend(
+        [
+            html.h2("Time spent in external calls"),
+            html.p(f"Full report: {CALL_STATS_FILE} in the log directory"),
+            html.table(
+                html.tr(
+                    html.th("Test"),
+                    html.th("Seconds"),
+                    html.th("Top command families"),
+                    html.th("Top callers"),
+                ),
+                *rows,
+            ),
+        ]
+    )
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Attribute external calls to the setup of the test
+    """
+    get_call_stats().set_context(item.nodeid, "setup")
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_call(item):
+    """
+    Attribute external calls to the test call
+    """
+    get_call_stats().set_context(item.nodeid, "call")
+    attach_test_handlers(item)
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    Switch per-test log files to the asynchronous logging pipeline before the
+    first fixture of the test is set up
+    """
+    item = getattr(request, "_pyfuncitem", None)
+    if item is not None:
+        attach_test_handlers(item)
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    """
+    Attribute external calls to the teardown of the test
+    """
+    get_call_stats().set_context(item.nodeid, "teardown")
+    yield
+    get_call_stats().set_context()
+
+
 @pytest.mark.hookwrapper
 def pytest_runtest_makereport(item, call):
     """
@@ -55,6 +154,7 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     report.description = str(item.function.__doc__)
+    get_result_store().record_report(report, item)
     extra = getattr(report, "extra", [])
 
     if report.when == "call":
@@ -74,9 +174,18 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_sessionstart(session):
     """
-    Prepare results dict
+    Prepare results dict and the results store
     """
     session.results = dict()
+    results_file = None
+    try:
+        log_path = ocsci_log_path()
+        os.makedirs(log_path, exist_ok=True)
+        results_file = os.path.join(log_path, RESULTS_FILE)
+    except Exception:
+        log.exception("Failed to prepare results file, results are kept in memory")
+    reset_result_store(results_file)
+    reset_call_stats(enabled=ocsci_config.RUN.get("call_stats", True))
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -90,6 +199,14 @@ def pytest_sessionfinish(session, exitstatus):
     if ocsci_config.RUN["cli_params"].get("email"):
         email_reports(session)
 
+    if get_call_stats().enabled:
+        try:
+            get_call_stats().save(os.path.join(ocsci_log_path(), CALL_STATS_FILE))
+        except Exception as e:
+            log.warning(f"Failed to save report of external calls. {e}")
+    for endpoint, s3_stats in get_s3_stats().items():
+        log.info(f"S3 operations on {endpoint}: {s3_stats}")
+
     # creating report of test cases with total time in ascending order
     data = GV.TIMEREPORT_DICT
     sorted_data = dict(
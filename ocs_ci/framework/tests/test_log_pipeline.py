@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import logging
+import threading
+
+import pytest
+
+from ocs_ci.framework import log_pipeline
+
+
+@pytest.fixture
+def test_logger():
+    logger = logging.getLogger("test_log_pipeline")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    log_pipeline.stop_log_pipeline()
+
+
+def test_file_handler_replaced_by_compressed_async_handler(test_logger, tmp_path):
+    log_file = str(tmp_path / "logs")
+    handler = logging.FileHandler(log_file, mode="w", delay=True)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    test_logger.addHandler(handler)
+    test_logger.info("before %s", "pipeline")
+
+    writer = log_pipeline.start_log_pipeline(
+        compression="gzip", output_dir=str(tmp_path / "outputs"), output_max_size=10
+    )
+    new_handler = log_pipeline.replace_file_handler(handler, test_logger)
+    assert test_logger.handlers == [new_handler]
+    assert new_handler.baseFilename == f"{log_file}.gz"
+    arg = ["mutable"]
+    test_logger.debug("list %s", arg)
+    arg.append("changed")
+    try:
+        raise ValueError("failure")
+    except ValueError:
+        test_logger.exception("error")
+    logged = log_pipeline.capture_output("0123456789abcdef")
+    assert logged.startswith("0123456789\n... [16 characters")
+    assert writer.flush()
+    new_handler.close()
+    stats = log_pipeline.stop_log_pipeline()
+    assert stats["written"] >= 2
+    assert (stats["dropped"], stats["side_files"]) == (0, 1)
+
+    with open(log_file) as fd:
+        assert fd.read() == "INFO before pipeline\n"
+    with gzip.open(f"{log_file}.gz", "rt") as fd:
+        content = fd.read()
+    assert content.startswith("DEBUG list ['mutable']\nERROR error\nTraceback")
+    assert "ValueError: failure" in content
+    with gzip.open(str(tmp_path / "outputs" / "000001-stdout.txt.gz"), "rt") as fd:
+        assert fd.read() == "0123456789abcdef"
+
+
+def test_records_dropped_when_queue_full(test_logger, tmp_path):
+    writer = log_pipeline.start_log_pipeline(max_queue_size=1)
+    handler = log_pipeline.AsyncFileHandler(str(tmp_path / "logs"), writer)
+    test_logger.addHandler(handler)
+    blocked = threading.Event()
+    writer.submit(blocked.wait)
+    # wait for the writer thread to take the blocking task
+    while not writer.queue.empty():
+        pass
+    test_logger.debug("queued")
+    test_logger.debug("dropped")
+    threading.Timer(0.2, blocked.set).start()
+    # warnings wait for the writer instead of being dropped
+    test_logger.warning("warning")
+    assert writer.flush()
+    assert writer.get_stats()["dropped"] == 1
+    assert writer.max_backlog == 1
+    with open(tmp_path / "logs") as fd:
+        assert fd.read() == "queued\nwarning\n"
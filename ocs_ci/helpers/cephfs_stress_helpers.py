@@ -12,6 +12,8 @@ import json
 from pathlib import Path
 import gc
 import logging
+import shutil
+import tempfile
 import threading
 
 from prettytable import PrettyTable
@@ -23,6 +25,7 @@ from ocs_ci.ocs.constants import (
     STATUS_RUNNING,
 )
 from ocs_ci.utility import templating
+from ocs_ci.utility.pod_collector import collect_pod_directory
 from ocs_ci.utility.utils import ocsci_log_path
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.resources.ocs import OCS
@@ -51,6 +54,7 @@ from ocs_ci.ocs.cluster import (
     get_percent_used_capacity,
 )
 from ocs_ci.ocs.node import (
+    get_node_inventory,
     get_node_resource_utilization_from_adm_top,
     get_node_resource_utilization_from_oc_describe,
 )
@@ -1000,12 +1004,13 @@ def get_nodes_resource_utilization():
         "\n=================================================="
         "\n"
     )
+    inventory = get_node_inventory()
     for node_type in [constants.MASTER_MACHINE, constants.WORKER_MACHINE]:
         get_node_resource_utilization_from_adm_top(
             node_type=node_type, print_table=True
         )
         get_node_resource_utilization_from_oc_describe(
-            node_type=node_type, print_table=True
+            node_type=node_type, print_table=True, inventory=inventory
         )
 
 
@@ -1208,83 +1213,24 @@ def collect_stress_job_output_directory(standby_pod_obj, dir_name=None):
 
             output_dir = os.environ.get("OUTPUT_DIR", "/mnt/output")
 
-            check_cmd = f"test -d {output_dir} && echo 'EXISTS' || echo 'NOT_EXISTS'"
-            result = pod_obj.exec_sh_cmd_on_pod(command=check_cmd, timeout=30)
-
-            if "NOT_EXISTS" in result:
+            result = collect_pod_directory(pod_obj, output_dir, destination_dir)
+            if result["found"] is None:
                 logger.warning(
                     f"Output directory {output_dir} not found in pod {pod_obj.name}"
                 )
                 return
-
-            # First, count total files
-            logger.info(f"Counting files in {output_dir}")
-            count_cmd = f"find {output_dir} -type f 2>/dev/null | wc -l"
-            file_count_result = pod_obj.exec_sh_cmd_on_pod(
-                command=count_cmd, timeout=120
-            )
-            total_files = (
-                int(file_count_result.strip())
-                if file_count_result.strip().isdigit()
-                else 0
-            )
-            logger.info(f"Total files found: {total_files}")
-
-            logger.info(f"Collecting directory structure from {output_dir}")
-            tree_cmd = f"find {output_dir} -type f 2>/dev/null"
-            file_list = pod_obj.exec_sh_cmd_on_pod(command=tree_cmd, timeout=300)
-
-            if file_list and file_list.strip():
-                files = file_list.strip().split("\n")
-                actual_files = len(files)
-                logger.info(f"Collecting {actual_files} files from shared mount")
-
-                if actual_files != total_files:
-                    logger.warning(
-                        f"File count mismatch: expected {total_files}, got {actual_files}. "
-                        "Some files may have been created/deleted during collection."
-                    )
-
-                collected_count = 0
-                failed_count = 0
-
-                for file_path in files:
-                    if not file_path or not file_path.startswith(output_dir):
-                        continue
-
-                    try:
-                        # Get relative path
-                        rel_path = file_path.replace(f"{output_dir}/", "")
-                        local_file_path = os.path.join(destination_dir, rel_path)
-
-                        # Create parent directories if needed
-                        local_file_dir = os.path.dirname(local_file_path)
-                        if not os.path.isdir(local_file_dir):
-                            Path(local_file_dir).mkdir(parents=True, exist_ok=True)
-
-                        # Copy file content
-                        cat_cmd = f"cat {file_path}"
-                        file_content = pod_obj.exec_sh_cmd_on_pod(
-                            command=cat_cmd, timeout=60
-                        )
-
-                        with open(local_file_path, "w") as f:
-                            f.write(file_content if file_content else "")
-
-                        logger.debug(f"Collected: {rel_path}")
-                        collected_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"Failed to collect file {file_path}: {e}")
-                        failed_count += 1
-
-                logger.info(
-                    f"Collection complete: {collected_count} files collected, "
-                    f"{failed_count} files failed out of {actual_files} total files. "
-                    f"Output saved to {destination_dir}"
-                )
-            else:
+            if not result["found"]:
                 logger.info("No files found in output directory")
+                return
+            if result["mismatched"]:
+                logger.warning(
+                    f"{len(result['mismatched'])} files were changed during the collection"
+                )
+            logger.info(
+                f"Collection complete: {len(result['collected'])} files collected, "
+                f"{len(result['missing'])} files failed out of {result['found']} total files. "
+                f"Output saved to {destination_dir}"
+            )
 
         except Exception as e:
             logger.error(
@@ -1326,50 +1272,44 @@ def check_for_filesystem_hangs(namespace, output_dir="/mnt/output"):
                 continue
 
             try:
-                logger.info(
-                    f"Checking if hang_markers directory exists and has files in pod {pod_name}"
-                )
+                logger.info(f"Checking hang markers in pod {pod_name}")
                 hang_marker_dir = f"{output_dir}/{pod_name}/hang_markers"
-                check_cmd = f"ls -la {hang_marker_dir} 2>/dev/null || echo 'NO_MARKERS'"
-                result = pod_obj.exec_sh_cmd_on_pod(command=check_cmd, timeout=30)
-
-                if "NO_MARKERS" not in result and "HANG_DETECTED" in result:
-                    logger.warning(f"Hang markers found in pod {pod_name}")
-
-                    logger.info("Getting the marker file contents")
-                    list_cmd = f"find {hang_marker_dir} -name 'HANG_DETECTED_*.json' 2>/dev/null"
-                    marker_files = pod_obj.exec_sh_cmd_on_pod(
-                        command=list_cmd, timeout=30
+                with tempfile.TemporaryDirectory() as local_dir:
+                    result = collect_pod_directory(
+                        pod_obj,
+                        hang_marker_dir,
+                        local_dir,
+                        include=["HANG_DETECTED_*.json"],
+                        recursive=False,
+                        resume=False,
+                        timeout=60,
                     )
-
-                    for marker_file in marker_files.strip().split("\n"):
-                        if marker_file:
-                            try:
-                                cat_cmd = f"cat {marker_file}"
-                                marker_content = pod_obj.exec_sh_cmd_on_pod(
-                                    command=cat_cmd, timeout=30
-                                )
-
-                                hang_info = json.loads(marker_content)
-                                hang_info["pod_name"] = pod_name
-                                hang_markers_found.append(hang_info)
-
-                                logger.error(
-                                    f"Filesystem hang detected in pod {pod_name}:\n"
-                                    f"  Monitor Type: {hang_info.get('monitor_type')}\n"
-                                    f"  Command: {hang_info.get('command')}\n"
-                                    f"  Timestamp: {hang_info.get('timestamp')}\n"
-                                    f"  Details: {hang_info.get('details')}"
-                                )
-
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to parse hang marker {marker_file}: {e}"
-                                )
-                                raise CommandFailed(
-                                    f"Failed to parse hang marker file {marker_file}. "
-                                    f"This may indicate a real hang or transient file issue: {e}"
-                                )
+                    if result["collected"]:
+                        logger.warning(f"Hang markers found in pod {pod_name}")
+
+                    for marker_file in result["collected"]:
+                        try:
+                            with open(os.path.join(local_dir, marker_file)) as fd:
+                                hang_info = json.load(fd)
+                            hang_info["pod_name"] = pod_name
+                            hang_markers_found.append(hang_info)
+
+                            logger.error(
+                                f"Filesystem hang detected in pod {pod_name}:\n"
+                                f"  Monitor Type: {hang_info.get('monitor_type')}\n"
+                                f"  Command: {hang_info.get('command')}\n"
+                                f"  Timestamp: {hang_info.get('timestamp')}\n"
+                                f"  Details: {hang_info.get('details')}"
+                            )
+
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to parse hang marker {marker_file}: {e}"
+                            )
+                            raise CommandFailed(
+                                f"Failed to parse hang marker file {marker_file}. "
+                                f"This may indicate a real hang or transient file issue: {e}"
+                            )
 
             except Exception as e:
                 logger.debug(f"Could not check pod {pod_name} for hang markers: {e}")
@@ -1431,35 +1371,25 @@ def collect_monitoring_logs(stress_job_obj, dir_name=None):
                 output_dir = os.environ.get("OUTPUT_DIR", "/mnt/output")
                 monitoring_log_dir = f"{output_dir}/{pod_name}/monitoring_logs"
 
-                list_cmd = (
-                    f"ls {monitoring_log_dir}/*.log 2>/dev/null || echo 'NO_LOGS'"
-                )
-                result = pod_obj.exec_sh_cmd_on_pod(command=list_cmd, timeout=30)
-
-                if "NO_LOGS" not in result:
-                    log_files = result.strip().split("\n")
-
-                    for log_file in log_files:
-                        if log_file and log_file.endswith(".log"):
-                            try:
-                                cat_cmd = f"cat {log_file}"
-                                log_content = pod_obj.exec_sh_cmd_on_pod(
-                                    command=cat_cmd, timeout=60
-                                )
-                                log_filename = os.path.basename(log_file)
-                                local_log_path = os.path.join(
-                                    destination_dir, f"{pod_name}_{log_filename}"
-                                )
-
-                                with open(local_log_path, "w") as f:
-                                    f.write(log_content)
-
-                                logger.info(f"Saved monitoring log to {local_log_path}")
-
-                            except Exception as e:
-                                logger.warning(f"Failed to collect log {log_file}: {e}")
-                else:
-                    logger.info(f"No monitoring logs found in pod {pod_name}")
+                with tempfile.TemporaryDirectory() as local_dir:
+                    result = collect_pod_directory(
+                        pod_obj,
+                        monitoring_log_dir,
+                        local_dir,
+                        include=["*.log"],
+                        recursive=False,
+                        resume=False,
+                    )
+                    for log_filename in result["collected"]:
+                        local_log_path = os.path.join(
+                            destination_dir, f"{pod_name}_{log_filename}"
+                        )
+                        shutil.move(
+                            os.path.join(local_dir, log_filename), local_log_path
+                        )
+                        logger.info(f"Saved monitoring log to {local_log_path}")
+                    if not result["found"]:
+                        logger.info(f"No monitoring logs found in pod {pod_name}")
 
             except Exception as e:
                 logger.error(
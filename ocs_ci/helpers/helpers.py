@@ -41,6 +41,7 @@ from ocs_ci.ocs.utils import (
     query_nb_db_psql_version,
 )
 from ocs_ci.ocs import constants, defaults, node, ocp, exceptions
+from ocs_ci.ocs.event_recorder import get_event_recorder
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     NoRunningCephToolBoxException,
@@ -3006,6 +3007,7 @@ def ceph_health_check_with_toolbox_recovery(
     fix_ceph_health: bool = True,
     update_jira: bool = True,
     no_exception_if_jira_issue_updated: bool = False,
+    max_age: float = None,
 ) -> bool:
     """
     Perform ceph health check with automatic toolbox pod recovery.
@@ -3020,6 +3022,8 @@ def ceph_health_check_with_toolbox_recovery(
         fix_ceph_health (bool): Whether to attempt fixing ceph health issues.
         update_jira (bool): Whether to update Jira on health issues.
         no_exception_if_jira_issue_updated (bool): Skip exception if Jira was updated.
+        max_age (float): Accept HEALTH_OK tracked by the background health
+            tracker if not older than max_age seconds.
 
     Returns:
         bool: True if ceph health check passes.
@@ -3036,6 +3040,7 @@ def ceph_health_check_with_toolbox_recovery(
             fix_ceph_health=fix_ceph_health,
             update_jira=update_jira,
             no_exception_if_jira_issue_updated=no_exception_if_jira_issue_updated,
+            max_age=max_age,
         )
     except NoRunningCephToolBoxException:
         logger.warning(
@@ -3049,6 +3054,7 @@ def ceph_health_check_with_toolbox_recovery(
                 fix_ceph_health=fix_ceph_health,
                 update_jira=update_jira,
                 no_exception_if_jira_issue_updated=no_exception_if_jira_issue_updated,
+                max_age=max_age,
             )
         raise
 
@@ -3273,11 +3279,16 @@ def collect_performance_stats(dir_name):
     )
 
     # Get the cpu and memory from describe of nodes
+    inventory = node.get_node_inventory()
     master_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="master")
+        node.get_node_resource_utilization_from_oc_describe(
+            node_type="master", inventory=inventory
+        )
     )
     worker_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="worker")
+        node.get_node_resource_utilization_from_oc_describe(
+            node_type="worker", inventory=inventory
+        )
     )
 
     performance_stats["master_node_utilization"] = master_node_utilization_from_adm_top
@@ -4210,9 +4221,45 @@ def get_event_line_datetime(event_line):
     return event_line_dt
 
 
+def get_recorded_pod_event_lines(pod_name, namespace=None):
+    """
+    Get the recorded Kubernetes events of the pod as lines in the format of the
+    rook ceph operator logs, with the UTC time of the event at the beginning
+
+    Args:
+        pod_name (str): The pod name to get the events
+        namespace (str): The namespace of the pod, the cluster namespace if None
+
+    Returns:
+        list: The event lines ordered by the time, empty if the events of the
+            namespace are not recorded
+
+    """
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    recorder = get_event_recorder(namespace=namespace)
+    if not recorder:
+        return []
+    event_lines = []
+    events = recorder.query(kind=constants.POD, name=pod_name, namespace=namespace)
+    for event in events:
+        if not event["last"]:
+            continue
+        # operator log lines are in UTC
+        event_time = datetime.datetime.fromtimestamp(
+            event["last"], tz=datetime.timezone.utc
+        )
+        event_lines.append(
+            f"{event_time.strftime('%Y-%m-%d %H:%M:%S.%f')} {event['type']} "
+            f"{event['reason']} pod {pod_name}: {event['message']}"
+        )
+    return event_lines
+
+
 def get_rook_ceph_pod_events(pod_name):
     """
-    Get the rook ceph pod events from the rook ceph pod operator logs
+    Get the rook ceph pod events from the rook ceph pod operator logs. If the
+    events of the cluster namespace are recorded, the recorded Kubernetes
+    events of the pod are merged in by their time.
 
     Args:
         pod_name (str): The rook ceph pod name to get the events
@@ -4222,7 +4269,18 @@ def get_rook_ceph_pod_events(pod_name):
 
     """
     rook_ceph_operator_event_lines = get_logs_rook_ceph_operator().splitlines()
-    return [line for line in rook_ceph_operator_event_lines if pod_name in line]
+    event_lines = [line for line in rook_ceph_operator_event_lines if pod_name in line]
+    recorded_event_lines = get_recorded_pod_event_lines(pod_name)
+    if not recorded_event_lines:
+        return event_lines
+    timed_lines = []
+    line_datetime = datetime.datetime.min
+    for line in event_lines + recorded_event_lines:
+        # a line without the time keeps the position after the preceding line
+        line_datetime = get_event_line_datetime(line) or line_datetime
+        timed_lines.append((line_datetime, line))
+    timed_lines.sort(key=lambda timed_line: timed_line[0])
+    return [line for _, line in timed_lines]
 
 
 def get_rook_ceph_pod_events_by_keyword(pod_name, keyword):
@@ -402,10 +402,7 @@ class OSDKeyrotation(KeyRotation):
             bool: return True If KeyRotation is sucessfull otherwise False.
         """
 
-        old_keys = {}
-
-        for dev in self.deviceset:
-            old_keys[dev] = self.kms.get_osd_secret(dev)
+        old_keys = self.kms.get_osd_secrets(self.deviceset)
 
         # Noobaa Secret
         old_keys[constants.NOOBAA_BACKEND_SECRET] = self.kms.get_noobaa_secret()
@@ -414,9 +411,7 @@ class OSDKeyrotation(KeyRotation):
 
         @retry(UnexpectedBehaviour, tries=tries, delay=delay)
         def compare_keys():
-            new_keys = {}
-            for dev in self.deviceset:
-                new_keys[dev] = self.kms.get_osd_secret(dev)
+            new_keys = self.kms.get_osd_secrets(self.deviceset)
 
             new_keys[constants.NOOBAA_BACKEND_SECRET] = self.kms.get_noobaa_secret()
 
@@ -624,32 +619,35 @@ class PVKeyrotation(KeyRotation):
             dict: Dictionary mapping PVC names to their device handles and vault keys.
                   Returns None for vault_key if the key doesn't exist yet.
         """
-        import subprocess
-
         keys_data = {}
         for pvc in pvc_objs:
-            device_handle = pvc.get_pv_volume_handle_name
-
             # Get the KMS ID for this PVC to use the correct Vault backend path
-            kms_id = self.get_pvc_kms_id(pvc)
-
-            try:
-                # Pass kms_id to ensure we use the correct backend path
-                vault_key = self.kms.get_pv_secret(device_handle, kms_id=kms_id)
-            except subprocess.CalledProcessError as e:
-                log.warning(
-                    f"Could not retrieve vault key for PVC '{pvc.name}' "
-                    f"(device: {device_handle}, kms_id: {kms_id}). "
-                    f"Key may not exist yet. Error: {e}"
-                )
-                vault_key = None
-
             keys_data[pvc.name] = {
-                "device_handle": device_handle,
-                "vault_key": vault_key,
-                "kms_id": kms_id,
+                "device_handle": pvc.get_pv_volume_handle_name,
+                "vault_key": None,
+                "kms_id": self.get_pvc_kms_id(pvc),
             }
 
+        # Read the keys of all the PVCs with the same KMS ID at once
+        for kms_id in {data["kms_id"] for data in keys_data.values()}:
+            device_handles = [
+                data["device_handle"]
+                for data in keys_data.values()
+                if data["kms_id"] == kms_id
+            ]
+            # Pass kms_id to ensure we use the correct backend path
+            vault_keys = self.kms.get_pv_secrets(device_handles, kms_id=kms_id)
+            for pvc_name, data in keys_data.items():
+                if data["kms_id"] != kms_id:
+                    continue
+                data["vault_key"] = vault_keys.get(data["device_handle"])
+                if data["vault_key"] is None:
+                    log.warning(
+                        f"Could not retrieve vault key for PVC '{pvc_name}' "
+                        f"(device: {data['device_handle']}, kms_id: {kms_id}). "
+                        "Key may not exist yet."
+                    )
+
         return keys_data
 
     @retry(UnexpectedBehaviour, tries=10, delay=20)
@@ -18,6 +18,7 @@ Success Criteria:
 - Healthy Ceph status throughout
 """
 
+import functools
 import logging
 import threading
 import time
@@ -40,6 +41,14 @@ from ocs_ci.ocs.exceptions import (
     ResourceNotFoundError,
 )
 from ocs_ci.helpers import helpers
+from ocs_ci.krkn_chaos.background_ops_scheduler import (
+    BoundedExecutor,
+    LatencyHistogram,
+    CHAOS_PHASE_BASELINE,
+    OpenLoopScheduler,
+    get_chaos_phase,
+    set_chaos_phase,
+)
 
 log = logging.getLogger(__name__)
 
@@ -53,11 +62,33 @@ class BackgroundClusterMetrics:
         self.failures = defaultdict(int)
         self.errors = []
         self.start_time = time.time()
+        self.latency = defaultdict(LatencyHistogram)
+        self.latency_by_phase = defaultdict(lambda: defaultdict(LatencyHistogram))
+        self.scheduler_summary: Dict[str, Any] = {}
 
     def record_operation(
-        self, operation_type: str, success: bool, error: Optional[str] = None
+        self,
+        operation_type: str,
+        success: bool,
+        error: Optional[str] = None,
+        duration: Optional[float] = None,
+        phase: Optional[str] = None,
     ):
-        """Record an operation result."""
+        """
+        Record an operation result.
+
+        Args:
+            operation_type: Name of the operation
+            success: Whether the operation succeeded
+            error: Error message of failed operation
+            duration: Latency of the operation in seconds
+            phase: Chaos phase in which the operation started
+        """
+        if duration is not None:
+            self.latency[operation_type].record(duration)
+            self.latency_by_phase[phase or get_chaos_phase()][operation_type].record(
+                duration
+            )
         self.operations[operation_type] += 1
         if success:
             self.successes[operation_type] += 1
@@ -89,6 +120,14 @@ class BackgroundClusterMetrics:
                 if sum(self.operations.values()) > 0
                 else 0
             ),
+            "latency_by_type": {
+                op_type: hist.get_summary() for op_type, hist in self.latency.items()
+            },
+            "latency_by_phase": {
+                phase: {op_type: hist.get_summary() for op_type, hist in hists.items()}
+                for phase, hists in self.latency_by_phase.items()
+            },
+            "scheduler": self.scheduler_summary,
         }
 
 
@@ -106,6 +145,8 @@ class BackgroundClusterOperations:
         enabled_operations: Optional[List[str]] = None,
         operation_interval: int = 60,
         max_concurrent_operations: int = 3,
+        operation_rates: Optional[Dict[str, float]] = None,
+        max_queued_operations: int = 0,
     ):
         """
         Initialize BackgroundClusterOperations.
@@ -113,19 +154,29 @@ class BackgroundClusterOperations:
         Args:
             workload_ops: Workload operations object containing running workloads
             enabled_operations: List of enabled operation types (None = all)
-            operation_interval: Seconds between operations (default: 60)
+            operation_interval: Mean seconds between operations (default: 60),
+                used to derive target rates when operation_rates is not set
             max_concurrent_operations: Max concurrent background operations
+            operation_rates: Target rate in operations per minute per
+                operation type, operations missing in the dict are not
+                scheduled (None = 60 / operation_interval spread evenly
+                across enabled operations)
+            max_queued_operations: Max operations waiting for a free worker,
+                arrivals above this bound are counted as backpressure
         """
         self.workload_ops = workload_ops
         self.namespace = workload_ops.namespace
         self.workloads = workload_ops.workloads
         self.operation_interval = operation_interval
         self.max_concurrent_operations = max_concurrent_operations
+        self.max_queued_operations = max_queued_operations
+        self._operation_rates = operation_rates
 
         # Operation control
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._operation_threads: List[threading.Thread] = []
+        self._executor: Optional[BoundedExecutor] = None
+        self._scheduler: Optional[OpenLoopScheduler] = None
 
         # Metrics and tracking
         self.metrics = BackgroundClusterMetrics()
@@ -234,7 +285,21 @@ class BackgroundClusterOperations:
             return
 
         log.info("Starting background cluster operations")
+        # phase left by an earlier KrKn run doesn't apply to this workload
+        set_chaos_phase(CHAOS_PHASE_BASELINE)
         self._running = True
+        self._executor = BoundedExecutor(
+            max_workers=self.max_concurrent_operations,
+            max_queued=self.max_queued_operations,
+        )
+        self._scheduler = OpenLoopScheduler(
+            operations={
+                name: functools.partial(self._run_operation_safe, operation_func=func)
+                for name, func in self.enabled_operations.items()
+            },
+            rates=self._get_operation_rates(),
+            executor=self._executor,
+        )
         self._thread = threading.Thread(
             target=self._operation_loop, name="BackgroundClusterOperations", daemon=True
         )
@@ -258,10 +323,11 @@ class BackgroundClusterOperations:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=30)
 
-        # Wait for operation threads
-        for thread in self._operation_threads:
-            if thread.is_alive():
-                thread.join(timeout=10)
+        # Wait for running operations
+        if self._executor:
+            self._executor.shutdown(timeout=10 * self.max_concurrent_operations)
+        if self._scheduler:
+            self.metrics.scheduler_summary = self._scheduler.get_summary()
 
         if cleanup:
             self._cleanup_resources()
@@ -269,35 +335,46 @@ class BackgroundClusterOperations:
         log.info("Background cluster operations stopped")
         self._log_final_summary()
 
+    def _get_operation_rates(self) -> Dict[str, float]:
+        """
+        Get target rate in operations per minute for every enabled operation.
+
+        Without explicit rates, 60 / operation_interval operations per minute
+        are spread evenly across enabled operations, which matches the average
+        load of picking one random operation every operation_interval seconds.
+
+        Returns:
+            dict: Operation name -> ops/min
+        """
+        if self._operation_rates is not None:
+            return {
+                name: float(self._operation_rates.get(name, 0))
+                for name in self.enabled_operations
+            }
+        if not self.enabled_operations:
+            return {}
+        rate = 60.0 / self.operation_interval / len(self.enabled_operations)
+        return {name: rate for name in self.enabled_operations}
+
     def _operation_loop(self):
-        """Main operation loop - continuously performs background operations."""
-        log.info("Background cluster operation loop started")
+        """
+        Main operation loop - dispatches operations according to the open-loop
+        schedule, the loop never waits for operations to finish.
+        """
+        log.info(
+            f"Background cluster operation loop started, target rates (ops/min): "
+            f"{self._scheduler.rates}"
+        )
 
         while self._running:
             try:
-                # Clean up completed threads
-                self._operation_threads = [
-                    t for t in self._operation_threads if t.is_alive()
-                ]
-
-                # Check if we can start new operations
-                if len(self._operation_threads) < self.max_concurrent_operations:
-                    # Select random operation
-                    operation_name = random.choice(list(self.enabled_operations.keys()))
-                    operation_func = self.enabled_operations[operation_name]
-
-                    # Start operation in separate thread
-                    op_thread = threading.Thread(
-                        target=self._run_operation_safe,
-                        args=(operation_name, operation_func),
-                        name=f"BgOp-{operation_name}",
-                        daemon=True,
-                    )
-                    op_thread.start()
-                    self._operation_threads.append(op_thread)
-
-                # Sleep before next operation
-                time.sleep(self.operation_interval)
+                self._scheduler.dispatch_due()
+                next_arrival = self._scheduler.next_arrival_time()
+                if next_arrival is None:
+                    log.warning("No background operation has non-zero target rate")
+                    break
+                # Sleep until next arrival, wake up regularly to react on stop()
+                time.sleep(min(max(0, next_arrival - time.time()), 5))
 
             except Exception as e:
                 log.error(f"Error in background operation loop: {e}")
@@ -338,6 +415,7 @@ class BackgroundClusterOperations:
             operation_name: Name of the operation
             operation_func: Function to execute
         """
+        phase = start_time = None
         try:
             # Check if namespace still exists before running operation
             if not self._namespace_exists():
@@ -345,14 +423,25 @@ class BackgroundClusterOperations:
                 return
 
             log.info(f"Starting background operation: {operation_name}")
+            phase = get_chaos_phase()
+            start_time = time.time()
             operation_func()
-            self.metrics.record_operation(operation_name, success=True)
+            self.metrics.record_operation(
+                operation_name,
+                success=True,
+                duration=time.time() - start_time,
+                phase=phase,
+            )
             log.info(f"Completed background operation: {operation_name}")
         except Exception as e:
             error_msg = f"{operation_name} failed: {str(e)}"
             log.error(error_msg)
             self.metrics.record_operation(
-                operation_name, success=False, error=error_msg
+                operation_name,
+                success=False,
+                error=error_msg,
+                duration=time.time() - start_time if start_time else None,
+                phase=phase,
             )
 
     # ==========================================================================
@@ -1419,6 +1508,36 @@ class BackgroundClusterOperations:
             failures = summary["failures_by_type"].get(op_type, 0)
             log.info(f"  {op_type}: {count} ({successes} success, {failures} failed)")
 
+        def format_latency(stats):
+            if not stats["count"]:
+                return "no samples"
+            return (
+                f"n={stats['count']} p50={stats['p50']:.1f}s "
+                f"p95={stats['p95']:.1f}s p99={stats['p99']:.1f}s "
+                f"max={stats['max']:.1f}s"
+            )
+
+        log.info("\nLatency by Type:")
+        for op_type, stats in summary["latency_by_type"].items():
+            log.info(f"  {op_type}: {format_latency(stats)}")
+        for phase, latencies in summary["latency_by_phase"].items():
+            log.info(f"\nLatency in {phase} phase:")
+            for op_type, stats in latencies.items():
+                log.info(f"  {op_type}: {format_latency(stats)}")
+
+        scheduler_summary = summary["scheduler"]
+        if scheduler_summary:
+            log.info(
+                f"\nScheduled: {scheduler_summary['scheduled_by_type']}, "
+                f"max dispatch lag: "
+                f"{scheduler_summary['max_dispatch_lag_seconds']:.1f}s"
+            )
+            if scheduler_summary["total_rejected"]:
+                log.warning(
+                    f"Backpressure: {scheduler_summary['total_rejected']} arrivals "
+                    f"rejected, by type: {scheduler_summary['rejected_by_type']}"
+                )
+
         if summary["error_count"] > 0:
             log.warning(f"\n{summary['error_count']} errors occurred during operations")
 
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Tuple
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
+from ocs_ci.ocs.event_recorder import get_event_recorder, start_event_recorder
 from ocs_ci.ocs.resources import pod as pod_helpers
 
 log = logging.getLogger(__name__)
@@ -49,6 +50,11 @@ class BackgroundClusterValidator:
         """
         log.info("Performing pre-operation validation")
 
+        if config.RUN.get("record_events"):
+            # the session recorder follows only the cluster namespace, PVC
+            # events of the workload namespace are recorded from now on
+            start_event_recorder([self.namespace])
+
         try:
             # Capture initial PV count
             self.initial_pv_count = self._get_pv_count()
@@ -429,6 +435,29 @@ class BackgroundClusterValidator:
         """
         error_events = []
 
+        recorder = get_event_recorder(namespace=self.namespace)
+        if recorder:
+            # Recorded events survive event expiration in the cluster
+            for event in recorder.query(
+                kind="PersistentVolumeClaim", namespace=self.namespace
+            ):
+                reason = event["reason"] or ""
+                if (
+                    event["type"] in ["Warning", "Error"]
+                    or "fail" in reason.lower()
+                    or "error" in reason.lower()
+                ):
+                    error_events.append(
+                        {
+                            "pvc": event["name"],
+                            "type": event["type"],
+                            "reason": reason,
+                            "message": event["message"],
+                            "timestamp": event["last"],
+                        }
+                    )
+            return error_events
+
         try:
             # Get all events in namespace
             event_obj = ocp.OCP(kind="Event", namespace=self.namespace)
@@ -0,0 +1,351 @@
+"""
+Open-loop scheduling and latency tracking for background cluster operations.
+
+This module provides:
+1. LatencyHistogram - HDR-style log-linear histogram with bounded relative error
+2. BoundedExecutor - fixed pool of daemon workers with bounded queue which
+   reports backpressure instead of blocking the scheduler
+3. OpenLoopScheduler - weighted open-loop scheduler issuing operations at a
+   target rate (ops/min) per operation type independently of their latency
+4. Chaos phase tracking - the current chaos phase (baseline/chaos/recovery)
+   used to split latencies recorded during chaos from the rest
+"""
+
+import logging
+import math
+import queue
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+CHAOS_PHASE_BASELINE = "baseline"
+CHAOS_PHASE_CHAOS = "chaos"
+CHAOS_PHASE_RECOVERY = "recovery"
+
+_chaos_phase = CHAOS_PHASE_BASELINE
+_chaos_phase_lock = threading.Lock()
+
+
+def set_chaos_phase(phase: str):
+    """
+    Set current chaos phase, latencies of background operations started after
+    this call are accounted to the phase.
+
+    Args:
+        phase (str): Name of the phase (e.g. CHAOS_PHASE_CHAOS)
+    """
+    global _chaos_phase
+    with _chaos_phase_lock:
+        if phase != _chaos_phase:
+            log.info(f"Chaos phase changed: {_chaos_phase} -> {phase}")
+        _chaos_phase = phase
+
+
+def get_chaos_phase() -> str:
+    """
+    Returns:
+        str: Current chaos phase
+    """
+    with _chaos_phase_lock:
+        return _chaos_phase
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies.
+
+    Values are recorded in milliseconds into log-linear buckets: every power
+    of two range is split into 2^(sub_bucket_bits - 1) linear sub-buckets, so
+    the relative error of reported percentiles is bounded by
+    2^-(sub_bucket_bits - 1) regardless of the magnitude of values.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8):
+        """
+        Args:
+            sub_bucket_bits (int): Resolution of the histogram, 8 bits keeps
+                the relative error under 1%
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[tuple, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+
+    def _bucket(self, value_ms: int) -> tuple:
+        shift = max(0, value_ms.bit_length() - self.sub_bucket_bits)
+        return shift, value_ms >> shift
+
+    @staticmethod
+    def _bucket_value(bucket: tuple) -> float:
+        shift, mantissa = bucket
+        # middle of the bucket range
+        return (mantissa << shift) + ((1 << shift) - 1) / 2
+
+    def record(self, seconds: float):
+        """
+        Record latency
+
+        Args:
+            seconds (float): Latency in seconds
+        """
+        value_ms = max(0, int(round(seconds * 1000)))
+        with self._lock:
+            self.counts[self._bucket(value_ms)] += 1
+            self.count += 1
+            self.total += seconds
+            self.min = seconds if self.min is None else min(self.min, seconds)
+            self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add values recorded in other histogram to this one
+
+        Args:
+            other (LatencyHistogram): Histogram with the same resolution
+        """
+        with self._lock:
+            for bucket, count in other.counts.items():
+                self.counts[bucket] += count
+            self.count += other.count
+            self.total += other.total
+            for attr, func in (("min", min), ("max", max)):
+                other_value = getattr(other, attr)
+                if other_value is not None:
+                    value = getattr(self, attr)
+                    setattr(
+                        self,
+                        attr,
+                        other_value if value is None else func(value, other_value),
+                    )
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get value at given percentile
+
+        Args:
+            percent (float): Percentile in range 0-100
+
+        Returns:
+            float: Latency in seconds, None if nothing was recorded
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            threshold = max(1, math.ceil(percent / 100 * self.count))
+            seen = 0
+            for bucket in sorted(self.counts, key=lambda b: b[1] << b[0]):
+                seen += self.counts[bucket]
+                if seen >= threshold:
+                    value = self._bucket_value(bucket) / 1000
+                    return min(max(value, self.min), self.max)
+            return self.max
+
+    def get_summary(self) -> Dict[str, Optional[float]]:
+        """
+        Returns:
+            dict: count, mean, min, max, p50, p95 and p99 latencies in seconds
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class BoundedExecutor:
+    """
+    Pool of daemon worker threads with bounded queue.
+
+    Daemon threads are used on purpose (as before with raw threads), a hung
+    cluster operation must not block interpreter exit. When all workers are
+    busy and the queue is full, submit() doesn't block and returns False, so
+    the caller can account the rejected work as backpressure.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int = 0, name: str = "BgOp"):
+        """
+        Args:
+            max_workers (int): Number of worker threads
+            max_queued (int): Number of tasks waiting for a free worker
+            name (str): Prefix of worker thread names
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = True
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns:
+            int: Number of running and queued tasks
+        """
+        with self._lock:
+            return self._in_flight
+
+    def submit(self, func: Callable, *args) -> bool:
+        """
+        Submit task if there is a capacity for it
+
+        Args:
+            func (callable): Function to execute
+            *args: Arguments for the function
+
+        Returns:
+            bool: True if the task was accepted, False on backpressure
+        """
+        with self._lock:
+            if not self._running:
+                return False
+            if self._in_flight >= self.max_workers + self.max_queued:
+                return False
+            self._in_flight += 1
+        self._queue.put((func, args))
+        return True
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                log.error(f"Unhandled error in background worker: {e}")
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def shutdown(self, timeout: float = 30):
+        """
+        Stop accepting tasks and wait for running ones
+
+        Args:
+            timeout (float): Overall time to wait for the workers
+        """
+        with self._lock:
+            self._running = False
+        for _ in self._workers:
+            self._queue.put(None)
+        deadline = time.time() + timeout
+        for worker in self._workers:
+            worker.join(timeout=max(0, deadline - time.time()))
+        alive = [worker.name for worker in self._workers if worker.is_alive()]
+        if alive:
+            log.warning(f"Background workers still running after shutdown: {alive}")
+
+
+class OpenLoopScheduler:
+    """
+    Weighted open-loop scheduler.
+
+    Every operation type has its own arrival process with target rate in
+    operations per minute. Arrivals are scheduled on the wall clock (with
+    exponentially distributed inter-arrival times when poisson is enabled),
+    independently of how long operations take, so the offered load doesn't
+    drop when the cluster slows down. Arrivals which can't be admitted by the
+    executor are counted as backpressure.
+    """
+
+    def __init__(
+        self,
+        operations: Dict[str, Callable],
+        rates: Dict[str, float],
+        executor: BoundedExecutor,
+        poisson: bool = True,
+    ):
+        """
+        Args:
+            operations (dict): Operation name -> callable
+            rates (dict): Operation name -> target rate in ops/min, operations
+                with zero rate are never scheduled
+            executor (BoundedExecutor): Executor running the operations
+            poisson (bool): Use exponentially distributed inter-arrival times,
+                fixed intervals otherwise
+        """
+        self.operations = operations
+        self.rates = {name: rates.get(name, 0) for name in operations}
+        self.executor = executor
+        self.poisson = poisson
+        self.scheduled = defaultdict(int)
+        self.rejected = defaultdict(int)
+        self.max_lag = 0.0
+        now = time.time()
+        self._next_arrival = {
+            name: now + self._interval(name)
+            for name, rate in self.rates.items()
+            if rate > 0
+        }
+
+    def _interval(self, name: str) -> float:
+        mean_interval = 60.0 / self.rates[name]
+        if self.poisson:
+            return random.expovariate(1 / mean_interval)
+        return mean_interval
+
+    def next_arrival_time(self) -> Optional[float]:
+        """
+        Returns:
+            float: Timestamp of the nearest arrival, None if nothing is scheduled
+        """
+        return min(self._next_arrival.values()) if self._next_arrival else None
+
+    def dispatch_due(self, now: Optional[float] = None) -> int:
+        """
+        Submit all operations whose arrival time passed
+
+        Args:
+            now (float): Current timestamp, time.time() by default
+
+        Returns:
+            int: Number of operations accepted by the executor
+        """
+        now = now or time.time()
+        accepted = 0
+        for name in sorted(self._next_arrival, key=self._next_arrival.get):
+            while self._next_arrival[name] <= now:
+                self.max_lag = max(self.max_lag, now - self._next_arrival[name])
+                self.scheduled[name] += 1
+                if self.executor.submit(self.operations[name], name):
+                    accepted += 1
+                else:
+                    self.rejected[name] += 1
+                    log.warning(
+                        f"Backpressure: {name} arrival rejected, "
+                        f"{self.executor.in_flight} operations in flight"
+                    )
+                self._next_arrival[name] += self._interval(name)
+        return accepted
+
+    def get_summary(self) -> Dict[str, object]:
+        """
+        Returns:
+            dict: Target rates, scheduled and rejected arrivals per operation
+        """
+        return {
+            "target_ops_per_min": dict(self.rates),
+            "scheduled_by_type": dict(self.scheduled),
+            "rejected_by_type": dict(self.rejected),
+            "total_rejected": sum(self.rejected.values()),
+            "max_dispatch_lag_seconds": self.max_lag,
+        }
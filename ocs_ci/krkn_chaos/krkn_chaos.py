@@ -17,6 +17,12 @@ from ocs_ci.ocs.constants import (
     VSPHERE_PLATFORM,
 )
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.krkn_chaos.background_ops_scheduler import (
+    CHAOS_PHASE_BASELINE,
+    CHAOS_PHASE_CHAOS,
+    CHAOS_PHASE_RECOVERY,
+    set_chaos_phase,
+)
 from ocs_ci.krkn_chaos.krkn_port_manager import KrknPortManager
 from ocs_ci.framework import config
 from ocs_ci.utility.ibmcloud import get_ibmcloud_cluster_region
@@ -40,6 +46,9 @@ class KrKnRunner:
         # True when we stopped waiting because FAILURE was detected in the log
         self._completed_due_to_failure = False
         os.makedirs(KRKN_OUTPUT_DIR, exist_ok=True)
+        # operations before this run starts are its baseline, not the
+        # recovery of the previous run
+        set_chaos_phase(CHAOS_PHASE_BASELINE)
 
     def _print_config_file(self):
         """Print the contents of the Krkn config file before execution."""
@@ -70,11 +79,14 @@ class KrKnRunner:
 
     def _run_krkn_command_wrapper(self):
         """Wrapper method to capture exceptions from the thread."""
+        set_chaos_phase(CHAOS_PHASE_CHAOS)
         try:
             self._run_krkn_command()
         except Exception as e:
             self.thread_exception = e
             log.error(f"Exception in Krkn thread: {e}")
+        finally:
+            set_chaos_phase(CHAOS_PHASE_RECOVERY)
 
     def _validate_environment(self):
         """Validate the environment before running Krkn."""
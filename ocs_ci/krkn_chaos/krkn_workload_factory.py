@@ -309,6 +309,8 @@ class WorkloadOps:
                 enabled_operations=enabled_operations if enabled_operations else None,
                 operation_interval=operation_interval,
                 max_concurrent_operations=max_concurrent,
+                operation_rates=config.get_background_operations_rates(),
+                max_queued_operations=config.get_background_operations_max_queued(),
             )
             self.background_cluster_ops.start()
 
@@ -0,0 +1,103 @@
+# -*- coding: utf8 -*-
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.krkn_chaos.background_cluster_operations import (
+    BackgroundClusterOperations,
+)
+from ocs_ci.krkn_chaos.background_ops_scheduler import (
+    CHAOS_PHASE_BASELINE,
+    CHAOS_PHASE_RECOVERY,
+    BoundedExecutor,
+    LatencyHistogram,
+    OpenLoopScheduler,
+    get_chaos_phase,
+    set_chaos_phase,
+)
+
+
+def test_histogram_percentiles():
+    """
+    Percentiles of uniformly distributed latencies are reported within the
+    relative error of the histogram.
+    """
+    hist = LatencyHistogram()
+    for ms in range(1, 10001):
+        hist.record(ms / 1000)
+    summary = hist.get_summary()
+    assert summary["count"] == 10000
+    assert summary["min"] == 0.001
+    assert summary["max"] == 10.0
+    for key, expected in (("p50", 5.0), ("p95", 9.5), ("p99", 9.9)):
+        assert summary[key] == pytest.approx(expected, rel=0.01)
+
+
+def test_histogram_empty_and_merge():
+    hist = LatencyHistogram()
+    assert hist.percentile(50) is None
+    other = LatencyHistogram()
+    other.record(2)
+    other.record(4)
+    hist.record(1)
+    hist.merge(other)
+    assert hist.count == 3
+    assert hist.min == 1
+    assert hist.max == 4
+    assert hist.percentile(50) == pytest.approx(2, rel=0.01)
+
+
+def test_scheduler_reports_backpressure():
+    """
+    Arrivals are dispatched by the clock, those which don't fit into the
+    executor are rejected instead of delaying the schedule.
+    """
+    release = threading.Event()
+    executor = BoundedExecutor(max_workers=1, max_queued=1)
+    scheduler = OpenLoopScheduler(
+        operations={"op": lambda name: release.wait(10)},
+        rates={"op": 60},
+        executor=executor,
+        poisson=False,
+    )
+    first_arrival = scheduler.next_arrival_time()
+    # 5 arrivals are due, 1 runs, 1 waits in the queue, 3 are rejected
+    accepted = scheduler.dispatch_due(now=first_arrival + 4)
+    release.set()
+    executor.shutdown(timeout=10)
+    assert accepted == 2
+    summary = scheduler.get_summary()
+    assert summary["scheduled_by_type"] == {"op": 5}
+    assert summary["rejected_by_type"] == {"op": 3}
+    assert summary["max_dispatch_lag_seconds"] == pytest.approx(4)
+    assert scheduler.next_arrival_time() == pytest.approx(first_arrival + 5)
+
+
+def test_zero_rate_is_not_scheduled():
+    executor = BoundedExecutor(max_workers=1)
+    scheduler = OpenLoopScheduler(
+        operations={"op": lambda name: None, "disabled": lambda name: None},
+        rates={"op": 1},
+        executor=executor,
+    )
+    executor.shutdown()
+    assert scheduler.rates == {"op": 1, "disabled": 0}
+    assert scheduler.next_arrival_time() is not None
+    assert "disabled" not in scheduler._next_arrival
+
+
+def test_start_resets_chaos_phase():
+    """
+    Operations of a new run are not counted as recovery of an earlier KrKn run.
+    """
+    set_chaos_phase(CHAOS_PHASE_RECOVERY)
+    ops = BackgroundClusterOperations(
+        SimpleNamespace(namespace="test", workloads=[]), operation_rates={}
+    )
+    ops.start()
+    try:
+        assert get_chaos_phase() == CHAOS_PHASE_BASELINE
+    finally:
+        ops.stop(cleanup=False)
@@ -24,6 +24,13 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.s3_batch_deleter import S3BatchDeleter
+from ocs_ci.ocs.s3_operations import (
+    DELETE_BATCH_SIZE,
+    S3Operations,
+    get_s3_operations,
+    is_endpoint_reachable,
+    run_parallel,
+)
 from ocs_ci.utility import templating
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.ssl_certs import get_root_ca_cert
@@ -39,6 +46,53 @@ from ocs_ci.utility.prometheus import PrometheusAPI
 
 logger = logging.getLogger(__name__)
 
+# max number of AWS CLI commands running in parallel in one pod
+POD_CLI_WORKERS = 8
+
+
+def get_s3_operations_for(s3_obj):
+    """
+    Get the shared S3 operations of the endpoint and credentials of the object
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+
+    Returns:
+        S3Operations: S3 operations with pooled client, the client of the
+            object is used if the object has no static credentials
+
+    """
+    access_key_id = getattr(s3_obj, "access_key_id", None)
+    access_key = getattr(s3_obj, "access_key", None)
+    if not (access_key_id and access_key):
+        return S3Operations(client=s3_obj.s3_client)
+    return get_s3_operations(
+        s3_obj.s3_client.meta.endpoint_url,
+        access_key_id,
+        access_key,
+        verify=retrieve_verification_mode(),
+        region=s3_obj.s3_client.meta.region_name,
+    )
+
+
+def get_reachable_s3_operations(s3_obj):
+    """
+    Get the shared S3 operations of the object if its endpoint is reachable
+    from the test runner
+
+    Args:
+        s3_obj (obj): MCG or OBC object
+
+    Returns:
+        S3Operations: S3 operations with pooled client, None if the endpoint
+            of the object's client (e.g. the external MCG route) can't be
+            reached from the test runner
+
+    """
+    if not is_endpoint_reachable(s3_obj.s3_client.meta.endpoint_url):
+        return None
+    return get_s3_operations_for(s3_obj)
+
 
 def craft_s3_command(
     cmd, mcg_obj=None, api=False, signed_request_creds=None, max_attempts=8
@@ -701,9 +755,10 @@ def upload_parts(
         list: List containing the ETag of the parts
 
     """
-    parts = []
     secrets = [mcg_obj.access_key_id, mcg_obj.access_key, mcg_obj.s3_internal_endpoint]
-    for count, part in enumerate(uploaded_parts, 1):
+
+    def upload_part(numbered_part):
+        count, part = numbered_part
         upload_cmd = (
             f"upload-part --bucket {bucketname} --key {object_key}"
             f" --part-number {count} --body {body_path}/{part}"
@@ -719,8 +774,10 @@ def upload_parts(
             .split('"')[-3]
             .split("\\")[0]
         )
-        parts.append({"PartNumber": count, "ETag": f'"{part}"'})
-    return parts
+        return {"PartNumber": count, "ETag": f'"{part}"'}
+
+    # parts are independent, so they are uploaded in parallel
+    return run_parallel(upload_part, enumerate(uploaded_parts, 1), POD_CLI_WORKERS)
 
 
 def oc_create_aws_backingstore(cld_mgr, backingstore_name, uls_name, region):
@@ -2161,7 +2218,8 @@ def s3_list_objects_v2(
 
 def s3_delete_objects(s3_obj, bucketname, object_keys):
     """
-    Boto3 client based delete objects
+    Boto3 client based delete objects, more than 1000 objects are deleted by
+    parallel batch requests
 
     Args:
         s3_obj (obj): MCG or OBC object
@@ -2169,9 +2227,12 @@ def s3_delete_objects(s3_obj, bucketname, object_keys):
         object_keys (list): The objects to delete. Format: {'Key': 'object_key', 'VersionId': ''}
 
     Returns:
-        dict : delete objects response
+        dict : delete objects response ('Deleted' and 'Errors' of all the
+            requests for more than 1000 objects)
 
     """
+    if len(object_keys) > DELETE_BATCH_SIZE:
+        return get_s3_operations_for(s3_obj).delete_objects(bucketname, object_keys)
     return s3_obj.s3_client.delete_objects(
         Bucket=bucketname, Delete={"Objects": object_keys}
     )
@@ -2651,11 +2712,12 @@ def upload_bulk_buckets(s3_obj, buckets, amount=1, object_key="obj-key-0", prefi
         prefix (str, optional): prefix for the upload path
 
     """
+    s3_ops = get_s3_operations_for(s3_obj)
     for bucket in buckets:
-        for index in range(amount):
-            s3_put_object(
-                s3_obj, bucket.name, f"{prefix}/{object_key}-{index}", object_key
-            )
+        s3_ops.put_objects(
+            bucket.name,
+            {f"{prefix}/{object_key}-{index}": object_key for index in range(amount)},
+        )
 
 
 def change_versions_creation_date_in_noobaa_db(
@@ -3033,10 +3095,12 @@ def tag_objects(
     prefix="",
 ):
     """
-    Apply tags to objects in a bucket via the AWS CLI
+    Apply tags to objects in a bucket, the objects are tagged in parallel
 
     Args:
-        io_pod (pod): The pod that will execute the AWS CLI commands
+        io_pod (pod): The pod that will execute the AWS CLI commands against
+            the internal endpoint, used when the S3 endpoint of mcg_obj is not
+            reachable from the test runner
         mcg_obj (MCG): An MCG class instance
         bucket (str): The name of the bucket to tag the objects in
         object_keys (list): A list of object keys to tag
@@ -3061,6 +3125,24 @@ def tag_objects(
             tags_list.append({key: val})
         tags = tags_list
 
+    # If there prefix ends with a slash, remove it
+    prefix = prefix[:-1] if prefix.endswith("/") else prefix
+    object_keys = [
+        f"{prefix}/{object_key}" if prefix else object_key for object_key in object_keys
+    ]
+
+    logger.info(f"Tagging objects in bucket {bucket} with tags {tags}")
+    s3_ops = get_reachable_s3_operations(mcg_obj)
+    if s3_ops:
+        # Convert the tags to the S3 format
+        tag_set = [
+            {"Key": key, "Value": value}
+            for tag_dict in tags
+            for key, value in tag_dict.items()
+        ]
+        s3_ops.put_object_tagging(bucket, object_keys, tag_set)
+        return
+
     # Convert the tags to the expected aws-cli format
     tags_str = "'TagSet=["
     for tag_dict in tags:
@@ -3069,12 +3151,7 @@ def tag_objects(
             tags_str += f"{{Key={key}, Value={value}}}, "
     tags_str += "]'"
 
-    # If there prefix ends with a slash, remove it
-    prefix = prefix[:-1] if prefix.endswith("/") else prefix
-
-    logger.info(f"Tagging objects in bucket {bucket} with tags {tags}")
-    for object_key in object_keys:
-        object_key = f"{prefix}/{object_key}" if prefix else object_key
+    def tag_object(object_key):
         io_pod.exec_cmd_on_pod(
             craft_s3_command(
                 f"put-object-tagging --bucket  {bucket} --key {object_key} --tagging {tags_str}",
@@ -3084,6 +3161,8 @@ def tag_objects(
             out_yaml_format=False,
         )
 
+    run_parallel(tag_object, object_keys, POD_CLI_WORKERS)
+
 
 def get_object_to_tags_dict(
     io_pod,
@@ -3092,10 +3171,12 @@ def get_object_to_tags_dict(
     object_keys,
 ):
     """
-    Get tags of objects in a bucket via the AWS CLI
+    Get tags of objects in a bucket, the tags are read in parallel
 
     Args:
-        io_pod (pod): The pod that will execute the AWS CLI commands
+        io_pod (pod): The pod that will execute the AWS CLI commands against
+            the internal endpoint, used when the S3 endpoint of mcg_obj is not
+            reachable from the test runner
         mcg_obj (MCG): An MCG class instance
         bucket (str): The name of the bucket to get the tags from
         object_keys (list): A list of object keys to get the tags from
@@ -3108,24 +3189,31 @@ def get_object_to_tags_dict(
 
     """
 
-    obj_to_tag_dict = {obj: [] for obj in object_keys}
     logger.info(f"Getting tags of objects in bucket {bucket}")
-    for object_key in object_keys:
-        json_str_output = io_pod.exec_cmd_on_pod(
-            craft_s3_command(
-                f"get-object-tagging --bucket  {bucket} --key {object_key}",
-                mcg_obj=mcg_obj,
-                api=True,
-            ),
-            out_yaml_format=False,
+    s3_ops = get_reachable_s3_operations(mcg_obj)
+    if s3_ops:
+        object_tag_sets = s3_ops.get_object_tagging(bucket, object_keys)
+    else:
+
+        def get_tag_set(object_key):
+            json_str_output = io_pod.exec_cmd_on_pod(
+                craft_s3_command(
+                    f"get-object-tagging --bucket  {bucket} --key {object_key}",
+                    mcg_obj=mcg_obj,
+                    api=True,
+                ),
+                out_yaml_format=False,
+            )
+            return json.loads(json_str_output)["TagSet"]
+
+        object_tag_sets = dict(
+            zip(object_keys, run_parallel(get_tag_set, object_keys, POD_CLI_WORKERS))
         )
-        list_of_awscli_tag_dicts = json.loads(json_str_output)["TagSet"]
-        # Convert the tags to the expected format
-        obj_to_tag_dict[object_key] = [
-            {awscli_tag_dict["Key"]: awscli_tag_dict["Value"]}
-            for awscli_tag_dict in list_of_awscli_tag_dicts
-        ]
-    return obj_to_tag_dict
+    # Convert the tags to the expected format
+    return {
+        object_key: [{tag["Key"]: tag["Value"]} for tag in tag_set]
+        for object_key, tag_set in object_tag_sets.items()
+    }
 
 
 def delete_object_tags(
@@ -3136,10 +3224,12 @@ def delete_object_tags(
     prefix="",
 ):
     """
-    Delete tags of objects in a bucket via the AWS CLI
+    Delete tags of objects in a bucket, the tags are deleted in parallel
 
     Args:
-        io_pod (pod): The pod that will execute the AWS CLI commands
+        io_pod (pod): The pod that will execute the AWS CLI commands against
+            the internal endpoint, used when the S3 endpoint of mcg_obj is not
+            reachable from the test runner
         mcg_obj (MCG): An MCG class instance
         bucket (str): The name of the bucket to delete the tags from
         object_keys (list): A list of object keys to delete the tags from
@@ -3147,8 +3237,15 @@ def delete_object_tags(
 
     """
     logger.info(f"Deleting tags of objects in bucket {bucket}")
-    for object_key in object_keys:
-        object_key = f"{prefix}/{object_key}" if prefix else object_key
+    object_keys = [
+        f"{prefix}/{object_key}" if prefix else object_key for object_key in object_keys
+    ]
+    s3_ops = get_reachable_s3_operations(mcg_obj)
+    if s3_ops:
+        s3_ops.delete_object_tagging(bucket, object_keys)
+        return
+
+    def delete_tags(object_key):
         io_pod.exec_cmd_on_pod(
             craft_s3_command(
                 f"delete-object-tagging --bucket {bucket} --key {object_key}",
@@ -3158,6 +3255,8 @@ def delete_object_tags(
             out_yaml_format=False,
         )
 
+    run_parallel(delete_tags, object_keys, POD_CLI_WORKERS)
+
 
 def bulk_s3_put_bucket_lifecycle_config(mcg_obj, buckets, lifecycle_config):
     """
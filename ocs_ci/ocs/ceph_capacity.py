@@ -0,0 +1,322 @@
+"""
+Capacity and utilization model of the Ceph cluster.
+
+CephCapacity is built from the JSON output of 'ceph df detail' and
+'ceph osd df tree'. Per pool and per OSD values are stored in numpy arrays,
+so aggregates (used %, per host utilization, imbalance, projected time to
+full based on the fill rate between two snapshots) are computed without
+iterating over the raw command output again. One snapshot can drive several
+decisions of fill/utilization workloads instead of re-running ceph commands
+for each of them.
+"""
+
+import logging
+import time
+
+import numpy as np
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import PoolNotFound
+from ocs_ci.ocs.resources import pod
+
+log = logging.getLogger(__name__)
+
+POOL_COLUMNS = ("id", "stored", "objects", "bytes_used", "percent_used", "max_avail")
+OSD_COLUMNS = ("id", "kb", "kb_used", "kb_avail", "utilization", "pgs")
+
+
+class CephCapacity(object):
+    """
+    Point in time snapshot of Ceph capacity with array backed columns
+    """
+
+    def __init__(self, ceph_df=None, osd_df=None, timestamp=None):
+        """
+        Args:
+            ceph_df (dict): Output of 'ceph df' or 'ceph df detail' in JSON
+            osd_df (dict): Output of 'ceph osd df' or 'ceph osd df tree' in JSON
+            timestamp (float): Time when the data were collected
+
+        """
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.stats = {}
+        self.pool_names = []
+        self.pools = {column: np.zeros(0) for column in POOL_COLUMNS}
+        self.osd_names = []
+        self.osd_hosts = []
+        self.osds = {column: np.zeros(0) for column in OSD_COLUMNS}
+        if ceph_df:
+            self._load_ceph_df(ceph_df)
+        if osd_df:
+            self._load_osd_df(osd_df)
+
+    @classmethod
+    def collect(cls, pools=True, osds=True):
+        """
+        Collect the capacity snapshot from the cluster
+
+        Args:
+            pools (bool): Collect cluster and pool stats ('ceph df detail')
+            osds (bool): Collect OSD stats ('ceph osd df tree')
+
+        Returns:
+            CephCapacity: Capacity snapshot
+
+        """
+        ct_pod = pod.get_ceph_tools_pod()
+        ceph_df = ct_pod.exec_ceph_cmd(ceph_cmd="ceph df detail") if pools else None
+        osd_df = ct_pod.exec_ceph_cmd(ceph_cmd="ceph osd df tree") if osds else None
+        return cls(ceph_df=ceph_df, osd_df=osd_df)
+
+    def _load_ceph_df(self, ceph_df):
+        self.stats = ceph_df.get("stats", {})
+        pools = ceph_df.get("pools", [])
+        self.pool_names = [pool["name"] for pool in pools]
+        for column in POOL_COLUMNS:
+            self.pools[column] = np.array(
+                [
+                    pool["id"] if column == "id" else pool["stats"].get(column, 0)
+                    for pool in pools
+                ],
+                dtype=float,
+            )
+
+    def _load_osd_df(self, osd_df):
+        nodes = osd_df.get("nodes", [])
+        host_of = {}
+        for node in nodes:
+            if node.get("type") == "host":
+                for child in node.get("children", []):
+                    host_of[child] = node["name"]
+        osds = [node for node in nodes if node.get("type", "osd") == "osd"]
+        osds += [node for node in osd_df.get("stray", []) if node.get("kb")]
+        self.osd_names = [osd["name"] for osd in osds]
+        self.osd_hosts = [host_of.get(osd["id"]) for osd in osds]
+        for column in OSD_COLUMNS:
+            self.osds[column] = np.array(
+                [osd.get(column, 0) for osd in osds], dtype=float
+            )
+
+    def _pool_index(self, pool_name):
+        try:
+            return self.pool_names.index(pool_name)
+        except ValueError:
+            raise PoolNotFound(f"Pool {pool_name} not found in ceph df output")
+
+    @property
+    def total_bytes(self):
+        return int(self.stats.get("total_bytes", 0))
+
+    @property
+    def total_used_raw_bytes(self):
+        return int(self.stats.get("total_used_raw_bytes", 0))
+
+    @property
+    def percent_used(self):
+        """
+        Returns:
+            float: Used raw capacity of the cluster in percent
+
+        """
+        if not self.total_bytes:
+            return 0.0
+        return 100.0 * self.total_used_raw_bytes / self.total_bytes
+
+    @property
+    def total_stored(self):
+        """
+        Returns:
+            int: Sum of STORED values of all pools (Bytes)
+
+        """
+        return int(self.pools["stored"].sum())
+
+    def get_pool_stats(self, pool_name):
+        """
+        Args:
+            pool_name (str): Name of the pool
+
+        Returns:
+            dict: Values of pool columns
+
+        Raises:
+            PoolNotFound: If the pool is not in the snapshot
+
+        """
+        index = self._pool_index(pool_name)
+        return {column: self.pools[column][index].item() for column in POOL_COLUMNS}
+
+    def get_pool_used_percent(self):
+        """
+        Returns:
+            dict: Pool name -> used capacity in percent
+
+        """
+        return dict(zip(self.pool_names, (self.pools["percent_used"] * 100).tolist()))
+
+    def get_storageutilization_size(self, target_percentage, pool_name):
+        """
+        Get size of the volume which has to be filled to reach the target
+        total utilization, based on STORED and MAX AVAIL of the pool
+
+        Args:
+            target_percentage (float): Target total utilization, eg. 0.5 for 50%
+            pool_name (str): Name of the pool where the data will be written
+
+        Returns:
+            int: Size to fill (in GiB, rounded)
+
+        """
+        max_avail = self.get_pool_stats(pool_name)["max_avail"]
+        total = max_avail + self.total_stored
+        to_utilize = total * target_percentage - self.total_stored
+        return round(to_utilize / constants.BYTES_IN_GB)
+
+    def get_osd_utilization(self):
+        """
+        Returns:
+            dict: OSD name -> utilization in percent
+
+        """
+        return dict(zip(self.osd_names, self.osds["utilization"].tolist()))
+
+    def get_pgs_per_osd(self):
+        """
+        Returns:
+            dict: OSD name -> number of PGs
+
+        """
+        return dict(zip(self.osd_names, self.osds["pgs"].astype(int).tolist()))
+
+    def get_osds_below_utilization(self, utilization):
+        """
+        Args:
+            utilization (float): Utilization threshold in percent
+
+        Returns:
+            list: Names of OSDs with lower utilization
+
+        """
+        mask = self.osds["utilization"] < utilization
+        return [name for name, below in zip(self.osd_names, mask) if below]
+
+    def get_host_utilization(self):
+        """
+        Get utilization of hosts aggregated from their OSDs
+
+        Returns:
+            dict: Host name -> used capacity in percent
+
+        """
+        hosts = sorted({host for host in self.osd_hosts if host})
+        if not hosts:
+            return {}
+        host_index = np.array(
+            [hosts.index(host) if host else -1 for host in self.osd_hosts]
+        )
+        known = host_index >= 0
+        kb = np.bincount(
+            host_index[known], weights=self.osds["kb"][known], minlength=len(hosts)
+        )
+        kb_used = np.bincount(
+            host_index[known], weights=self.osds["kb_used"][known], minlength=len(hosts)
+        )
+        utilization = np.divide(kb_used * 100, kb, out=np.zeros_like(kb), where=kb > 0)
+        return dict(zip(hosts, utilization.tolist()))
+
+    def get_osd_imbalance(self):
+        """
+        Get imbalance of OSD utilization
+
+        Returns:
+            dict: spread (max - min utilization in percent points) and
+                max_deviation (max relative deviation from mean utilization)
+
+        """
+        utilization = self.osds["utilization"]
+        if not utilization.size:
+            return {"spread": 0.0, "max_deviation": 0.0}
+        mean = utilization.mean()
+        deviation = np.abs(utilization - mean).max() / mean if mean else 0.0
+        return {
+            "spread": float(utilization.max() - utilization.min()),
+            "max_deviation": float(deviation),
+        }
+
+    def get_pool_fill_rate(self, previous):
+        """
+        Get fill rate of pools between the previous snapshot and this one
+
+        Args:
+            previous (CephCapacity): Older snapshot
+
+        Returns:
+            dict: Pool name -> fill rate in Bytes/s (pools missing in the
+                previous snapshot are skipped)
+
+        """
+        elapsed = self.timestamp - previous.timestamp
+        if elapsed <= 0:
+            return {}
+        common = [name for name in self.pool_names if name in previous.pool_names]
+        current = self.pools["bytes_used"][[self._pool_index(n) for n in common]]
+        before = previous.pools["bytes_used"][[previous._pool_index(n) for n in common]]
+        return dict(zip(common, ((current - before) / elapsed).tolist()))
+
+    def get_pool_time_to_full(self, previous):
+        """
+        Project time until pools are full from the fill rate between the
+        previous snapshot and this one
+
+        Args:
+            previous (CephCapacity): Older snapshot
+
+        Returns:
+            dict: Pool name -> seconds until MAX AVAIL is consumed, inf if the
+                pool is not being filled
+
+        """
+        rates = self.get_pool_fill_rate(previous)
+        if not rates:
+            return {}
+        names = list(rates)
+        rate = np.array([rates[name] for name in names])
+        # MAX AVAIL is in stored bytes, fill rate in raw (replicated) bytes
+        replication = np.array(
+            [
+                (stats["bytes_used"] / stats["stored"]) if stats["stored"] else 1.0
+                for stats in (self.get_pool_stats(name) for name in names)
+            ]
+        )
+        avail_raw = self.pools["max_avail"][[self._pool_index(n) for n in names]]
+        avail_raw = avail_raw * replication
+        seconds = np.full(rate.shape, np.inf)
+        np.divide(avail_raw, rate, out=seconds, where=rate > 0)
+        return dict(zip(names, seconds.tolist()))
+
+    def get_osd_time_to_full(self, previous, full_ratio=1.0):
+        """
+        Project time until OSDs reach the full ratio from the fill rate between
+        the previous snapshot and this one
+
+        Args:
+            previous (CephCapacity): Older snapshot
+            full_ratio (float): Ratio considered as full (e.g. full_ratio from
+                'ceph osd dump')
+
+        Returns:
+            dict: OSD name -> seconds until full, inf if the OSD is not filled
+
+        """
+        elapsed = self.timestamp - previous.timestamp
+        common = [name for name in self.osd_names if name in previous.osd_names]
+        if elapsed <= 0 or not common:
+            return {}
+        index = [self.osd_names.index(name) for name in common]
+        previous_index = [previous.osd_names.index(name) for name in common]
+        kb_used = self.osds["kb_used"][index]
+        rate = (kb_used - previous.osds["kb_used"][previous_index]) / elapsed
+        remaining = self.osds["kb"][index] * full_ratio - kb_used
+        seconds = np.full(rate.shape, np.inf)
+        np.divide(np.maximum(remaining, 0), rate, out=seconds, where=rate > 0)
+        return dict(zip(common, seconds.tolist()))
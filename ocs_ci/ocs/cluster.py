@@ -25,6 +25,7 @@ from ocs_ci.utility.decorators import enable_high_recovery_during_rebalance_flag
 from ocs_ci.ocs.utils import thread_init_class
 
 import ocs_ci.ocs.resources.pod as pod
+from ocs_ci.ocs.ceph_capacity import CephCapacity
 from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
     PDBNotCreatedException,
@@ -43,6 +44,7 @@ from ocs_ci.ocs.resources import ocs, storage_cluster
 import ocs_ci.ocs.constants as constant
 from ocs_ci.ocs.resources.mcg import MCG
 from ocs_ci.utility import version
+from ocs_ci.utility.cluster_facts import get_storage_cluster_facts
 from ocs_ci.utility.prometheus import PrometheusAPI
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
@@ -67,7 +69,6 @@ from ocs_ci.utility.lvmo_utils import get_lvm_cluster_name
 from ocs_ci.ocs.resources.pod import (
     get_mds_pods,
     wait_for_pods_to_be_in_statuses,
-    get_ceph_tools_pod,
 )
 
 logger = logging.getLogger(__name__)
@@ -682,16 +683,13 @@ class CephCluster(object):
             int : Total storage capacity in GiB (GiB is for development environment)
 
         """
-        ceph_pod = pod.get_ceph_tools_pod()
-        ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph df")
+        capacity = CephCapacity.collect(osds=False)
         if replica_divide:
             replica = int(self.get_ceph_default_replica())
             logger.info(f"Number of replica : {replica}")
-            usable_capacity = (
-                int(ceph_status["stats"]["total_bytes"]) / replica / constant.GB
-            )
+            usable_capacity = capacity.total_bytes / replica / constant.GB
         else:
-            usable_capacity = int(ceph_status["stats"]["total_bytes"]) / constant.GB
+            usable_capacity = capacity.total_bytes / constant.GB
         return usable_capacity
 
     def get_ceph_free_capacity(self):
@@ -705,11 +703,8 @@ class CephCluster(object):
         replica = int(self.get_ceph_default_replica())
         if replica > 0:
             logger.info(f"Number of replica : {replica}")
-            ct_pod = pod.get_ceph_tools_pod()
-            output = ct_pod.exec_ceph_cmd(ceph_cmd="ceph df")
-            total_avail = output.get("stats").get("total_bytes")
-            total_used = output.get("stats").get("total_used_raw_bytes")
-            total_free = total_avail - total_used
+            capacity = CephCapacity.collect(osds=False)
+            total_free = capacity.total_bytes - capacity.total_used_raw_bytes
             return total_free / replica / constants.BYTES_IN_GB
         else:
             # if the replica number is 0, usable capacity can not be calculate
@@ -1469,14 +1464,7 @@ def get_osd_utilization():
         i.e {'osd.1': 15.276289408185841, 'osd.0': 15.276289408185841, 'osd.2': 15.276289408185841}
 
     """
-    osd_filled = {}
-    ceph_cmd = "ceph osd df"
-    ct_pod = pod.get_ceph_tools_pod()
-    output = ct_pod.exec_ceph_cmd(ceph_cmd=ceph_cmd)
-    for osd in output.get("nodes"):
-        osd_filled[osd["name"]] = osd["utilization"]
-
-    return osd_filled
+    return CephCapacity.collect(pools=False).get_osd_utilization()
 
 
 def get_ceph_df_detail(format="json-pretty", out_yaml_format=True):
@@ -1791,16 +1779,15 @@ def validate_osd_utilization(osd_used=80):
               False Otherwise.
 
     """
-    _rc = True
-    osd_filled = get_osd_utilization()
-    for osd, value in osd_filled.items():
-        if int(value) >= osd_used:
-            logger.info(f"{osd} used value {value}")
-        else:
-            _rc = False
+    capacity = CephCapacity.collect(pools=False)
+    below = set(capacity.get_osds_below_utilization(osd_used))
+    for osd, value in capacity.get_osd_utilization().items():
+        if osd in below:
             logger.warning(f"{osd} used value {value}")
+        else:
+            logger.info(f"{osd} used value {value}")
 
-    return _rc
+    return not below
 
 
 def get_pgs_per_osd():
@@ -1812,14 +1799,7 @@ def get_pgs_per_osd():
         i.e {'osd.0': 136, 'osd.2': 136, 'osd.1': 136}
 
     """
-    osd_dict = {}
-    ceph_cmd = "ceph osd df"
-    ct_pod = pod.get_ceph_tools_pod()
-    output = ct_pod.exec_ceph_cmd(ceph_cmd=ceph_cmd)
-    for osd in output.get("nodes"):
-        osd_dict[osd["name"]] = osd["pgs"]
-
-    return osd_dict
+    return CephCapacity.collect(pools=False).get_pgs_per_osd()
 
 
 def get_balancer_eval():
@@ -1906,9 +1886,7 @@ def get_ceph_df_stats() -> dict:
         dict: Ceph df stats.
 
     """
-    ct_pod = get_ceph_tools_pod()
-    output = ct_pod.exec_ceph_cmd(ceph_cmd="ceph df")
-    return output.get("stats")
+    return CephCapacity.collect(osds=False).stats
 
 
 def get_ceph_used_capacity() -> float:
@@ -2556,11 +2534,7 @@ def is_flexible_scaling_enabled():
         bool: True if failure domain is "host" and flexible scaling is enabled. False otherwise
 
     """
-    ocs_storage_cluster = storage_cluster.get_storage_cluster().get()["items"][0]
-
-    failure_domain = ocs_storage_cluster.get("status").get("failureDomain")
-    flexible_scaling = ocs_storage_cluster.get("spec").get("flexibleScaling")
-    return failure_domain == "host" and flexible_scaling
+    return get_storage_cluster_facts()["flexible_scaling"]
 
 
 def check_ceph_health_after_add_capacity(
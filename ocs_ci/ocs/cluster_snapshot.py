@@ -0,0 +1,208 @@
+"""
+Point in time snapshot of cluster resources shared by read-only checks.
+
+Every kind is fetched lazily with a single 'oc get <kind> -o yaml' call and
+served from memory to all consumers until it is invalidated, so concurrent
+checks don't issue their own listings of the same resources.
+"""
+
+import logging
+import threading
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+
+log = logging.getLogger(__name__)
+
+
+def parse_label_selector(selector):
+    """
+    Parse equality based label selector
+
+    Args:
+        selector (str): Label selector, e.g. 'app=rook-ceph-osd,ceph_daemon_type=osd'
+
+    Returns:
+        dict: Label requirements, None if the selector uses set based or
+            inequality requirements which are not supported
+
+    """
+    requirements = {}
+    for requirement in selector.split(","):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        if "!" in requirement or " " in requirement or "=" not in requirement:
+            return None
+        key, _, value = requirement.partition("=")
+        requirements[key.strip()] = value.lstrip("=").strip()
+    return requirements
+
+
+def match_labels(labels, selector):
+    """
+    Check whether labels match the equality based label selector
+
+    Args:
+        labels (dict): Labels of the resource
+        selector (str): Label selector
+
+    Returns:
+        bool: True if the labels match, None if the selector is not supported
+
+    """
+    requirements = parse_label_selector(selector)
+    if requirements is None:
+        return None
+    labels = labels or {}
+    return all(labels.get(key) == value for key, value in requirements.items())
+
+
+def get_pod_status(pod_data):
+    """
+    Compute status of the pod in the same way as STATUS column of 'oc get pod'
+    (simplified: terminating pods and waiting containers are reported by their
+    reason, otherwise the pod phase is used)
+
+    Args:
+        pod_data (dict): Pod resource data
+
+    Returns:
+        str: Status of the pod
+
+    """
+    if pod_data["metadata"].get("deletionTimestamp"):
+        return constants.STATUS_TERMINATING
+    status = pod_data.get("status", {})
+    for container in status.get("initContainerStatuses") or []:
+        reason = (container.get("state", {}).get("waiting") or {}).get("reason")
+        if reason:
+            return f"Init:{reason}"
+    for container in status.get("containerStatuses") or []:
+        reason = (container.get("state", {}).get("waiting") or {}).get("reason")
+        if reason:
+            return reason
+    return status.get("phase")
+
+
+class ClusterSnapshot(object):
+    """
+    Lazily populated, thread-safe snapshot of cluster resources
+    """
+
+    def __init__(self, namespace=None):
+        """
+        Args:
+            namespace (str): Namespace used for namespaced kinds
+
+        """
+        self.namespace = namespace
+        self._items = {}
+        self._locks = {}
+        self._global_lock = threading.Lock()
+
+    def _get_lock(self, key):
+        with self._global_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def items(self, kind, namespaced=True):
+        """
+        Get all resources of the kind, fetched once per snapshot
+
+        Args:
+            kind (str): Kind of the resource
+            namespaced (bool): If False, resources are listed without namespace
+
+        Returns:
+            list: Resource items
+
+        """
+        namespace = self.namespace if namespaced else None
+        key = (kind, namespace)
+        with self._get_lock(key):
+            if key not in self._items:
+                log.debug(f"Populating snapshot of {kind} in namespace {namespace}")
+                data = OCP(kind=kind, namespace=namespace).get()
+                self._items[key] = data.get("items", [])
+            return self._items[key]
+
+    def get_resource(self, kind, resource_name, namespaced=True):
+        """
+        Get resource data by name, falls back to 'oc get' if the resource is
+        not part of the snapshot (so the caller gets the same CommandFailed
+        as with direct OCP.get call)
+
+        Args:
+            kind (str): Kind of the resource
+            resource_name (str): Name of the resource
+            namespaced (bool): If False, resources are listed without namespace
+
+        Returns:
+            dict: Resource data
+
+        """
+        for item in self.items(kind, namespaced):
+            if item["metadata"]["name"] == resource_name:
+                return item
+        namespace = self.namespace if namespaced else None
+        return OCP(kind=kind, namespace=namespace).get(resource_name=resource_name)
+
+    def names(self, kind, namespaced=True):
+        """
+        Returns:
+            set: Names of resources of the kind
+
+        """
+        return {item["metadata"]["name"] for item in self.items(kind, namespaced)}
+
+    def select(self, kind, selector, namespaced=True):
+        """
+        Get resources of the kind matching the label selector
+
+        Args:
+            kind (str): Kind of the resource
+            selector (str): Equality based label selector
+            namespaced (bool): If False, resources are listed without namespace
+
+        Returns:
+            list: Matching resource items, None if the selector is not
+                supported by the snapshot
+
+        """
+        if parse_label_selector(selector) is None:
+            return None
+        return [
+            item
+            for item in self.items(kind, namespaced)
+            if match_labels(item["metadata"].get("labels"), selector)
+        ]
+
+    def count_pods_in_status(self, selector, status=constants.STATUS_RUNNING):
+        """
+        Count pods matching the selector which are in the given status
+
+        Args:
+            selector (str): Equality based label selector
+            status (str): Expected status of the pods
+
+        Returns:
+            int: Number of pods, None if the selector is not supported
+
+        """
+        pods = self.select(constants.POD, selector)
+        if pods is None:
+            return None
+        return len([pod for pod in pods if get_pod_status(pod) == status])
+
+    def invalidate(self, kind=None):
+        """
+        Drop cached resources, next access fetches fresh data
+
+        Args:
+            kind (str): Kind to invalidate, all kinds if not specified
+
+        """
+        with self._global_lock:
+            for key in list(self._items):
+                if kind is None or key[0] == kind:
+                    self._items.pop(key, None)
@@ -23,7 +23,9 @@ from ocs_ci.helpers.helpers import (
     create_resource,
 )
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.framework import config
 from ocs_ci.ocs.cnv.virtctl import Virtctl
+from ocs_ci.ocs.cnv.vm_session import close_vm_sessions, get_vm_session
 from ocs_ci.ocs.cnv.virtual_machine_instance import VirtualMachineInstance
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.resources import pvc
@@ -127,6 +129,9 @@ class VirtualMachine(Virtctl):
         self.vmi_obj = VirtualMachineInstance(
             vmi_name=self._vm_name, namespace=self.namespace
         )
+        # login facts of the VM, looked up once
+        self._os_username = None
+        self._identity_file = None
 
     @property
     def name(self):
@@ -374,6 +379,8 @@ chpasswd:
             UsernameNotFoundException: If the 'user' key is not present in the VM userData
 
         """
+        if self._os_username:
+            return self._os_username
         vm_get_out = self.get()
         volumes = (
             vm_get_out.get("spec", {})
@@ -390,6 +397,7 @@ chpasswd:
                 user_data_dict = yaml.safe_load(user_data)
                 username = user_data_dict.get("user")
                 if username is not None:
+                    self._os_username = username
                     return username
                 else:
                     raise UsernameNotFoundException(
@@ -490,6 +498,7 @@ chpasswd:
             wait (bool): True to wait for the VirtualMachine to reach the "Stopped" status.
 
         """
+        self.close_ssh_sessions()
         self.stop_vm(self._vm_name, force=force)
         logger.info(f"Successfully stopped VM: {self._vm_name}")
         if wait:
@@ -507,6 +516,7 @@ chpasswd:
             wait (bool): True to wait for the VirtualMachine to reach the "Running" status.
 
         """
+        self.close_ssh_sessions()
         self.restart_vm(self._vm_name)
         logger.info(f"Successfully restarted VM: {self._vm_name}")
         if wait:
@@ -603,9 +613,7 @@ chpasswd:
         """
         vm_username = vm_username if vm_username else self.get_os_username()
         vm_dest_path = vm_dest_path if vm_dest_path else "."
-        identity_file = (
-            identity_file if identity_file else cnv_helpers.get_ssh_private_key_path()
-        )
+        identity_file = identity_file if identity_file else self.get_identity_file()
         logger.info(
             f"Starting scp from local machine path: {local_path} to VM path: {vm_dest_path}"
         )
@@ -642,9 +650,7 @@ chpasswd:
 
         """
         vm_username = vm_username if vm_username else self.get_os_username()
-        identity_file = (
-            identity_file if identity_file else cnv_helpers.get_ssh_private_key_path()
-        )
+        identity_file = identity_file if identity_file else self.get_identity_file()
         logger.info(
             f"Starting scp from VM path: {vm_src_path} to local machine path: {local_path}"
         )
@@ -674,9 +680,11 @@ chpasswd:
         """
         logger.info(f"Executing {command} command on the {self._vm_name} VM using SSH")
         username = username if username else self.get_os_username()
-        identity_file = (
-            identity_file if identity_file else cnv_helpers.get_ssh_private_key_path()
-        )
+        identity_file = identity_file if identity_file else self.get_identity_file()
+        if config.RUN.get("vm_ssh_multiplexing", True):
+            return get_vm_session(
+                self._vm_name, self.namespace, username, identity_file
+            ).run(command, use_sudo=use_sudo)
         return self.run_ssh_command(
             self._vm_name,
             username,
@@ -685,6 +693,52 @@ chpasswd:
             identity_file=identity_file,
         )
 
+    def run_ssh_script(
+        self, commands, username=None, use_sudo=True, identity_file=None
+    ):
+        """
+        Connect to the VirtualMachine using SSH and execute the commands one
+        after another by one exec.
+
+        Args:
+            commands (list): Commands to execute
+            username (str): SSH username for the VirtualMachine.
+            use_sudo (bool): True to run the commands with sudo.
+            identity_file (str): Path to the SSH private key file.
+
+        Returns:
+            list: stdout of the commands
+
+        Raises:
+            CommandFailed: If any of the commands failed
+
+        """
+        logger.info(
+            f"Executing {len(commands)} commands on the {self._vm_name} VM using SSH"
+        )
+        username = username if username else self.get_os_username()
+        identity_file = identity_file if identity_file else self.get_identity_file()
+        results = get_vm_session(
+            self._vm_name, self.namespace, username, identity_file
+        ).run_script(commands, use_sudo=use_sudo)
+        return [output for _, output in results]
+
+    def get_identity_file(self):
+        """
+        Returns:
+            str: Path to the SSH private key file used for the VirtualMachine
+
+        """
+        if not self._identity_file:
+            self._identity_file = cnv_helpers.get_ssh_private_key_path()
+        return self._identity_file
+
+    def close_ssh_sessions(self):
+        """
+        Close the persistent SSH sessions to the VirtualMachine
+        """
+        close_vm_sessions(self._vm_name, self.namespace)
+
     def pause(self, wait=True):
         """
         Pause the VirtualMachine.
@@ -765,6 +819,7 @@ chpasswd:
         """
         if self.ready():
             self.stop()
+        self.close_ssh_sessions()
         if self.secret_obj:
             self.secret_obj.delete()
         self.vm_ocp_obj.delete(resource_name=self._vm_name)
@@ -0,0 +1,396 @@
+"""
+Persistent SSH sessions to virtual machines
+
+'virtctl ssh' creates a new port-forward tunnel and makes a new SSH handshake
+for every command. A VMSession runs the local ssh client with
+'virtctl port-forward --stdio' as ProxyCommand and keeps the connection open
+as an SSH ControlMaster, following commands to the same VM are multiplexed
+over it. The master is closed after ControlPersist seconds without use, by
+close() or when the VM is stopped, restarted or deleted.
+
+The master may go stale without notice, e.g. after migration of the VMI,
+drain of the node or drop of the port-forward. When ssh fails to connect
+(exit code 255), the master is restarted and the command is run once more,
+the last attempt uses its own connection without the master.
+
+Several commands can be run by one exec with VMSession.run_script and one
+command can be run on many VMs concurrently with run_on_vms.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shlex
+import subprocess
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.pod_collector import get_exec_env
+from ocs_ci.utility.utils import exec_cmd, mask_secrets
+
+logger = logging.getLogger(__name__)
+
+CONTROL_PERSIST = 600
+SSH_ERROR_CODE = 255
+DEFAULT_MAX_WORKERS = 8
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_control_dir = None
+_control_dir_lock = threading.Lock()
+
+
+def get_control_dir():
+    """
+    Returns:
+        str: Directory of the ControlMaster sockets, created once per process
+
+    """
+    global _control_dir
+    with _control_dir_lock:
+        if _control_dir is None:
+            # unix socket paths are limited to ~100 characters, keep it short
+            _control_dir = tempfile.mkdtemp(prefix="vmssh-")
+        return _control_dir
+
+
+def get_remote_command(command, use_sudo=True):
+    """
+    Args:
+        command (str): Command in the format accepted by
+            Virtctl.run_ssh_command
+        use_sudo (bool): True to run the command with sudo
+
+    Returns:
+        str: Command passed to the remote shell, the same as 'virtctl ssh -c'
+            gets from Virtctl.run_ssh_command
+
+    """
+    if use_sudo:
+        command = f"sudo {command}"
+    return shlex.split(f'"{command}"')[0]
+
+
+class VMSession(object):
+    """
+    Multiplexed SSH session to one virtual machine
+    """
+
+    def __init__(self, vm_name, namespace, username, identity_file=None):
+        """
+        Args:
+            vm_name (str): Name of the VM
+            namespace (str): Namespace of the VM
+            username (str): SSH username
+            identity_file (str): Path to the SSH private key
+
+        """
+        self.vm_name = vm_name
+        self.namespace = namespace
+        self.username = username
+        self.identity_file = identity_file
+        key = hashlib.sha1(
+            f"{namespace}/{vm_name}/{username}/{identity_file}".encode()
+        ).hexdigest()[:16]
+        self.control_path = os.path.join(get_control_dir(), key)
+        self.commands = 0
+        self.master_starts = 0
+
+    def get_ssh_cmd(self, *args, options=None, direct=False):
+        """
+        Args:
+            args (str): Remote command
+            options (list): Other options of the ssh client
+            direct (bool): True to connect without the master connection
+
+        Returns:
+            list: ssh command
+
+        """
+        proxy_command = (
+            f"virtctl port-forward --stdio=true --namespace {self.namespace} "
+            f"vmi/{self.vm_name} 22"
+        )
+        cmd = [
+            "ssh",
+            "-o",
+            f"ProxyCommand={proxy_command}",
+            "-o",
+            f"ControlPath={'none' if direct else self.control_path}",
+            "-o",
+            "StrictHostKeyChecking=no",
+            "-o",
+            "UserKnownHostsFile=/dev/null",
+            "-o",
+            "LogLevel=ERROR",
+            "-o",
+            "ServerAliveInterval=15",
+            "-o",
+            "ServerAliveCountMax=4",
+        ]
+        if self.identity_file:
+            cmd += ["-i", self.identity_file]
+        cmd += options or []
+        cmd.append(f"{self.username}@vmi.{self.vm_name}.{self.namespace}")
+        return cmd + list(args)
+
+    def start_master(self):
+        """
+        Start the master connection unless it is running, the commands fall
+        back to their own connections if it can't be started
+        """
+        if os.path.exists(self.control_path):
+            return
+        # the master runs in background with stdio detached, so it doesn't
+        # keep the output pipes of the first command open
+        cmd = self.get_ssh_cmd(
+            options=[
+                "-o",
+                "ControlMaster=yes",
+                "-o",
+                f"ControlPersist={CONTROL_PERSIST}",
+                "-N",
+                "-f",
+            ]
+        )
+        logger.info(f"Starting SSH master connection to VM {self.vm_name}")
+        try:
+            subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=get_exec_env(),
+                timeout=120,
+                check=True,
+            )
+            self.master_starts += 1
+        except (subprocess.SubprocessError, OSError) as ex:
+            logger.warning(
+                f"Failed to start SSH master connection to VM {self.vm_name}: {ex}"
+            )
+
+    def restart_master(self):
+        """
+        Close the master connection, remove its socket if the master doesn't
+        respond and start the master again
+        """
+        self.close()
+        try:
+            os.remove(self.control_path)
+        except FileNotFoundError:
+            pass
+        self.start_master()
+
+    def exec_ssh(self, remote_command, ignore_error=False, secrets=None, **kwargs):
+        """
+        Run the ssh command, the master connection is restarted and the
+        command is run once more when ssh fails to connect, the last attempt
+        uses its own connection
+
+        Args:
+            remote_command (str): Command passed to the remote shell
+            ignore_error (bool): True to return the failed process instead of
+                raising the exception
+            secrets (list): Secrets to be masked in the logs
+            kwargs (dict): Other arguments of exec_cmd
+
+        Returns:
+            CompletedProcess: Result of the last attempt
+
+        Raises:
+            CommandFailed: If the command failed and ignore_error is False
+
+        """
+        self.start_master()
+        self.commands += 1
+        attempts = ("multiplexed", "restarted", "direct")
+        for attempt in attempts:
+            if attempt == "restarted":
+                logger.warning(
+                    f"SSH connection to VM {self.vm_name} failed, restarting "
+                    "the master connection"
+                )
+                self.restart_master()
+            elif attempt == "direct":
+                logger.warning(
+                    f"SSH connection to VM {self.vm_name} failed again, "
+                    "connecting without the master connection"
+                )
+            cmd = self.get_ssh_cmd(remote_command, direct=attempt == "direct")
+            completed_process = exec_cmd(
+                cmd, ignore_error=True, secrets=secrets, **kwargs
+            )
+            if completed_process.returncode != SSH_ERROR_CODE:
+                break
+        if completed_process.returncode and not ignore_error:
+            raise CommandFailed(
+                f"Error during execution of command: "
+                f"{mask_secrets(' '.join(cmd), secrets)}."
+                f"\nError is "
+                f"{mask_secrets(completed_process.stderr.decode(), secrets)}"
+            )
+        return completed_process
+
+    def run(self, command, use_sudo=True, timeout=600, secrets=None):
+        """
+        Run the command on the VM
+
+        Args:
+            command (str): Command to run
+            use_sudo (bool): True to run the command with sudo
+            timeout (int): Timeout of the command in seconds
+            secrets (list): Secrets to be masked in the logs
+
+        Returns:
+            str: stdout of the command
+
+        Raises:
+            CommandFailed: If the command failed
+
+        """
+        completed_process = self.exec_ssh(
+            get_remote_command(command, use_sudo), secrets=secrets, timeout=timeout
+        )
+        return mask_secrets(completed_process.stdout.decode(), secrets)
+
+    def run_script(self, commands, use_sudo=True, timeout=600, ignore_error=False):
+        """
+        Run the commands on the VM by one exec, one after another
+
+        Args:
+            commands (list): Commands to run
+            use_sudo (bool): True to run the commands with sudo
+            timeout (int): Timeout of all the commands in seconds
+            ignore_error (bool): True to return results of failed commands
+                instead of raising the exception
+
+        Returns:
+            list: tuples (return code, stdout) of the commands
+
+        Raises:
+            CommandFailed: If any of the commands failed
+
+        """
+        marker = f"__OCS_CI_{uuid.uuid4().hex}__"
+        script = []
+        for index, command in enumerate(commands):
+            script.append(get_remote_command(command, use_sudo))
+            # the marker starts on a new line even if the output doesn't end
+            # by a new line, the added new line is removed by the parsing
+            script.append(f"printf '\\n{marker} {index} %s\\n' $?")
+        completed_process = self.exec_ssh(
+            "bash -s",
+            input="\n".join(script).encode(),
+            timeout=timeout,
+            ignore_error=True,
+        )
+        parts = re.split(rf"\n{marker} \d+ (\d+)\n", completed_process.stdout.decode())
+        results = [
+            (int(parts[index + 1]), parts[index])
+            for index in range(0, len(parts) - 1, 2)
+        ]
+        if len(results) < len(commands) and not ignore_error:
+            raise CommandFailed(
+                f"Script on VM {self.vm_name} finished after {len(results)} of "
+                f"{len(commands)} commands: {completed_process.stderr.decode()}"
+            )
+        failed = [
+            commands[index]
+            for index, (returncode, _) in enumerate(results)
+            if returncode
+        ]
+        if failed and not ignore_error:
+            raise CommandFailed(f"Commands failed on VM {self.vm_name}: {failed}")
+        return results
+
+    def close(self):
+        """
+        Close the master connection of the session
+        """
+        if not os.path.exists(self.control_path):
+            return
+        exec_cmd(
+            self.get_ssh_cmd(options=["-O", "exit"]), ignore_error=True, timeout=30
+        )
+
+
+def get_vm_session(vm_name, namespace, username, identity_file=None):
+    """
+    Get the session to the VM, shared by all the callers
+
+    Args:
+        vm_name (str): Name of the VM
+        namespace (str): Namespace of the VM
+        username (str): SSH username
+        identity_file (str): Path to the SSH private key
+
+    Returns:
+        VMSession: Session to the VM
+
+    """
+    key = (namespace, vm_name, username, identity_file)
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = VMSession(vm_name, namespace, username, identity_file)
+        return _sessions[key]
+
+
+def close_vm_sessions(vm_name=None, namespace=None):
+    """
+    Close the sessions, e.g. when the VM is stopped or restarted
+
+    Args:
+        vm_name (str): Name of the VM, all the VMs if None
+        namespace (str): Namespace of the VM
+
+    """
+    with _sessions_lock:
+        keys = [
+            key
+            for key in _sessions
+            if vm_name is None or (key[0], key[1]) == (namespace, vm_name)
+        ]
+        sessions = [_sessions.pop(key) for key in keys]
+    for session in sessions:
+        session.close()
+
+
+def run_on_vms(vm_objs, command, max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+    """
+    Run the command on the VMs concurrently
+
+    Args:
+        vm_objs (list): VirtualMachine objects
+        command (str): Command to run
+        max_workers (int): Max number of VMs running the command at once
+        kwargs (dict): Other arguments of VirtualMachine.run_ssh_cmd
+
+    Returns:
+        dict: Name of the VM -> stdout of the command
+
+    Raises:
+        CommandFailed: The first failure, after the command finished on all
+            the VMs
+
+    """
+    if not vm_objs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(vm_objs))) as executor:
+        futures = {
+            vm_obj.name: executor.submit(vm_obj.run_ssh_cmd, command, **kwargs)
+            for vm_obj in vm_objs
+        }
+    errors = {
+        name: future.exception()
+        for name, future in futures.items()
+        if future.exception()
+    }
+    if errors:
+        logger.error(f"Command {command} failed on VMs {list(errors)}")
+        raise next(iter(errors.values()))
+    return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,566 @@
+"""
+Recorder of Kubernetes events.
+
+Events expire in the cluster after about an hour, so long running chaos and
+longevity runs lose the evidence before anybody looks at it. EventRecorder
+follows events of selected namespaces with 'oc get events --watch' in
+background threads (one per namespace) and appends them to an EventStore.
+
+EventStore keeps compact records of events in a size rotated JSONL file
+(rotated files are gzipped) and maintains in-memory indexes, so events can be
+queried by involved object, reason, type and time window without re-listing
+events from the cluster. The indexes keep the most recently updated events up
+to max_events, the older ones are left only in the files.
+
+Recorders are registered per cluster (multicluster index), use
+start_event_recorder() to start (or extend) the recorder for the current
+cluster and get_event_recorder() to query it.
+"""
+
+import glob
+import gzip
+import json
+import logging
+import os
+import shlex
+import subprocess
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from itertools import count
+from datetime import datetime, timezone
+
+from ocs_ci.framework import config
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILE_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_ROTATED_FILES = 10
+DEFAULT_MAX_EVENTS = 100000
+EVENTS_FILE_NAME = "events.jsonl"
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def parse_event_time(value):
+    """
+    Parse timestamp used in events
+
+    Args:
+        value (str): RFC3339 timestamp, e.g. '2024-01-15T10:30:00Z'
+
+    Returns:
+        float: Unix timestamp, None if value is empty
+
+    """
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    value = value.replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        # microseconds with other than 3 or 6 digits (e.g. eventTime)
+        main, _, fraction = value.partition(".")
+        fraction_digits = "".join(c for c in fraction if c.isdigit())
+        tz = fraction[len(fraction_digits) :]
+        parsed = datetime.fromisoformat(f"{main}.{fraction_digits[:6]:0<6}{tz}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def compact_event(event):
+    """
+    Convert event resource into compact record stored by EventStore
+
+    Args:
+        event (dict): Event resource data
+
+    Returns:
+        dict: Compact event record
+
+    """
+    metadata = event.get("metadata", {})
+    involved_object = event.get("involvedObject") or event.get("regarding") or {}
+    first = (
+        event.get("firstTimestamp")
+        or event.get("eventTime")
+        or metadata.get("creationTimestamp")
+    )
+    last = event.get("lastTimestamp") or event.get("eventTime") or first
+    source = event.get("source") or {}
+    return {
+        "uid": metadata.get("uid")
+        or f"{metadata.get('namespace')}/{metadata.get('name')}",
+        "rv": metadata.get("resourceVersion"),
+        "namespace": metadata.get("namespace") or involved_object.get("namespace"),
+        "kind": involved_object.get("kind"),
+        "name": involved_object.get("name"),
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "message": event.get("message") or event.get("note"),
+        "count": event.get("count") or 1,
+        "first": parse_event_time(first),
+        "last": parse_event_time(last),
+        "source": source.get("component") or event.get("reportingController"),
+    }
+
+
+class EventStore(object):
+    """
+    Append-only store of compact event records with in-memory indexes
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_file_size=DEFAULT_MAX_FILE_SIZE,
+        max_rotated_files=DEFAULT_MAX_ROTATED_FILES,
+        max_events=DEFAULT_MAX_EVENTS,
+    ):
+        """
+        Args:
+            directory (str): Directory for JSONL files, None for memory only store
+            max_file_size (int): Size in bytes after which the file is rotated
+            max_rotated_files (int): Number of rotated (gzipped) files to keep
+            max_events (int): Max number of indexed events, the least recently
+                updated events are dropped from the indexes
+
+        """
+        self.directory = directory
+        self.max_file_size = max_file_size
+        self.max_rotated_files = max_rotated_files
+        self.max_events = max_events
+        self.evicted = 0
+        self._lock = threading.RLock()
+        self._events = OrderedDict()
+        self._order = {}
+        self._counter = count()
+        self._by_object = defaultdict(set)
+        self._by_reason = defaultdict(set)
+        self._by_type = defaultdict(set)
+        self._by_namespace = defaultdict(set)
+        self._file = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def path(self):
+        return (
+            os.path.join(self.directory, EVENTS_FILE_NAME) if self.directory else None
+        )
+
+    def __len__(self):
+        return len(self._events)
+
+    def _index_keys(self, record):
+        return (
+            (self._by_object, (record["kind"], record["name"])),
+            (self._by_reason, record["reason"]),
+            (self._by_type, record["type"]),
+            (self._by_namespace, record["namespace"]),
+        )
+
+    def _unindex(self, record):
+        for index, key in self._index_keys(record):
+            uids = index.get(key)
+            if uids is not None:
+                uids.discard(record["uid"])
+                if not uids:
+                    del index[key]
+
+    def _index(self, record):
+        uid = record["uid"]
+        current = self._events.pop(uid, None)
+        if current:
+            self._unindex(current)
+        self._events[uid] = record
+        if uid not in self._order:
+            self._order[uid] = next(self._counter)
+        for index, key in self._index_keys(record):
+            index[key].add(uid)
+        while len(self._events) > self.max_events:
+            _, evicted = self._events.popitem(last=False)
+            self._unindex(evicted)
+            del self._order[evicted["uid"]]
+            self.evicted += 1
+
+    def _write(self, record):
+        if not self.directory:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if self._file.tell() >= self.max_file_size:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        rotated = f"{self.path}.{int(time.time() * 1000)}.gz"
+        with open(self.path, "rb") as src, gzip.open(rotated, "wb") as dst:
+            dst.writelines(src)
+        os.remove(self.path)
+        rotated_files = sorted(glob.glob(f"{self.path}.*.gz"))
+        for old_file in rotated_files[: -self.max_rotated_files or None]:
+            os.remove(old_file)
+
+    def add(self, event):
+        """
+        Add event to the store, event updates (e.g. increased count) replace
+        the indexed record and are appended to the file
+
+        Args:
+            event (dict): Event resource data or compact event record
+
+        Returns:
+            bool: True if the event is new or changed
+
+        """
+        record = event if "uid" in event else compact_event(event)
+        with self._lock:
+            current = self._events.get(record["uid"])
+            if current and current["rv"] == record["rv"]:
+                return False
+            self._index(record)
+            self._write(record)
+            return True
+
+    def query(
+        self,
+        kind=None,
+        name=None,
+        namespace=None,
+        reason=None,
+        event_type=None,
+        since=None,
+        until=None,
+        message_contains=None,
+    ):
+        """
+        Query recorded events, all conditions have to match
+
+        Args:
+            kind (str): Kind of involved object (e.g. PersistentVolumeClaim)
+            name (str): Name of involved object (requires kind)
+            namespace (str): Namespace of the event
+            reason (str or list): Reason(s) of the event
+            event_type (str or list): Type(s) of the event (Normal, Warning)
+            since (float): Unix timestamp, events last seen before are skipped
+            until (float): Unix timestamp, events first seen after are skipped
+            message_contains (str): Case insensitive substring of the message
+
+        Returns:
+            list: Compact event records sorted by last timestamp
+
+        """
+        with self._lock:
+            candidates = None
+
+            def narrow(uids):
+                nonlocal candidates
+                candidates = set(uids) if candidates is None else candidates & uids
+
+            if kind and name:
+                narrow(self._by_object.get((kind, name), set()))
+            elif kind or name:
+                narrow(
+                    set().union(
+                        *(
+                            uids
+                            for (obj_kind, obj_name), uids in self._by_object.items()
+                            if (not kind or obj_kind == kind)
+                            and (not name or obj_name == name)
+                        )
+                    )
+                )
+            if namespace:
+                narrow(self._by_namespace.get(namespace, set()))
+            for index, values in (
+                (self._by_reason, reason),
+                (self._by_type, event_type),
+            ):
+                if values:
+                    values = [values] if isinstance(values, str) else values
+                    narrow(set().union(*(index.get(value, set()) for value in values)))
+            records = [
+                self._events[uid]
+                for uid in (self._events if candidates is None else candidates)
+            ]
+        if since is not None:
+            records = [rec for rec in records if (rec["last"] or 0) >= since]
+        if until is not None:
+            records = [rec for rec in records if (rec["first"] or 0) <= until]
+        if message_contains:
+            needle = message_contains.lower()
+            records = [
+                rec for rec in records if needle in (rec["message"] or "").lower()
+            ]
+        return sorted(
+            records, key=lambda rec: (rec["last"] or 0, self._order[rec["uid"]])
+        )
+
+    def load(self):
+        """
+        Rebuild indexes from files on disk (rotated files included)
+
+        Returns:
+            int: Number of indexed events
+
+        """
+        files = sorted(glob.glob(f"{self.path}.*.gz"))
+        if os.path.exists(self.path):
+            files.append(self.path)
+        with self._lock:
+            for file_path in files:
+                opener = gzip.open if file_path.endswith(".gz") else open
+                with opener(file_path, "rt") as fd:
+                    for line in fd:
+                        if line.strip():
+                            self._index(json.loads(line))
+            return len(self._events)
+
+    def export(self, destination):
+        """
+        Write all indexed events into a single JSONL file, events dropped from
+        the indexes are left only in the (rotated) files of the store
+
+        Args:
+            destination (str): Path to the file
+
+        """
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        with open(destination, "w") as fd:
+            for record in self.query():
+                fd.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+class EventRecorder(object):
+    """
+    Background recorder following events of namespaces on one cluster
+    """
+
+    def __init__(self, store, cluster_index=None, restart_delay=5):
+        """
+        Args:
+            store (EventStore): Store for recorded events
+            cluster_index (int): Multicluster index of the cluster, current
+                cluster is used if not specified
+            restart_delay (int): Seconds to wait before the watch is restarted
+                after it ended (watches are closed by API server regularly)
+
+        """
+        self.store = store
+        self.cluster_index = (
+            config.cur_index if cluster_index is None else cluster_index
+        )
+        self.restart_delay = restart_delay
+        self.namespaces = set()
+        self._threads = {}
+        self._processes = {}
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def _oc_cmd(self, namespace):
+        cluster_config = config.clusters[self.cluster_index]
+        kubeconfig = os.path.join(
+            cluster_config.ENV_DATA["cluster_path"],
+            cluster_config.RUN.get("kubeconfig_location"),
+        )
+        cmd = "oc "
+        if os.path.exists(kubeconfig):
+            cmd += f"--kubeconfig {kubeconfig} "
+        cmd += f"get events -n {namespace} --watch -o json"
+        return shlex.split(cmd)
+
+    def watch(self, namespace):
+        """
+        Start following events in the namespace, no-op if already watched
+
+        Args:
+            namespace (str): Namespace to watch
+
+        """
+        with self._lock:
+            if namespace in self.namespaces:
+                return
+            self.namespaces.add(namespace)
+            thread = threading.Thread(
+                target=self._watch_loop,
+                args=(namespace,),
+                name=f"EventRecorder-{self.cluster_index}-{namespace}",
+                daemon=True,
+            )
+            self._threads[namespace] = thread
+        log.info(
+            f"Recording events of namespace {namespace} on cluster index "
+            f"{self.cluster_index} into {self.store.directory}"
+        )
+        thread.start()
+
+    def is_watching(self, namespace):
+        """
+        Returns:
+            bool: True if events of the namespace are recorded
+
+        """
+        thread = self._threads.get(namespace)
+        return bool(thread and thread.is_alive())
+
+    def _watch_loop(self, namespace):
+        decoder = json.JSONDecoder()
+        while not self._stop_event.is_set():
+            try:
+                process = subprocess.Popen(
+                    self._oc_cmd(namespace),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+                self._processes[namespace] = process
+                buffer = ""
+                for chunk in iter(lambda: process.stdout.readline(), ""):
+                    buffer += chunk
+                    while buffer:
+                        buffer = buffer.lstrip()
+                        try:
+                            event, end = decoder.raw_decode(buffer)
+                        except ValueError:
+                            # incomplete JSON document, read more data
+                            break
+                        buffer = buffer[end:]
+                        self.store.add(event)
+                    if self._stop_event.is_set():
+                        break
+                process.wait()
+            except Exception as e:
+                log.warning(f"Event watch of namespace {namespace} failed: {e}")
+            self._stop_event.wait(self.restart_delay)
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def query(self, **kwargs):
+        """
+        Query recorded events, see EventStore.query for arguments
+        """
+        return self.store.query(**kwargs)
+
+    def stop(self):
+        """
+        Stop all watches and close the store
+        """
+        self._stop_event.set()
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+        for thread in self._threads.values():
+            thread.join(timeout=10)
+        self.store.close()
+
+
+def get_event_store_dir(cluster_index=None):
+    """
+    Get directory used for events recorded on the cluster
+
+    Args:
+        cluster_index (int): Multicluster index, current cluster if not specified
+
+    Returns:
+        str: Path to the directory
+
+    """
+    cluster_index = config.cur_index if cluster_index is None else cluster_index
+    cluster_config = config.clusters[cluster_index]
+    return os.path.join(
+        os.path.expanduser(cluster_config.RUN["log_dir"]),
+        f"recorded_events_{cluster_config.RUN['run_id']}",
+        cluster_config.ENV_DATA["cluster_name"] or str(cluster_index),
+    )
+
+
+def start_event_recorder(namespaces, cluster_index=None):
+    """
+    Start recording events of the namespaces, running recorder of the cluster
+    is extended with new namespaces
+
+    Args:
+        namespaces (list): Namespaces to watch
+        cluster_index (int): Multicluster index, current cluster if not specified
+
+    Returns:
+        EventRecorder: Recorder of the cluster
+
+    """
+    cluster_index = config.cur_index if cluster_index is None else cluster_index
+    with _recorders_lock:
+        recorder = _recorders.get(cluster_index)
+        if not recorder or recorder.stopped:
+            store = EventStore(get_event_store_dir(cluster_index))
+            recorder = EventRecorder(store, cluster_index=cluster_index)
+            _recorders[cluster_index] = recorder
+    for namespace in namespaces:
+        recorder.watch(namespace)
+    return recorder
+
+
+def get_event_recorder(cluster_index=None, namespace=None):
+    """
+    Get running event recorder of the cluster
+
+    Args:
+        cluster_index (int): Multicluster index, current cluster if not specified
+        namespace (str): If specified, the recorder is returned only when it
+            records events of this namespace
+
+    Returns:
+        EventRecorder: Recorder, None if events are not recorded
+
+    """
+    cluster_index = config.cur_index if cluster_index is None else cluster_index
+    recorder = _recorders.get(cluster_index)
+    if recorder and namespace and not recorder.is_watching(namespace):
+        return None
+    return recorder
+
+
+def stop_event_recorders():
+    """
+    Stop recorders of all clusters, already recorded events stay available
+    for queries and export
+    """
+    with _recorders_lock:
+        for recorder in _recorders.values():
+            recorder.stop()
+
+
+def export_recorded_events(destination_dir, cluster_index=None):
+    """
+    Export events recorded on the cluster (e.g. as part of log collection)
+
+    Args:
+        destination_dir (str): Directory where events.jsonl is written
+        cluster_index (int): Multicluster index, current cluster if not specified
+
+    Returns:
+        str: Path to the exported file, None if events are not recorded
+
+    """
+    recorder = get_event_recorder(cluster_index)
+    if not recorder:
+        return None
+    destination = os.path.join(destination_dir, EVENTS_FILE_NAME)
+    recorder.store.export(destination)
+    log.info(f"Exported {len(recorder.store)} recorded events to {destination}")
+    return destination
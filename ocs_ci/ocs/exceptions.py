@@ -852,3 +852,12 @@ class NodeBMCUnreachableError(Exception):
     """
 
     pass
+
+
+class ExecReplayMissError(Exception):
+    """
+    Raised when no recorded response matches the command executed during
+    replay (see ocs_ci/utility/exec_transport.py)
+    """
+
+    pass
@@ -24,6 +24,7 @@ from ocs_ci.framework import config
 from ocs_ci.helpers.helpers import default_storage_class
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs import defaults
+from ocs_ci.ocs.ceph_capacity import CephCapacity
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
 from ocs_ci.ocs.exceptions import UnexpectedVolumeType
 from ocs_ci.ocs.resources import pod
@@ -35,7 +36,7 @@ from ocs_ci.utility.workloadfixture import measure_operation
 logger = logging.getLogger(__name__)
 
 
-def get_ceph_storage_stats(ceph_pool_name):
+def get_ceph_storage_stats(ceph_pool_name, capacity=None):
     """
     Get ceph storage utilization values from ``ceph df``: total STORED value
     and MAX AVAIL of given ceph pool, which are important for understanding
@@ -43,6 +44,8 @@ def get_ceph_storage_stats(ceph_pool_name):
 
     Args:
         ceph_pool_name (str): name of ceph pool where you want to write data
+        capacity (CephCapacity): already collected capacity snapshot, fresh
+            one is collected if not specified
 
     Returns:
         tuple:
@@ -50,30 +53,27 @@ def get_ceph_storage_stats(ceph_pool_name):
             int: value of MAX AVAIL value of given ceph pool (Bytes)
 
     """
-    with config.RunWithProviderConfigContextIfAvailable():
-        ct_pod = pod.get_ceph_tools_pod()
-        ceph_df_dict = ct_pod.exec_ceph_cmd(ceph_cmd="ceph df")
-        ceph_pool = None
-        ceph_total_stored = 0
-        for pool in ceph_df_dict["pools"]:
-            ceph_total_stored += pool["stats"]["stored"]
-            if pool["name"] == ceph_pool_name:
-                ceph_pool = pool
-        if ceph_pool is None:
-            logger.error(
-                f"pool {ceph_pool_name} was not found "
-                f"in output of `ceph df`: {ceph_df_dict}"
-            )
-        # If the following assert fail, the problem is either:
-        #  - name of the pool has changed (when this happens before GA, it's
-        #    likely ocs-ci bug, after the release it's a product bug),
-        #  - pool is missing (likely a product bug)
-        # either way, the fixture can't continue ...
-        assert ceph_pool is not None, f"Pool: {ceph_pool_name} doesn't exist!"
-    return ceph_total_stored, ceph_pool["stats"]["max_avail"]
-
-
-def get_storageutilization_size(target_percentage, ceph_pool_name):
+    if capacity is None:
+        with config.RunWithProviderConfigContextIfAvailable():
+            capacity = CephCapacity.collect(osds=False)
+    if ceph_pool_name not in capacity.pool_names:
+        logger.error(
+            f"pool {ceph_pool_name} was not found "
+            f"in output of `ceph df`: {capacity.pool_names}"
+        )
+    # If the following assert fail, the problem is either:
+    #  - name of the pool has changed (when this happens before GA, it's
+    #    likely ocs-ci bug, after the release it's a product bug),
+    #  - pool is missing (likely a product bug)
+    # either way, the fixture can't continue ...
+    assert (
+        ceph_pool_name in capacity.pool_names
+    ), f"Pool: {ceph_pool_name} doesn't exist!"
+    max_avail = int(capacity.get_pool_stats(ceph_pool_name)["max_avail"])
+    return capacity.total_stored, max_avail
+
+
+def get_storageutilization_size(target_percentage, ceph_pool_name, capacity=None):
     """
     For the purpose of the workload storage utilization fixtures, get expected
     pvc_size based on STORED and MAX AVAIL values (as reported by `ceph df`)
@@ -85,20 +85,23 @@ def get_storageutilization_size(target_percentage, ceph_pool_name):
     Args:
         target_percentage (float): target total utilization, eg. 0.5 for 50%
         ceph_pool_name (str): name of ceph pool where you want to write data
+        capacity (CephCapacity): already collected capacity snapshot, fresh
+            one is collected if not specified
 
     Returns:
         int: pvc_size for storage utilization job (in GiB, rounded)
 
     """
-    with config.RunWithProviderConfigContextIfAvailable():
-        ceph_total_stored, max_avail = get_ceph_storage_stats(ceph_pool_name)
+    if capacity is None:
+        with config.RunWithProviderConfigContextIfAvailable():
+            capacity = CephCapacity.collect(osds=False)
+    ceph_total_stored, max_avail = get_ceph_storage_stats(ceph_pool_name, capacity)
     # ... to compute PVC size (values in bytes)
     total = max_avail + ceph_total_stored  # Bytes
     max_avail_gi = max_avail / 2**30  # GiB
     logger.info(f"MAX AVAIL of {ceph_pool_name} is {max_avail_gi} Gi")
     target = total * target_percentage
-    to_utilize = target - ceph_total_stored
-    pvc_size = round(to_utilize / 2**30)  # GiB
+    pvc_size = capacity.get_storageutilization_size(target_percentage, ceph_pool_name)
     logger.info(
         f"to reach {target/2**30} Gi of total cluster utilization, "
         f"which is {target_percentage*100}% of the total capacity, "
@@ -470,10 +473,22 @@ def workload_fio_storageutilization(
         else:
             logger.warning(f"{ceph_ratio} not found in osd map")
 
+    # one capacity snapshot drives the sizing of the job and the reclaim
+    # baseline, so the cluster is not queried again for each decision
+    with config.RunWithProviderConfigContextIfAvailable():
+        capacity = CephCapacity.collect()
+    imbalance = capacity.get_osd_imbalance()
+    logger.info(
+        f"total utilization {capacity.percent_used:.2f}%, OSD utilization "
+        f"spread {imbalance['spread']:.2f}%, host utilization: "
+        f"{capacity.get_host_utilization()}"
+    )
     if target_size is not None:
         pvc_size = target_size
     else:
-        pvc_size = get_storageutilization_size(target_percentage, ceph_pool_name)
+        pvc_size = get_storageutilization_size(
+            target_percentage, ceph_pool_name, capacity
+        )
 
     # If we are trying to utilize particular percentage of total OCS capacity
     # and current usage is already higher, the test will be skipped, because
@@ -0,0 +1,537 @@
+"""
+Background tracker of the cluster health.
+
+The autouse health_checker fixture checks Ceph health and NooBaa and
+StorageCluster phases before and after every test, which costs several oc
+round trips per test (tools pod lookup, exec of 'ceph health detail', gets of
+the CRs). HealthTracker keeps the current health of one cluster up to date in
+background threads instead:
+
+ * Ceph health is polled every few seconds through a persistent toolbox
+   channel - one long running 'oc exec -i <tools pod> -- sh' process to which
+   the commands are written - so the tools pod is not looked up and a new exec
+   session is not created for every check
+ * NooBaa and StorageCluster phases are followed with 'oc get --watch'
+
+Every change of the health is recorded in the transition history. Health
+checks consult the tracker with a freshness bound (see get_tracked_health())
+and fall back to the direct check when the tracked state is stale or not
+healthy.
+
+Trackers are registered per cluster (multicluster index), use
+start_health_tracker() to start the tracker of the current cluster and
+get_health_tracker() to query it.
+"""
+
+import logging
+import os
+import queue
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque, namedtuple
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+
+log = logging.getLogger(__name__)
+
+CEPH = "ceph"
+NOOBAA = "noobaa"
+STORAGECLUSTER = "storagecluster"
+DEFAULT_INTERVAL = 10
+DEFAULT_HISTORY_SIZE = 1000
+
+HealthState = namedtuple("HealthState", ("value", "since", "checked"))
+HealthTransition = namedtuple(
+    "HealthTransition", ("timestamp", "component", "old", "new")
+)
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+def get_oc_base_cmd(cluster_index, namespace):
+    """
+    Args:
+        cluster_index (int): Multicluster index of the cluster
+        namespace (str): Namespace used for the command
+
+    Returns:
+        str: 'oc' command with kubeconfig of the cluster and the namespace
+
+    """
+    cluster_config = config.clusters[cluster_index]
+    kubeconfig = os.path.join(
+        cluster_config.ENV_DATA["cluster_path"],
+        cluster_config.RUN.get("kubeconfig_location"),
+    )
+    cmd = "oc "
+    if os.path.exists(kubeconfig):
+        cmd += f"--kubeconfig {kubeconfig} "
+    return cmd + f"-n {namespace}"
+
+
+class ToolboxChannel(object):
+    """
+    Persistent shell session in the Ceph tools pod
+
+    Commands are written to stdin of one 'oc exec -i' process and their output
+    is read up to the end marker printed after every command together with its
+    return code.
+    """
+
+    def __init__(self, cluster_index, namespace, timeout=60):
+        """
+        Args:
+            cluster_index (int): Multicluster index of the cluster
+            namespace (str): Namespace of the tools pod
+            timeout (int): Timeout in seconds for one command
+
+        """
+        self.cluster_index = cluster_index
+        self.namespace = namespace
+        self.timeout = timeout
+        self.pod_name = None
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _get_tools_pod_name(self):
+        cmd = (
+            f"{get_oc_base_cmd(self.cluster_index, self.namespace)} get pod "
+            f"-l {constants.TOOL_APP_LABEL} "
+            "--field-selector=status.phase=Running "
+            "-o jsonpath={.items[0].metadata.name}"
+        )
+        completed = subprocess.run(
+            shlex.split(cmd), capture_output=True, text=True, timeout=self.timeout
+        )
+        if completed.returncode or not completed.stdout.strip():
+            raise CommandFailed(
+                f"Running Ceph tools pod not found in {self.namespace}: "
+                f"{completed.stderr.strip()}"
+            )
+        return completed.stdout.strip()
+
+    def _read_lines(self, process, lines):
+        for line in iter(process.stdout.readline, ""):
+            lines.put(line)
+        lines.put(None)
+
+    def connect(self):
+        """
+        Start the shell session in the tools pod
+        """
+        self.close()
+        self.pod_name = self._get_tools_pod_name()
+        cmd = (
+            f"{get_oc_base_cmd(self.cluster_index, self.namespace)} "
+            f"exec -i {self.pod_name} -- sh"
+        )
+        self._process = subprocess.Popen(
+            shlex.split(cmd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._read_lines,
+            args=(self._process, self._lines),
+            name=f"ToolboxChannel-{self.cluster_index}",
+            daemon=True,
+        ).start()
+        log.debug(f"Opened toolbox channel to {self.pod_name}")
+
+    def run(self, command):
+        """
+        Run the command in the tools pod, the session is (re)connected if
+        needed
+
+        Args:
+            command (str): Shell command to run
+
+        Returns:
+            tuple: Return code (int) and output (str) of the command
+
+        Raises:
+            CommandFailed: If the session ended or the command timed out, the
+                session is closed in such case
+
+        """
+        with self._lock:
+            if not self.connected:
+                self.connect()
+            marker = f"__OCS_CI_END_{uuid.uuid4().hex}__"
+            try:
+                self._process.stdin.write(f"{command} 2>&1; echo {marker} $?\n")
+                self._process.stdin.flush()
+                deadline = time.monotonic() + self.timeout
+                output = []
+                while True:
+                    line = self._lines.get(
+                        timeout=max(deadline - time.monotonic(), 0.001)
+                    )
+                    if line is None:
+                        raise CommandFailed(
+                            f"Toolbox channel to {self.pod_name} ended: "
+                            f"{''.join(output)}"
+                        )
+                    if line.startswith(marker):
+                        return int(line.split()[1]), "".join(output)
+                    output.append(line)
+            except (OSError, queue.Empty, ValueError, IndexError) as ex:
+                self.close()
+                raise CommandFailed(
+                    f"Command '{command}' failed in toolbox channel: {ex!r}"
+                )
+            except CommandFailed:
+                self.close()
+                raise
+
+    def close(self):
+        """
+        Terminate the shell session
+        """
+        process, self._process = self._process, None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+class HealthTracker(object):
+    """
+    Background tracker of Ceph, NooBaa and StorageCluster health of one cluster
+    """
+
+    def __init__(
+        self,
+        cluster_index=None,
+        namespace=None,
+        interval=DEFAULT_INTERVAL,
+        history_size=DEFAULT_HISTORY_SIZE,
+        restart_delay=5,
+        components=(CEPH, NOOBAA, STORAGECLUSTER),
+    ):
+        """
+        Args:
+            cluster_index (int): Multicluster index of the cluster, current
+                cluster is used if not specified
+            namespace (str): Namespace of the storage cluster, cluster
+                namespace from the config if not specified
+            interval (int): Seconds between the Ceph health polls
+            history_size (int): Max number of kept transitions
+            restart_delay (int): Seconds to wait before a watch or the
+                toolbox channel is restarted after it ended
+            components (tuple): Tracked components (CEPH, NOOBAA,
+                STORAGECLUSTER)
+
+        """
+        self.cluster_index = (
+            config.cur_index if cluster_index is None else cluster_index
+        )
+        cluster_config = config.clusters[self.cluster_index]
+        self.namespace = namespace or cluster_config.ENV_DATA["cluster_namespace"]
+        self.interval = interval
+        self.restart_delay = restart_delay
+        self.components = tuple(components)
+        self.resource_names = {
+            NOOBAA: constants.NOOBAA_RESOURCE_NAME,
+            STORAGECLUSTER: cluster_config.ENV_DATA.get("storage_cluster_name")
+            or constants.DEFAULT_CLUSTERNAME,
+        }
+        self.channel = ToolboxChannel(self.cluster_index, self.namespace)
+        self.history = deque(maxlen=history_size)
+        self._states = {}
+        # watched components whose current watch already reported the phase
+        self._live = set()
+        self._threads = []
+        self._processes = {}
+        self._listeners = []
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start the background threads
+        """
+        targets = []
+        if CEPH in self.components:
+            targets.append((CEPH, self._ceph_loop, ()))
+        for component in (NOOBAA, STORAGECLUSTER):
+            if component in self.components:
+                targets.append((component, self._watch_loop, (component,)))
+        for component, target, args in targets:
+            thread = threading.Thread(
+                target=target,
+                args=args,
+                name=f"HealthTracker-{self.cluster_index}-{component}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+        log.info(
+            f"Tracking health of {', '.join(self.components)} in namespace "
+            f"{self.namespace} on cluster index {self.cluster_index}"
+        )
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def update(self, component, value, live=True):
+        """
+        Set current health of the component, a transition is recorded if the
+        value changed
+
+        Args:
+            component (str): Tracked component
+            value (str): Current health (Ceph health output or phase)
+            live (bool): Whether the value is backed by a running watch
+
+        """
+        now = time.time()
+        transition = None
+        with self._lock:
+            current = self._states.get(component)
+            if current and current.value == value:
+                self._states[component] = current._replace(checked=now)
+            else:
+                old = current.value if current else None
+                self._states[component] = HealthState(value, now, now)
+                transition = HealthTransition(now, component, old, value)
+                self.history.append(transition)
+                log.info(f"Tracked {component} health changed: {old} -> {value}")
+            if live:
+                self._live.add(component)
+            listeners = list(self._listeners) if transition else []
+        for listener in listeners:
+            try:
+                listener(transition)
+            except Exception:
+                log.exception(f"Listener of {component} health transitions failed")
+
+    def add_listener(self, listener):
+        """
+        Call the listener on every health transition, e.g. TimeoutSampler.wake
+        to resample immediately when the health changed
+
+        Args:
+            listener (callable): Function called with the HealthTransition
+
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Args:
+            listener (callable): Listener registered by add_listener
+
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def invalidate(self, component):
+        """
+        Mark current state of the component as unknown (e.g. the watch ended)
+
+        Args:
+            component (str): Tracked component
+
+        """
+        with self._lock:
+            self._live.discard(component)
+            state = self._states.get(component)
+            if state:
+                self._states[component] = state._replace(checked=0)
+
+    def get_state(self, component, max_age=None):
+        """
+        Get tracked health of the component
+
+        Args:
+            component (str): Tracked component
+            max_age (float): Max age in seconds of the last confirmation of
+                the state, state of watched components is confirmed as long as
+                the watch runs
+
+        Returns:
+            HealthState: Current state, None if unknown or stale
+
+        """
+        with self._lock:
+            state = self._states.get(component)
+            if not state or self.stopped:
+                return None
+            if component in self._live:
+                return state._replace(checked=time.time())
+            if max_age is not None and time.time() - state.checked > max_age:
+                return None
+            return state
+
+    def get_history(self, component=None, since=None):
+        """
+        Args:
+            component (str): Return transitions of this component only
+            since (float): Unix timestamp, older transitions are skipped
+
+        Returns:
+            list: HealthTransition tuples sorted by time
+
+        """
+        with self._lock:
+            return [
+                transition
+                for transition in self.history
+                if (component is None or transition.component == component)
+                and (since is None or transition.timestamp >= since)
+            ]
+
+    def _ceph_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                rc, output = self.channel.run("ceph health detail")
+                if rc == 0 and output.strip():
+                    self.update(CEPH, output.strip(), live=False)
+                else:
+                    log.debug(f"ceph health detail failed in toolbox: {output}")
+                    self.invalidate(CEPH)
+            except Exception as ex:
+                log.debug(f"Ceph health poll failed: {ex}")
+                self.invalidate(CEPH)
+                self._stop_event.wait(self.restart_delay)
+            self._stop_event.wait(self.interval)
+        self.channel.close()
+
+    def _watch_cmd(self, component):
+        return shlex.split(
+            f"{get_oc_base_cmd(self.cluster_index, self.namespace)} get "
+            f"{component} {self.resource_names[component]} --watch "
+            '-o jsonpath={.status.phase}{"\\n"}'
+        )
+
+    def _watch_loop(self, component):
+        while not self._stop_event.is_set():
+            try:
+                process = subprocess.Popen(
+                    self._watch_cmd(component),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+                self._processes[component] = process
+                for line in iter(process.stdout.readline, ""):
+                    self.update(component, line.strip())
+                    if self._stop_event.is_set():
+                        break
+                process.wait()
+            except Exception as ex:
+                log.warning(f"Watch of {component} health failed: {ex}")
+            self.invalidate(component)
+            self._stop_event.wait(self.restart_delay)
+
+    def stop(self):
+        """
+        Stop the background threads, the history stays available
+        """
+        self._stop_event.set()
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+        for thread in self._threads:
+            thread.join(timeout=10)
+        self.channel.close()
+
+
+def start_health_tracker(cluster_index=None, namespace=None, **kwargs):
+    """
+    Start the health tracker of the cluster, no-op if it already runs
+
+    Args:
+        cluster_index (int): Multicluster index, current cluster if not specified
+        namespace (str): Namespace of the storage cluster
+        kwargs (dict): Other arguments passed to HealthTracker
+
+    Returns:
+        HealthTracker: Tracker of the cluster
+
+    """
+    cluster_index = config.cur_index if cluster_index is None else cluster_index
+    with _trackers_lock:
+        tracker = _trackers.get(cluster_index)
+        if not tracker or tracker.stopped:
+            tracker = HealthTracker(
+                cluster_index=cluster_index, namespace=namespace, **kwargs
+            )
+            _trackers[cluster_index] = tracker
+            tracker.start()
+    return tracker
+
+
+def get_health_tracker(cluster_index=None):
+    """
+    Args:
+        cluster_index (int): Multicluster index, current cluster if not specified
+
+    Returns:
+        HealthTracker: Running tracker of the cluster, None if not tracked
+
+    """
+    cluster_index = config.cur_index if cluster_index is None else cluster_index
+    tracker = _trackers.get(cluster_index)
+    if tracker and tracker.stopped:
+        return None
+    return tracker
+
+
+def stop_health_trackers():
+    """
+    Stop trackers of all clusters
+    """
+    with _trackers_lock:
+        for tracker in _trackers.values():
+            tracker.stop()
+
+
+def get_tracked_health(component, namespace=None, max_age=None):
+    """
+    Get health of the component tracked on the current cluster
+
+    Args:
+        component (str): Tracked component (CEPH, NOOBAA, STORAGECLUSTER)
+        namespace (str): Namespace of the storage cluster, the tracked state
+            is used only if the tracker follows this namespace
+        max_age (float): Max age in seconds of the tracked state, tracked
+            state is not used if not specified
+
+    Returns:
+        str: Tracked health (Ceph health output or phase), None if the
+            component is not tracked or its state is stale
+
+    """
+    if max_age is None:
+        return None
+    tracker = get_health_tracker()
+    if not tracker or (namespace and namespace != tracker.namespace):
+        return None
+    state = tracker.get_state(component, max_age=max_age)
+    return state.value if state else None
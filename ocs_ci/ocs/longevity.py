@@ -10,17 +10,21 @@ from ocs_ci.ocs import constants
 from ocs_ci.ocs.ocp import switch_to_default_rook_cluster_project
 from ocs_ci.ocs.exceptions import CommandFailed, UnsupportedWorkloadError
 from ocs_ci.utility.utils import ocsci_log_path
-from ocs_ci.ocs.scale_noobaa_lib import (
-    construct_obc_creation_yaml_bulk_for_kube_job,
-    check_all_obc_reached_bound_state_in_kube_job,
-)
+from ocs_ci.ocs.scale_noobaa_lib import construct_obc_creation_yaml_bulk_for_kube_job
 from ocs_ci.utility import templating
-from ocs_ci.ocs.scale_lib import (
-    construct_pvc_creation_yaml_bulk_for_kube_job,
-    check_all_pvc_reached_bound_state_in_kube_job,
-    check_all_pod_reached_running_state_in_kube_job,
-)
+from ocs_ci.ocs.scale_lib import construct_pvc_creation_yaml_bulk_for_kube_job
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
+from ocs_ci.ocs.stage_engine import (
+    ActionBatch,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_READY_TIMEOUT,
+    DeleteBatch,
+    ResourceBatch,
+    ResourceSnapshots,
+    StageEngine,
+    StageMetrics,
+    get_kube_job_resource_names,
+)
 from ocs_ci.ocs.pgsql import Postgresql
 from ocs_ci.ocs.couchbase import CouchBase
 from ocs_ci.ocs.cosbench import Cosbench
@@ -57,6 +61,7 @@ from ocs_ci.ocs.cluster import (
     get_percent_used_capacity,
 )
 from ocs_ci.ocs.node import (
+    get_node_inventory,
     get_node_resource_utilization_from_adm_top,
     get_node_resource_utilization_from_oc_describe,
     check_for_zombie_process_on_node,
@@ -73,6 +78,7 @@ STAGE_0_NAMESPACE = "ever-running-project"
 STAGE_2_NAMESPACE_PREFIX = "stage-2-cycle-"
 STAGE_3_NAMESPACE_PREFIX = "stage-3-cycle-"
 STAGE_4_NAMESPACE_PREFIX = "stage-4-cycle-"
+STAGE_METRICS_FILE = "stage_metrics.json"
 
 
 class Longevity(object):
@@ -95,6 +101,9 @@ class Longevity(object):
         self.pvc_count = None
         self.pod_count = None
         self.num_of_obcs = None
+        # list snapshots and throughput metrics shared by all the stages
+        self.stage_snapshots = ResourceSnapshots()
+        self.stage_metrics = StageMetrics()
 
     def construct_stage_builder_bulk_pvc_creation_yaml(self, num_of_pvcs, pvc_size):
         """
@@ -227,8 +236,209 @@ class Longevity(object):
 
         return res_yaml_dict
 
+    def wait_for_kube_job_resources(
+        self, kube_job_obj_list, namespace, kind, count=None, timeout=None
+    ):
+        """
+        Wait until the resources of the kube jobs are ready, the readiness of
+        all the kube jobs is checked from one shared list of the resources
+
+        Args:
+            kube_job_obj_list (list): List of Kube job objects
+            namespace (str): Namespace where the Kube jobs are created
+            kind (str): Kind of the resources
+            count (int): Number of resources checked in each kube job; If not
+            specified all the resources of the kube job are checked
+            timeout (int): Max time to wait for all the resources in seconds
+
+        Returns:
+            list: Names of the resources
+
+        Raises:
+            TimeoutExpiredError: If not all resources are ready in the timeout
+
+        """
+        names = [
+            name
+            for kube_job_obj in kube_job_obj_list
+            for name in get_kube_job_resource_names(kube_job_obj)[:count]
+        ]
+        return self.stage_snapshots.wait_for(
+            kind, namespace, names, timeout=timeout or DEFAULT_READY_TIMEOUT
+        )
+
+    def get_stage_engine(self, name, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Get the stage engine sharing the list snapshots and the throughput
+        metrics of this longevity run
+
+        Args:
+            name (str): Name of the stage
+            max_workers (int): Max number of batches running at once
+
+        Returns:
+            StageEngine: The stage engine
+
+        """
+        return StageEngine(
+            name,
+            max_workers=max_workers,
+            snapshots=self.stage_snapshots,
+            metrics=self.stage_metrics,
+        )
+
+    def get_all_pvc_types_batch(
+        self,
+        name,
+        num_of_pvc,
+        namespace,
+        pvc_size,
+        kube_job_name="all_pvc_job_profile",
+        depends_on=(),
+    ):
+        """
+        Batch creating PVCs of all supported types and access modes
+
+        Args:
+            name (str): Name of the batch
+            num_of_pvc(int): Bulk PVC count
+            namespace (str): Namespace where the Kube job/PVCs are to be created
+            pvc_size (str): size of all pvcs to be created with Gi suffix (e.g. 10Gi).
+            If None, random size pvc will be created
+            kube_job_name (str): Name of the kube job
+            depends_on (list): Names of the batches which have to be done first
+
+        Returns:
+            ResourceBatch: The batch
+
+        """
+
+        def create(results):
+            # Construct bulk PVC creation yaml for kube job
+            pvc_dict_list = self.construct_stage_builder_bulk_pvc_creation_yaml(
+                num_of_pvcs=num_of_pvc, pvc_size=pvc_size
+            )
+            pvc_job_file_list = self.construct_stage_builder_kube_job(
+                obj_dict_list=pvc_dict_list,
+                namespace=namespace,
+                kube_job_name=kube_job_name,
+            )
+            self.create_stage_builder_kube_job(
+                kube_job_obj_list=pvc_job_file_list, namespace=namespace
+            )
+            return pvc_job_file_list
+
+        return ResourceBatch(
+            name, constants.PVC, namespace, create, depends_on=depends_on
+        )
+
+    def get_pods_batch(
+        self, name, pvc_batch, namespace, kube_job_name="all_pods_job_profile"
+    ):
+        """
+        Batch creating a pod for each PVC of the PVC batch
+
+        Args:
+            name (str): Name of the batch
+            pvc_batch (ResourceBatch): Batch of the PVCs
+            namespace (str): Namespace where the Kube job/PODs are to be created
+            kube_job_name (str): Name of the kube job
+
+        Returns:
+            ResourceBatch: The batch
+
+        """
+
+        def create(results):
+            # Construct bulk POD creation yaml for kube job
+            pods_dict_list = self.construct_stage_builder_bulk_pod_creation_yaml(
+                pvc_list=results[pvc_batch.name].names, namespace=namespace
+            )
+            pod_job_file_list = self.construct_stage_builder_kube_job(
+                obj_dict_list=pods_dict_list,
+                namespace=namespace,
+                kube_job_name=kube_job_name,
+            )
+            self.create_stage_builder_kube_job(
+                kube_job_obj_list=pod_job_file_list, namespace=namespace
+            )
+            return pod_job_file_list
+
+        return ResourceBatch(
+            name, constants.POD, namespace, create, depends_on=[pvc_batch.name]
+        )
+
+    def get_obc_batch(
+        self,
+        name,
+        num_of_obcs,
+        namespace,
+        sc_name=constants.NOOBAA_SC,
+        kube_job_name="obc_job_profile",
+        depends_on=(),
+    ):
+        """
+        Batch creating OBCs
+
+        Args:
+            name (str): Name of the batch
+            num_of_obcs (int): Bulk obc count
+            namespace(str): Namespace uses to create bulk of obc
+            sc_name (str): storage class name using for obc creation
+            kube_job_name (str): Name of the kube job
+            depends_on (list): Names of the batches which have to be done first
+
+        Returns:
+            ResourceBatch: The batch
+
+        """
+
+        def create(results):
+            # Construct bulk OBC creation yaml for kube job
+            obc_dict_list = construct_obc_creation_yaml_bulk_for_kube_job(
+                no_of_obc=num_of_obcs,
+                sc_name=sc_name,
+                namespace=namespace,
+            )
+            obc_job_file = self.construct_stage_builder_kube_job(
+                obj_dict_list=[obc_dict_list],
+                namespace=namespace,
+                kube_job_name=kube_job_name,
+            )
+            self.create_stage_builder_kube_job(
+                kube_job_obj_list=obc_job_file, namespace=namespace
+            )
+            return obc_job_file
+
+        return ResourceBatch(
+            name, constants.OBC, namespace, create, depends_on=depends_on
+        )
+
+    def get_delete_batch(self, name, target, depends_on=()):
+        """
+        Batch deleting the resources of the target batch
+
+        Args:
+            name (str): Name of the batch
+            target (ResourceBatch): Batch of the resources to delete
+            depends_on (list): Names of other batches which have to be done
+                first
+
+        Returns:
+            DeleteBatch: The batch
+
+        """
+        return DeleteBatch(
+            name,
+            target,
+            lambda kube_jobs: self.delete_stage_builder_kube_job(
+                kube_jobs, target.namespace
+            ),
+            depends_on=depends_on,
+        )
+
     def validate_pvc_in_kube_job_reached_bound_state(
-        self, kube_job_obj_list, namespace, pvc_count, timeout=600
+        self, kube_job_obj_list, namespace, pvc_count, timeout=DEFAULT_READY_TIMEOUT
     ):
         """
         Validate PVCs in the kube job list reached BOUND state
@@ -236,39 +446,21 @@ class Longevity(object):
         Args:
             kube_job_obj_list (list): List of Kube job objects
             namespace (str): Namespace where the Kube job/PVCs are created
-            pvc_count (int): Bulk PVC count; If not specified the count will be
-            fetched from the kube job pvc yaml dict
+            pvc_count (int): Bulk PVC count; If not specified all the PVCs of
+            the kube job are checked
+            timeout (int): Max time to wait for all the PVCs in seconds
 
         Returns:
             pvc_bound_list (list): List of all PVCs in Bound state
 
         Raises:
-        AssertionError: If not all PVCs reached to Bound state
+        TimeoutExpiredError: If not all PVCs reached to Bound state
 
         """
-        pvc_bound_list_of_list = []
         log.info("validate that all the pvcs in the kube job list reached BOUND state")
-        for i in range(0, len(kube_job_obj_list)):
-            pvc_count = (
-                pvc_count
-                if pvc_count
-                else len(
-                    self.get_pvc_yaml_dict_from_kube_job_obj(
-                        kube_job_obj_list[i], namespace=namespace
-                    )
-                )
-            )
-            pvc_bound = check_all_pvc_reached_bound_state_in_kube_job(
-                kube_job_obj=kube_job_obj_list[i],
-                namespace=namespace,
-                no_of_pvc=pvc_count,
-                timeout=timeout,
-            )
-            pvc_bound_list_of_list.append(pvc_bound)
-            log.info(
-                f"Kube job : {kube_job_obj_list[i].name} -> {len(pvc_bound_list_of_list[i])} PVCs in BOUND state"
-            )
-        pvc_bound_list = [item for elem in pvc_bound_list_of_list for item in elem]
+        pvc_bound_list = self.wait_for_kube_job_resources(
+            kube_job_obj_list, namespace, constants.PVC, pvc_count, timeout
+        )
         log.info(f"All Kube jobs -> {len(pvc_bound_list)} PVCs in BOUND state")
 
         return pvc_bound_list
@@ -303,34 +495,21 @@ class Longevity(object):
             pvc_job_file_list (list): List of all PVC.yaml dicts
 
         Raises:
-        AssertionError: If not all PVCs reached Bound state
+        TimeoutExpiredError: If not all PVCs reached Bound state
 
         """
-        log.info("Creating stagebuilder pods with all pvc types and access modes")
-        # Construct bulk PVC creation yaml for kube job
-        pvc_dict_list = self.construct_stage_builder_bulk_pvc_creation_yaml(
-            num_of_pvcs=num_of_pvc, pvc_size=pvc_size
-        )
-        # Construct kube job with the pvc dict list
-        pvc_job_file_list = self.construct_stage_builder_kube_job(
-            obj_dict_list=pvc_dict_list,
-            namespace=namespace,
-            kube_job_name=kube_job_name,
-        )
-        # Create stage builder for PVC kube job
-        self.create_stage_builder_kube_job(
-            kube_job_obj_list=pvc_job_file_list, namespace=namespace
-        )
-        # Wait 60 secs to ensure the PVC on the list has status field populated
-        time.sleep(60)
-        # Validate PVCs in kube job reached BOUND state
-        self.validate_pvc_in_kube_job_reached_bound_state(
-            kube_job_obj_list=pvc_job_file_list,
-            namespace=namespace,
-            pvc_count=num_of_pvc,
+        log.info("Creating stagebuilder pvcs with all pvc types and access modes")
+        engine = self.get_stage_engine(kube_job_name)
+        pvc_batch = engine.add(
+            self.get_all_pvc_types_batch(
+                "pvc", num_of_pvc, namespace, pvc_size, kube_job_name=kube_job_name
+            )
         )
+        # PVCs without populated status are not Bound yet, no need to sleep
+        # before the validation
+        results = engine.run()
 
-        return pvc_job_file_list
+        return results[pvc_batch.name].kube_jobs
 
     def get_pvc_bound_list(self, pvc_job_file_list, namespace, pvc_count):
         """
@@ -399,41 +578,30 @@ class Longevity(object):
         return [pods_dict_list]
 
     def validate_pods_in_kube_job_reached_running_state(
-        self, kube_job_obj, namespace, pod_count=None, timeout=60
+        self, kube_job_obj, namespace, pod_count=None, timeout=DEFAULT_READY_TIMEOUT
     ):
         """
         Validate PODs in the kube job list reached RUNNING state
 
         Args:
-            kube_job_obj_list (list): List of Kube job objects
+            kube_job_obj (obj): Kube job object
             namespace (str): Namespace where the Kube job/PVCs are created
-            pod_count (int): Bulk PODs count; If not specified the count will be
-            fetched from the kube job pod yaml dict
+            pod_count (int): Bulk PODs count; If not specified all the PODs of
+            the kube job are checked
+            timeout (int): Max time to wait for all the PODs in seconds
 
         Returns:
             running_pods_list (list): List of all PODs in RUNNING state
 
         Raises:
-        AssertionError: If not all PODs reached to Running state
+        TimeoutExpiredError: If not all PODs reached to Running state
 
         """
         log.info(
             "validate that all the pods in the kube job list reached RUNNING state"
         )
-        pod_count = (
-            pod_count
-            if pod_count
-            else len(
-                self.get_resource_yaml_dict_from_kube_job_obj(
-                    kube_job_obj, namespace=namespace, resource_name="POD"
-                )
-            )
-        )
-        running_pods_list = check_all_pod_reached_running_state_in_kube_job(
-            kube_job_obj=kube_job_obj,
-            namespace=namespace,
-            no_of_pod=pod_count,
-            timeout=timeout,
+        running_pods_list = self.wait_for_kube_job_resources(
+            [kube_job_obj], namespace, constants.POD, pod_count, timeout
         )
         log.info(f"Total number of PODs in Running state: {len(running_pods_list)}")
 
@@ -472,37 +640,21 @@ class Longevity(object):
              pod_pvc_job_file_list (list): List of all POD.yaml and PVC.yaml dicts
 
         """
-        # Create stage builder PVCs of all supported types and access modes
-        pvc_job_file_list = self.create_stagebuilder_all_pvc_types(
-            num_of_pvc=num_of_pvc,
-            namespace=namespace,
-            pvc_size=pvc_size,
-            kube_job_name=pvc_kube_job_name,
-        )
-        pvc_bound_list = self.get_pvc_bound_list(
-            pvc_job_file_list=pvc_job_file_list,
-            namespace=namespace,
-            pvc_count=num_of_pvc,
-        )
-        # Construct bulk POD creation yaml for kube job
-        pods_dict_list = self.construct_stage_builder_bulk_pod_creation_yaml(
-            pvc_list=pvc_bound_list, namespace=namespace
-        )
-        # Construct kube job with the pods dict list
-        pod_job_file_list = self.construct_stage_builder_kube_job(
-            obj_dict_list=pods_dict_list,
-            namespace=namespace,
-            kube_job_name=pod_kube_job_name,
+        engine = self.get_stage_engine(pod_kube_job_name)
+        pvc_batch = engine.add(
+            self.get_all_pvc_types_batch(
+                "pvc", num_of_pvc, namespace, pvc_size, kube_job_name=pvc_kube_job_name
+            )
         )
-        # Create stage builder for POD kube job
-        self.create_stage_builder_kube_job(
-            kube_job_obj_list=pod_job_file_list, namespace=namespace
+        pod_batch = engine.add(
+            self.get_pods_batch(
+                "pod", pvc_batch, namespace, kube_job_name=pod_kube_job_name
+            )
         )
-        # Validate PODs in kube job reached RUNNING state
-        self.validate_pods_in_kube_job_reached_running_state(
-            kube_job_obj=pod_job_file_list[0], namespace=namespace
+        results = engine.run()
+        pod_pvc_job_file_list = (
+            results[pod_batch.name].kube_jobs + results[pvc_batch.name].kube_jobs
         )
-        pod_pvc_job_file_list = pod_job_file_list + pvc_job_file_list
 
         return pod_pvc_job_file_list
 
@@ -530,33 +682,22 @@ class Longevity(object):
 
         """
         log.info("Creating stagebuilder OBCs")
-        # Construct bulk OBC creation yaml for kube job
-        obc_dict_list = construct_obc_creation_yaml_bulk_for_kube_job(
-            no_of_obc=num_of_obcs,
-            sc_name=sc_name,
-            namespace=namespace,
-        )
-        # Construct kube job with the OBCs dict list
-        obc_job_file = self.construct_stage_builder_kube_job(
-            obj_dict_list=[obc_dict_list],
-            namespace=namespace,
-            kube_job_name=obc_kube_job_name,
-        )
-        # Create stage builder for OBC kube job
-        self.create_stage_builder_kube_job(
-            kube_job_obj_list=obc_job_file, namespace=namespace
-        )
-        # Validate OBCs in kube job reached BOUND state
-        self.validate_obcs_in_kube_job_reached_running_state(
-            kube_job_obj=obc_job_file[0],
-            namespace=namespace,
-            num_of_obc=num_of_obcs,
+        engine = self.get_stage_engine(obc_kube_job_name)
+        obc_batch = engine.add(
+            self.get_obc_batch(
+                "obc",
+                num_of_obcs,
+                namespace,
+                sc_name=sc_name,
+                kube_job_name=obc_kube_job_name,
+            )
         )
+        obc_job_file = engine.run()[obc_batch.name].kube_jobs
 
         return obc_job_file
 
     def validate_obcs_in_kube_job_reached_running_state(
-        self, kube_job_obj, namespace, num_of_obc
+        self, kube_job_obj, namespace, num_of_obc, timeout=DEFAULT_READY_TIMEOUT
     ):
         """
         Validate that OBCs in the kube job list reached BOUND state
@@ -564,31 +705,20 @@ class Longevity(object):
         Args:
             kube_job_obj (obj): Kube Job Object
             namespace (str): Namespace of OBC's created
-            num_of_obc (int): Bulk OBCs count; If not specified the count will be
-            fetched from the kube job obc yaml dict
+            num_of_obc (int): Bulk OBCs count; If not specified all the OBCs of
+            the kube job are checked
+            timeout (int): Max time to wait for all the OBCs in seconds
 
         Returns:
             obc_bound_list (list): List of all OBCs which is in Bound state.
 
         Raises:
-            AssertionError: If not all OBC reached to Bound state
+            TimeoutExpiredError: If not all OBC reached to Bound state
 
         """
         log.info("validate that all the OBCs in the kube job list reached BOUND state")
-        num_of_obc = (
-            num_of_obc
-            if num_of_obc
-            else len(
-                self.get_resource_yaml_dict_from_kube_job_obj(
-                    kube_job_obj, namespace=namespace, resource_name="OBC"
-                )
-            )
-        )
-        # Check all the OBCs to reach Bound state
-        obc_bound_list = check_all_obc_reached_bound_state_in_kube_job(
-            kube_job_obj=kube_job_obj,
-            namespace=namespace,
-            no_of_obc=num_of_obc,
+        obc_bound_list = self.wait_for_kube_job_resources(
+            [kube_job_obj], namespace, constants.OBC, num_of_obc, timeout
         )
         log.info(f"Number of OBCs in Bound state {len(obc_bound_list)}")
 
@@ -659,13 +789,15 @@ class Longevity(object):
                 "adm_top_nodes_res_util"
             ] = res_util_list
             # Get the cpu and memory from describe of nodes
+            # one snapshot of the nodes and pods serves both node types
+            inventory = get_node_inventory()
             master_describe_dict_out = get_node_resource_utilization_from_oc_describe(
-                node_type="master", print_table=True
+                node_type="master", print_table=True, inventory=inventory
             )
             res_util_list.clear()
             res_util_list.append(master_describe_dict_out)
             worker_describe_dict_out = get_node_resource_utilization_from_oc_describe(
-                node_type="worker", print_table=True
+                node_type="worker", print_table=True, inventory=inventory
             )
             res_util_list.append(worker_describe_dict_out)
             cluster_sanity_check_dict["resource_utilization"][
@@ -723,6 +855,16 @@ class Longevity(object):
                 for key2, value in cluster_sanity_out_dict[key1].items():
                     f.write(f"{key2} : {value}\n\n")
 
+    def write_stage_metrics(self):
+        """
+        Write throughput and latency of the stage batches of all the cycles
+        into the cluster sanity outputs directory
+        """
+        Path(self.cluster_sanity_check_dir).mkdir(parents=True, exist_ok=True)
+        self.stage_metrics.write(
+            os.path.join(self.cluster_sanity_check_dir, STAGE_METRICS_FILE)
+        )
+
     def stage_0(
         self, num_of_pvc, num_of_obc, pvc_size, namespace=None, ignore_teardown=True
     ):
@@ -884,6 +1026,7 @@ class Longevity(object):
         collect_cluster_sanity_checks=True,
         delay=60,
         run_time=1440,
+        max_workers=5,
     ):
         """
         Concurrent bulk operations of following
@@ -903,6 +1046,7 @@ class Longevity(object):
             collect_cluster_sanity_checks (bool): If True, collects the cluster level sanity checks
             delay (int): Delay in seconds before starting the next cycle
             run_time (int): The amount of time the particular stage has to run (in minutes)
+            max_workers (int): Max number of resource batches created or deleted at once
 
         """
         end_time = datetime.now() + timedelta(minutes=run_time)
@@ -923,71 +1067,102 @@ class Longevity(object):
             log.info(
                 "Creating the initial resources required for PVC/OBC/POD deletion operations concurrently"
             )
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                resource_to_delete = [
-                    executor.submit(
-                        self.create_stagebuilder_all_pvc_types,
+            engine = self.get_stage_engine("stage3", max_workers=max_workers)
+            # resources created for the deletion operations
+            initial_batches = [
+                engine.add(
+                    self.get_all_pvc_types_batch(
+                        "delete-pvc",
                         num_of_pvc,
                         namespace,
                         pvc_size,
                         kube_job_name="delete_all_pvc_job_profile",
-                    ),
-                    executor.submit(
-                        self.create_stagebuilder_obc,
+                    )
+                ),
+                engine.add(
+                    self.get_obc_batch(
+                        "delete-obc",
                         num_of_obc,
                         namespace,
-                        obc_kube_job_name="delete_obc_job_profile",
-                    ),
-                    executor.submit(
-                        self.create_stagebuilder_pods_with_all_pvc_types,
+                        kube_job_name="delete_obc_job_profile",
+                    )
+                ),
+                engine.add(
+                    self.get_all_pvc_types_batch(
+                        "delete-pod-pvc",
                         num_of_pvc,
                         namespace,
                         pvc_size,
-                        pvc_kube_job_name="delete_all_pvc_for_pod_attach_job_profile",
-                        pod_kube_job_name="delete_all_pods_job_profile",
-                    ),
-                ]
-                # waiting for the resource thread to complete
-                log.info("Waiting for the resource to delete thread to complete")
-                resource_to_delete_job_file = [
-                    resource.result() for resource in resource_to_delete
-                ]
-
-                log.info(
-                    "Starting concurrent bulk creation and deletion requests of PVC, OBC and APP pod"
+                        kube_job_name="delete_all_pvc_for_pod_attach_job_profile",
+                    )
+                ),
+            ]
+            initial_batches.append(
+                engine.add(
+                    self.get_pods_batch(
+                        "delete-pod",
+                        initial_batches[-1],
+                        namespace,
+                        kube_job_name="delete_all_pods_job_profile",
+                    )
                 )
-                bulk_create_delete = [
-                    executor.submit(
-                        self.create_stagebuilder_all_pvc_types,
+            )
+            initial_names = [batch.name for batch in initial_batches]
+            # concurrent bulk creation and deletion, started once all the
+            # initial resources are ready
+            bulk_batches = [
+                engine.add(
+                    self.get_all_pvc_types_batch(
+                        "create-pvc",
                         num_of_pvc,
                         namespace,
                         pvc_size,
-                    ),
-                    executor.submit(
-                        self.create_stagebuilder_obc, num_of_obc, namespace
-                    ),
-                    executor.submit(
-                        self.create_stagebuilder_pods_with_all_pvc_types,
+                        depends_on=initial_names,
+                    )
+                ),
+                engine.add(
+                    self.get_obc_batch(
+                        "create-obc", num_of_obc, namespace, depends_on=initial_names
+                    )
+                ),
+                engine.add(
+                    self.get_all_pvc_types_batch(
+                        "create-pod-pvc",
                         num_of_pvc,
                         namespace,
                         pvc_size,
-                    ),
-                ]
-                for job_file in resource_to_delete_job_file:
-                    executor.submit(
-                        self.delete_stage_builder_kube_job, job_file, namespace
+                        kube_job_name="all_pvc_for_pod_attach_job_profile",
+                        depends_on=initial_names,
                     )
-
-                # waiting for the bulk create delete thread to complete
-                log.info("Waiting for the bulk create delete thread to complete")
-                bulk_create_delete_job_file = [
-                    thread.result() for thread in bulk_create_delete
-                ]
-                # Delete all the created resources in the bulk create delete thread
-                for job_file in bulk_create_delete_job_file:
-                    executor.submit(
-                        self.delete_stage_builder_kube_job, job_file, namespace
+                ),
+            ]
+            bulk_batches.append(
+                engine.add(
+                    self.get_pods_batch("create-pod", bulk_batches[-1], namespace)
+                )
+            )
+            # pods are deleted before their PVCs
+            for batches in (initial_batches, bulk_batches):
+                pod_batch = batches[-1]
+                delete_pod = engine.add(
+                    self.get_delete_batch(
+                        f"{pod_batch.name}-delete", pod_batch, depends_on=initial_names
+                    )
+                )
+                for batch in batches[:-1]:
+                    engine.add(
+                        self.get_delete_batch(
+                            f"{batch.name}-delete",
+                            batch,
+                            depends_on=initial_names
+                            + ([delete_pod.name] if batch is batches[-2] else []),
+                        )
                     )
+            log.info(
+                "Starting concurrent bulk creation and deletion requests of PVC, OBC and APP pod"
+            )
+            engine.run(iteration=cycle_count)
+            self.write_stage_metrics()
 
             log.info(
                 f"##############[COMPLETED STAGE3 CYCLE:{cycle_count}]####################"
@@ -1097,70 +1272,63 @@ class Longevity(object):
                         f"PVCs and PODs for operation:{operation} were successfully created + {fio_percentage}% FIO."
                     )
 
-                if not concurrent:
-                    cloned_pvcs, cloned_pod_objs = multi_pvc_clone_factory(
-                        pvc_obj=operation_pvc_dict["clone"],
-                        wait_each=True,
-                        attach_pods=True,
-                        verify_data_integrity=True,
-                        file_name=file_name,
-                    )
-
-                    (
-                        restored_pvc_objs,
-                        restored_pod_objs,
-                    ) = create_restore_verify_snapshots(
-                        multi_snapshot_factory,
-                        snapshot_restore_factory,
-                        pod_factory,
-                        operation_pvc_dict["snapshot"],
-                        namespace,
-                        file_name,
-                    )
-
-                    expand_verify_pvcs(
-                        operation_pvc_dict["expand"],
-                        operation_pod_dict["expand"],
-                        pvc_size_new,
-                        file_name,
-                        fio_size,
-                    )
-
-                else:
-                    stage4_executor1 = ThreadPoolExecutor(max_workers=1)
-                    stage4_thread1 = stage4_executor1.submit(
-                        multi_pvc_clone_factory,
-                        pvc_obj=operation_pvc_dict["clone"],
-                        wait_each=True,
-                        attach_pods=True,
-                        verify_data_integrity=True,
-                        file_name=file_name,
+                # sequential operations run one after another by one worker
+                engine = self.get_stage_engine(
+                    f"stage4-{current_ops.lower()}",
+                    max_workers=3 if concurrent else 1,
+                )
+                clone_batch = engine.add(
+                    ActionBatch(
+                        "clone",
+                        lambda results: multi_pvc_clone_factory(
+                            pvc_obj=operation_pvc_dict["clone"],
+                            wait_each=True,
+                            attach_pods=True,
+                            verify_data_integrity=True,
+                            file_name=file_name,
+                        ),
+                        kind=constants.PVC,
+                        count=num_of_pvcs,
+                        operation="clone",
                     )
-
-                    stage4_executor2 = ThreadPoolExecutor(max_workers=1)
-                    stage4_thread2 = stage4_executor2.submit(
-                        create_restore_verify_snapshots,
-                        multi_snapshot_factory,
-                        snapshot_restore_factory,
-                        pod_factory,
-                        operation_pvc_dict["snapshot"],
-                        namespace,
-                        file_name,
+                )
+                snapshot_batch = engine.add(
+                    ActionBatch(
+                        "snapshot",
+                        lambda results: create_restore_verify_snapshots(
+                            multi_snapshot_factory,
+                            snapshot_restore_factory,
+                            pod_factory,
+                            operation_pvc_dict["snapshot"],
+                            namespace,
+                            file_name,
+                        ),
+                        kind=constants.PVC,
+                        count=num_of_pvcs,
+                        operation="snapshot-restore",
                     )
-
-                    stage4_executor3 = ThreadPoolExecutor(max_workers=1)
-                    stage4_thread3 = stage4_executor3.submit(
-                        expand_verify_pvcs,
-                        operation_pvc_dict["expand"],
-                        operation_pod_dict["expand"],
-                        pvc_size_new,
-                        file_name,
-                        fio_size,
+                )
+                engine.add(
+                    ActionBatch(
+                        "expand",
+                        lambda results: expand_verify_pvcs(
+                            operation_pvc_dict["expand"],
+                            operation_pod_dict["expand"],
+                            pvc_size_new,
+                            file_name,
+                            fio_size,
+                        ),
+                        kind=constants.PVC,
+                        count=num_of_pvcs,
+                        operation="expand",
                     )
-
-                    cloned_pvcs, cloned_pod_objs = stage4_thread1.result()
-                    restored_pvc_objs, restored_pod_objs = stage4_thread2.result()
-                    stage4_thread3.result()
+                )
+                results = engine.run(iteration=cycle_no)
+                self.write_stage_metrics()
+                cloned_pvcs, cloned_pod_objs = results[clone_batch.name].value
+                restored_pvc_objs, restored_pod_objs = results[
+                    snapshot_batch.name
+                ].value
 
                 total_pvcs = (
                     operation_pvc_dict["clone"]
@@ -29,6 +29,8 @@ from ocs_ci.ocs.exceptions import (
     NotFoundError,
 )
 from ocs_ci.ocs.machinepool import MachinePools
+from ocs_ci.ocs import node_inventory
+from ocs_ci.ocs.node_inventory import filter_nodes_by_type, get_node_inventory
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs import constants, exceptions, ocp, defaults
@@ -355,15 +357,13 @@ def wait_for_nodes_status(
                     break
         nodes_not_in_state = copy.deepcopy(node_names)
         log.info(f"Waiting for nodes {node_names} to reach status {status}")
+        # the status of every node is derived from one list of the nodes per
+        # attempt, instead of 'oc get node' per node
         for sample in TimeoutSampler(timeout, sleep, get_node_objs, nodes_not_in_state):
             for node in sample:
-                try:
-                    if node.ocp.get_resource_status(node.name) == status:
-                        log.info(f"Node {node.name} reached status {status}")
-                        nodes_not_in_state.remove(node.name)
-                except CommandFailed as ex:
-                    log.info(f"failed to get the node status by error {ex}")
-                    continue
+                if node_inventory.get_node_status(node.data) == status:
+                    log.info(f"Node {node.name} reached status {status}")
+                    nodes_not_in_state.remove(node.name)
             if not nodes_not_in_state:
                 break
         log.info(f"The following nodes reached status {status}: {node_names}")
@@ -804,40 +804,32 @@ def get_node_resource_utilization_from_adm_top(
 
 
 def get_node_resource_utilization_from_oc_describe(
-    nodename=None, node_type=constants.WORKER_MACHINE, print_table=False
+    nodename=None, node_type=constants.WORKER_MACHINE, print_table=False, inventory=None
 ):
     """
-    Gets the node's cpu and memory utilization in percentage using oc describe node
+    Gets the node's cpu and memory utilization in percentage, the requested
+    resources as reported by oc describe node. Derived for all the nodes from
+    one node list and one pod list (see node_inventory).
 
     Args:
         nodename (str) : The node name
         node_type (str) : The node type (e.g. master, worker)
+        print_table (bool): True to log the utilization table
+        inventory (dict): Node inventory (see get_node_inventory) to use
+            instead of collecting a new one
 
     Returns:
         dict : Node name and its cpu and memory utilization in
                percentage
 
     """
-
-    node_names = (
-        [nodename]
-        if nodename
-        else [node.name for node in get_nodes(node_type=node_type)]
-    )
-    obj = ocp.OCP()
-    utilization_dict = {}
-    for node in node_names:
-        output = obj.exec_oc_cmd(
-            command=f"describe node {node}", out_yaml_format=False
-        ).split("\n")
-        for line in output:
-            if "cpu  " in line:
-                cpu_data = line.split(" ")
-                cpu = re.findall(r"\d+", [i for i in cpu_data if i][2])
-            if "memory  " in line:
-                mem_data = line.split(" ")
-                mem = re.findall(r"\d+", [i for i in mem_data if i][2])
-        utilization_dict[node] = {"cpu": int(cpu[0]), "memory": int(mem[0])}
+    if inventory is None:
+        inventory = get_node_inventory([nodename] if nodename else None)
+    node_names = [nodename] if nodename else filter_nodes_by_type(inventory, node_type)
+    utilization_dict = {
+        node: {"cpu": inventory[node]["cpu"], "memory": inventory[node]["memory"]}
+        for node in node_names
+    }
 
     if print_table:
         print_table_node_resource_utilization(
@@ -852,37 +844,26 @@ def get_node_resource_utilization_from_oc_describe(
     return utilization_dict
 
 
-def get_running_pod_count_from_node(nodename=None, node_type=constants.WORKER_MACHINE):
+def get_running_pod_count_from_node(
+    nodename=None, node_type=constants.WORKER_MACHINE, inventory=None
+):
     """
-    Gets the node running pod count using oc describe node
+    Gets the node non-terminated pod count, as reported by oc describe node
 
     Args:
         nodename (str) : The node name
         node_type (str) : The node type (e.g. master, worker)
+        inventory (dict): Node inventory (see get_node_inventory) to use
+            instead of collecting a new one
 
     Returns:
         dict : Node name and its pod_count
 
     """
-
-    node_names = (
-        [nodename]
-        if nodename
-        else [node.name for node in get_nodes(node_type=node_type)]
-    )
-    obj = ocp.OCP()
-    pod_count_dict = {}
-    for node in node_names:
-        output = obj.exec_oc_cmd(
-            command=f"describe node {node}", out_yaml_format=False
-        ).split("\n")
-        for line in output:
-            if "Non-terminated Pods:  " in line:
-                count_line = line.split(" ")
-                pod_count = re.findall(r"\d+", [i for i in count_line if i][2])
-        pod_count_dict[node] = int(pod_count[0])
-
-    return pod_count_dict
+    if inventory is None:
+        inventory = get_node_inventory([nodename] if nodename else None)
+    node_names = [nodename] if nodename else filter_nodes_by_type(inventory, node_type)
+    return {node: inventory[node]["pod_count"] for node in node_names}
 
 
 def print_table_node_resource_utilization(utilization_dict, field_names):
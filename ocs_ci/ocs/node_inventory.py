@@ -0,0 +1,266 @@
+"""
+Node inventory collected from one node list and one pod list.
+
+'oc describe node' is executed per node and reads the pods of the node, so
+utilization tables, pod counts and status waits of 20-100 node clusters
+cost hundreds of commands per check. The inventory derives the same data for
+all the nodes from one 'oc get nodes' and one 'oc get pods -A' of the
+non-terminated pods:
+
+ * roles and status as shown by 'oc get nodes' (e.g. 'Ready,SchedulingDisabled')
+ * conditions and taints
+ * allocatable CPU (millicores) and memory (bytes)
+ * CPU and memory requested by the pods of the node and their percentage of
+   the allocatable resources, computed the same way as 'oc describe node'
+ * number of non-terminated pods
+"""
+
+import logging
+import re
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+
+log = logging.getLogger(__name__)
+
+ROLE_LABEL_PREFIX = "node-role.kubernetes.io/"
+# pods in these phases are not counted by 'oc describe node' either
+NON_TERMINATED_PODS_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+
+QUANTITY_SUFFIXES = {
+    "": 1,
+    "m": 10**-3,
+    "k": 10**3,
+    "M": 10**6,
+    "G": 10**9,
+    "T": 10**12,
+    "P": 10**15,
+    "E": 10**18,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+    "Pi": 2**50,
+    "Ei": 2**60,
+}
+QUANTITY_PATTERN = re.compile(r"^([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)([a-zA-Z]*)$")
+
+
+def parse_quantity(quantity):
+    """
+    Parse the Kubernetes resource quantity
+
+    Args:
+        quantity (str or int): Quantity, e.g. '500m', '4', '16Gi', '1e3'
+
+    Returns:
+        float: Value of the quantity in base units (cores, bytes)
+
+    Raises:
+        ValueError: If the quantity is not valid
+
+    """
+    match = QUANTITY_PATTERN.match(str(quantity).strip())
+    if not match or match.group(2) not in QUANTITY_SUFFIXES:
+        raise ValueError(f"Invalid resource quantity: {quantity}")
+    return float(match.group(1)) * QUANTITY_SUFFIXES[match.group(2)]
+
+
+def get_pod_requests(pod_dict):
+    """
+    Resources requested by the pod the same way as 'oc describe node' counts
+    them: max of the sum of the containers and of any init container, plus
+    the pod overhead
+
+    Args:
+        pod_dict (dict): Pod resource
+
+    Returns:
+        tuple: Requested CPU in millicores and memory in bytes
+
+    """
+    spec = pod_dict.get("spec", {})
+
+    def get_requests(containers):
+        return [
+            (
+                parse_quantity(requests.get("cpu", 0)) * 1000,
+                parse_quantity(requests.get("memory", 0)),
+            )
+            for requests in (
+                (container.get("resources") or {}).get("requests") or {}
+                for container in containers
+            )
+        ]
+
+    containers = get_requests(spec.get("containers", []))
+    init_containers = get_requests(spec.get("initContainers", []))
+    overhead = spec.get("overhead") or {}
+    cpu = max([sum(cpu for cpu, _ in containers)] + [cpu for cpu, _ in init_containers])
+    memory = max(
+        [sum(memory for _, memory in containers)]
+        + [memory for _, memory in init_containers]
+    )
+    cpu += parse_quantity(overhead.get("cpu", 0)) * 1000
+    memory += parse_quantity(overhead.get("memory", 0))
+    return cpu, memory
+
+
+def get_node_roles(node_dict):
+    """
+    Args:
+        node_dict (dict): Node resource
+
+    Returns:
+        list: Roles of the node as in ROLES column of 'oc get nodes'
+
+    """
+    labels = node_dict.get("metadata", {}).get("labels") or {}
+    roles = {
+        label[len(ROLE_LABEL_PREFIX) :]
+        for label in labels
+        if label.startswith(ROLE_LABEL_PREFIX) and label != ROLE_LABEL_PREFIX
+    }
+    if labels.get("kubernetes.io/role"):
+        roles.add(labels["kubernetes.io/role"])
+    return sorted(roles)
+
+
+def get_node_status(node_dict):
+    """
+    Args:
+        node_dict (dict): Node resource
+
+    Returns:
+        str: Status of the node as in STATUS column of 'oc get nodes', e.g.
+            'Ready', 'NotReady' or 'Ready,SchedulingDisabled'
+
+    """
+    statuses = [
+        constants.NODE_READY if condition.get("status") == "True" else "NotReady"
+        for condition in node_dict.get("status", {}).get("conditions", [])
+        if condition.get("type") == "Ready"
+    ]
+    if not statuses:
+        statuses = ["Unknown"]
+    if node_dict.get("spec", {}).get("unschedulable"):
+        statuses.append("SchedulingDisabled")
+    return ",".join(statuses)
+
+
+def get_node_info(node_dict, pod_dicts=None):
+    """
+    Summary of the node
+
+    Args:
+        node_dict (dict): Node resource
+        pod_dicts (list): Non-terminated pods of the node, the requested
+            resources and pod count are not computed if None
+
+    Returns:
+        dict: name, roles, status, conditions (type -> status), taints,
+            allocatable_cpu (millicores), allocatable_memory (bytes) and
+            with the pods also requested_cpu, requested_memory, cpu and
+            memory (requested percentage of the allocatable, as an integer)
+            and pod_count
+
+    """
+    allocatable = node_dict.get("status", {}).get("allocatable", {})
+    info = {
+        "name": node_dict["metadata"]["name"],
+        "roles": get_node_roles(node_dict),
+        "status": get_node_status(node_dict),
+        "conditions": {
+            condition["type"]: condition.get("status")
+            for condition in node_dict.get("status", {}).get("conditions", [])
+        },
+        "taints": node_dict.get("spec", {}).get("taints", []),
+        "allocatable_cpu": parse_quantity(allocatable.get("cpu", 0)) * 1000,
+        "allocatable_memory": parse_quantity(allocatable.get("memory", 0)),
+    }
+    if pod_dicts is None:
+        return info
+    requests = [get_pod_requests(pod_dict) for pod_dict in pod_dicts]
+    info["requested_cpu"] = sum(cpu for cpu, _ in requests)
+    info["requested_memory"] = sum(memory for _, memory in requests)
+    for resource in ("cpu", "memory"):
+        allocatable_value = info[f"allocatable_{resource}"]
+        # truncated to integer as by 'oc describe node'
+        info[resource] = (
+            int(info[f"requested_{resource}"] * 100 / allocatable_value)
+            if allocatable_value
+            else 0
+        )
+    info["pod_count"] = len(pod_dicts)
+    return info
+
+
+def get_node_inventory(node_names=None, include_pods=True):
+    """
+    Collect the inventory of the nodes by one node list and one pod list
+
+    Args:
+        node_names (list): Names of the nodes, all the nodes if None
+        include_pods (bool): False to skip the pod list, the inventory then
+            doesn't contain requested resources and pod counts
+
+    Returns:
+        dict: Node name -> node info (see get_node_info)
+
+    """
+    node_dicts = OCP(kind=constants.NODE).get()["items"]
+    if node_names:
+        node_dicts = [
+            node_dict
+            for node_dict in node_dicts
+            if node_dict["metadata"]["name"] in node_names
+        ]
+    pods_by_node = None
+    if include_pods:
+        pods_by_node = {node_dict["metadata"]["name"]: [] for node_dict in node_dicts}
+        pod_dicts = OCP(kind=constants.POD).get(
+            all_namespaces=True, field_selector=NON_TERMINATED_PODS_SELECTOR
+        )["items"]
+        for pod_dict in pod_dicts:
+            node_name = pod_dict.get("spec", {}).get("nodeName")
+            if node_name in pods_by_node:
+                pods_by_node[node_name].append(pod_dict)
+    return {
+        node_dict["metadata"]["name"]: get_node_info(
+            node_dict,
+            (
+                None
+                if pods_by_node is None
+                else pods_by_node[node_dict["metadata"]["name"]]
+            ),
+        )
+        for node_dict in node_dicts
+    }
+
+
+def filter_nodes_by_type(inventory, node_type=constants.WORKER_MACHINE):
+    """
+    Select the nodes of the type the same way as node.get_nodes does
+
+    Args:
+        inventory (dict): Node name -> node info
+        node_type (str): The node type (e.g. worker, master)
+
+    Returns:
+        list: Names of the nodes of the type
+
+    """
+    from ocs_ci.ocs.cluster import is_hci_provider_cluster
+
+    excluded_roles = set()
+    if node_type == constants.WORKER_MACHINE:
+        if config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
+            excluded_roles.add(constants.INFRA_MACHINE)
+        if is_hci_provider_cluster():
+            excluded_roles.add(constants.MASTER_MACHINE)
+    return [
+        name
+        for name, info in inventory.items()
+        if node_type in info["roles"] and not excluded_roles & set(info["roles"])
+    ]
@@ -22,11 +22,15 @@ from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
 )
 from ocs_ci.utility.proxy import update_kubeconfig_with_proxy_url_for_client
+from ocs_ci.utility.cluster_facts import (
+    cluster_facts_bypass,
+    invalidate_cluster_facts,
+)
 from ocs_ci.utility.retry import retry, catch_exceptions
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
 from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
-from ocs_ci.utility import version
+from ocs_ci.utility import call_stats, version
 from ocs_ci.ocs import constants
 from ocs_ci.framework import config
 
@@ -216,30 +220,33 @@ class OCP(object):
             command += " --insecure-skip-tls-verify"
 
         oc_cmd += command
-        out = run_cmd(
-            cmd=oc_cmd,
-            secrets=secrets,
-            timeout=timeout,
-            ignore_error=ignore_error,
-            threading_lock=self.threading_lock,
-            silent=silent,
-            cluster_config=cluster_config,
-            output_file=output_file,
-            **kwargs,
-        )
+        with call_stats.measure("oc", command) as call:
+            out = run_cmd(
+                cmd=oc_cmd,
+                secrets=secrets,
+                timeout=timeout,
+                ignore_error=ignore_error,
+                threading_lock=self.threading_lock,
+                silent=silent,
+                cluster_config=cluster_config,
+                output_file=output_file,
+                **kwargs,
+            )
+            call.output_bytes = len(out)
 
-        try:
-            if out.startswith("hints = "):
-                out = out[out.index("{") :]
-        except ValueError:
-            pass
+            try:
+                if out.startswith("hints = "):
+                    out = out[out.index("{") :]
+            except ValueError:
+                pass
 
-        if original_context is not None:
-            config.switch_ctx(original_context)
+            if original_context is not None:
+                config.switch_ctx(original_context)
 
-        if out_yaml_format:
-            return yaml.load(out, Loader=yaml.CSafeLoader)
-        return out
+            if out_yaml_format:
+                with call.parsing():
+                    return yaml.load(out, Loader=yaml.CSafeLoader)
+            return out
 
     @retry(CommandFailed, tries=3, delay=30, backoff=1)
     def exec_oc_debug_cmd(
@@ -283,14 +290,15 @@ class OCP(object):
             f"debug nodes/{node} --to-namespace={namespace} "
             f' -- {root_option} "{cmd}"'
         )
-        out = str(
-            self.exec_oc_cmd(
-                command=debug_cmd,
-                out_yaml_format=False,
-                timeout=timeout,
-                secrets=secrets,
+        with call_stats.measure("oc_debug", cmd_list[0] if cmd_list else ""):
+            out = str(
+                self.exec_oc_cmd(
+                    command=debug_cmd,
+                    out_yaml_format=False,
+                    timeout=timeout,
+                    secrets=secrets,
+                )
             )
-        )
         if err_msg in out:
             raise CommandFailed
         else:
@@ -309,6 +317,7 @@ class OCP(object):
         field_selector=None,
         cluster_config=None,
         skip_tls_verify=False,
+        output=None,
     ):
         """
         Get command - 'oc get <resource>'
@@ -324,12 +333,15 @@ class OCP(object):
             field_selector (str): Selector (field query) to filter on, supports
                 '=', '==', and '!='. (e.g. status.phase=Running)
             skip_tls_verify (bool): Adding '--insecure-skip-tls-verify' to oc command
+            output (str): Output format passed to '-o' instead of yaml (e.g.
+                'name' or 'jsonpath=...'), the raw output is returned
 
         Example:
             get('my-pv1')
 
         Returns:
             dict: Dictionary represents a returned yaml file
+            str: Raw output of the command when output is used
             None: Incase dont_raise is True and get is not found
 
         """
@@ -350,16 +362,19 @@ class OCP(object):
         elif self.namespace:
             command += f" -n {self.namespace}"
         if selector is not None:
-            command += f" --selector={selector}"
+            command += f" --selector={shlex.quote(selector)}"
         if field_selector is not None:
-            command += f" --field-selector={field_selector}"
-        if out_yaml_format:
+            command += f" --field-selector={shlex.quote(field_selector)}"
+        if output:
+            command += f" -o {shlex.quote(output)}"
+        elif out_yaml_format:
             command += " -o yaml"
         retry += 1
         while retry:
             try:
                 return self.exec_oc_cmd(
                     command,
+                    out_yaml_format=not output,
                     silent=silent,
                     cluster_config=cluster_config,
                     skip_tls_verify=skip_tls_verify,
@@ -386,6 +401,63 @@ class OCP(object):
                     )
                     time.sleep(wait if wait else 1)
 
+    def get_fields(
+        self,
+        fields,
+        selector=None,
+        field_selector=None,
+        all_namespaces=False,
+        retry=0,
+        wait=3,
+        silent=False,
+        cluster_config=None,
+    ):
+        """
+        Get only the given fields of the resources - 'oc get <resource> -o jsonpath'
+
+        Only the projected values are transferred and parsed instead of the
+        whole yaml of every resource, which matters for listings of big
+        namespaces.
+
+        Args:
+            fields (dict): Field name -> jsonpath of the value in the resource
+                (e.g. {"name": ".metadata.name", "node": ".spec.nodeName"}),
+                multiple values (e.g. '.spec.containers[*].image') are
+                separated by space
+            selector (str): The label selector to look for
+            field_selector (str): Selector (field query) to filter on
+            all_namespaces (bool): Equal to oc get <resource> -A
+            retry (int): Number of attempts to retry to get resources
+            wait (int): Number of seconds to wait between attempts for retry
+            silent (bool): If True, the command is not logged
+            cluster_config (MultiClusterConfig): Config of the cluster
+
+        Returns:
+            list: Dictionaries with the field names and the values as strings
+                (empty string when the field is missing in the resource)
+
+        """
+        names = list(fields)
+        template = '{"\\t"}'.join(f"{{{fields[name]}}}" for name in names)
+        out = self.get(
+            selector=selector,
+            field_selector=field_selector,
+            all_namespaces=all_namespaces,
+            retry=retry,
+            wait=wait,
+            silent=silent,
+            cluster_config=cluster_config,
+            output=f'jsonpath={{range .items[*]}}{template}{{"\\n"}}{{end}}',
+        )
+        resources = []
+        for line in out.splitlines():
+            if not line.strip():
+                continue
+            values = line.split("\t")
+            values += [""] * (len(names) - len(values))
+            resources.append(dict(zip(names, values)))
+        return resources
+
     def describe(self, resource_name="", selector=None, all_namespaces=False):
         """
         Get command - 'oc describe <resource>'
@@ -405,7 +477,7 @@ class OCP(object):
         if all_namespaces and not self.namespace:
             command += " -A"
         if selector is not None:
-            command += f" --selector={selector}"
+            command += f" --selector={shlex.quote(selector)}"
         return self.exec_oc_cmd(command, out_yaml_format=False)
 
     def create(self, yaml_file=None, resource_name="", out_yaml_format=True):
@@ -1802,6 +1874,24 @@ def rsync(src, dst, node, dst_node=True, extra_params=""):
             raise
 
 
+def format_set_based_selector(label, values, exclude=False):
+    """
+    Format set based label selector, e.g. 'app in (rook-ceph-mon,rook-ceph-mgr)'
+
+    Args:
+        label (str): Label key
+        values (list): Label values
+        exclude (bool): If True, select resources which don't have any of
+            the values (or don't have the label at all)
+
+    Returns:
+        str: Label selector
+
+    """
+    operator = "notin" if exclude else "in"
+    return f"{label} {operator} ({','.join(values)})"
+
+
 def get_images(data, images=None, image_key="image"):
     """
     Get the images from the ocp object like pod, CSV and so on.
@@ -1955,28 +2045,33 @@ def check_cluster_operator_versions(target_image, operator_upgrade_timeout):
     Function will wait for the operator upgrade to complete.
     In case of sample fail, it will log the operator that is not upgraded yet.
     In case of timeout reached, it will raise TimeoutExpiredError.
+    The cached cluster facts are not used during the wait and are
+    invalidated when it's finished, as the versions change during the
+    rollout.
 
     Args:
         target_image (str): target image to be upgraded
         operator_upgrade_timeout (int): timeout for operator upgrade
     """
-    cluster_operators = get_all_cluster_operators()
-    if "aro" in cluster_operators:
-        log.debug("aro cluster operator check will be ignored!")
-        cluster_operators.remove("aro")
-    for ocp_operator in cluster_operators:
-        for sampler in TimeoutSampler(
-            timeout=operator_upgrade_timeout,
-            sleep=60,
-            func=confirm_cluster_operator_version,
-            target_version=target_image,
-            cluster_operator=ocp_operator,
-        ):
-            if sampler:
-                log.info(f"{ocp_operator} upgrade is completed!")
-                break
-            else:
-                log.info(f"{ocp_operator} upgrade is not completed yet!")
+    with cluster_facts_bypass():
+        cluster_operators = get_all_cluster_operators()
+        if "aro" in cluster_operators:
+            log.debug("aro cluster operator check will be ignored!")
+            cluster_operators.remove("aro")
+        for ocp_operator in cluster_operators:
+            for sampler in TimeoutSampler(
+                timeout=operator_upgrade_timeout,
+                sleep=60,
+                func=confirm_cluster_operator_version,
+                target_version=target_image,
+                cluster_operator=ocp_operator,
+            ):
+                if sampler:
+                    log.info(f"{ocp_operator} upgrade is completed!")
+                    break
+                else:
+                    log.info(f"{ocp_operator} upgrade is not completed yet!")
+    invalidate_cluster_facts(reason="cluster operators upgraded")
 
 
 def get_cluster_operator_version(cluster_operator_name):
@@ -2064,7 +2159,8 @@ def verify_cluster_operator_status(cluster_operator, skip_tls_verify=False):
 def validate_cluster_version_status():
     """
     Verify OCP upgrade is completed, by checking 'oc get clusterversion'
-    status
+    status. The cached cluster facts are invalidated once the status is
+    valid, so versions looked up during the rollout are not kept.
 
     Returns:
         bool: False in case that one of condition flags is invalid:
@@ -2087,6 +2183,7 @@ def validate_cluster_version_status():
             return False
 
     log.info("Cluster version validation - OK!")
+    invalidate_cluster_facts(reason="cluster version is not progressing")
     return True
 
 
@@ -44,6 +44,7 @@ from ocs_ci.ocs.resources.csv import (
     get_csvs_start_with_prefix,
 )
 from ocs_ci.ocs.resources.install_plan import wait_for_install_plan_and_approve
+from ocs_ci.ocs.upgrade_rollout import RolloutVerifier
 from ocs_ci.ocs.resources.pod import (
     get_noobaa_pods,
     verify_pods_upgraded,
@@ -60,6 +61,7 @@ from ocs_ci.ocs.resources.storage_cluster import (
 )
 from ocs_ci.ocs.utils import setup_ceph_toolbox, get_expected_nb_db_psql_version
 from ocs_ci.utility import version
+from ocs_ci.utility.cluster_facts import invalidate_cluster_facts
 from ocs_ci.utility.reporting import update_live_must_gather_image
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.rgwutils import get_rgw_count
@@ -310,6 +312,11 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
     """
     Verify if all the images of OCS objects got upgraded
 
+    All the components (except NooBaa pods, which have their own verification
+    with retries) are evaluated together against one snapshot of pods per
+    tick. Every component keeps the same time budget as when the components
+    were verified one after another.
+
     Args:
         old_images (set): set with old images
         upgrade_version (packaging.version.Version): version of OCS
@@ -319,7 +326,8 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
     # Get all worker nodes for CSI nodeplugin count (they run on all workers, not just storage-labeled)
     all_worker_nodes = get_worker_nodes(skip_master_nodes=False)
     number_of_all_worker_nodes = len(all_worker_nodes)
-    verify_pods_upgraded(old_images, selector=constants.OCS_OPERATOR_LABEL)
+    rollout = RolloutVerifier(old_images, sequential_budget=True)
+    rollout.add(constants.OCS_OPERATOR_LABEL)
     if not (
         config.ENV_DATA.get("mcg_only_deployment")
         and (
@@ -330,8 +338,7 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
             )
         )
     ):
-        verify_pods_upgraded(old_images, selector=constants.OPERATOR_LABEL)
-    verify_noobaa_pods_upgraded(old_images, upgrade_version)
+        rollout.add(constants.OPERATOR_LABEL)
     if not config.ENV_DATA.get("mcg_only_deployment"):
         odf_running_version = version.get_ocs_version_from_csv(only_major_minor=True)
         # cephfs and rbdplugin label and count
@@ -362,22 +369,16 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
             log.info(
                 f"Label for cephfsplugin and rbdplugin are {csi_cephfsplugin_label} and {csi_rbdplugin_label}"
             )
-        verify_pods_upgraded(
-            old_images,
-            selector=csi_cephfsplugin_label,
+        rollout.add(
+            csi_cephfsplugin_label,
             count=count_csi_cephfsplugin_label,
         )
-        verify_pods_upgraded(
-            old_images, selector=csi_cephfsplugin_provisioner_label, count=2
-        )
-        verify_pods_upgraded(
-            old_images,
-            selector=csi_rbdplugin_label,
+        rollout.add(csi_cephfsplugin_provisioner_label, count=2)
+        rollout.add(
+            csi_rbdplugin_label,
             count=count_csi_rbdplugin_label,
         )
-        verify_pods_upgraded(
-            old_images, selector=csi_rbdplugin_provisioner_label, count=2
-        )
+        rollout.add(csi_rbdplugin_provisioner_label, count=2)
     if not (
         config.DEPLOYMENT.get("external_mode")
         or config.ENV_DATA.get("mcg_only_deployment")
@@ -385,41 +386,35 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
         mon_count = 3
         if config.DEPLOYMENT.get("arbiter_deployment"):
             mon_count = 5
-        verify_pods_upgraded(
-            old_images,
-            selector=constants.MON_APP_LABEL,
+        rollout.add(
+            constants.MON_APP_LABEL,
             count=mon_count,
             timeout=820,
         )
         mgr_count = constants.MGR_COUNT_415
         if upgrade_version < parse_version("4.15"):
             mgr_count = constants.MGR_COUNT
-        verify_pods_upgraded(
-            old_images, selector=constants.MGR_APP_LABEL, count=mgr_count
-        )
+        rollout.add(constants.MGR_APP_LABEL, count=mgr_count)
         osd_timeout = 600 if upgrade_version >= parse_version("4.5") else 750
         osd_count = get_osd_count()
         # In the debugging issue:
         # https://github.com/red-hat-storage/ocs-ci/issues/5031
         # Noticed that it's taking about 1 more minute from previous check till actual
-        # OSD pods getting restarted.
-        # Hence adding sleep here for 120 seconds to be sure, OSD pods upgrade started.
-        log.info("Waiting for 2 minutes before start checking OSD pods")
-        time.sleep(120)
-        verify_pods_upgraded(
-            old_images,
-            selector=constants.OSD_APP_LABEL,
+        # OSD pods getting restarted. OSD pods with old images are reported as
+        # not upgraded, so instead of sleeping, 120 seconds are added to the
+        # time budget of OSD pods.
+        rollout.add(
+            constants.OSD_APP_LABEL,
             count=osd_count,
-            timeout=osd_timeout * osd_count,
+            timeout=osd_timeout * osd_count + 120,
         )
-        verify_pods_upgraded(old_images, selector=constants.MDS_APP_LABEL, count=2)
+        rollout.add(constants.MDS_APP_LABEL, count=2)
         if config.ENV_DATA.get("platform") in constants.ON_PREM_PLATFORMS:
             rgw_count = get_rgw_count(
                 upgrade_version.base_version, True, version_before_upgrade
             )
-            verify_pods_upgraded(
-                old_images,
-                selector=constants.RGW_APP_LABEL,
+            rollout.add(
+                constants.RGW_APP_LABEL,
                 count=rgw_count,
             )
     if upgrade_version >= parse_version("4.6"):
@@ -428,12 +423,14 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
             or config.ENV_DATA.get("mcg_only_deployment")
         )
         if not skip_metrics_exporter:
-            verify_pods_upgraded(old_images, selector=constants.OCS_METRICS_EXPORTER)
+            rollout.add(constants.OCS_METRICS_EXPORTER)
         else:
             log.info(
                 "Skipping ocs-metrics-exporter upgrade verification for ODF 4.21 "
                 "external mode deployment due to bug DFBUGS-5811"
             )
+    rollout.wait()
+    verify_noobaa_pods_upgraded(old_images, upgrade_version)
 
 
 class OCSUpgrade(object):
@@ -1197,6 +1194,7 @@ def run_ocs_upgrade(
                 f"Failed to set values for bluestore_slow_ops. Exception is: {ex}"
             )
 
+    invalidate_cluster_facts("ODF upgrade")
     if config.ENV_DATA.get("mcg_only_deployment"):
         mcg_only_install_verification(ocs_registry_image=upgrade_ocs.ocs_registry_image)
     else:
@@ -17,7 +17,7 @@ from threading import Thread
 import base64
 from semantic_version import Version
 
-from ocs_ci.ocs.ocp import get_images, OCP, verify_images_upgraded, get_sha256_digest
+from ocs_ci.ocs.ocp import OCP
 from ocs_ci.helpers import helpers
 from ocs_ci.helpers.proxy import update_container_with_proxy_env
 from ocs_ci.ocs import constants, defaults, node, workload, ocp
@@ -25,8 +25,6 @@ from ocs_ci.framework import config
 from ocs_ci.ocs.exceptions import (
     CephToolBoxNotFoundException,
     CommandFailed,
-    NotAllPodsHaveSameImagesError,
-    NonUpgradedImagesFoundError,
     TimeoutExpiredError,
     UnavailableResourceException,
     ResourceNotFoundError,
@@ -39,11 +37,11 @@ from ocs_ci.ocs.exceptions import (
 from ocs_ci.ocs.utils import setup_ceph_toolbox, get_pod_name_by_pattern
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs.resources.job import get_job_obj, get_jobs_with_prefix
-from ocs_ci.utility import templating
+from ocs_ci.ocs.upgrade_rollout import RolloutVerifier
+from ocs_ci.utility import call_stats, ceph_cmd_cache, templating
 from ocs_ci.utility.utils import (
     get_primary_nb_db_pod,
     run_cmd,
-    check_timeout_reached,
     TimeoutSampler,
     exec_cmd,
 )
@@ -66,6 +64,15 @@ TEXT_CONTENT = (
 )
 TEST_FILE = "/var/lib/www/html/test"
 FEDORA_TEST_FILE = "/mnt/test"
+# jsonpath of the pod fields available for projected pod listings
+POD_FIELDS = {
+    "name": ".metadata.name",
+    "namespace": ".metadata.namespace",
+    "node": ".spec.nodeName",
+    "phase": ".status.phase",
+    "images": ".spec.containers[*].image",
+}
+LABEL_VALUE_PATTERN = re.compile(r"^([A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?)$")
 
 
 class Pod(OCS):
@@ -356,7 +363,12 @@ class Pod(OCS):
         return self.pod_data.get("metadata").get("labels")
 
     def exec_ceph_cmd(
-        self, ceph_cmd, format="json-pretty", out_yaml_format=True, timeout=600
+        self,
+        ceph_cmd,
+        format="json-pretty",
+        out_yaml_format=True,
+        timeout=600,
+        use_cache=True,
     ):
         """
         Execute a Ceph command on the Ceph tools pod
@@ -367,6 +379,8 @@ class Pod(OCS):
             out_yaml_format (bool): whether to return yaml loaded python
                 object OR to return raw output
             timeout (int): timeout for the exec_cmd_on_pod, defaults to 600 seconds
+            use_cache (bool): If True, result of read-only Ceph command may be
+                served from ceph_cmd_cache (see CEPH_CMD_CACHE_TTL)
 
         Returns:
             dict: Ceph command output
@@ -376,12 +390,35 @@ class Pod(OCS):
         """
         if "rook-ceph-tools" not in self.labels.values():
             raise CommandFailed("Ceph commands can be executed only on toolbox pod")
-        ceph_cmd = ceph_cmd
+        ttl = ceph_cmd_cache.get_ceph_cmd_ttl(ceph_cmd) if use_cache else None
+        cache_key = (
+            "ceph_cmd",
+            self.ocp.cluster_context,
+            self.ocp.cluster_kubeconfig,
+            self.namespace,
+            self.name,
+            ceph_cmd_cache.normalize_ceph_cmd(ceph_cmd),
+            format,
+            out_yaml_format,
+        )
         if format:
             ceph_cmd += f" --format {format}"
-        out = self.exec_cmd_on_pod(
-            ceph_cmd, out_yaml_format=out_yaml_format, timeout=timeout
-        )
+        try:
+            with call_stats.measure("ceph", ceph_cmd, words=3):
+                out = ceph_cmd_cache.cached_call(
+                    cache_key,
+                    ttl,
+                    self.exec_cmd_on_pod,
+                    ceph_cmd,
+                    out_yaml_format=out_yaml_format,
+                    timeout=timeout,
+                )
+        except CommandFailed:
+            # the cached toolbox pod may be gone
+            ceph_cmd_cache.get_ceph_cmd_cache().invalidate(
+                reason=f"{ceph_cmd} failed on {self.name}"
+            )
+            raise
 
         # For some commands, like "ceph fs ls", the returned output is a list
         if isinstance(out, list):
@@ -804,6 +841,20 @@ def get_all_pods(
 
     """
 
+    # push the selector down to the API server when it can be expressed as
+    # set based label selector, otherwise (e.g. None in the values to match
+    # pods without the label) the pods are filtered here
+    label_selector = None
+    values = list(selector) if selector else []
+    if (
+        values
+        and selector_label
+        and all(value and LABEL_VALUE_PATTERN.match(value) for value in values)
+    ):
+        label_selector = ocp.format_set_based_selector(
+            selector_label, values, exclude=exclude_selector
+        )
+        selector = None
     ocp_pod_obj = OCP(
         kind=constants.POD,
         namespace=namespace,
@@ -817,7 +868,7 @@ def get_all_pods(
         wait_time = 180
         logger.info(f"Waiting for {wait_time}s for the pods to stabilize")
         time.sleep(wait_time)
-    pods = ocp_pod_obj.get()["items"]
+    pods = ocp_pod_obj.get(selector=label_selector)["items"]
     if selector:
         if exclude_selector:
             pods_new = [
@@ -840,7 +891,9 @@ def get_ceph_tools_pod(
     skip_creating_pod=False, wait=False, namespace=None, get_running_pods=True
 ):
     """
-    Get the Ceph tools pod
+    Get the Ceph tools pod, the pod found by the lookup is reused for a short
+    time (see TOOLS_POD_CACHE_TTL in ceph_cmd_cache) when the Ceph command
+    cache is enabled, a new pod object is returned to every caller
 
     Args:
         skip_creating_pod (bool): True if user doesn't want to create new tool box
@@ -859,6 +912,61 @@ def get_ceph_tools_pod(
     """
     from ocs_ci.ocs.managedservice import patch_consumer_toolbox
 
+    cache_key = (
+        "tools_pod",
+        config.cur_index,
+        namespace,
+        skip_creating_pod,
+        wait,
+        get_running_pods,
+    )
+    pod_dict, cluster_kubeconfig = ceph_cmd_cache.cached_call(
+        cache_key,
+        ceph_cmd_cache.TOOLS_POD_CACHE_TTL,
+        _get_ceph_tools_pod_data,
+        skip_creating_pod=skip_creating_pod,
+        wait=wait,
+        namespace=namespace,
+        get_running_pods=get_running_pods,
+    )
+    with config.RunWithProviderConfigContextIfAvailable():
+        ceph_pod = Pod(**pod_dict)
+        ceph_pod.ocp.cluster_kubeconfig = cluster_kubeconfig
+
+        if (
+            config.ENV_DATA.get("platform", "").lower() == constants.ROSA_PLATFORM
+            and config.ENV_DATA.get("cluster_type", "").lower()
+            == constants.MS_CONSUMER_TYPE
+        ):
+            # If the cluster is an MS consumer cluster, we need to patch the rook-ceph-tool box
+            new_ceph_pod = patch_consumer_toolbox(consumer_tools_pod=ceph_pod)
+            ceph_pod = new_ceph_pod or ceph_pod
+
+    return ceph_pod
+
+
+def _get_ceph_tools_pod_data(
+    skip_creating_pod=False, wait=False, namespace=None, get_running_pods=True
+):
+    """
+    Look up the Ceph tools pod
+
+    Args:
+        skip_creating_pod (bool): True if user doesn't want to create new tool box
+            if it doesn't exist
+        wait (bool): True if you want to wait for the tool pods to be Running
+        namespace: Namespace of OCS
+        get_running_pods (bool): If True, get only the ceph tool pods in a Running status.
+            If False, get the ceph tool pods even if they are not in a Running status.
+
+    Returns:
+        tuple: Dictionary of the Ceph tools pod and kubeconfig of the cluster
+            it runs in
+
+    Raises:
+        ToolBoxNotFoundException: In case of tool box not found
+
+    """
     if (
         config.multicluster
         and config.ENV_DATA.get("platform", "").lower()
@@ -964,19 +1072,7 @@ def get_ceph_tools_pod(
         else:
             running_ct_pods = _get_tools_pod_objs()
 
-        ceph_pod = Pod(**running_ct_pods[0])
-        ceph_pod.ocp.cluster_kubeconfig = cluster_kubeconfig
-
-        if (
-            config.ENV_DATA.get("platform", "").lower() == constants.ROSA_PLATFORM
-            and config.ENV_DATA.get("cluster_type", "").lower()
-            == constants.MS_CONSUMER_TYPE
-        ):
-            # If the cluster is an MS consumer cluster, we need to patch the rook-ceph-tool box
-            new_ceph_pod = patch_consumer_toolbox(consumer_tools_pod=ceph_pod)
-            ceph_pod = new_ceph_pod or ceph_pod
-
-    return ceph_pod
+    return running_ct_pods[0], cluster_kubeconfig
 
 
 def get_csi_provisioner_pod(interface):
@@ -1704,16 +1800,82 @@ def get_pods_having_label(
     """
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
     ocp_pod = OCP(kind=constants.POD, namespace=namespace)
-    pods = ocp_pod.get(selector=label, retry=retry, cluster_config=cluster_config).get(
-        "items"
+    # single status can be filtered by the API server
+    field_selector = (
+        f"status.phase={statuses[0]}" if statuses and len(statuses) == 1 else None
     )
+    pods = ocp_pod.get(
+        selector=label,
+        field_selector=field_selector,
+        retry=retry,
+        cluster_config=cluster_config,
+    ).get("items")
     if statuses:
-        for pod in pods:
-            if pod["status"]["phase"] not in statuses:
-                pods.remove(pod)
+        pods = [pod for pod in pods if pod["status"]["phase"] in statuses]
     return pods
 
 
+def get_pods_fields(
+    namespace=None,
+    selector=None,
+    field_selector=None,
+    fields=("name", "node", "phase"),
+    cluster_config=None,
+):
+    """
+    Get only the given fields of the pods, without fetching the whole pod
+    resources. Use it when only names, nodes, phases or images are needed.
+
+    Args:
+        namespace (str): Namespace of the pods
+            (default: config.ENV_DATA["cluster_namespace"])
+        selector (str): Label selector (e.g. 'app=rook-ceph-osd' or
+            'app in (rook-ceph-mon,rook-ceph-mgr)')
+        field_selector (str): Field selector (e.g. status.phase=Running)
+        fields (tuple): Fields from POD_FIELDS to get
+        cluster_config (MultiClusterConfig): In case of multicluster, this
+            object will hold specific cluster config
+
+    Returns:
+        list: Dictionaries with the fields of the pods, 'images' is a list
+
+    """
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    ocp_pod = OCP(kind=constants.POD, namespace=namespace)
+    pods = ocp_pod.get_fields(
+        {field: POD_FIELDS[field] for field in fields},
+        selector=selector,
+        field_selector=field_selector,
+        cluster_config=cluster_config,
+    )
+    if "images" in fields:
+        for pod_fields in pods:
+            pod_fields["images"] = pod_fields["images"].split()
+    return pods
+
+
+def get_pod_names_having_label(label, namespace=None, statuses=None):
+    """
+    Get names of the pods with given label, only the names are fetched
+
+    Args:
+        label (str): label which pods might have
+        namespace (str): Namespace in which to be looked up
+        statuses (list): List of pod statuses. Get only pods in any of the
+            status mentioned in the statuses list
+
+    Returns:
+        list: Names of the pods
+
+    """
+    fields = ("name", "phase") if statuses else ("name",)
+    return [
+        pod_fields["name"]
+        for pod_fields in get_pods_fields(namespace, selector=label, fields=fields)
+        if not statuses or pod_fields["phase"] in statuses
+    ]
+
+
 def get_deployments_having_label(label, namespace):
     """
     Fetches deployment resources with given label in given namespace
@@ -1903,8 +2065,7 @@ def get_osd_deployments(osd_label=constants.OSD_APP_LABEL, namespace=None):
 
 def get_pod_count(label, namespace=None):
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
-    pods = get_pods_having_label(label=label, namespace=namespace)
-    return len(pods)
+    return len(get_pod_names_having_label(label=label, namespace=namespace))
 
 
 def get_cephfsplugin_provisioner_pods(
@@ -2587,67 +2748,12 @@ def verify_pods_upgraded(
         TimeoutException: If the pods didn't get upgraded till the timeout.
 
     """
-
-    namespace = config.ENV_DATA["cluster_namespace"]
-    info_message = (
-        f"Waiting for {count} pods with selector: {selector} to be running "
-        f"and upgraded. Old images: {old_images}"
-    )
-    logger.info(info_message)
-    start_time = time.time()
-    selector_label, selector_value = selector.split("=")
-    while True:
-        pod_count = 0
-        pod_images = {}
-        try:
-            pods = get_all_pods(namespace, [selector_value], selector_label)
-            pods_len = len(pods)
-            logger.info(f"Found {pods_len} pod(s) for selector: {selector}")
-            if pods_len != count:
-                logger.warning(
-                    f"Number of found pods {pods_len} is not as expected: " f"{count}"
-                )
-            for pod in pods:
-                pod_obj = pod.get()
-                verify_images_upgraded(old_images, pod_obj, ignore_psql_12_verification)
-                current_pod_images = get_images(pod_obj)
-                current_pod_image_ids = get_images(pod_obj, image_key="imageID")
-                for container_name, container_image in current_pod_images.items():
-                    if container_name not in pod_images:
-                        pod_images[container_name] = container_image
-                    else:
-                        if pod_images[container_name] != container_image:
-                            current_pod_image_id = current_pod_image_ids.get(
-                                container_name
-                            )
-                            if get_sha256_digest(container_image) == get_sha256_digest(
-                                current_pod_image_id
-                            ):
-                                logger.info(
-                                    f"Container image: {container_image} match with imageID "
-                                    f" digest: {current_pod_image_id}"
-                                )
-                            else:
-                                raise NotAllPodsHaveSameImagesError(
-                                    f"Not all the pods with the selector: {selector} have the same "
-                                    f"images! Image for container {container_name} has image {container_image} "
-                                    f"which doesn't match with: {pod_images} differ! This means "
-                                    "that upgrade hasn't finished to restart all the pods yet! "
-                                    "Or it's caused by other discrepancy which needs to be investigated!"
-                                    f"ImageID is: {current_pod_image_id}"
-                                )
-                pod_count += 1
-        except CommandFailed as ex:
-            logger.warning(
-                f"Failed when getting pods with selector {selector}." f"Error: {ex}"
-            )
-        except (NonUpgradedImagesFoundError, NotAllPodsHaveSameImagesError) as ex:
-            logger.warning(ex)
-        check_timeout_reached(start_time, timeout, info_message)
-        if pods_len != count:
-            logger.error(f"Found pods: {pods_len} but expected: {count}!")
-        elif pod_count == count:
-            return
+    RolloutVerifier(old_images).add(
+        selector,
+        count=count,
+        timeout=timeout,
+        ignore_psql_12_verification=ignore_psql_12_verification,
+    ).wait()
 
 
 def get_noobaa_pods(noobaa_label=constants.NOOBAA_APP_LABEL, namespace=None):
@@ -25,7 +25,8 @@ from ocs_ci.helpers.managed_services import (
     get_ocs_osd_deployer_version,
     verify_faas_resources,
 )
-from ocs_ci.ocs import constants, defaults, ocp, managedservice
+from ocs_ci.ocs import constants, defaults, health_tracker, ocp, managedservice
+from ocs_ci.ocs.cluster_snapshot import ClusterSnapshot
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     InvalidPodPresent,
@@ -39,8 +40,8 @@ from ocs_ci.ocs.ocp import get_images, OCP
 from ocs_ci.ocs.resources import csv, deployment
 from ocs_ci.ocs.resources.ocs import get_ocs_csv
 from ocs_ci.ocs.resources.pod import (
-    get_all_pods,
     get_pods_having_label,
+    get_pods_fields,
     get_osd_pods,
     get_mon_pods,
     get_mds_pods,
@@ -97,6 +98,7 @@ from ocs_ci.utility.utils import (
     extract_image_urls,
 )
 from ocs_ci.utility.decorators import switch_to_orig_index_at_last
+from ocs_ci.utility.verification_graph import VerificationGraph
 from ocs_ci.helpers.helpers import storagecluster_independent_check
 
 log = logging.getLogger(__name__)
@@ -337,6 +339,10 @@ def ocs_install_verification(
             called after upgrade.
         version_before_upgrade (float): Set to OCS version before upgrade
 
+    Returns:
+        VerificationReport: Durations and results of the checks executed
+            concurrently as a dependency graph
+
     """
     from ocs_ci.ocs.node import get_nodes
     from ocs_ci.ocs.resources.pvc import get_deviceset_pvcs
@@ -555,6 +561,35 @@ def ocs_install_verification(
                 }
             )
 
+    # Read-only checks below are executed concurrently as a dependency graph
+    # and share one snapshot of the resources in the cluster namespace
+    snapshot = ClusterSnapshot(namespace=namespace)
+    graph = VerificationGraph("OCS install verification")
+    # facts discovered by the checks which are needed by subsequent steps
+    verification_facts = {}
+
+    def pods_running_check(ocp_pod, label, count):
+        def _check():
+            if count and ocp_pod is pod:
+                running_count = snapshot.count_pods_in_status(label)
+                if running_count is not None and running_count >= count:
+                    log.info(
+                        f"{running_count} pods with selector {label} already "
+                        f"reached condition {constants.STATUS_RUNNING}"
+                    )
+                    return
+            assert ocp_pod.wait_for_resource(
+                condition=constants.STATUS_RUNNING,
+                selector=label,
+                resource_count=count,
+                timeout=timeout,
+            )
+            # pods changed since the snapshot was taken
+            snapshot.invalidate(constants.POD)
+
+        return _check
+
+    pod_checks = []
     for label, count in resources_dict.items():
         if label == constants.RGW_APP_LABEL:
             if (
@@ -569,251 +604,295 @@ def ocs_install_verification(
             continue
         if ("mds" in label or "cephfs" in label) and disable_cephfs:
             continue
-        if label == constants.MANAGED_CONTROLLER_LABEL:
-            if fusion_aas_provider:
-                service_pod = OCP(
-                    kind=constants.POD, namespace=config.ENV_DATA["service_namespace"]
-                )
-                assert service_pod.wait_for_resource(
-                    condition=constants.STATUS_RUNNING,
-                    selector=label,
-                    resource_count=count,
-                    timeout=timeout,
-                )
-                continue
-
-        assert pod.wait_for_resource(
-            condition=constants.STATUS_RUNNING,
-            selector=label,
-            resource_count=count,
-            timeout=timeout,
-        )
+        ocp_pod = pod
+        if label == constants.MANAGED_CONTROLLER_LABEL and fusion_aas_provider:
+            ocp_pod = OCP(
+                kind=constants.POD, namespace=config.ENV_DATA["service_namespace"]
+            )
+        pod_checks.append(f"pods {label}")
+        graph.add(pod_checks[-1], pods_running_check(ocp_pod, label, count))
 
     # Checks for FaaS
     if fusion_aas:
-        verify_faas_resources()
+        graph.add(
+            "FaaS resources",
+            verify_faas_resources,
+            depends_on=pod_checks,
+            exclusive=True,
+        )
 
-    # Verify StorageClasses (1 ceph-fs, 1 ceph-rbd)
-    log.info("Verifying storage classes")
-    storage_class = OCP(kind=constants.STORAGECLASS, namespace=namespace)
     storage_cluster_name = config.ENV_DATA["storage_cluster_name"]
     rbd_namespace = config.EXTERNAL_MODE.get("rbd_namespace")
+    cluster_name = config.ENV_DATA["cluster_name"]
 
-    if config.ENV_DATA.get("custom_default_storageclass_names"):
-        custom_sc = get_storageclass_names_from_storagecluster_spec()
-        if not all(
-            sc in custom_sc
-            for sc in [
-                constants.OCS_COMPONENTS_MAP["blockpools"],
-                constants.OCS_COMPONENTS_MAP["cephfs"],
-            ]
-        ):
-            raise ValueError(
-                "Custom StorageClass are not defined in Storagecluster Spec."
-            )
+    def verify_required_storage_classes():
+        # Verify StorageClasses (1 ceph-fs, 1 ceph-rbd)
+        log.info("Verifying storage classes")
+        if config.ENV_DATA.get("custom_default_storageclass_names"):
+            custom_sc = get_storageclass_names_from_storagecluster_spec()
+            if not all(
+                sc in custom_sc
+                for sc in [
+                    constants.OCS_COMPONENTS_MAP["blockpools"],
+                    constants.OCS_COMPONENTS_MAP["cephfs"],
+                ]
+            ):
+                raise ValueError(
+                    "Custom StorageClass are not defined in Storagecluster Spec."
+                )
+            verification_facts["custom_sc"] = custom_sc
 
-        required_storage_classes = {
-            custom_sc[constants.OCS_COMPONENTS_MAP["cephfs"]],
-            custom_sc[constants.OCS_COMPONENTS_MAP["blockpools"]],
-        }
-    else:
-        if external and rbd_namespace:
-            sc_rbd = f"{constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD_NAMESPACE_PREFIX}-{rbd_namespace}"
+            required_storage_classes = {
+                custom_sc[constants.OCS_COMPONENTS_MAP["cephfs"]],
+                custom_sc[constants.OCS_COMPONENTS_MAP["blockpools"]],
+            }
         else:
-            sc_rbd = f"{storage_cluster_name}-ceph-rbd"
-        required_storage_classes = {
-            f"{storage_cluster_name}-cephfs",
-            sc_rbd,
-        }
-    skip_storage_classes = set()
-    if disable_cephfs:
-        skip_storage_classes.update(
-            {
+            if external and rbd_namespace:
+                sc_rbd = f"{constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD_NAMESPACE_PREFIX}-{rbd_namespace}"
+            else:
+                sc_rbd = f"{storage_cluster_name}-ceph-rbd"
+            required_storage_classes = {
                 f"{storage_cluster_name}-cephfs",
+                sc_rbd,
             }
+        skip_storage_classes = set()
+        if disable_cephfs:
+            skip_storage_classes.update(
+                {
+                    f"{storage_cluster_name}-cephfs",
+                }
+            )
+        if disable_blockpools:
+            skip_storage_classes.update(
+                {
+                    f"{storage_cluster_name}-ceph-rbd",
+                }
+            )
+        required_storage_classes = required_storage_classes.difference(
+            skip_storage_classes
         )
-    if disable_blockpools:
-        skip_storage_classes.update(
-            {
-                f"{storage_cluster_name}-ceph-rbd",
-            }
-        )
-    required_storage_classes = required_storage_classes.difference(skip_storage_classes)
 
-    if config.DEPLOYMENT["external_mode"]:
-        required_storage_classes.update(
-            {
-                f"{storage_cluster_name}-ceph-rgw",
-                f'{config.ENV_DATA["cluster_namespace"]}.noobaa.io',
-            }
-        )
-    storage_classes = storage_class.get()
-    storage_class_names = {
-        item["metadata"]["name"] for item in storage_classes["items"]
-    }
-    # required storage class names should be observed in the cluster under test
-    missing_scs = required_storage_classes.difference(storage_class_names)
-    if len(missing_scs) > 0:
-        log.error("few storage classes are not present: %s", missing_scs)
-    assert list(missing_scs) == []
+        if config.DEPLOYMENT["external_mode"]:
+            required_storage_classes.update(
+                {
+                    f"{storage_cluster_name}-ceph-rgw",
+                    f'{config.ENV_DATA["cluster_namespace"]}.noobaa.io',
+                }
+            )
+        storage_class_names = snapshot.names(constants.STORAGECLASS)
+        # required storage class names should be observed in the cluster under test
+        missing_scs = required_storage_classes.difference(storage_class_names)
+        if len(missing_scs) > 0:
+            log.error("few storage classes are not present: %s", missing_scs)
+        assert list(missing_scs) == []
+
+    graph.add("storage classes", verify_required_storage_classes)
 
     # Verify OSDs are distributed
+    def verify_osds_distribution():
+        log.info("Verifying OSDs are distributed evenly across worker nodes")
+        osds = snapshot.select(constants.POD, constants.OSD_APP_LABEL)
+        deviceset_count = get_total_deviceset_count()
+        node_names = [osd["spec"]["nodeName"] for osd in osds]
+        for node in node_names:
+            assert (
+                not node_names.count(node) > deviceset_count
+            ), "OSD's are not distributed evenly across worker nodes"
+
     if not external:
         if not skip_osd_distribution_check:
-            log.info("Verifying OSDs are distributed evenly across worker nodes")
-            ocp_pod_obj = OCP(kind=constants.POD, namespace=namespace)
-            osds = ocp_pod_obj.get(selector=constants.OSD_APP_LABEL)["items"]
-            deviceset_count = get_total_deviceset_count()
-            node_names = [osd["spec"]["nodeName"] for osd in osds]
-            for node in node_names:
-                assert (
-                    not node_names.count(node) > deviceset_count
-                ), "OSD's are not distributed evenly across worker nodes"
+            osd_pod_check = f"pods {constants.OSD_APP_LABEL}"
+            graph.add(
+                "OSD distribution",
+                verify_osds_distribution,
+                depends_on=[osd_pod_check] if osd_pod_check in graph else None,
+            )
 
     # Verify that CSI driver object contains provisioner names
-    log.info("Verifying CSI driver object contains provisioner names.")
-    csi_driver = OCP(kind="CSIDriver")
-    csi_drivers = {item["metadata"]["name"] for item in csi_driver.get()["items"]}
-    if not provider_cluster:
-        if fusion_aas_consumer or client_cluster:
-            {
-                f"{namespace}.cephfs.csi.ceph.com",
-                f"{namespace}.rbd.csi.ceph.com",
-            }.issubset(csi_drivers)
-        else:
-            csi_provisioners = set(defaults.CSI_PROVISIONERS)
-            if disable_cephfs:
-                csi_provisioners.discard(defaults.CEPHFS_PROVISIONER)
-            if disable_blockpools:
-                csi_provisioners.discard(defaults.RBD_PROVISIONER)
-            assert csi_provisioners.issubset(csi_drivers)
+    def verify_csi_driver_provisioners():
+        log.info("Verifying CSI driver object contains provisioner names.")
+        csi_drivers = snapshot.names("CSIDriver", namespaced=False)
+        if not provider_cluster:
+            if fusion_aas_consumer or client_cluster:
+                {
+                    f"{namespace}.cephfs.csi.ceph.com",
+                    f"{namespace}.rbd.csi.ceph.com",
+                }.issubset(csi_drivers)
+            else:
+                csi_provisioners = set(defaults.CSI_PROVISIONERS)
+                if disable_cephfs:
+                    csi_provisioners.discard(defaults.CEPHFS_PROVISIONER)
+                if disable_blockpools:
+                    csi_provisioners.discard(defaults.RBD_PROVISIONER)
+                assert csi_provisioners.issubset(csi_drivers)
+
+    # the drivers are looked up by the ownership check of the CSI drivers
+    # since 4.19, don't verify them twice
+    if not (odf_running_version >= version.VERSION_4_19 or hci_cluster):
+        graph.add("CSI drivers", verify_csi_driver_provisioners)
 
     # Verify node and provisioner secret names in storage class
-    log.info("Verifying node and provisioner secret names in storage class.")
-    cluster_name = config.ENV_DATA["cluster_name"]
-    if config.ENV_DATA.get("custom_default_storageclass_names"):
-        sc_rbd = storage_class.get(
-            resource_name=custom_sc[constants.OCS_COMPONENTS_MAP["blockpools"]]
-        )
-        sc_cephfs = storage_class.get(
-            resource_name=custom_sc[constants.OCS_COMPONENTS_MAP["cephfs"]]
-        )
-
-    elif config.DEPLOYMENT["external_mode"]:
-        rbd_namespace = config.EXTERNAL_MODE.get("rbd_namespace")
-        if rbd_namespace:
-            rbd_resource_name = f"{constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD_NAMESPACE_PREFIX}-{rbd_namespace}"
-        else:
-            rbd_resource_name = constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD
-        sc_rbd = storage_class.get(resource_name=rbd_resource_name)
-        sc_cephfs = storage_class.get(
-            resource_name=(constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_CEPHFS)
-        )
-    else:
-        if not disable_blockpools and not provider_cluster:
-            sc_rbd = storage_class.get(resource_name=constants.DEFAULT_STORAGECLASS_RBD)
-        if not disable_cephfs and not provider_cluster:
-            sc_cephfs = storage_class.get(
-                resource_name=constants.DEFAULT_STORAGECLASS_CEPHFS
+    def verify_storage_class_secrets():
+        log.info("Verifying node and provisioner secret names in storage class.")
+        if config.ENV_DATA.get("custom_default_storageclass_names"):
+            custom_sc = verification_facts["custom_sc"]
+            sc_rbd = snapshot.get_resource(
+                constants.STORAGECLASS,
+                custom_sc[constants.OCS_COMPONENTS_MAP["blockpools"]],
             )
-
-    if not disable_blockpools and not provider_cluster:
-        if consumer_cluster or client_cluster:
-            assert (
-                "rook-ceph-client"
-                in sc_rbd["parameters"]["csi.storage.k8s.io/node-stage-secret-name"]
+            sc_cephfs = snapshot.get_resource(
+                constants.STORAGECLASS,
+                custom_sc[constants.OCS_COMPONENTS_MAP["cephfs"]],
             )
-            assert (
-                "rook-ceph-client"
-                in sc_rbd["parameters"]["csi.storage.k8s.io/provisioner-secret-name"]
+
+        elif config.DEPLOYMENT["external_mode"]:
+            if rbd_namespace:
+                rbd_resource_name = (
+                    f"{constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD_NAMESPACE_PREFIX}"
+                    f"-{rbd_namespace}"
+                )
+            else:
+                rbd_resource_name = constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD
+            sc_rbd = snapshot.get_resource(constants.STORAGECLASS, rbd_resource_name)
+            sc_cephfs = snapshot.get_resource(
+                constants.STORAGECLASS,
+                constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_CEPHFS,
             )
         else:
-            if (
-                config.DEPLOYMENT["external_mode"]
-                and config.ENV_DATA["restricted-auth-permission"]
-            ):
-                if config.ENV_DATA.get("alias_rbd_name"):
-                    rbd_name = config.ENV_DATA["alias_rbd_name"]
-                else:
-                    rbd_name = config.ENV_DATA.get("rbd_name") or defaults.RBD_NAME
-                rbd_node_secret = (
-                    f"{constants.RBD_NODE_SECRET}-{cluster_name}-{rbd_name}"
+            if not disable_blockpools and not provider_cluster:
+                sc_rbd = snapshot.get_resource(
+                    constants.STORAGECLASS, constants.DEFAULT_STORAGECLASS_RBD
                 )
-                rbd_provisioner_secret = (
-                    f"{constants.RBD_PROVISIONER_SECRET}-{cluster_name}-{rbd_name}"
+            if not disable_cephfs and not provider_cluster:
+                sc_cephfs = snapshot.get_resource(
+                    constants.STORAGECLASS, constants.DEFAULT_STORAGECLASS_CEPHFS
                 )
-                if rbd_namespace:
-                    rbd_node_secret += f"-{rbd_namespace}"
-                    rbd_provisioner_secret += f"-{rbd_namespace}"
+
+        if not disable_blockpools and not provider_cluster:
+            if consumer_cluster or client_cluster:
                 assert (
-                    sc_rbd["parameters"]["csi.storage.k8s.io/node-stage-secret-name"]
-                    == rbd_node_secret
+                    "rook-ceph-client"
+                    in sc_rbd["parameters"]["csi.storage.k8s.io/node-stage-secret-name"]
                 )
                 assert (
-                    sc_rbd["parameters"]["csi.storage.k8s.io/provisioner-secret-name"]
-                    == rbd_provisioner_secret
+                    "rook-ceph-client"
+                    in sc_rbd["parameters"][
+                        "csi.storage.k8s.io/provisioner-secret-name"
+                    ]
                 )
             else:
-                if odf_running_version <= version.VERSION_4_18:
+                if (
+                    config.DEPLOYMENT["external_mode"]
+                    and config.ENV_DATA["restricted-auth-permission"]
+                ):
+                    if config.ENV_DATA.get("alias_rbd_name"):
+                        rbd_name = config.ENV_DATA["alias_rbd_name"]
+                    else:
+                        rbd_name = config.ENV_DATA.get("rbd_name") or defaults.RBD_NAME
+                    verification_facts["rbd_name"] = rbd_name
+                    rbd_node_secret = (
+                        f"{constants.RBD_NODE_SECRET}-{cluster_name}-{rbd_name}"
+                    )
+                    rbd_provisioner_secret = (
+                        f"{constants.RBD_PROVISIONER_SECRET}-{cluster_name}-{rbd_name}"
+                    )
+                    if rbd_namespace:
+                        rbd_node_secret += f"-{rbd_namespace}"
+                        rbd_provisioner_secret += f"-{rbd_namespace}"
                     assert (
                         sc_rbd["parameters"][
                             "csi.storage.k8s.io/node-stage-secret-name"
                         ]
-                        == constants.RBD_NODE_SECRET
+                        == rbd_node_secret
                     )
                     assert (
                         sc_rbd["parameters"][
                             "csi.storage.k8s.io/provisioner-secret-name"
                         ]
-                        == constants.RBD_PROVISIONER_SECRET
+                        == rbd_provisioner_secret
                     )
+                else:
+                    if odf_running_version <= version.VERSION_4_18:
+                        assert (
+                            sc_rbd["parameters"][
+                                "csi.storage.k8s.io/node-stage-secret-name"
+                            ]
+                            == constants.RBD_NODE_SECRET
+                        )
+                        assert (
+                            sc_rbd["parameters"][
+                                "csi.storage.k8s.io/provisioner-secret-name"
+                            ]
+                            == constants.RBD_PROVISIONER_SECRET
+                        )
 
-    if not disable_cephfs and not provider_cluster:
-        if consumer_cluster or client_cluster:
-            assert (
-                "rook-ceph-client"
-                in sc_cephfs["parameters"]["csi.storage.k8s.io/node-stage-secret-name"]
-            )
-            assert (
-                "rook-ceph-client"
-                in sc_cephfs["parameters"]["csi.storage.k8s.io/provisioner-secret-name"]
-            )
-        else:
-            if (
-                config.DEPLOYMENT["external_mode"]
-                and config.ENV_DATA["restricted-auth-permission"]
-            ):
-                cephfs_name = config.ENV_DATA.get("cephfs_name") or get_cephfs_name()
-                cephfs_node_secret = (
-                    f"{constants.CEPHFS_NODE_SECRET}-{cluster_name}-{cephfs_name}"
-                )
-                cephfs_provisioner_secret = f"{constants.CEPHFS_PROVISIONER_SECRET}-{cluster_name}-{cephfs_name}"
+        if not disable_cephfs and not provider_cluster:
+            if consumer_cluster or client_cluster:
                 assert (
-                    sc_cephfs["parameters"]["csi.storage.k8s.io/node-stage-secret-name"]
-                    == cephfs_node_secret
+                    "rook-ceph-client"
+                    in sc_cephfs["parameters"][
+                        "csi.storage.k8s.io/node-stage-secret-name"
+                    ]
                 )
                 assert (
-                    sc_cephfs["parameters"][
+                    "rook-ceph-client"
+                    in sc_cephfs["parameters"][
                         "csi.storage.k8s.io/provisioner-secret-name"
                     ]
-                    == cephfs_provisioner_secret
                 )
             else:
-                if odf_running_version <= version.VERSION_4_18:
+                if (
+                    config.DEPLOYMENT["external_mode"]
+                    and config.ENV_DATA["restricted-auth-permission"]
+                ):
+                    cephfs_name = (
+                        config.ENV_DATA.get("cephfs_name") or get_cephfs_name()
+                    )
+                    verification_facts["cephfs_name"] = cephfs_name
+                    cephfs_node_secret = (
+                        f"{constants.CEPHFS_NODE_SECRET}-{cluster_name}-{cephfs_name}"
+                    )
+                    cephfs_provisioner_secret = f"{constants.CEPHFS_PROVISIONER_SECRET}-{cluster_name}-{cephfs_name}"
                     assert (
                         sc_cephfs["parameters"][
                             "csi.storage.k8s.io/node-stage-secret-name"
                         ]
-                        == constants.CEPHFS_NODE_SECRET
+                        == cephfs_node_secret
                     )
                     assert (
                         sc_cephfs["parameters"][
                             "csi.storage.k8s.io/provisioner-secret-name"
                         ]
-                        == constants.CEPHFS_PROVISIONER_SECRET
+                        == cephfs_provisioner_secret
                     )
+                else:
+                    if odf_running_version <= version.VERSION_4_18:
+                        assert (
+                            sc_cephfs["parameters"][
+                                "csi.storage.k8s.io/node-stage-secret-name"
+                            ]
+                            == constants.CEPHFS_NODE_SECRET
+                        )
+                        assert (
+                            sc_cephfs["parameters"][
+                                "csi.storage.k8s.io/provisioner-secret-name"
+                            ]
+                            == constants.CEPHFS_PROVISIONER_SECRET
+                        )
+
+        log.info("Verified node and provisioner secret names in storage class.")
+
+    graph.add(
+        "storage class secrets",
+        verify_storage_class_secrets,
+        depends_on=["storage classes"],
+    )
 
-    log.info("Verified node and provisioner secret names in storage class.")
+    verification_report = graph.run()
+    verification_report.log_summary()
+    verification_report.raise_first_failure()
+    rbd_name = verification_facts.get("rbd_name")
+    cephfs_name = verification_facts.get("cephfs_name")
 
     # TODO: Enable the tools pod check when a solution is identified for tools pod on FaaS consumer
     if not (fusion_aas_consumer or client_cluster):
@@ -1121,74 +1200,96 @@ def ocs_install_verification(
             nodeplugin_daemonset_and_owner_names["csi-rbdplugin"] = csi_owner_name
         csi_owner_kind = constants.CONFIGMAP if hci_cluster else constants.DEPLOYMENT
 
-    deployment_kind = OCP(kind=constants.DEPLOYMENT, namespace=namespace)
-    daemonset_kind = OCP(kind=constants.DAEMONSET, namespace=namespace)
-    for (
-        provisioner_name,
-        csi_owner_name,
-    ) in provisioner_deployment_and_owner_names.items():
-        provisioner_deployment = deployment_kind.get(resource_name=provisioner_name)
-        owner_references = provisioner_deployment["metadata"].get("ownerReferences")
-        assert (
-            len(owner_references) == 1
-        ), f"Found more than 1 or none owner reference for {constants.DEPLOYMENT} {provisioner_name}"
-        assert (
-            owner_references[0].get("kind") == csi_owner_kind
-        ), f"Owner reference of {constants.DEPLOYMENT} {provisioner_name} is not of kind {csi_owner_kind}"
-        assert (
-            owner_references[0].get("name") == csi_owner_name
-        ), f"Owner reference of {constants.DEPLOYMENT} {provisioner_name} is not {csi_owner_name} {csi_owner_kind}"
-    log.info("Verified the ownerReferences CSI provisioner deployments")
-    for plugin_name, csi_owner_name in nodeplugin_daemonset_and_owner_names.items():
-        plugin_daemonset = daemonset_kind.get(resource_name=plugin_name)
-        owner_references = plugin_daemonset["metadata"].get("ownerReferences")
-        assert (
-            len(owner_references) == 1
-        ), f"Found more than 1 or none owner reference for {constants.DAEMONSET} {plugin_name}"
-        assert (
-            owner_references[0].get("kind") == csi_owner_kind
-        ), f"Owner reference of {constants.DAEMONSET} {plugin_name} is not of kind {csi_owner_kind}"
-        assert (
-            owner_references[0].get("name") == csi_owner_name
-        ), f"Owner reference of {constants.DAEMONSET} {plugin_name} is not {csi_owner_name} {csi_owner_kind}"
-    log.info("Verified the ownerReferences CSI plugin daemonsets")
-    log.info("Verifying the providerAPIServerServiceType setting in StorageCluster")
-    sc_obj = get_storage_cluster()
-    sc_ob_spec = sc_obj.get().get("items")[0].get("spec")
-    if sc_ob_spec.get("hostNetwork") is True:
-        assert sc_ob_spec.get("providerAPIServerServiceType") in (
-            constants.SERVICE_TYPE_NODEPORT,
-            constants.SERVICE_TYPE_CLUSTERIP,
-        ), f"Provider API server service type is not {constants.SERVICE_TYPE_NODEPORT}"
-        # check the rule in bz DFBUGS-2324 is followed:
-        assert (
-            sc_ob_spec.get("managedResources", {})
-            .get("cephObjectStores", {})
-            .get("hostNetwork", True)
-            is False
-        ), "Host network is not set to False for cephObjectStores when spec.hostNetwork is True"
-    log.info("Verified the providerAPIServerServiceType setting in StorageCluster")
-    log.info("Verifying the csi driver ownership")
-    csi_driver_list = []
-    if not disable_blockpools:
-        csi_driver_list.append(constants.RBD_PROVISIONER)
-    if not disable_cephfs:
-        csi_driver_list.append(constants.CEPHFS_PROVISIONER)
-    if odf_running_version >= version.VERSION_4_19 or hci_cluster:
-        csi_driver_obj = OCP(kind=constants.DRIVER, namespace=namespace)
-        for driver in csi_driver_list:
-            csi_driver = csi_driver_obj.get(resource_name=driver)
-            owner_references = csi_driver["metadata"].get("ownerReferences")
+    ownership_graph = VerificationGraph("OCS install verification - ownership")
+    # resources changed since the first round of checks
+    snapshot.invalidate()
+
+    def verify_csi_deployments_owner():
+        for (
+            provisioner_name,
+            csi_owner_name,
+        ) in provisioner_deployment_and_owner_names.items():
+            provisioner_deployment = snapshot.get_resource(
+                constants.DEPLOYMENT, provisioner_name
+            )
+            owner_references = provisioner_deployment["metadata"].get("ownerReferences")
+            assert (
+                len(owner_references) == 1
+            ), f"Found more than 1 or none owner reference for {constants.DEPLOYMENT} {provisioner_name}"
+            assert (
+                owner_references[0].get("kind") == csi_owner_kind
+            ), f"Owner reference of {constants.DEPLOYMENT} {provisioner_name} is not of kind {csi_owner_kind}"
+            assert (
+                owner_references[0].get("name") == csi_owner_name
+            ), f"Owner reference of {constants.DEPLOYMENT} {provisioner_name} is not {csi_owner_name} {csi_owner_kind}"
+        log.info("Verified the ownerReferences CSI provisioner deployments")
+
+    def verify_csi_daemonsets_owner():
+        for plugin_name, csi_owner_name in nodeplugin_daemonset_and_owner_names.items():
+            plugin_daemonset = snapshot.get_resource(constants.DAEMONSET, plugin_name)
+            owner_references = plugin_daemonset["metadata"].get("ownerReferences")
             assert (
                 len(owner_references) == 1
-            ), f"Found more than 1 or none owner reference for {driver} driver"
+            ), f"Found more than 1 or none owner reference for {constants.DAEMONSET} {plugin_name}"
             assert (
-                owner_references[0].get("kind") == constants.CONFIGMAP
-            ), f"Owner reference of {driver} driver is not of kind ConfigMap"
+                owner_references[0].get("kind") == csi_owner_kind
+            ), f"Owner reference of {constants.DAEMONSET} {plugin_name} is not of kind {csi_owner_kind}"
             assert (
-                owner_references[0].get("name") == constants.CLIENT_OPERATOR_CONFIGMAP
-            ), f"Owner reference of {driver} driver is not {constants.CLIENT_OPERATOR_CONFIGMAP}"
-    log.info("Verified the ownerReferences for CSI drivers")
+                owner_references[0].get("name") == csi_owner_name
+            ), f"Owner reference of {constants.DAEMONSET} {plugin_name} is not {csi_owner_name} {csi_owner_kind}"
+        log.info("Verified the ownerReferences CSI plugin daemonsets")
+
+    def verify_provider_api_server_service_type():
+        log.info("Verifying the providerAPIServerServiceType setting in StorageCluster")
+        sc_obj = get_storage_cluster()
+        sc_ob_spec = sc_obj.get().get("items")[0].get("spec")
+        if sc_ob_spec.get("hostNetwork") is True:
+            assert sc_ob_spec.get("providerAPIServerServiceType") in (
+                constants.SERVICE_TYPE_NODEPORT,
+                constants.SERVICE_TYPE_CLUSTERIP,
+            ), f"Provider API server service type is not {constants.SERVICE_TYPE_NODEPORT}"
+            # check the rule in bz DFBUGS-2324 is followed:
+            assert (
+                sc_ob_spec.get("managedResources", {})
+                .get("cephObjectStores", {})
+                .get("hostNetwork", True)
+                is False
+            ), "Host network is not set to False for cephObjectStores when spec.hostNetwork is True"
+        log.info("Verified the providerAPIServerServiceType setting in StorageCluster")
+
+    def verify_csi_drivers_owner():
+        log.info("Verifying the csi driver ownership")
+        csi_driver_list = []
+        if not disable_blockpools:
+            csi_driver_list.append(constants.RBD_PROVISIONER)
+        if not disable_cephfs:
+            csi_driver_list.append(constants.CEPHFS_PROVISIONER)
+        if odf_running_version >= version.VERSION_4_19 or hci_cluster:
+            for driver in csi_driver_list:
+                csi_driver = snapshot.get_resource(constants.DRIVER, driver)
+                owner_references = csi_driver["metadata"].get("ownerReferences")
+                assert (
+                    len(owner_references) == 1
+                ), f"Found more than 1 or none owner reference for {driver} driver"
+                assert (
+                    owner_references[0].get("kind") == constants.CONFIGMAP
+                ), f"Owner reference of {driver} driver is not of kind ConfigMap"
+                assert (
+                    owner_references[0].get("name")
+                    == constants.CLIENT_OPERATOR_CONFIGMAP
+                ), f"Owner reference of {driver} driver is not {constants.CLIENT_OPERATOR_CONFIGMAP}"
+        log.info("Verified the ownerReferences for CSI drivers")
+
+    ownership_graph.add("CSI deployments owner", verify_csi_deployments_owner)
+    ownership_graph.add("CSI daemonsets owner", verify_csi_daemonsets_owner)
+    ownership_graph.add(
+        "provider API server service type", verify_provider_api_server_service_type
+    )
+    ownership_graph.add("CSI drivers owner", verify_csi_drivers_owner)
+    ownership_report = ownership_graph.run()
+    ownership_report.log_summary()
+    verification_report.merge(ownership_report)
+    ownership_report.raise_first_failure()
 
     no_ceph = (
         config.DEPLOYMENT["external_mode"] or config.ENV_DATA["mcg_only_deployment"]
@@ -1203,6 +1304,8 @@ def ocs_install_verification(
             f"Verified '{constants.INTERNAL_STORAGE_CONSUMER_NAME}' storage consumer resources"
         )
 
+    return verification_report
+
 
 def mcg_only_install_verification(ocs_registry_image=None):
     """
@@ -1334,18 +1437,26 @@ def verify_storage_system():
         )
 
 
-def get_noobaa_phase(namespace: str) -> Optional[str]:
+def get_noobaa_phase(namespace: str, max_age: Optional[float] = None) -> Optional[str]:
     """
     Get the current phase of the NooBaa CR via a single lightweight API call.
 
     Args:
         namespace (str): Kubernetes namespace where NooBaa is deployed.
+        max_age (float): If set, Ready phase followed by the background
+            health tracker is returned without the API call when it is fresh,
+            other tracked phases are checked by the API call.
 
     Returns:
         Optional[str]: NooBaa phase string (e.g. "Ready", "Configuring"),
             or None if the CR cannot be retrieved.
 
     """
+    tracked_phase = health_tracker.get_tracked_health(
+        health_tracker.NOOBAA, namespace=namespace, max_age=max_age
+    )
+    if tracked_phase == constants.STATUS_READY:
+        return tracked_phase
     try:
         noobaa = OCP(kind="noobaa", namespace=namespace).get(
             resource_name=constants.NOOBAA_RESOURCE_NAME
@@ -1356,7 +1467,9 @@ def get_noobaa_phase(namespace: str) -> Optional[str]:
         return None
 
 
-def get_storage_cluster_phase(namespace: str) -> Optional[str]:
+def get_storage_cluster_phase(
+    namespace: str, max_age: Optional[float] = None
+) -> Optional[str]:
     """
     Get the current phase of the StorageCluster CR via a single lightweight
     API call.
@@ -1364,12 +1477,20 @@ def get_storage_cluster_phase(namespace: str) -> Optional[str]:
     Args:
         namespace (str): Kubernetes namespace where the StorageCluster is
             deployed.
+        max_age (float): If set, Ready phase followed by the background
+            health tracker is returned without the API call when it is fresh,
+            other tracked phases are checked by the API call.
 
     Returns:
         Optional[str]: StorageCluster phase string (e.g. "Ready",
             "Progressing"), or None if the CR cannot be retrieved.
 
     """
+    tracked_phase = health_tracker.get_tracked_health(
+        health_tracker.STORAGECLUSTER, namespace=namespace, max_age=max_age
+    )
+    if tracked_phase == constants.STATUS_READY:
+        return tracked_phase
     try:
         sc_name = config.ENV_DATA["storage_cluster_name"]
         sc = OCP(kind=constants.STORAGECLUSTER, namespace=namespace).get(
@@ -2286,14 +2407,10 @@ def get_osd_count():
         int: osd count (In the case of external mode it returns 0)
 
     """
-    sc = get_storage_cluster()
-    sc_data = sc.get().get("items")[0]
-    if sc_data["spec"].get("externalStorage", {}).get("enable"):
-        return 0
-    return sum(
-        int(ds["count"]) * int(ds["replica"])
-        for ds in sc_data["spec"]["storageDeviceSets"]
-    )
+    # importing here to avoid circular imports
+    from ocs_ci.utility.cluster_facts import get_storage_cluster_facts
+
+    return get_storage_cluster_facts()["osd_count"]
 
 
 def get_osd_size():
@@ -3809,7 +3926,10 @@ def check_unnecessary_pods_present():
     mcg_only = config.ENV_DATA["mcg_only_deployment"]
     no_ceph = config.DEPLOYMENT["external_mode"]
     pod_names = [
-        pod.name for pod in get_all_pods(namespace=config.ENV_DATA["cluster_namespace"])
+        pod_fields["name"]
+        for pod_fields in get_pods_fields(
+            namespace=config.ENV_DATA["cluster_namespace"], fields=("name",)
+        )
     ]
     log.info(f"Checking if only required operator pods are available in : {pod_names}")
     invalid_pods_found = []
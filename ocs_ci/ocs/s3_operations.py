@@ -0,0 +1,404 @@
+"""
+S3 operation layer for MCG and RGW endpoints.
+
+One boto3 client is kept per endpoint and credentials, with a connection pool
+large enough for the parallel operations, so the helpers don't create a new
+client (and TLS connections) or fork the AWS CLI for every object:
+
+ * per-object operations (put, tagging, ...) run concurrently with bounded
+   parallelism (see run_parallel)
+ * deletion uses the DeleteObjects batch API, 1000 keys per request
+
+Number of operations, errors, transferred bytes and time spent are counted per
+operation, see S3Operations.get_stats and get_s3_stats.
+"""
+
+import hashlib
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import boto3
+import botocore.config
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+DEFAULT_MAX_WORKERS = 16
+# max number of keys of one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# seconds to wait for the TCP connection when checking the endpoint
+REACHABILITY_TIMEOUT = 5
+
+_operations = {}
+_operations_lock = threading.Lock()
+# endpoint -> True if the test runner can connect to it
+_reachable_endpoints = {}
+
+
+def run_parallel(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Call the function for every item with bounded parallelism
+
+    Args:
+        func (callable): Function called with one item
+        items (iterable): Items
+        max_workers (int): Max number of concurrent calls
+
+    Returns:
+        list: Results in the order of the items
+
+    Raises:
+        Exception: The first exception raised by the function, after all the
+            calls finished
+
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers <= 1 or len(items) == 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    errors = [future.exception() for future in futures if future.exception()]
+    if errors:
+        log.error(f"{len(errors)} of {len(items)} parallel calls failed")
+        raise errors[0]
+    return [future.result() for future in futures]
+
+
+class S3Operations(object):
+    """
+    S3 operations with a pooled client of one endpoint and credentials
+    """
+
+    def __init__(
+        self,
+        endpoint=None,
+        access_key_id=None,
+        access_key=None,
+        verify=None,
+        max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS,
+        max_workers=DEFAULT_MAX_WORKERS,
+        region=None,
+        client=None,
+    ):
+        """
+        Args:
+            endpoint (str): S3 endpoint URL, AWS if None
+            access_key_id (str): Access key ID
+            access_key (str): Secret access key
+            verify (bool or str): TLS verification, path of the CA bundle or
+                False to disable it
+            max_pool_connections (int): Max number of pooled connections
+            max_workers (int): Max number of concurrent operations
+            region (str): Region of the endpoint
+            client (botocore.client.S3): Existing client used instead of
+                a new one (e.g. a client with session token), parallelism is
+                limited by its connection pool
+
+        """
+        if client is not None:
+            endpoint = client.meta.endpoint_url
+            max_pool_connections = client.meta.config.max_pool_connections
+        self.endpoint = endpoint
+        self.max_workers = min(max_workers, max_pool_connections)
+        # boto3 clients are thread safe, but their creation is not, so the
+        # client has its own session
+        self.client = client or boto3.session.Session().client(
+            "s3",
+            endpoint_url=endpoint,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=access_key,
+            verify=verify,
+            region_name=region,
+            config=botocore.config.Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 8},
+                tcp_keepalive=True,
+            ),
+        )
+        # operation -> [count, errors, bytes, seconds]
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _call(self, operation, func, *args, size=0, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record(operation, time.perf_counter() - start, error=True)
+            raise
+        self._record(operation, time.perf_counter() - start, size)
+        return result
+
+    def _record(self, operation, duration, size=0, error=False, count=1):
+        with self._lock:
+            stats = self._stats.setdefault(operation, [0, 0, 0, 0.0])
+            stats[0] += count
+            stats[1] += count if error else 0
+            stats[2] += size
+            stats[3] += duration
+
+    def _parallel(self, func, items):
+        return run_parallel(func, items, self.max_workers)
+
+    def put_objects(self, bucket, objects):
+        """
+        Upload the objects concurrently
+
+        Args:
+            bucket (str): Name of the bucket
+            objects (dict): Object key -> body (str or bytes)
+
+        Returns:
+            list: put_object responses in the order of the objects
+
+        """
+
+        def put(item):
+            key, body = item
+            if isinstance(body, str):
+                body = body.encode()
+            return self._call(
+                "put_object",
+                self.client.put_object,
+                Bucket=bucket,
+                Key=key,
+                Body=body,
+                size=len(body),
+            )
+
+        return self._parallel(put, objects.items())
+
+    def delete_objects(self, bucket, keys):
+        """
+        Delete the objects by DeleteObjects requests of up to 1000 keys
+
+        Args:
+            bucket (str): Name of the bucket
+            keys (list): Object keys (str) or dicts with 'Key' and optional
+                'VersionId'
+
+        Returns:
+            dict: 'Deleted' and 'Errors' of all the requests
+
+        """
+        objects = [key if isinstance(key, dict) else {"Key": key} for key in keys]
+        batches = [
+            objects[index : index + DELETE_BATCH_SIZE]
+            for index in range(0, len(objects), DELETE_BATCH_SIZE)
+        ]
+
+        def delete(batch):
+            return self._call(
+                "delete_objects",
+                self.client.delete_objects,
+                Bucket=bucket,
+                Delete={"Objects": batch},
+            )
+
+        result = {"Deleted": [], "Errors": []}
+        for response in self._parallel(delete, batches):
+            result["Deleted"].extend(response.get("Deleted", []))
+            result["Errors"].extend(response.get("Errors", []))
+        if result["Errors"]:
+            self._record("delete_objects", 0, error=True, count=len(result["Errors"]))
+        return result
+
+    def put_object_tagging(self, bucket, keys, tag_set):
+        """
+        Set the tags of the objects concurrently
+
+        Args:
+            bucket (str): Name of the bucket
+            keys (list): Object keys
+            tag_set (list): Tags in the S3 format: [{'Key': k, 'Value': v}]
+
+        """
+
+        def put_tagging(key):
+            self._call(
+                "put_object_tagging",
+                self.client.put_object_tagging,
+                Bucket=bucket,
+                Key=key,
+                Tagging={"TagSet": tag_set},
+            )
+
+        self._parallel(put_tagging, keys)
+
+    def get_object_tagging(self, bucket, keys):
+        """
+        Get the tags of the objects concurrently
+
+        Args:
+            bucket (str): Name of the bucket
+            keys (list): Object keys
+
+        Returns:
+            dict: Object key -> tags in the S3 format
+
+        """
+
+        def get_tagging(key):
+            return self._call(
+                "get_object_tagging",
+                self.client.get_object_tagging,
+                Bucket=bucket,
+                Key=key,
+            )["TagSet"]
+
+        return dict(zip(keys, self._parallel(get_tagging, keys)))
+
+    def delete_object_tagging(self, bucket, keys):
+        """
+        Delete the tags of the objects concurrently
+
+        Args:
+            bucket (str): Name of the bucket
+            keys (list): Object keys
+
+        """
+
+        def delete_tagging(key):
+            self._call(
+                "delete_object_tagging",
+                self.client.delete_object_tagging,
+                Bucket=bucket,
+                Key=key,
+            )
+
+        self._parallel(delete_tagging, keys)
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Operation -> count, errors, bytes, seconds (cumulative time
+                of the calls), ops_per_second and bytes_per_second (per
+                second of the cumulative time)
+
+        """
+        with self._lock:
+            stats = {key: list(value) for key, value in self._stats.items()}
+        result = {}
+        for operation, (count, errors, size, seconds) in stats.items():
+            result[operation] = {
+                "count": count,
+                "errors": errors,
+                "bytes": size,
+                "seconds": round(seconds, 3),
+                "ops_per_second": round(count / seconds, 1) if seconds else None,
+                "bytes_per_second": int(size / seconds) if seconds else None,
+            }
+        return result
+
+
+def get_s3_operations(endpoint, access_key_id, access_key, verify=None, **kwargs):
+    """
+    Get the S3 operations of the endpoint and credentials, the instance (and
+    its client) is reused by all the callers
+
+    Args:
+        endpoint (str): S3 endpoint URL
+        access_key_id (str): Access key ID
+        access_key (str): Secret access key
+        verify (bool or str): TLS verification
+        kwargs (dict): Other arguments of S3Operations, used only when the
+            instance is created
+
+    Returns:
+        S3Operations: The shared instance
+
+    """
+    key = (
+        endpoint,
+        access_key_id,
+        hashlib.sha256((access_key or "").encode()).hexdigest(),
+        verify,
+    )
+    with _operations_lock:
+        operations = _operations.get(key)
+        if operations is None:
+            log.debug(f"Creating S3 client for {endpoint} and key {access_key_id}")
+            operations = S3Operations(
+                endpoint, access_key_id, access_key, verify, **kwargs
+            )
+            _operations[key] = operations
+        return operations
+
+
+def is_endpoint_reachable(endpoint, timeout=REACHABILITY_TIMEOUT):
+    """
+    Check the test runner can open a TCP connection to the endpoint, e.g. the
+    external route of MCG may not be reachable from the runner while the
+    internal endpoint is reachable from the pods. The result is cached per
+    endpoint.
+
+    Args:
+        endpoint (str): S3 endpoint URL, AWS if None
+        timeout (int): Seconds to wait for the connection
+
+    Returns:
+        bool: True if the endpoint is reachable
+
+    """
+    if not endpoint:
+        return True
+    with _operations_lock:
+        if endpoint in _reachable_endpoints:
+            return _reachable_endpoints[endpoint]
+    parsed = urlparse(endpoint)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        socket.create_connection((parsed.hostname, port), timeout=timeout).close()
+        reachable = True
+    except OSError as ex:
+        log.info(f"S3 endpoint {endpoint} is not reachable from the runner: {ex}")
+        reachable = False
+    with _operations_lock:
+        _reachable_endpoints[endpoint] = reachable
+    return reachable
+
+
+def get_s3_stats():
+    """
+    Returns:
+        dict: Endpoint -> operation -> counters, counters of all credentials
+            of the endpoint are summed
+
+    """
+    with _operations_lock:
+        operations = list(_operations.values())
+    result = {}
+    for s3_ops in operations:
+        endpoint_stats = result.setdefault(s3_ops.endpoint or "aws", {})
+        for operation, stats in s3_ops.get_stats().items():
+            if operation not in endpoint_stats:
+                endpoint_stats[operation] = stats
+                continue
+            merged = endpoint_stats[operation]
+            for counter in ("count", "errors", "bytes", "seconds"):
+                merged[counter] += stats[counter]
+            merged["ops_per_second"] = (
+                round(merged["count"] / merged["seconds"], 1)
+                if merged["seconds"]
+                else None
+            )
+            merged["bytes_per_second"] = (
+                int(merged["bytes"] / merged["seconds"]) if merged["seconds"] else None
+            )
+    return result
+
+
+def clear_s3_operations():
+    """
+    Forget all the shared instances (e.g. after credentials were rotated)
+    """
+    with _operations_lock:
+        _operations.clear()
+        _reachable_endpoints.clear()
@@ -541,17 +541,15 @@ def add_worker_based_on_cpu_utilization(
         config.ENV_DATA["deployment_type"] == "ipi"
         and config.ENV_DATA["platform"].lower() == "aws"
     ):
-        app_nodes = node.get_nodes(node_type=role_type)
         uti_dict = node.get_node_resource_utilization_from_oc_describe(
             node_type=role_type
         )
         uti_high_nodes, uti_less_nodes = ([], [])
-        for node_obj in app_nodes:
-            utilization_percent = uti_dict[f"{node_obj.name}"]["cpu"]
-            if utilization_percent > expected_percent:
-                uti_high_nodes.append(node_obj.name)
+        for node_name, utilization in uti_dict.items():
+            if utilization["cpu"] > expected_percent:
+                uti_high_nodes.append(node_name)
             else:
-                uti_less_nodes.append(node_obj.name)
+                uti_less_nodes.append(node_name)
         if len(uti_less_nodes) <= 1:
             for name in machineset_name:
                 count = machine.get_replica_count(machine_set=name)
@@ -599,15 +597,13 @@ def add_worker_based_on_pods_count_per_node(
         config.ENV_DATA["deployment_type"] == "ipi"
         and config.ENV_DATA["platform"].lower() == "aws"
     ):
-        app_nodes = node.get_nodes(node_type=role_type)
         pod_count_dict = node.get_running_pod_count_from_node(node_type=role_type)
         high_count_nodes, less_count_nodes = ([], [])
-        for node_obj in app_nodes:
-            count = pod_count_dict[f"{node_obj.name}"]
+        for node_name, count in pod_count_dict.items():
             if count >= expected_count:
-                high_count_nodes.append(node_obj.name)
+                high_count_nodes.append(node_name)
             else:
-                less_count_nodes.append(node_obj.name)
+                less_count_nodes.append(node_name)
         if len(less_count_nodes) <= 1:
             for name in machineset_name:
                 count = machine.get_replica_count(machine_set=name)
@@ -0,0 +1,620 @@
+"""
+Declarative stage engine for longevity runs.
+
+A stage is a graph of batches. A batch creates resources (e.g. bulk PVCs by
+kube jobs) and waits until all of them are ready, deletes the resources of
+another batch and waits until they are gone, or runs any other action. The
+batches declare their dependencies and the engine runs every batch as soon
+as its dependencies are done, independent batches run concurrently with
+bounded parallelism.
+
+Readiness is evaluated from list snapshots shared by all the batches: one
+'oc get <kind> -n <namespace>' per poll interval serves every batch waiting
+for resources of the kind, instead of one 'oc get -f <kube job>' per kube
+job and poll. A batch is done as soon as its resources are ready, there are
+no fixed sleeps between the steps.
+
+Count and latency (from the start of the batch until its resources are ready
+or gone) of every batch are recorded by StageMetrics with the throughput in
+resources per minute, so creation and deletion rates of PVCs, pods and OBCs
+can be compared across cycles and releases.
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import yaml
+from prettytable import PrettyTable
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+# seconds between list snapshots of the resources of one kind and namespace
+DEFAULT_POLL_INTERVAL = 10
+DEFAULT_READY_TIMEOUT = 1800
+
+CREATE = "create"
+DELETE = "delete"
+ACTION = "action"
+
+
+def is_resource_ready(item):
+    """
+    Default readiness condition: PVCs and OBCs are Bound, pods are Running,
+    other resources are ready once they exist
+
+    Args:
+        item (dict): Resource from the list snapshot
+
+    Returns:
+        bool: True if the resource is ready
+
+    """
+    phase = (item.get("status") or {}).get("phase")
+    kind = item.get("kind")
+    if kind in (constants.PVC, constants.OBC):
+        return phase == constants.STATUS_BOUND
+    if kind == constants.POD:
+        return phase == constants.STATUS_RUNNING
+    return True
+
+
+def get_kube_job_resource_names(kube_job):
+    """
+    Args:
+        kube_job (ObjectConfFile): Kube job
+
+    Returns:
+        list: Names of the resources defined by the kube job
+
+    """
+    return [
+        obj_dict["metadata"]["name"]
+        for obj_dict in yaml.safe_load_all(kube_job.yaml_file.read_text())
+        if obj_dict
+    ]
+
+
+class ResourceSnapshots(object):
+    """
+    List snapshots of resources shared by the waiting batches
+    """
+
+    def __init__(self, max_age=DEFAULT_POLL_INTERVAL):
+        """
+        Args:
+            max_age (float): Seconds a snapshot is reused before the resources
+                are listed again
+
+        """
+        self.max_age = max_age
+        self.lists = 0
+        # (kind, namespace) -> (monotonic time of the list, name -> item)
+        self._snapshots = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, namespace):
+        """
+        Get the snapshot of the resources, the resources are listed if the
+        last snapshot is older than max_age
+
+        Args:
+            kind (str): Kind of the resources
+            namespace (str): Namespace of the resources
+
+        Returns:
+            dict: Name of the resource -> resource
+
+        """
+        key = (kind, namespace)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        # other batches waiting for the same kind use the list of the first one
+        with lock:
+            listed_at, items = self._snapshots.get(key, (None, None))
+            if listed_at is None or time.monotonic() - listed_at >= self.max_age:
+                items = {
+                    item["metadata"]["name"]: dict(item, kind=item.get("kind", kind))
+                    for item in OCP(kind=kind, namespace=namespace).get()["items"]
+                }
+                self.lists += 1
+                self._snapshots[key] = (time.monotonic(), items)
+            return items
+
+    def wait_for(
+        self,
+        kind,
+        namespace,
+        names,
+        condition=is_resource_ready,
+        present=True,
+        timeout=DEFAULT_READY_TIMEOUT,
+    ):
+        """
+        Wait until all the resources meet the condition or are gone
+
+        Args:
+            kind (str): Kind of the resources
+            namespace (str): Namespace of the resources
+            names (list): Names of the resources
+            condition (function): Called with the resource, returns True if the
+                resource is ready
+            present (bool): False to wait until the resources are deleted
+            timeout (float): Max time to wait in seconds
+
+        Returns:
+            list: Names of the resources
+
+        Raises:
+            TimeoutExpiredError: If some of the resources are not ready or not
+                deleted in the timeout
+
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            items = self.get(kind, namespace)
+            if present:
+                pending = [
+                    name
+                    for name in names
+                    if name not in items or not condition(items[name])
+                ]
+            else:
+                pending = [name for name in names if name in items]
+            if not pending:
+                return list(names)
+            if time.monotonic() >= deadline:
+                state = "ready" if present else "deleted"
+                raise TimeoutExpiredError(
+                    timeout,
+                    f"{len(pending)} of {len(names)} {kind} resources in namespace "
+                    f"{namespace} not {state} in {timeout}s: {pending[:10]}",
+                )
+            log.debug(
+                f"Waiting for {len(pending)} of {len(names)} {kind} resources in "
+                f"namespace {namespace}"
+            )
+            time.sleep(self.max_age)
+
+
+class BatchResult(object):
+    """
+    Outcome of one batch
+    """
+
+    def __init__(self, name, kind, operation, names=None, kube_jobs=None, value=None):
+        """
+        Args:
+            name (str): Name of the batch
+            kind (str): Kind of the resources
+            operation (str): CREATE, DELETE or ACTION
+            names (list): Names of the resources
+            kube_jobs (list): Kube jobs of the resources
+            value: Return value of the action
+
+        """
+        self.name = name
+        self.kind = kind
+        self.operation = operation
+        self.names = names or []
+        self.kube_jobs = kube_jobs or []
+        self.value = value
+        self.count = len(self.names)
+        self.seconds = 0.0
+
+
+class Batch(object):
+    """
+    Base of the batches of the stage graph
+    """
+
+    operation = ACTION
+
+    def __init__(self, name, kind=None, depends_on=(), timeout=DEFAULT_READY_TIMEOUT):
+        """
+        Args:
+            name (str): Name of the batch, unique in the stage
+            kind (str): Kind of the resources of the batch
+            depends_on (list): Names of the batches which have to be done first
+            timeout (float): Max time to wait for the resources in seconds
+
+        """
+        self.name = name
+        self.kind = kind
+        self.depends_on = list(depends_on)
+        self.timeout = timeout
+
+    def run(self, results, snapshots):
+        """
+        Run the batch
+
+        Args:
+            results (dict): Name of the batch -> BatchResult of the batches
+                which are done
+            snapshots (ResourceSnapshots): Shared list snapshots
+
+        Returns:
+            BatchResult: Outcome of the batch
+
+        """
+        raise NotImplementedError
+
+
+class ResourceBatch(Batch):
+    """
+    Create resources by kube jobs and wait until they are ready
+    """
+
+    operation = CREATE
+
+    def __init__(
+        self,
+        name,
+        kind,
+        namespace,
+        create,
+        depends_on=(),
+        condition=is_resource_ready,
+        timeout=DEFAULT_READY_TIMEOUT,
+    ):
+        """
+        Args:
+            name (str): Name of the batch, unique in the stage
+            kind (str): Kind of the resources
+            namespace (str): Namespace of the resources
+            create (function): Called with the results of the done batches,
+                creates the kube jobs and returns them
+            depends_on (list): Names of the batches which have to be done first
+            condition (function): Readiness condition of one resource
+            timeout (float): Max time to wait for the resources in seconds
+
+        """
+        super().__init__(name, kind, depends_on, timeout)
+        self.namespace = namespace
+        self.create = create
+        self.condition = condition
+
+    def run(self, results, snapshots):
+        kube_jobs = self.create(results)
+        names = [
+            name
+            for kube_job in kube_jobs
+            for name in get_kube_job_resource_names(kube_job)
+        ]
+        snapshots.wait_for(
+            self.kind,
+            self.namespace,
+            names,
+            condition=self.condition,
+            timeout=self.timeout,
+        )
+        return BatchResult(
+            self.name, self.kind, self.operation, names=names, kube_jobs=kube_jobs
+        )
+
+
+class DeleteBatch(Batch):
+    """
+    Delete the resources of another batch and wait until they are gone
+    """
+
+    operation = DELETE
+
+    def __init__(
+        self, name, target, delete, depends_on=(), timeout=DEFAULT_READY_TIMEOUT
+    ):
+        """
+        Args:
+            name (str): Name of the batch, unique in the stage
+            target (ResourceBatch): Batch of the resources to delete, it is
+                added to the dependencies
+            delete (function): Called with the kube jobs of the target batch,
+                deletes the resources
+            depends_on (list): Names of other batches which have to be done
+                first
+            timeout (float): Max time to wait for the deletion in seconds
+
+        """
+        super().__init__(name, target.kind, [target.name] + list(depends_on), timeout)
+        self.target = target
+        self.delete = delete
+
+    def run(self, results, snapshots):
+        target_result = results[self.target.name]
+        self.delete(target_result.kube_jobs)
+        snapshots.wait_for(
+            self.kind,
+            self.target.namespace,
+            target_result.names,
+            present=False,
+            timeout=self.timeout,
+        )
+        return BatchResult(
+            self.name,
+            self.kind,
+            self.operation,
+            names=target_result.names,
+            kube_jobs=target_result.kube_jobs,
+        )
+
+
+class ActionBatch(Batch):
+    """
+    Run an action, e.g. a fixture creating clones or snapshots of PVCs
+    """
+
+    def __init__(
+        self, name, action, kind=None, count=0, depends_on=(), operation=ACTION
+    ):
+        """
+        Args:
+            name (str): Name of the batch, unique in the stage
+            action (function): Called with the results of the done batches,
+                its return value is stored in BatchResult.value
+            kind (str): Kind of the resources handled by the action
+            count (int): Number of resources handled by the action, for the
+                throughput
+            depends_on (list): Names of the batches which have to be done first
+            operation (str): Name of the operation in the metrics, e.g. 'clone'
+
+        """
+        super().__init__(name, kind, depends_on)
+        self.action = action
+        self.count = count
+        self.operation = operation
+
+    def run(self, results, snapshots):
+        result = BatchResult(
+            self.name, self.kind, self.operation, value=self.action(results)
+        )
+        result.count = self.count
+        return result
+
+
+class StageMetrics(object):
+    """
+    Count, latency and throughput of the batches per iteration of the stages
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, stage, iteration, result):
+        """
+        Record the batch
+
+        Args:
+            stage (str): Name of the stage
+            iteration (int): Iteration (cycle) of the stage
+            result (BatchResult): Outcome of the batch
+
+        """
+        per_minute = result.count * 60 / result.seconds if result.seconds else 0
+        with self._lock:
+            self.records.append(
+                {
+                    "stage": stage,
+                    "iteration": iteration,
+                    "batch": result.name,
+                    "kind": result.kind,
+                    "operation": result.operation,
+                    "count": result.count,
+                    "seconds": round(result.seconds, 2),
+                    "per_minute": round(per_minute, 2),
+                }
+            )
+
+    def get_records(self, stage=None, iteration=None):
+        """
+        Args:
+            stage (str): Name of the stage, all the stages if None
+            iteration (int): Iteration of the stage, all if None
+
+        Returns:
+            list: Records of the batches
+
+        """
+        with self._lock:
+            return [
+                record
+                for record in self.records
+                if stage in (None, record["stage"])
+                and iteration in (None, record["iteration"])
+            ]
+
+    def get_summary(self, stage=None, iteration=None):
+        """
+        Throughput per kind and operation, the resources of all the matching
+        batches divided by the sum of their latencies
+
+        Args:
+            stage (str): Name of the stage, all the stages if None
+            iteration (int): Iteration of the stage, all if None
+
+        Returns:
+            dict: (kind, operation) -> dict with count, batches, seconds,
+                per_minute and max_seconds
+
+        """
+        summary = {}
+        for record in self.get_records(stage, iteration):
+            if not record["kind"] or not record["count"]:
+                continue
+            entry = summary.setdefault(
+                (record["kind"], record["operation"]),
+                {"count": 0, "batches": 0, "seconds": 0.0, "max_seconds": 0.0},
+            )
+            entry["count"] += record["count"]
+            entry["batches"] += 1
+            entry["seconds"] += record["seconds"]
+            entry["max_seconds"] = max(entry["max_seconds"], record["seconds"])
+        for entry in summary.values():
+            entry["per_minute"] = (
+                round(entry["count"] * 60 / entry["seconds"], 2)
+                if entry["seconds"]
+                else 0
+            )
+        return summary
+
+    def log_summary(self, stage=None, iteration=None):
+        """
+        Log the table of the throughput per kind and operation
+
+        Args:
+            stage (str): Name of the stage, all the stages if None
+            iteration (int): Iteration of the stage, all if None
+
+        """
+        table = PrettyTable()
+        table.field_names = [
+            "Kind",
+            "Operation",
+            "Count",
+            "Batches",
+            "Per minute",
+            "Max latency (s)",
+        ]
+        for (kind, operation), entry in sorted(
+            self.get_summary(stage, iteration).items()
+        ):
+            table.add_row(
+                [
+                    kind,
+                    operation,
+                    entry["count"],
+                    entry["batches"],
+                    entry["per_minute"],
+                    entry["max_seconds"],
+                ]
+            )
+        log.info(
+            f"Throughput of {stage or 'all stages'} iteration {iteration}:\n{table}"
+        )
+
+    def write(self, path):
+        """
+        Write the records into the JSON file
+
+        Args:
+            path (str): Path of the file
+
+        """
+        with open(path, "w") as metrics_file:
+            json.dump(self.get_records(), metrics_file, indent=2)
+
+
+class StageEngine(object):
+    """
+    Run the graph of batches of a stage
+    """
+
+    def __init__(
+        self,
+        name,
+        max_workers=DEFAULT_MAX_WORKERS,
+        snapshots=None,
+        metrics=None,
+    ):
+        """
+        Args:
+            name (str): Name of the stage
+            max_workers (int): Max number of batches running at once
+            snapshots (ResourceSnapshots): List snapshots shared with other
+                engines, new ones if None
+            metrics (StageMetrics): Metrics shared with other engines, new ones
+                if None
+
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.snapshots = snapshots or ResourceSnapshots()
+        self.metrics = metrics or StageMetrics()
+        self.batches = {}
+
+    def add(self, batch):
+        """
+        Add the batch to the stage
+
+        Args:
+            batch (Batch): The batch, its dependencies have to be added first
+
+        Returns:
+            Batch: The added batch
+
+        Raises:
+            ValueError: If the name is not unique or a dependency is unknown
+
+        """
+        if batch.name in self.batches:
+            raise ValueError(f"Batch {batch.name} is already in stage {self.name}")
+        unknown = [name for name in batch.depends_on if name not in self.batches]
+        if unknown:
+            raise ValueError(f"Batch {batch.name} depends on unknown batches {unknown}")
+        self.batches[batch.name] = batch
+        return batch
+
+    def _run_batch(self, batch, results):
+        log.info(f"Stage {self.name}: starting batch {batch.name}")
+        start = time.monotonic()
+        result = batch.run(results, self.snapshots)
+        result.seconds = time.monotonic() - start
+        log.info(
+            f"Stage {self.name}: batch {batch.name} done, {result.count} "
+            f"{result.kind or 'items'} in {result.seconds:.1f}s"
+        )
+        return result
+
+    def run(self, iteration=1):
+        """
+        Run the batches, each one as soon as its dependencies are done
+
+        Args:
+            iteration (int): Iteration (cycle) of the stage for the metrics
+
+        Returns:
+            dict: Name of the batch -> BatchResult
+
+        Raises:
+            Exception: The first failure of a batch, after the running batches
+                finished, batches depending on a failed one are not started
+
+        """
+        results = {}
+        pending = dict(self.batches)
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    for name, batch in list(pending.items()):
+                        if all(dep in results for dep in batch.depends_on):
+                            del pending[name]
+                            future = executor.submit(
+                                self._run_batch, batch, dict(results)
+                            )
+                            running[future] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as ex:
+                        log.error(f"Stage {self.name}: batch {name} failed: {ex}")
+                        error = error or ex
+                        continue
+                    self.metrics.add(self.name, iteration, results[name])
+        self.metrics.log_summary(self.name, iteration)
+        if error:
+            raise error
+        return results
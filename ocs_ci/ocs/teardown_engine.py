@@ -0,0 +1,340 @@
+"""
+Dependency ordered teardown of resources created by tests.
+
+TeardownEngine gathers resources (OCS or OCP objects) and deletes them level
+by level in the dependency order: workloads -> PVCs -> PVs -> storage classes
+-> pools and secrets -> projects. All resources of one level are deleted by
+one bulk 'oc delete --wait=false' per kind and namespace (executed
+concurrently) and the whole level is awaited by listing the remaining
+resources of each kind only (names projected via jsonpath) instead of
+waiting for every resource one by one. PVs backing the deleted PVCs are
+awaited in the PV level. Namespaced resources of projects which are removed
+by the same engine are not deleted one by one, they are removed together
+with the project. Resources still present after the timeout are reported
+as leftovers.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceLeftoversException,
+    TimeoutExpiredError,
+)
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import TimeoutSampler
+
+log = logging.getLogger(__name__)
+
+PROJECT_KINDS = ("project", "namespace", "namespaces")
+# kinds not listed here are deleted in the first level together with workloads
+TEARDOWN_LEVELS = (
+    (constants.PVC,),
+    (constants.PV,),
+    (constants.STORAGECLASS, constants.VOLUMESNAPSHOTCLASS),
+    (constants.CEPHBLOCKPOOL, constants.CEPHFILESYSTEM, constants.SECRET),
+    PROJECT_KINDS,
+)
+KIND_LEVEL = {
+    kind.lower(): level
+    for level, kinds in enumerate(TEARDOWN_LEVELS, start=1)
+    for kind in kinds
+}
+PROJECT_LEVEL = len(TEARDOWN_LEVELS)
+PV_LEVEL = KIND_LEVEL[constants.PV.lower()]
+PROTECTED_RESOURCES = (
+    constants.DEFAULT_STORAGECLASS_CEPHFS,
+    constants.DEFAULT_STORAGECLASS_RBD,
+)
+
+
+def get_teardown_level(kind):
+    """
+    Args:
+        kind (str): Kind of the resource
+
+    Returns:
+        int: Level in which the resource is deleted, lower levels first
+
+    """
+    return KIND_LEVEL.get(kind.lower(), 0)
+
+
+class TeardownEngine(object):
+    """
+    Delete the registered resources in dependency order with bulk deletes
+    """
+
+    def __init__(
+        self,
+        timeout=300,
+        sleep=3,
+        max_workers=8,
+        reclaim_retained_pvs=True,
+        raise_on_leftovers=True,
+    ):
+        """
+        Args:
+            timeout (int): Time in seconds to wait for resources of one level
+                to be deleted
+            sleep (int): Seconds between listings of the remaining resources
+            max_workers (int): Max number of concurrent bulk deletes
+            reclaim_retained_pvs (bool): If True, PVs with Retain reclaim
+                policy backing the deleted PVCs are patched to Delete once
+                released and awaited, otherwise they are kept
+            raise_on_leftovers (bool): Raise ResourceLeftoversException from
+                run() if some resources were not deleted
+
+        """
+        self.timeout = timeout
+        self.sleep = sleep
+        self.max_workers = max_workers
+        self.reclaim_retained_pvs = reclaim_retained_pvs
+        self.raise_on_leftovers = raise_on_leftovers
+        # cluster index -> {(kind, namespace, name): resource object}
+        self.resources = defaultdict(dict)
+        self.leftovers = []
+
+    def add(self, resource_obj):
+        """
+        Register resource (or list of resources) to delete
+
+        Args:
+            resource_obj (OCS|OCP|list): OCS object, OCP object with
+                resource_name set (or Project OCP object) or list of them
+
+        Returns:
+            TeardownEngine: self, to allow chaining
+
+        """
+        if isinstance(resource_obj, (list, tuple)):
+            for item in resource_obj:
+                self.add(item)
+            return self
+        if getattr(resource_obj, "is_deleted", False) is True:
+            return self
+        # OCS objects (and their subclasses) carry the OCP object
+        if hasattr(resource_obj, "ocp"):
+            kind, name, namespace = (
+                resource_obj.kind,
+                resource_obj.name,
+                resource_obj.namespace,
+            )
+            ocp_obj = resource_obj.ocp
+        else:
+            kind, name, namespace = (
+                resource_obj.kind,
+                resource_obj.resource_name,
+                resource_obj.namespace,
+            )
+            ocp_obj = resource_obj
+        if kind.lower() in PROJECT_KINDS:
+            kind, name, namespace = "Project", name or namespace, None
+        if not name or name in PROTECTED_RESOURCES:
+            log.info(f"Skipping teardown of {kind} {name}")
+            return self
+        cluster_index = getattr(ocp_obj, "cluster_context", None)
+        if cluster_index is None:
+            cluster_index = config.cur_index
+        self.resources[cluster_index][(kind, namespace, name)] = resource_obj
+        return self
+
+    def run(self):
+        """
+        Delete all the registered resources
+
+        Returns:
+            list: Leftovers as (kind, namespace, name) tuples
+
+        Raises:
+            ResourceLeftoversException: If some resources were not deleted
+                and raise_on_leftovers is True
+
+        """
+        self.leftovers = []
+        for cluster_index, resources in self.resources.items():
+            with config.RunWithConfigContext(cluster_index):
+                self._run_cluster(resources)
+        self.resources.clear()
+        if self.leftovers:
+            msg = f"Resources not deleted in teardown: {self.leftovers}"
+            log.error(msg)
+            if self.raise_on_leftovers:
+                raise ResourceLeftoversException(msg)
+        return self.leftovers
+
+    def _run_cluster(self, resources):
+        projects = {name for kind, _, name in resources if kind == "Project"}
+        levels = defaultdict(list)
+        for key, resource_obj in resources.items():
+            kind, namespace, _ = key
+            # removed together with the project
+            if namespace in projects:
+                continue
+            levels[get_teardown_level(kind)].append(key)
+        pvcs_by_namespace = defaultdict(set)
+        for kind, namespace, name in resources:
+            if kind.lower() == constants.PVC.lower():
+                pvcs_by_namespace[namespace].add(name)
+        backing_pvs = self._get_backing_pvs(pvcs_by_namespace)
+        pvs_with_projects = {
+            pv: namespace
+            for pv, namespace in backing_pvs.items()
+            if namespace in projects
+        }
+        for level in range(PROJECT_LEVEL + 1):
+            keys = levels.get(level, [])
+            if keys:
+                self._delete_level(level, keys)
+            if level == PV_LEVEL:
+                self._wait_for_pvs(
+                    {pv for pv in backing_pvs if pv not in pvs_with_projects}
+                )
+        self._wait_for_pvs(set(pvs_with_projects))
+        for resource_obj in resources.values():
+            if hasattr(resource_obj, "set_deleted"):
+                resource_obj.set_deleted()
+
+    def _get_backing_pvs(self, pvcs_by_namespace):
+        """
+        Returns:
+            dict: PV name -> namespace of the PVC, for the PVCs which should
+                have their PV awaited
+
+        """
+        backing_pvs = {}
+        for namespace, names in pvcs_by_namespace.items():
+            try:
+                pvcs = OCP(kind=constants.PVC, namespace=namespace).get_fields(
+                    {"name": ".metadata.name", "volume": ".spec.volumeName"}
+                )
+            except CommandFailed as ex:
+                log.warning(f"Failed to list PVCs in {namespace}: {ex}")
+                continue
+            for pvc in pvcs:
+                if pvc["name"] in names and pvc["volume"]:
+                    backing_pvs[pvc["volume"]] = namespace
+        return backing_pvs
+
+    def _delete_level(self, level, keys):
+        groups = defaultdict(list)
+        for kind, namespace, name in keys:
+            groups[(kind, namespace)].append(name)
+        log.info(
+            f"Deleting teardown level {level}: "
+            + ", ".join(
+                f"{len(names)} {kind}" + (f" in {namespace}" if namespace else "")
+                for (kind, namespace), names in groups.items()
+            )
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(
+                executor.map(
+                    lambda group: self._bulk_delete(*group[0], group[1]),
+                    groups.items(),
+                )
+            )
+        by_kind = defaultdict(set)
+        for kind, namespace, name in keys:
+            by_kind[kind].add((namespace, name))
+        for kind, remaining in by_kind.items():
+            self._wait_for_deletion(kind, remaining)
+
+    def _bulk_delete(self, kind, namespace, names):
+        command = f"delete {kind} {' '.join(names)} --wait=false --ignore-not-found"
+        try:
+            OCP(kind=kind, namespace=namespace).exec_oc_cmd(
+                command, out_yaml_format=False
+            )
+        except CommandFailed as ex:
+            log.warning(f"Failed to delete {kind} {names}: {ex}")
+
+    def _list_existing(self, kind, remaining):
+        """
+        Returns:
+            set: (namespace, name) of the remaining resources still present
+
+        """
+        namespaces = {namespace for namespace, _ in remaining}
+        if len(namespaces) == 1:
+            namespace = namespaces.pop()
+            items = OCP(kind=kind, namespace=namespace).get_fields(
+                {"name": ".metadata.name"}, silent=True
+            )
+            present = {(namespace, item["name"]) for item in items}
+        else:
+            items = OCP(kind=kind).get_fields(
+                {"namespace": ".metadata.namespace", "name": ".metadata.name"},
+                all_namespaces=True,
+                silent=True,
+            )
+            present = {(item["namespace"] or None, item["name"]) for item in items}
+        return remaining & present
+
+    def _list_existing_pvs(self, kind, remaining):
+        """
+        List remaining PVs, patch released PVs with Retain reclaim policy to
+        Delete (or stop waiting for them when they should be kept)
+
+        Returns:
+            set: (None, name) of the remaining PVs still present
+
+        """
+        pv_ocp = OCP(kind=kind)
+        pvs = pv_ocp.get_fields(
+            {
+                "name": ".metadata.name",
+                "policy": ".spec.persistentVolumeReclaimPolicy",
+                "phase": ".status.phase",
+            },
+            silent=True,
+        )
+        present = set()
+        for pv in pvs:
+            if (None, pv["name"]) not in remaining:
+                continue
+            if pv["policy"] == constants.RECLAIM_POLICY_RETAIN:
+                if not self.reclaim_retained_pvs:
+                    log.info(f"Keeping PV {pv['name']} with Retain reclaim policy")
+                    continue
+                if pv["phase"] == constants.STATUS_RELEASED:
+                    pv_ocp.patch(
+                        resource_name=pv["name"],
+                        params='{"spec":{"persistentVolumeReclaimPolicy":"Delete"}}',
+                    )
+            present.add((None, pv["name"]))
+        return present
+
+    def _wait_for_deletion(self, kind, remaining, list_existing=None):
+        list_existing = list_existing or self._list_existing
+        start_time = time.time()
+        try:
+            for remaining in TimeoutSampler(
+                self.timeout, self.sleep, list_existing, kind, remaining
+            ):
+                if not remaining:
+                    log.info(
+                        f"All {kind} resources deleted in "
+                        f"{time.time() - start_time:.1f} seconds"
+                    )
+                    return
+                log.info(f"Waiting for deletion of {len(remaining)} {kind}")
+        except TimeoutExpiredError:
+            remaining = sorted(remaining, key=str)
+            log.error(f"{kind} resources not deleted: {remaining}")
+            self.leftovers.extend(
+                (kind, namespace, name) for namespace, name in remaining
+            )
+
+    def _wait_for_pvs(self, pv_names):
+        if pv_names:
+            self._wait_for_deletion(
+                constants.PV,
+                {(None, name) for name in pv_names},
+                list_existing=self._list_existing_pvs,
+            )
@@ -0,0 +1,121 @@
+# -*- coding: utf8 -*-
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+
+from ocs_ci.ocs.ui import browser_pool
+
+
+class FakeSwitchTo(object):
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+class FakeDriver(object):
+    """
+    Driver of a browser logged in to the console
+    """
+
+    def __init__(self):
+        self.handles = ["main"]
+        self.current_handle = "main"
+        self.current_url = None
+        self.cookies = []
+        self.crashed = False
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise InvalidSessionIdException("session deleted")
+        return list(self.handles)
+
+    def execute_script(self, script):
+        return "complete"
+
+    def get(self, url):
+        # the console redirects to the OAuth server without the session cookie
+        logged_in = any(c["name"] == "openshift-session-token" for c in self.cookies)
+        self.current_url = url if logged_in else "https://oauth/login"
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def login(driver):
+    driver.cookies = [{"name": "openshift-session-token", "value": "token"}]
+    driver.get("https://console/dashboards")
+
+
+def validate(driver):
+    return driver.current_url.startswith("https://console")
+
+
+@pytest.fixture
+def pool():
+    return browser_pool.BrowserPool(max_uses=3)
+
+
+def test_warm_start_resets_driver(pool):
+    key = ("https://console", None)
+    driver = pool.acquire(key, FakeDriver, login, validate)
+    driver.handles.append("popup")
+    driver.delete_all_cookies()
+    driver.current_url = "https://console/odf"
+    assert pool.release(driver)
+
+    assert pool.acquire(key, FakeDriver, login, validate) is driver
+    assert driver.handles == ["main"]
+    assert driver.current_url == "https://console/dashboards"
+    assert driver.cookies[0]["name"] == "openshift-session-token"
+    # other user gets its own driver
+    other = pool.acquire(("https://console", "user"), FakeDriver, login, validate)
+    assert other is not driver
+    assert pool.get_stats()["cold"] == 2
+    assert pool.get_stats()["warm"] == 1
+
+
+def test_drivers_are_recycled(pool):
+    key = ("https://console", None)
+    driver = pool.acquire(key, FakeDriver, login, validate)
+    driver.crashed = True
+    new_driver = pool.acquire(key, FakeDriver, login, validate)
+    assert new_driver is not driver and driver.quit_called
+    for _ in range(2):
+        assert pool.acquire(key, FakeDriver, login, validate) is new_driver
+    # used by max_uses tests
+    assert pool.acquire(key, FakeDriver, login, validate) is not new_driver
+    assert pool.get_stats()["recycled"] == 2
+    assert not pool.release(FakeDriver())
+
+
+def test_failed_login_quits_driver(pool):
+    drivers = []
+
+    def create():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    def failing_login(driver):
+        raise TimeoutError("login page not loaded")
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(("https://console", None), create, failing_login)
+    assert drivers[0].quit_called
+    assert not pool.entries
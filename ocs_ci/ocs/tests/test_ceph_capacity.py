@@ -0,0 +1,105 @@
+# -*- coding: utf8 -*-
+
+import math
+
+import pytest
+
+from ocs_ci.ocs.ceph_capacity import CephCapacity
+from ocs_ci.ocs.exceptions import PoolNotFound
+
+GiB = 2**30
+
+
+def ceph_df(stored, bytes_used, max_avail):
+    return {
+        "stats": {"total_bytes": 300 * GiB, "total_used_raw_bytes": 30 * GiB},
+        "pools": [
+            {
+                "name": "ocs-storagecluster-cephblockpool",
+                "id": 1,
+                "stats": {
+                    "stored": stored,
+                    "objects": 10,
+                    "bytes_used": bytes_used,
+                    "percent_used": 0.1,
+                    "max_avail": max_avail,
+                },
+            },
+            {
+                "name": "ocs-storagecluster-cephfilesystem-data0",
+                "id": 3,
+                "stats": {
+                    "stored": 0,
+                    "objects": 0,
+                    "bytes_used": 0,
+                    "percent_used": 0.0,
+                    "max_avail": max_avail,
+                },
+            },
+        ],
+    }
+
+
+def osd_df_tree(kb_used):
+    nodes = [
+        {"id": -1, "name": "default", "type": "root", "children": [-3, -5]},
+        {"id": -3, "name": "compute-0", "type": "host", "children": [0, 1]},
+        {"id": -5, "name": "compute-1", "type": "host", "children": [2]},
+    ]
+    for osd_id, used in enumerate(kb_used):
+        nodes.append(
+            {
+                "id": osd_id,
+                "name": f"osd.{osd_id}",
+                "type": "osd",
+                "kb": 100,
+                "kb_used": used,
+                "kb_avail": 100 - used,
+                "utilization": float(used),
+                "pgs": 100 + osd_id,
+            }
+        )
+    return {"nodes": nodes, "stray": []}
+
+
+def test_pool_and_cluster_aggregates():
+    capacity = CephCapacity(ceph_df(10 * GiB, 30 * GiB, 80 * GiB))
+    assert capacity.total_stored == 10 * GiB
+    assert capacity.percent_used == pytest.approx(10)
+    assert capacity.get_pool_stats("ocs-storagecluster-cephblockpool")["id"] == 1
+    # 50% of (80 + 10) GiB is 45 GiB, 10 GiB is already stored
+    assert (
+        capacity.get_storageutilization_size(0.5, "ocs-storagecluster-cephblockpool")
+        == 35
+    )
+    with pytest.raises(PoolNotFound):
+        capacity.get_pool_stats("missing")
+
+
+def test_osd_and_host_aggregates():
+    capacity = CephCapacity(osd_df=osd_df_tree([20, 40, 60]))
+    assert capacity.get_osd_utilization() == {"osd.0": 20, "osd.1": 40, "osd.2": 60}
+    assert capacity.get_pgs_per_osd() == {"osd.0": 100, "osd.1": 101, "osd.2": 102}
+    assert capacity.get_host_utilization() == {"compute-0": 30, "compute-1": 60}
+    assert capacity.get_osds_below_utilization(40) == ["osd.0"]
+    imbalance = capacity.get_osd_imbalance()
+    assert imbalance["spread"] == 40
+    assert imbalance["max_deviation"] == pytest.approx(0.5)
+
+
+def test_time_to_full():
+    before = CephCapacity(
+        ceph_df(10 * GiB, 30 * GiB, 80 * GiB), osd_df_tree([20, 40, 60]), timestamp=0
+    )
+    after = CephCapacity(
+        ceph_df(20 * GiB, 60 * GiB, 70 * GiB), osd_df_tree([30, 40, 70]), timestamp=10
+    )
+    rates = after.get_pool_fill_rate(before)
+    assert rates["ocs-storagecluster-cephblockpool"] == 3 * GiB
+    time_to_full = after.get_pool_time_to_full(before)
+    # 70 GiB stored with replica 3 at 3 GiB/s of raw capacity
+    assert time_to_full["ocs-storagecluster-cephblockpool"] == pytest.approx(70)
+    assert math.isinf(time_to_full["ocs-storagecluster-cephfilesystem-data0"])
+    osd_time_to_full = after.get_osd_time_to_full(before, full_ratio=0.8)
+    assert osd_time_to_full["osd.0"] == pytest.approx(50)
+    assert math.isinf(osd_time_to_full["osd.1"])
@@ -0,0 +1,108 @@
+# -*- coding: utf8 -*-
+
+import glob
+import os
+
+from ocs_ci.ocs.event_recorder import EVENTS_FILE_NAME, EventStore
+
+
+def make_event(uid, kind, name, reason, event_type="Normal", rv="1", last=None):
+    last = last or "2024-01-15T10:30:00Z"
+    return {
+        "metadata": {
+            "uid": uid,
+            "namespace": "openshift-storage",
+            "resourceVersion": rv,
+        },
+        "involvedObject": {"kind": kind, "name": name},
+        "reason": reason,
+        "type": event_type,
+        "message": f"{reason} of {name}",
+        "count": 1,
+        "firstTimestamp": last,
+        "lastTimestamp": last,
+    }
+
+
+def test_query_by_object_reason_and_type(tmp_path):
+    store = EventStore(str(tmp_path))
+    store.add(make_event("1", "Pod", "osd-0", "Started"))
+    store.add(make_event("2", "Pod", "osd-0", "BackOff", "Warning"))
+    store.add(
+        make_event(
+            "3", "PersistentVolumeClaim", "pvc-a", "ProvisioningFailed", "Warning"
+        )
+    )
+    store.add(make_event("4", "Pod", "mon-a", "Killing", last="2024-01-15T11:30:00Z"))
+    assert [e["uid"] for e in store.query(kind="Pod", name="osd-0")] == ["1", "2"]
+    assert {e["uid"] for e in store.query(event_type="Warning")} == {"2", "3"}
+    assert [e["uid"] for e in store.query(kind="Pod", event_type="Warning")] == ["2"]
+    assert [e["uid"] for e in store.query(reason=["Killing", "Started"])] == ["1", "4"]
+    since = store.query(since=store.query(reason="Killing")[0]["last"])
+    assert [e["uid"] for e in since] == ["4"]
+    assert len(store.query(message_contains="pvc-A")) == 1
+
+
+def test_updates_are_deduplicated_and_reloaded(tmp_path):
+    store = EventStore(str(tmp_path))
+    event = make_event("1", "Pod", "osd-0", "BackOff", "Warning")
+    assert store.add(event)
+    assert not store.add(event)
+    event["metadata"]["resourceVersion"] = "2"
+    event["count"] = 5
+    assert store.add(event)
+    store.close()
+    assert len(store) == 1
+
+    reloaded = EventStore(str(tmp_path))
+    assert reloaded.load() == 1
+    assert reloaded.query(name="osd-0")[0]["count"] == 5
+
+
+def test_rotation(tmp_path):
+    store = EventStore(str(tmp_path), max_file_size=1024, max_rotated_files=2)
+    for i in range(100):
+        store.add(make_event(str(i), "Pod", f"pod-{i}", "Scheduled"))
+    store.close()
+    rotated = glob.glob(os.path.join(str(tmp_path), f"{EVENTS_FILE_NAME}.*.gz"))
+    assert len(rotated) == 2
+    # all events stay queryable from memory regardless of rotation
+    assert len(store.query(kind="Pod")) == 100
+
+
+def test_indexes_are_capped(tmp_path):
+    store = EventStore(str(tmp_path), max_events=10)
+    for i in range(30):
+        store.add(make_event(str(i), "Pod", f"pod-{i % 15}", "Scheduled"))
+    # update of the oldest indexed event keeps it in the indexes
+    store.add(make_event("20", "Pod", "pod-5", "Killing", rv="2"))
+    store.add(make_event("30", "Pod", "pod-0", "Scheduled"))
+    assert len(store) == 10
+    assert store.evicted == 21
+    assert [e["uid"] for e in store.query(kind="Pod", name="pod-5")] == ["20"]
+    assert len(store.query(reason="Scheduled")) == 9
+    assert len(store._by_object) == 10
+    store.close()
+    # all the events are kept in the file
+    assert EventStore(str(tmp_path)).load() == 31
+
+
+def test_recorded_events_merged_with_operator_log(tmp_path, monkeypatch):
+    from ocs_ci.helpers import helpers
+
+    store = EventStore(str(tmp_path))
+    store.add(make_event("1", "Pod", "osd-0", "Started"))
+    store.add(make_event("2", "Pod", "osd-1", "Started"))
+    log_lines = [
+        "2024-01-15 10:29:00.000000 I | op-osd: osd-0 is Pending",
+        "2024-01-15 10:31:00.000000 I | op-osd: osd-0 is Running",
+    ]
+    monkeypatch.setattr(
+        helpers, "get_logs_rook_ceph_operator", lambda: "\n".join(log_lines)
+    )
+    monkeypatch.setattr(helpers, "get_event_recorder", lambda namespace: store)
+    assert helpers.get_rook_ceph_pod_events("osd-0") == [
+        log_lines[0],
+        "2024-01-15 10:30:00.000000 Normal Started pod osd-0: Started of osd-0",
+        log_lines[1],
+    ]
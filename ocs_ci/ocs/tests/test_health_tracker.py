@@ -0,0 +1,98 @@
+# -*- coding: utf8 -*-
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import health_tracker
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.health_tracker import HealthTracker, ToolboxChannel
+from ocs_ci.ocs.resources import storage_cluster
+from ocs_ci.utility import utils
+
+
+def test_toolbox_channel_reuses_session():
+    popen = subprocess.Popen
+    started = []
+
+    def local_shell(args, **kwargs):
+        started.append(args)
+        return popen(["sh"], **kwargs)
+
+    channel = ToolboxChannel(0, "ns", timeout=10)
+    with (
+        patch.object(channel, "_get_tools_pod_name", return_value="tools"),
+        patch.object(health_tracker, "get_oc_base_cmd", return_value="oc -n ns"),
+    ):
+        with patch.object(health_tracker.subprocess, "Popen", local_shell):
+            assert channel.run("echo HEALTH_OK") == (0, "HEALTH_OK\n")
+            assert channel.run("echo a; echo b >&2") == (0, "a\nb\n")
+            assert channel.run("false")[0] == 1
+            assert len(started) == 1
+            assert started[0][-4:] == ["-i", "tools", "--", "sh"]
+            with pytest.raises(CommandFailed):
+                channel.run("exit")
+            assert not channel.connected
+
+
+def test_tracked_health_freshness_and_fallback():
+    namespace = config.ENV_DATA["cluster_namespace"]
+    tracker = HealthTracker(cluster_index=config.cur_index)
+    tracker.update(health_tracker.CEPH, "HEALTH_OK", live=False)
+    tracker.update(health_tracker.NOOBAA, "Ready")
+    tracker.update(health_tracker.NOOBAA, "Ready")
+    tracker.update(health_tracker.NOOBAA, "Configuring")
+    assert [
+        (item.old, item.new)
+        for item in tracker.get_history(component=health_tracker.NOOBAA)
+    ] == [(None, "Ready"), ("Ready", "Configuring")]
+
+    with patch.dict(health_tracker._trackers, {config.cur_index: tracker}):
+        # tracked state is used only when the caller sets the freshness bound
+        assert health_tracker.get_tracked_health(health_tracker.CEPH) is None
+        assert (
+            health_tracker.get_tracked_health(health_tracker.CEPH, max_age=60)
+            == "HEALTH_OK"
+        )
+        assert (
+            health_tracker.get_tracked_health(
+                health_tracker.CEPH, namespace="other", max_age=60
+            )
+            is None
+        )
+        with patch.object(utils, "run_ceph_health_cmd") as run_ceph_health_cmd:
+            assert utils.ceph_health_check_base(namespace, max_age=60)
+            run_ceph_health_cmd.assert_not_called()
+
+            # stale or unhealthy state falls back to the direct check
+            run_ceph_health_cmd.return_value = "HEALTH_OK"
+            with patch.object(health_tracker.time, "time", return_value=1e12):
+                assert utils.ceph_health_check_base(namespace, max_age=60)
+            tracker.update(health_tracker.CEPH, "HEALTH_WARN 1 osds down", False)
+            assert utils.ceph_health_check_base(namespace, max_age=60)
+            assert run_ceph_health_cmd.call_count == 2
+
+        # watched phase is valid as long as the watch runs
+        tracker.invalidate(health_tracker.NOOBAA)
+        assert (
+            health_tracker.get_tracked_health(health_tracker.NOOBAA, max_age=60) is None
+        )
+
+
+def test_tracked_phase_not_ready_is_checked_directly():
+    namespace = config.ENV_DATA["cluster_namespace"]
+    tracker = HealthTracker(cluster_index=config.cur_index)
+    tracker.update(health_tracker.NOOBAA, "Ready")
+    tracker.update(health_tracker.STORAGECLUSTER, "Progressing")
+    with patch.dict(health_tracker._trackers, {config.cur_index: tracker}):
+        with patch.object(storage_cluster, "OCP") as ocp:
+            ocp.return_value.get.return_value = {"status": {"phase": "Ready"}}
+            assert storage_cluster.get_noobaa_phase(namespace, max_age=60) == "Ready"
+            ocp.assert_not_called()
+            assert (
+                storage_cluster.get_storage_cluster_phase(namespace, max_age=60)
+                == "Ready"
+            )
+            ocp.return_value.get.assert_called_once()
@@ -0,0 +1,80 @@
+# -*- coding: utf8 -*-
+
+from ocs_ci.ocs import node_inventory
+
+
+def get_node(name, roles, ready="True", unschedulable=False):
+    return {
+        "metadata": {
+            "name": name,
+            "labels": {f"node-role.kubernetes.io/{role}": "" for role in roles},
+        },
+        "spec": {"unschedulable": unschedulable},
+        "status": {
+            "allocatable": {"cpu": "3500m", "memory": "15Gi"},
+            "conditions": [
+                {"type": "MemoryPressure", "status": "False"},
+                {"type": "Ready", "status": ready},
+            ],
+        },
+    }
+
+
+def get_pod(node_name, requests, init_requests=None):
+    spec = {
+        "nodeName": node_name,
+        "containers": [{"resources": {"requests": r}} for r in requests],
+    }
+    if init_requests:
+        spec["initContainers"] = [{"resources": {"requests": init_requests}}]
+    return {"spec": spec}
+
+
+class FakeOCP(object):
+    """
+    OCP returning the prepared nodes and pods
+    """
+
+    items = {}
+    calls = []
+
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+
+    def get(self, **kwargs):
+        FakeOCP.calls.append((self.kind, kwargs))
+        return {"items": FakeOCP.items[self.kind]}
+
+
+def test_node_inventory(monkeypatch):
+    FakeOCP.items = {
+        "Node": [
+            get_node("master-0", ["master", "control-plane"]),
+            get_node("worker-0", ["worker"], unschedulable=True),
+            get_node("worker-1", ["worker"], ready="Unknown"),
+        ],
+        "Pod": [
+            get_pod("worker-0", [{"cpu": "500m", "memory": "1Gi"}, {"cpu": "0.25"}]),
+            # init container requests more CPU than the containers together
+            get_pod("worker-0", [{"cpu": "100m"}], init_requests={"cpu": "1"}),
+            get_pod("master-0", [{}]),
+        ],
+    }
+    FakeOCP.calls = []
+    monkeypatch.setattr(node_inventory, "OCP", FakeOCP)
+
+    inventory = node_inventory.get_node_inventory()
+    assert len(FakeOCP.calls) == 2
+    assert FakeOCP.calls[1][1]["all_namespaces"]
+    worker = inventory["worker-0"]
+    assert worker["status"] == "Ready,SchedulingDisabled"
+    assert worker["requested_cpu"] == 1750
+    assert worker["cpu"] == 50
+    assert worker["memory"] == 6
+    assert worker["pod_count"] == 2
+    assert inventory["worker-1"]["status"] == "NotReady"
+    assert inventory["worker-1"]["pod_count"] == 0
+    assert inventory["master-0"]["roles"] == ["control-plane", "master"]
+    assert inventory["master-0"]["conditions"]["MemoryPressure"] == "False"
+    assert node_inventory.parse_quantity("1e3") == 1000
+    assert node_inventory.parse_quantity("64Mi") == 64 * 2**20
@@ -0,0 +1,74 @@
+# -*- coding: utf8 -*-
+
+import shlex
+from unittest.mock import patch
+
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources import pod
+
+
+def get_pods_command(exec_oc_cmd):
+    return next(
+        shlex.split(call[0][0])
+        for call in reversed(exec_oc_cmd.call_args_list)
+        if call[0][0].startswith("get Pod")
+    )
+
+
+def make_pod(name, app):
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "ns", "labels": {"app": app}},
+    }
+
+
+def test_get_all_pods_selector_pushdown():
+    with patch.object(OCP, "exec_oc_cmd") as exec_oc_cmd:
+        exec_oc_cmd.return_value = {"items": [make_pod("mon-a", "rook-ceph-mon")]}
+        pods = pod.get_all_pods(
+            namespace="ns", selector=["rook-ceph-mon", "rook-ceph-mgr"]
+        )
+        assert [pod_obj.name for pod_obj in pods] == ["mon-a"]
+        args = get_pods_command(exec_oc_cmd)
+        assert "--selector=app in (rook-ceph-mon,rook-ceph-mgr)" in args
+
+        pod.get_all_pods(
+            namespace="ns", selector=["rook-ceph-mgr"], exclude_selector=True
+        )
+        args = get_pods_command(exec_oc_cmd)
+        assert "--selector=app notin (rook-ceph-mgr)" in args
+
+        # None can't be pushed down, the pods are filtered on the client side
+        exec_oc_cmd.return_value = {
+            "items": [make_pod("mon-a", "rook-ceph-mon"), make_pod("mgr-a", "mgr")]
+        }
+        pods = pod.get_all_pods(namespace="ns", selector=[None, "mgr"])
+        assert [pod_obj.name for pod_obj in pods] == ["mgr-a"]
+        assert "--selector" not in " ".join(get_pods_command(exec_oc_cmd))
+
+
+def test_get_pods_fields():
+    out = "osd-0\tcompute-0\tRunning\timg-a img-b\nosd-1\t\tPending\timg-a\n"
+    with patch.object(OCP, "exec_oc_cmd", return_value=out) as exec_oc_cmd:
+        pods = pod.get_pods_fields(
+            namespace="ns",
+            selector="app=rook-ceph-osd",
+            fields=("name", "node", "phase", "images"),
+        )
+        assert pods == [
+            {
+                "name": "osd-0",
+                "node": "compute-0",
+                "phase": "Running",
+                "images": ["img-a", "img-b"],
+            },
+            {"name": "osd-1", "node": "", "phase": "Pending", "images": ["img-a"]},
+        ]
+        args = shlex.split(exec_oc_cmd.call_args[0][0])
+        assert args[-1].startswith("jsonpath={range .items[*]}{.metadata.name}")
+        assert exec_oc_cmd.call_args[1]["out_yaml_format"] is False
+
+        exec_oc_cmd.return_value = "osd-0\tRunning\nosd-1\tPending\n"
+        assert pod.get_pod_names_having_label(
+            "app=rook-ceph-osd", "ns", statuses=["Running"]
+        ) == ["osd-0"]
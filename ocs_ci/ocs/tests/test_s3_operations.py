@@ -0,0 +1,107 @@
+# -*- coding: utf8 -*-
+
+import json
+import socket
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs import bucket_utils, s3_operations
+
+moto = pytest.importorskip("moto")
+
+
+@pytest.fixture
+def s3_obj(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        s3_ops = s3_operations.S3Operations(
+            access_key_id="testing", access_key="testing", region="us-east-1"
+        )
+        s3_ops.client.create_bucket(Bucket="bucket")
+        monkeypatch.setattr(
+            bucket_utils, "get_s3_operations_for", lambda s3_obj: s3_ops
+        )
+        monkeypatch.setattr(
+            bucket_utils, "get_reachable_s3_operations", lambda s3_obj: s3_ops
+        )
+        yield SimpleNamespace(s3_client=s3_ops.client, s3_ops=s3_ops)
+
+
+def test_parallel_object_operations(s3_obj):
+    s3_ops = s3_obj.s3_ops
+    bucket_utils.upload_bulk_buckets(
+        s3_obj, [SimpleNamespace(name="bucket")], amount=30, prefix="dir"
+    )
+    keys = [f"dir/obj-key-0-{index}" for index in range(30)]
+    bucket_utils.tag_objects(None, s3_obj, "bucket", keys[:2], {"a": "1", "b": "2"})
+    assert bucket_utils.get_object_to_tags_dict(None, s3_obj, "bucket", keys[:2]) == {
+        keys[0]: [{"a": "1"}, {"b": "2"}],
+        keys[1]: [{"a": "1"}, {"b": "2"}],
+    }
+    bucket_utils.delete_object_tags(None, s3_obj, "bucket", keys[:1])
+    assert s3_ops.get_object_tagging("bucket", keys[:1]) == {keys[0]: []}
+
+    with pytest.raises(Exception):
+        s3_ops.get_object_tagging("bucket", ["missing"])
+    result = s3_ops.delete_objects("bucket", keys)
+    assert len(result["Deleted"]) == 30
+    assert "Contents" not in s3_ops.client.list_objects_v2(Bucket="bucket")
+
+    stats = s3_ops.get_stats()
+    assert stats["put_object"]["count"] == 30
+    assert stats["put_object"]["bytes"] == 30 * len("obj-key-0")
+    assert stats["get_object_tagging"]["errors"] == 1
+
+
+def test_shared_operations_per_credentials():
+    first = s3_operations.get_s3_operations("http://s3.local", "id", "key")
+    assert s3_operations.get_s3_operations("http://s3.local", "id", "key") is first
+    assert (
+        s3_operations.get_s3_operations("http://s3.local", "id", "other") is not first
+    )
+    assert first.client.meta.config.max_pool_connections == 32
+    s3_operations.clear_s3_operations()
+    assert s3_operations.get_s3_operations("http://s3.local", "id", "key") is not first
+    s3_operations.clear_s3_operations()
+
+
+def test_tagging_in_pod_without_reachable_endpoint(monkeypatch):
+    monkeypatch.setattr(bucket_utils, "get_reachable_s3_operations", lambda obj: None)
+    commands = []
+
+    class FakePod(object):
+        def exec_cmd_on_pod(self, command, **kwargs):
+            commands.append(command)
+            return json.dumps({"TagSet": [{"Key": "a", "Value": "1"}]})
+
+    mcg_obj = SimpleNamespace(
+        region=None,
+        access_key_id="id",
+        access_key="key",
+        s3_internal_endpoint="https://s3.openshift-storage.svc:443",
+    )
+    bucket_utils.tag_objects(FakePod(), mcg_obj, "bucket", ["k1", "k2"], {"a": "1"})
+    assert bucket_utils.get_object_to_tags_dict(
+        FakePod(), mcg_obj, "bucket", ["k1"]
+    ) == {"k1": [{"a": "1"}]}
+    assert len(commands) == 3
+    assert all("--endpoint=https://s3.openshift-storage.svc:443" in c for c in commands)
+    assert sum("put-object-tagging" in c for c in commands) == 2
+
+
+def test_endpoint_reachability():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    port = server.getsockname()[1]
+    try:
+        assert s3_operations.is_endpoint_reachable(f"http://127.0.0.1:{port}")
+    finally:
+        server.close()
+    # result is cached per endpoint
+    assert s3_operations.is_endpoint_reachable(f"http://127.0.0.1:{port}")
+    s3_operations.clear_s3_operations()
+    assert not s3_operations.is_endpoint_reachable(f"http://127.0.0.1:{port}")
+    s3_operations.clear_s3_operations()
@@ -0,0 +1,137 @@
+# -*- coding: utf8 -*-
+
+import pytest
+import yaml
+
+from ocs_ci.ocs import stage_engine
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+
+
+class FakeOCP(object):
+    """
+    OCP listing the resources created by the fake kube jobs
+    """
+
+    items = {}
+
+    def __init__(self, kind, namespace=None, **kwargs):
+        self.kind = kind
+
+    def get(self, **kwargs):
+        return {"items": list(FakeOCP.items.get(self.kind, {}).values())}
+
+
+class FakeKubeJob(object):
+    def __init__(self, tmp_path, name, kind, names):
+        self.kind = kind
+        self.names = names
+        self.yaml_file = tmp_path / f"{name}.yaml"
+        self.yaml_file.write_text(
+            yaml.dump_all([{"kind": kind, "metadata": {"name": n}} for n in names])
+        )
+
+    def create(self, phase):
+        FakeOCP.items.setdefault(self.kind, {}).update(
+            {
+                name: {"kind": self.kind, "metadata": {"name": name}}
+                for name in self.names
+            }
+        )
+        for name in self.names:
+            FakeOCP.items[self.kind][name]["status"] = {"phase": phase}
+
+    def delete(self):
+        for name in self.names:
+            FakeOCP.items[self.kind].pop(name)
+
+
+@pytest.fixture
+def fake_ocp(monkeypatch):
+    FakeOCP.items = {}
+    monkeypatch.setattr(stage_engine, "OCP", FakeOCP)
+
+
+def test_stage_graph(fake_ocp, tmp_path):
+    engine = stage_engine.StageEngine(
+        "test", snapshots=stage_engine.ResourceSnapshots(max_age=0)
+    )
+    created = []
+
+    def create_pvcs(results):
+        job = FakeKubeJob(tmp_path, "pvc", "PersistentVolumeClaim", ["pvc-0", "pvc-1"])
+        job.create("Bound")
+        created.append("pvc")
+        return [job]
+
+    def create_pods(results):
+        pvc_names = results["pvc"].names
+        job = FakeKubeJob(tmp_path, "pod", "Pod", [f"pod-{name}" for name in pvc_names])
+        job.create("Running")
+        created.append("pod")
+        return [job]
+
+    pvc_batch = engine.add(
+        stage_engine.ResourceBatch("pvc", "PersistentVolumeClaim", "ns", create_pvcs)
+    )
+    pod_batch = engine.add(
+        stage_engine.ResourceBatch("pod", "Pod", "ns", create_pods, depends_on=["pvc"])
+    )
+    delete_pod = engine.add(
+        stage_engine.DeleteBatch(
+            "pod-delete", pod_batch, lambda jobs: [job.delete() for job in jobs]
+        )
+    )
+    engine.add(
+        stage_engine.DeleteBatch(
+            "pvc-delete",
+            pvc_batch,
+            lambda jobs: [job.delete() for job in jobs],
+            depends_on=[delete_pod.name],
+        )
+    )
+    results = engine.run(iteration=3)
+
+    assert created == ["pvc", "pod"]
+    assert results["pod"].names == ["pod-pvc-0", "pod-pvc-1"]
+    assert results["pvc-delete"].count == 2
+    assert not FakeOCP.items["Pod"] and not FakeOCP.items["PersistentVolumeClaim"]
+    summary = engine.metrics.get_summary("test", 3)
+    assert summary[("Pod", stage_engine.CREATE)]["count"] == 2
+    assert summary[("PersistentVolumeClaim", stage_engine.DELETE)]["batches"] == 1
+
+
+def test_stage_failure_skips_dependent_batches(fake_ocp):
+    engine = stage_engine.StageEngine("test")
+    started = []
+
+    def fail(results):
+        raise ValueError("creation failed")
+
+    engine.add(stage_engine.ActionBatch("first", fail))
+    engine.add(
+        stage_engine.ActionBatch(
+            "second", lambda results: started.append("second"), depends_on=["first"]
+        )
+    )
+    with pytest.raises(ValueError):
+        engine.run()
+    assert not started
+    with pytest.raises(ValueError):
+        engine.add(stage_engine.ActionBatch("third", fail, depends_on=["unknown"]))
+
+
+def test_wait_for_timeout(fake_ocp):
+    FakeOCP.items = {
+        "Pod": {
+            "pod-0": {"kind": "Pod", "metadata": {"name": "pod-0"}},
+            "pod-1": {
+                "kind": "Pod",
+                "metadata": {"name": "pod-1"},
+                "status": {"phase": "Running"},
+            },
+        }
+    }
+    snapshots = stage_engine.ResourceSnapshots(max_age=0.01)
+    assert snapshots.wait_for("Pod", "ns", ["pod-1"]) == ["pod-1"]
+    with pytest.raises(TimeoutExpiredError, match="pod-0"):
+        snapshots.wait_for("Pod", "ns", ["pod-0", "pod-1"], timeout=0.05)
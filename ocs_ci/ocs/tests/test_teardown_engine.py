@@ -0,0 +1,119 @@
+# -*- coding: utf8 -*-
+
+import re
+import shlex
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.ocs.exceptions import ResourceLeftoversException
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources.ocs import OCS
+from ocs_ci.ocs.teardown_engine import TeardownEngine
+
+
+class FakeCluster(object):
+    """
+    Resources of the cluster and the executed delete commands
+    """
+
+    def __init__(self, resources, volumes, stuck=()):
+        # (kind, namespace, name) -> fields
+        self.resources = dict(resources)
+        self.volumes = volumes
+        self.stuck = set(stuck)
+        self.deletes = []
+
+    def exec_oc_cmd(self, ocp_obj, command, **kwargs):
+        args = shlex.split(command)
+        kind = args[1]
+        if args[0] == "delete":
+            names = [arg for arg in args[2:] if not arg.startswith("--")]
+            self.deletes.append((kind, ocp_obj.namespace, sorted(names)))
+            for name in names:
+                if (kind, ocp_obj.namespace, name) in self.stuck:
+                    continue
+                self.resources.pop((kind, ocp_obj.namespace, name), None)
+                if kind == "PersistentVolumeClaim":
+                    self.resources.pop(("PersistentVolume", None, self.volumes[name]))
+                if kind == "Project":
+                    for key in list(self.resources):
+                        if key[1] == name:
+                            self.resources.pop(key)
+                            if key[0] == "PersistentVolumeClaim":
+                                self.resources.pop(
+                                    ("PersistentVolume", None, self.volumes[key[2]])
+                                )
+            return ""
+        paths = re.findall(r"\{(\.[^}]+)\}", args[-1])
+        lines = []
+        for (res_kind, namespace, name), fields in self.resources.items():
+            if res_kind != kind:
+                continue
+            if "-A" not in args and namespace != ocp_obj.namespace:
+                continue
+            values = {".metadata.name": name, ".metadata.namespace": namespace or ""}
+            values.update(fields)
+            lines.append("\t".join(values.get(path, "") for path in paths))
+        return "\n".join(lines)
+
+
+def make_obj(kind, name, namespace=None):
+    metadata = {"name": name}
+    if namespace:
+        metadata["namespace"] = namespace
+    return OCS(kind=kind, metadata=metadata)
+
+
+@pytest.fixture
+def cluster():
+    return FakeCluster(
+        {
+            ("Pod", "ns1", "pod-1"): {},
+            ("Pod", "ns1", "pod-2"): {},
+            ("PersistentVolumeClaim", "ns1", "pvc-1"): {".spec.volumeName": "pv-1"},
+            ("PersistentVolumeClaim", "ns2", "pvc-2"): {".spec.volumeName": "pv-2"},
+            ("PersistentVolume", None, "pv-1"): {
+                ".spec.persistentVolumeReclaimPolicy": "Delete"
+            },
+            ("PersistentVolume", None, "pv-2"): {
+                ".spec.persistentVolumeReclaimPolicy": "Delete"
+            },
+            ("StorageClass", None, "sc-1"): {},
+            ("Project", None, "ns2"): {},
+        },
+        volumes={"pvc-1": "pv-1", "pvc-2": "pv-2"},
+    )
+
+
+def test_dependency_order_and_project_shortcut(cluster):
+    pods = [make_obj("Pod", "pod-1", "ns1"), make_obj("Pod", "pod-2", "ns1")]
+    pvcs = [
+        make_obj("PersistentVolumeClaim", "pvc-1", "ns1"),
+        make_obj("PersistentVolumeClaim", "pvc-2", "ns2"),
+    ]
+    engine = TeardownEngine(timeout=1, sleep=0)
+    engine.add(OCP(kind="Project", namespace="ns2"))
+    engine.add(make_obj("StorageClass", "sc-1")).add(pvcs).add(pods)
+    with patch.object(OCP, "exec_oc_cmd", autospec=True) as exec_oc_cmd:
+        exec_oc_cmd.side_effect = cluster.exec_oc_cmd
+        assert engine.run() == []
+    assert cluster.deletes == [
+        ("Pod", "ns1", ["pod-1", "pod-2"]),
+        ("PersistentVolumeClaim", "ns1", ["pvc-1"]),
+        ("StorageClass", None, ["sc-1"]),
+        ("Project", None, ["ns2"]),
+    ]
+    assert not cluster.resources
+    assert all(obj.is_deleted for obj in pods + pvcs)
+
+
+def test_leftovers_are_reported(cluster):
+    cluster.stuck.add(("Pod", "ns1", "pod-2"))
+    engine = TeardownEngine(timeout=1, sleep=0.5)
+    engine.add([make_obj("Pod", "pod-1", "ns1"), make_obj("Pod", "pod-2", "ns1")])
+    with patch.object(OCP, "exec_oc_cmd", autospec=True) as exec_oc_cmd:
+        exec_oc_cmd.side_effect = cluster.exec_oc_cmd
+        with pytest.raises(ResourceLeftoversException, match="pod-2"):
+            engine.run()
+    assert engine.leftovers == [("Pod", "ns1", "pod-2")]
@@ -0,0 +1,52 @@
+# -*- coding: utf8 -*-
+
+from ocs_ci.ocs.ui import artifact_writer, page_readiness
+
+
+class FakeDriver(object):
+    """
+    Driver returning the given states of the page readiness probe
+    """
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.calls = 0
+
+    def execute_script(self, script):
+        self.calls += 1
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_wait_for_quiescence():
+    driver = FakeDriver(
+        [
+            ["loading", 0, 0],
+            ["complete", 2, 900],
+            ["complete", 0, 100],
+            ["complete", 0, 600],
+        ]
+    )
+    assert page_readiness.wait_for_quiescence(driver, timeout=5, poll_interval=0)
+    assert driver.calls == 4
+    driver = FakeDriver([["complete", 1, 5000]])
+    assert not page_readiness.wait_for_quiescence(driver, timeout=0.05, poll_interval=0)
+
+
+def test_artifact_writer_dedupe(tmp_path):
+    writer = artifact_writer.ArtifactWriter()
+    first = str(tmp_path / "test" / "1.png")
+    assert writer.submit(first, b"png") == first
+    assert writer.submit(str(tmp_path / "test" / "2.png"), b"png") == first
+    third = str(tmp_path / "test" / "3.png")
+    assert writer.submit(third, b"png", dedupe=False) == third
+    other = str(tmp_path / "other" / "1.png")
+    assert writer.submit(other, b"png") == other
+    writer.flush()
+    assert sorted(p.name for p in (tmp_path / "test").iterdir()) == ["1.png", "3.png"]
+    assert (tmp_path / "other" / "1.png").read_bytes() == b"png"
+    assert writer.get_stats() == {
+        "written": 3,
+        "deduplicated": 1,
+        "failed": 0,
+        "pending": 0,
+    }
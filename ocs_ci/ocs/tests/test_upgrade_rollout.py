@@ -0,0 +1,84 @@
+# -*- coding: utf8 -*-
+
+from itertools import chain, repeat
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TimeoutException
+from ocs_ci.ocs.upgrade_rollout import RolloutVerifier
+
+OLD = "quay.io/ocs/rook@sha256:old"
+NEW = "quay.io/ocs/rook@sha256:new"
+
+
+def make_pod(name, app, images):
+    return {
+        "metadata": {"name": name, "labels": {"app": app}},
+        "spec": {
+            "containers": [
+                {"name": f"c{i}", "image": image} for i, image in enumerate(images)
+            ]
+        },
+    }
+
+
+def run_ticks(verifier, snapshots):
+    with patch("ocs_ci.ocs.upgrade_rollout.OCP") as ocp:
+        ocp.return_value.get.side_effect = [{"items": pods} for pods in snapshots]
+        return [verifier.tick() for _ in snapshots]
+
+
+def test_all_selectors_evaluated_from_one_snapshot():
+    verifier = RolloutVerifier({OLD}, namespace="openshift-storage")
+    verifier.add("app=rook-ceph-mon", count=2).add("app=rook-ceph-osd", count=1)
+    snapshots = [
+        [
+            make_pod("mon-a", "rook-ceph-mon", [NEW]),
+            make_pod("mon-b", "rook-ceph-mon", [OLD, NEW]),
+            make_pod("osd-0", "rook-ceph-osd", [OLD]),
+        ],
+        [
+            make_pod("mon-a", "rook-ceph-mon", [NEW]),
+            make_pod("mon-b", "rook-ceph-mon", [NEW]),
+            make_pod("osd-0", "rook-ceph-osd", [NEW]),
+        ],
+    ]
+    with patch("ocs_ci.ocs.upgrade_rollout.OCP") as ocp:
+        ocp.return_value.get.side_effect = [{"items": pods} for pods in snapshots]
+        assert not verifier.tick()
+        progress = verifier.get_progress()
+        assert progress["app=rook-ceph-mon"]["new"] == 1
+        assert progress["app=rook-ceph-mon"]["mixed"] == 1
+        assert progress["app=rook-ceph-osd"]["old"] == 1
+        assert verifier.tick()
+        # one listing per tick for all the selectors
+        assert ocp.return_value.get.call_count == 2
+
+
+def test_missing_pods_are_not_upgraded():
+    verifier = RolloutVerifier({OLD}, namespace="openshift-storage")
+    verifier.add("app=rook-ceph-mds", count=2)
+    pods = [make_pod("mds-a", "rook-ceph-mds", [NEW])]
+    assert run_ticks(
+        verifier, [pods, pods + [make_pod("mds-b", "rook-ceph-mds", [NEW])]]
+    ) == [False, True]
+    assert verifier.get_progress()["app=rook-ceph-mds"]["found"] == 2
+
+
+def test_sequential_budget_and_timeout():
+    verifier = RolloutVerifier(
+        {OLD}, namespace="openshift-storage", sleep=0, sequential_budget=True
+    )
+    verifier.add("app=a", timeout=10).add("app=b", timeout=20)
+    assert [component.budget for component in verifier.components] == [10, 30]
+    with (
+        patch("ocs_ci.ocs.upgrade_rollout.OCP") as ocp,
+        patch(
+            "ocs_ci.ocs.upgrade_rollout.time.time",
+            side_effect=chain([0, 5], repeat(100)),
+        ),
+    ):
+        ocp.return_value.get.return_value = {"items": []}
+        with pytest.raises(TimeoutException):
+            verifier.wait()
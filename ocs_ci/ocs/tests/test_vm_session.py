@@ -0,0 +1,65 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs.cnv import vm_session
+from ocs_ci.ocs.exceptions import CommandFailed
+
+
+@pytest.fixture
+def local_session(monkeypatch):
+    # run the remote commands by the local shell instead of ssh
+    monkeypatch.setattr(
+        vm_session.VMSession,
+        "get_ssh_cmd",
+        lambda self, *args, options=None, direct=False: ["sh", "-c", " ".join(args)],
+    )
+    monkeypatch.setattr(vm_session.VMSession, "start_master", lambda self: None)
+    session = vm_session.get_vm_session("vm-1", "test", "cloud-user")
+    yield session
+    vm_session.close_vm_sessions()
+
+
+def test_vm_session_commands(local_session):
+    assert vm_session.get_vm_session("vm-1", "test", "cloud-user") is local_session
+    # quoting is the same as of 'virtctl ssh -c "<command>"'
+    assert vm_session.get_remote_command('echo \\"a b\\"') == 'sudo echo "a b"'
+    assert local_session.run("echo 'a  b'", use_sudo=False) == "a  b\n"
+
+    results = local_session.run_script(
+        ["printf partial", "echo line", "false"], use_sudo=False, ignore_error=True
+    )
+    assert results == [(0, "partial"), (0, "line\n"), (1, "")]
+    with pytest.raises(CommandFailed, match="false"):
+        local_session.run_script(["true", "false"], use_sudo=False)
+    assert local_session.commands == 3
+
+
+def test_vm_session_recovers_stale_master(local_session, monkeypatch):
+    connections = {"master": "stale", "restarts": 0}
+
+    def get_ssh_cmd(self, *args, options=None, direct=False):
+        if connections["master"] == "stale" and not direct:
+            # ssh fails to connect through the stale master
+            return ["sh", "-c", "echo 'broken pipe' >&2; exit 255"]
+        return ["sh", "-c", " ".join(args)]
+
+    def restart_master(self):
+        connections["restarts"] += 1
+        connections["master"] = connections.pop("restarted_master", "stale")
+
+    monkeypatch.setattr(vm_session.VMSession, "get_ssh_cmd", get_ssh_cmd)
+    monkeypatch.setattr(vm_session.VMSession, "restart_master", restart_master)
+
+    # restarted master is used by the second attempt
+    connections["restarted_master"] = "running"
+    assert local_session.run("echo ok", use_sudo=False) == "ok\n"
+    assert connections["restarts"] == 1
+
+    # master which can't be restarted falls back to the direct connection
+    connections["master"] = "stale"
+    assert local_session.run_script(["echo ok"], use_sudo=False) == [(0, "ok\n")]
+    assert connections["restarts"] == 2
+    with pytest.raises(CommandFailed, match="exit 3"):
+        local_session.run("exit 3", use_sudo=False)
+    assert connections["restarts"] == 3
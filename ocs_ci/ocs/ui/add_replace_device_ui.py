@@ -3,6 +3,7 @@ import time
 
 from ocs_ci.ocs.ui.page_objects.page_navigator import PageNavigator
 from ocs_ci.ocs.ui.views import ODF_OPERATOR
+from ocs_ci.utility.cluster_facts import invalidate_cluster_facts
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ class AddReplaceDeviceUI(PageNavigator):
         self.do_click(
             self.add_capacity_ui_loc["confirm_add_capacity"], enable_screenshot=True
         )
+        invalidate_cluster_facts("capacity added via UI")
 
     def verify_pod_status(self, pod_names, pod_state="Running"):
         """
@@ -0,0 +1,174 @@
+"""
+Background writer of UI artifacts (screenshots and DOM copies).
+
+The content of the artifact is read from the browser synchronously, since it
+has to reflect the page at the moment of the capture, while writing it into
+the file is left to a writer thread. Artifacts with the same content as an
+artifact already saved into the same folder (e.g. screenshots before several
+clicks on an unchanged page) are not written again, the path of the saved one
+is logged and returned instead.
+
+Pending artifacts are written by flush_artifacts(), called when the browser is
+closed and at exit of the process.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 100
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+class ArtifactWriter(object):
+    """
+    Writer thread of the artifacts with content-hash dedupe
+    """
+
+    def __init__(self, max_queue_size=DEFAULT_QUEUE_SIZE):
+        """
+        Args:
+            max_queue_size (int): Max number of artifacts waiting for write,
+                the capture waits for the writer when the queue is full
+
+        """
+        self.queue = queue.Queue(max_queue_size)
+        self.written = 0
+        self.deduplicated = 0
+        self.failed = 0
+        # (folder, sha256 of the content) -> path of the saved artifact
+        self._saved = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="ArtifactWriter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            path, data = self.queue.get()
+            try:
+                write_artifact(path, data)
+                self.written += 1
+            except OSError as ex:
+                self.failed += 1
+                logger.warning(f"Failed to write UI artifact {path}: {ex}")
+            finally:
+                self.queue.task_done()
+
+    def submit(self, path, data, dedupe=True):
+        """
+        Queue the artifact for write
+
+        Args:
+            path (str): Path of the file
+            data (bytes or str): Content of the artifact
+            dedupe (bool): False to write the artifact even if the same
+                content was already saved
+
+        Returns:
+            str: Path where the content is saved, the path of the earlier
+                artifact if the content is a duplicate
+
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        if dedupe:
+            key = (os.path.dirname(path), hashlib.sha256(data).hexdigest())
+            with self._lock:
+                saved_path = self._saved.setdefault(key, path)
+            if saved_path != path:
+                self.deduplicated += 1
+                logger.debug(f"UI artifact {path} is the same as {saved_path}")
+                return saved_path
+        self.queue.put((path, data))
+        return path
+
+    def flush(self):
+        """
+        Wait until all the queued artifacts are written
+        """
+        self.queue.join()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Number of written, deduplicated, failed and pending artifacts
+
+        """
+        return {
+            "written": self.written,
+            "deduplicated": self.deduplicated,
+            "failed": self.failed,
+            "pending": self.queue.qsize(),
+        }
+
+
+def write_artifact(path, data):
+    """
+    Write the artifact, create its folder if it doesn't exist
+
+    Args:
+        path (str): Path of the file
+        data (bytes): Content of the artifact
+
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as artifact_file:
+        artifact_file.write(data)
+
+
+def get_artifact_writer():
+    """
+    Returns:
+        ArtifactWriter: Writer shared by the process, started on first use
+
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ArtifactWriter()
+            atexit.register(flush_artifacts)
+        return _writer
+
+
+def save_artifact(path, data, background=True, dedupe=True):
+    """
+    Save the artifact
+
+    Args:
+        path (str): Path of the file
+        data (bytes or str): Content of the artifact
+        background (bool): True to write the artifact by the writer thread,
+            False to write it before returning
+        dedupe (bool): False to write the artifact even if the same content
+            was already saved into the folder
+
+    Returns:
+        str: Path where the content is saved
+
+    """
+    if background:
+        return get_artifact_writer().submit(path, data, dedupe=dedupe)
+    write_artifact(path, data.encode() if isinstance(data, str) else data)
+    return path
+
+
+def flush_artifacts():
+    """
+    Wait until all the queued artifacts are written
+    """
+    if _writer is None:
+        return
+    _writer.flush()
+    stats = _writer.get_stats()
+    if stats["written"] or stats["deduplicated"]:
+        logger.debug(f"UI artifacts: {stats}")
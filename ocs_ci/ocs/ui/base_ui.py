@@ -38,6 +38,13 @@ from ocs_ci.ocs.exceptions import (
     NotSupportedProxyConfiguration,
 )
 from ocs_ci.ocs.ocp import get_ocp_url
+from ocs_ci.ocs.ui.artifact_writer import flush_artifacts, save_artifact
+from ocs_ci.ocs.ui.browser_pool import (
+    DEFAULT_MAX_USES,
+    get_browser_pool,
+    is_pooled_driver,
+)
+from ocs_ci.ocs.ui.page_readiness import wait_for_quiescence
 from ocs_ci.ocs.ui.views import locators_for_current_ocp_version, login as login_view
 from ocs_ci.ocs.ui.llm_tools.locator_fallback import LocatorFallback
 from ocs_ci.utility.templating import Templating
@@ -637,7 +644,9 @@ class BaseUI:
         self, retries=5, sleep_time=2, module_loc=("html", By.TAG_NAME)
     ):
         """
-        Waits for page to completely load by comparing current page hash values.
+        Waits for page to completely load. When UI_SELENIUM['dom_quiescence'] is enabled, the page is loaded
+        when it has no pending XHR/fetch requests and its DOM didn't change for a while (see page_readiness),
+        otherwise or if the probe can't be executed by comparing current page hash values.
         Not suitable for pages that use frequent dynamically content (less than sleep_time)
 
         Args:
@@ -645,6 +654,21 @@ class BaseUI:
             sleep_time (int): Time to wait between every pool of dom hash
             module_loc (tuple): locator of the module of the page awaited to be loaded
         """
+        if ocsci_config.UI_SELENIUM.get("dom_quiescence", True):
+            self.check_element_presence(module_loc[::-1])
+            try:
+                loaded = wait_for_quiescence(self.driver, timeout=retries * sleep_time)
+            except (WebDriverException, TypeError, ValueError) as e:
+                logger.debug(f"Page readiness probe failed, comparing DOM hashes: {e}")
+            else:
+                if loaded:
+                    logger.info(f"page loaded: {self.driver.current_url}")
+                else:
+                    logger.error(
+                        f"Current URL did not finish loading in {retries * sleep_time}"
+                    )
+                    self.take_screenshot()
+                return
 
         # IndexError when dom is empty due to page not loaded yet
         @retry((TimeoutException, IndexError))
@@ -747,13 +771,24 @@ class BaseUI:
         element = self.driver.find_element(locator[1], locator[0])
         actions.move_to_element(element).perform()
 
-    def take_screenshot(self, name_suffix: str = ""):
+    def take_screenshot(self, name_suffix: str = "", background=None, dedupe=True):
         """
         Take screenshot using python code
 
+        Args:
+            name_suffix (str): name suffix, will be added before extension. Optional argument
+            background (bool): write the file by the background writer, UI_SELENIUM['async_artifacts'] if None
+            dedupe (bool): don't save the screenshot if the same one was already saved into the folder
+
+        Returns:
+            str: path of the screenshot
+
         """
-        take_screenshot(
-            screenshots_folder=self.screenshots_folder, name_suffix=name_suffix
+        return take_screenshot(
+            screenshots_folder=self.screenshots_folder,
+            name_suffix=name_suffix,
+            background=background,
+            dedupe=dedupe,
         )
 
     def take_screenshot_for_llm(self, name_suffix="", region=None):
@@ -789,11 +824,13 @@ class BaseUI:
 
         try:
             suffix = f"{name_suffix}_llm" if name_suffix else "llm"
-            take_screenshot(
-                screenshots_folder=self.screenshots_folder, name_suffix=suffix
+            # the file is read (and cropped) right away, it has to be written now
+            path = take_screenshot(
+                screenshots_folder=self.screenshots_folder,
+                name_suffix=suffix,
+                background=False,
+                dedupe=False,
             )
-            screenshots = sorted(Path(self.screenshots_folder).glob("*.png"))
-            path = str(screenshots[-1])
             if region:
                 _crop_screenshot(path, region)
             return [path]
@@ -805,8 +842,11 @@ class BaseUI:
         """
         Get page source of the webpage
 
+        Returns:
+            str: path of the DOM file
+
         """
-        copy_dom(dom_folder=self.dom_folder, name_suffix=name_suffix)
+        return copy_dom(dom_folder=self.dom_folder, name_suffix=name_suffix)
 
     def do_clear(self, locator, timeout=30):
         """
@@ -1038,54 +1078,99 @@ def screenshot_dom_location(type_loc="screenshot"):
         )
 
 
-def copy_dom(name_suffix: str = "", dom_folder=None):
+def _wait_before_capture(driver):
+    """
+    Give the page up to a second to finish rendering before the capture
+
+    Args:
+        driver (WebDriver): Selenium driver
+
+    """
+    if not ocsci_config.UI_SELENIUM.get("dom_quiescence", True):
+        time.sleep(1)
+        return
+    try:
+        wait_for_quiescence(driver, timeout=1, quiet_period=0.2)
+    except (WebDriverException, TypeError, ValueError) as e:
+        logger.debug(f"Page readiness probe failed: {e}")
+
+
+def _is_background_capture(background):
+    """
+    Args:
+        background (bool): explicit choice of the caller, or None
+
+    Returns:
+        bool: True if the artifact should be written by the background writer
+
+    """
+    if background is None:
+        return bool(ocsci_config.UI_SELENIUM.get("async_artifacts", True))
+    return background
+
+
+def copy_dom(name_suffix: str = "", dom_folder=None, background=None, dedupe=True):
     """
     Copy DOM using python code
 
     Args:
         name_suffix (str): name suffix, will be added before extension. Optional argument
         dom_folder (str): path to folder where dom text file will be saved
+        background (bool): write the file by the background writer, UI_SELENIUM['async_artifacts'] if None
+        dedupe (bool): don't save the DOM if the same one was already saved into the folder
+
+    Returns:
+        str: path of the DOM file, path of the earlier file with the same DOM if deduplicated
     """
     if dom_folder is None:
         dom_folder = screenshot_dom_location(type_loc="dom")
-    if not os.path.isdir(dom_folder):
-        Path(dom_folder).mkdir(parents=True, exist_ok=True)
-    time.sleep(1)
+    driver = SeleniumDriver()
+    _wait_before_capture(driver)
     if name_suffix:
         name_suffix = f"_{name_suffix}"
     filename = os.path.join(
         dom_folder,
         f"{datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S.%f')}{name_suffix}_DOM.html",
     )
-    logger.info(f"Copy DOM file: {filename}")
-    html = SeleniumDriver().page_source
-    with open(filename, "w") as f:
-        f.write(html)
-    time.sleep(0.5)
+    html = driver.page_source
+    path = save_artifact(
+        filename, html, background=_is_background_capture(background), dedupe=dedupe
+    )
+    logger.info(f"Copy DOM file: {path}")
+    return path
 
 
-def take_screenshot(name_suffix: str = "", screenshots_folder=None):
+def take_screenshot(
+    name_suffix: str = "", screenshots_folder=None, background=None, dedupe=True
+):
     """
     Take screenshot using python code
 
     Args:
         name_suffix (str): name suffix, will be added before extension. Optional argument
         screenshots_folder (str): path to folder where screenshot will be saved
+        background (bool): write the file by the background writer, UI_SELENIUM['async_artifacts'] if None
+        dedupe (bool): don't save the screenshot if the same one was already saved into the folder
+
+    Returns:
+        str: path of the screenshot, path of the earlier screenshot with the same content if deduplicated
     """
     if screenshots_folder is None:
         screenshots_folder = screenshot_dom_location(type_loc="screenshot")
-    if not os.path.isdir(screenshots_folder):
-        Path(screenshots_folder).mkdir(parents=True, exist_ok=True)
-    time.sleep(1)
+    driver = SeleniumDriver()
+    _wait_before_capture(driver)
     if name_suffix:
         name_suffix = f"_{name_suffix}"
     filename = os.path.join(
         screenshots_folder,
         f"{datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S.%f')}{name_suffix}.png",
     )
-    logger.debug(f"Creating screenshot: {filename}")
-    SeleniumDriver().save_screenshot(filename)
-    time.sleep(0.5)
+    png = driver.get_screenshot_as_png()
+    path = save_artifact(
+        filename, png, background=_is_background_capture(background), dedupe=dedupe
+    )
+    logger.debug(f"Creating screenshot: {path}")
+    return path
 
 
 def _crop_screenshot(path, region):
@@ -1138,6 +1223,9 @@ def garbage_collector_webdriver():
     collected_objs = gc.get_objects()
     for obj in collected_objs:
         if str(type(obj)) == constants.WEB_DRIVER_CHROME_OBJ_TYPE:
+            if is_pooled_driver(obj):
+                # kept logged in for the next test, quit by the browser pool
+                continue
             try:
                 logger.debug(
                     f"garbage collector to quit webdriver session id {obj.session_id}"
@@ -1278,6 +1366,18 @@ class SeleniumDriver(WebDriver):
             raise ValueError(f"No Support on {browser}")
         return driver
 
+    @classmethod
+    def use_driver(cls, driver):
+        """
+        Make the driver the one returned by SeleniumDriver()
+
+        Args:
+            driver (WebDriver): The driver, e.g. taken from the browser pool
+
+        """
+        cls.instance = super(SeleniumDriver, cls).__new__(cls)
+        cls.instance.driver = driver
+
     @classmethod
     def remove_instance(cls):
         if hasattr(cls, "instance"):
@@ -1312,6 +1412,10 @@ def login_ui(console_url=None, username=None, password=None, otp_secret=None, **
     """
     Login to OpenShift Console
 
+    With UI_SELENIUM browser_pool enabled, the browser logged in to the
+    console as the user by an earlier test is reset and reused instead of
+    starting a new one and logging in again, see ocs_ci.ocs.ui.browser_pool
+
     Args:
         console_url (str): ocp console url
         username(str): User which is other than admin user,
@@ -1321,6 +1425,43 @@ def login_ui(console_url=None, username=None, password=None, otp_secret=None, **
     return:
         driver (Selenium WebDriver)
 
+    """
+    if not ocsci_config.UI_SELENIUM.get("browser_pool", True):
+        return _login_ui(SeleniumDriver(), console_url, username, password, otp_secret)
+    url = console_url or get_ocp_url()
+    pool = get_browser_pool(
+        max_uses=ocsci_config.UI_SELENIUM.get("browser_pool_max_uses", DEFAULT_MAX_USES)
+    )
+
+    def login(driver):
+        SeleniumDriver.use_driver(driver)
+        _login_ui(driver, console_url, username, password, otp_secret)
+
+    def validate(driver):
+        # expired session is redirected to the OAuth server
+        return urlparse(driver.current_url).netloc == urlparse(url).netloc
+
+    driver = pool.acquire(
+        (url, username), SeleniumDriver._set_driver, login, validate=validate
+    )
+    SeleniumDriver.use_driver(driver)
+    return driver
+
+
+def _login_ui(driver, console_url=None, username=None, password=None, otp_secret=None):
+    """
+    Login to OpenShift Console by the driver
+
+    Args:
+        driver (WebDriver): The driver, returned by SeleniumDriver()
+        console_url (str): ocp console url
+        username(str): User which is other than admin user,
+        password(str): Password of user other than admin user
+        otp_secret(str): Secret for OTP 2F authentication from which we generate token
+
+    return:
+        driver (Selenium WebDriver)
+
     """
     ibm_cloud_managed = (
         config.ENV_DATA["platform"] == constants.IBMCLOUD_PLATFORM
@@ -1341,7 +1482,6 @@ def login_ui(console_url=None, username=None, password=None, otp_secret=None, **
         password = password.rstrip()
     login_loc = locators_for_current_ocp_version()["login"]
     page_nav_loc = locators_for_current_ocp_version()["page"]
-    driver = SeleniumDriver()
     # Skip maximize_window in headless mode - it resets window size and doesn't work properly
     if not ocsci_config.UI_SELENIUM.get("headless"):
         driver.maximize_window()
@@ -1534,7 +1674,8 @@ def login_ui(console_url=None, username=None, password=None, otp_secret=None, **
 
 def close_browser():
     """
-    Close Selenium WebDriver
+    Close Selenium WebDriver, the driver of the browser pool is kept for the
+    next test
 
     """
     logger.info("Close browser")
@@ -1554,15 +1695,22 @@ def close_browser():
             f"  ├─ AI fallback  : ${fallback_cost:.4f}  ({fallback_requests} requests)\n"
             f"  └─ Other LLM    : ${other_cost:.4f}  ({other_requests} requests)"
         )
+    pooled = False
     try:
         take_screenshot("close_browser")
         copy_dom("close_browser")
-        SeleniumDriver().quit()
+        driver = SeleniumDriver()
+        pooled = is_pooled_driver(driver) and get_browser_pool().release(driver)
+        if not pooled:
+            driver.quit()
     except InvalidSessionIdException:
         # when browser session is closed unexpectedly or session timeout occurs take_screenshot or copy_dom will fail
         logger.error("InvalidSessionIdException occurred")
         pass
+    flush_artifacts()
     SeleniumDriver.remove_instance()
+    if pooled:
+        return
     time.sleep(10)
     garbage_collector_webdriver()
 
@@ -0,0 +1,316 @@
+"""
+Pool of warm, logged in browsers reused by the UI tests.
+
+Starting the browser and the OAuth login to the console take longer than most
+of the UI tests themselves. The pool keeps the driver logged in to a console
+as a user after the test closes the browser, and the next login of the same
+user to the same console gets the driver reset instead of a new one:
+
+ * the tabs opened by the previous test are closed
+ * the cookies of the login are restored, if the test removed them
+ * the page the login ended on is opened again and checked that the session
+   is still logged in
+
+The driver is started and logged in again (cold start) when it doesn't
+respond to the health check, the reset fails, or it was used by
+max_uses tests. The duration of the cold and warm starts is recorded and
+logged by log_summary().
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+COLD = "cold"
+WARM = "warm"
+DEFAULT_MAX_USES = 20
+DEFAULT_MAX_SIZE = 2
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class PooledBrowser(object):
+    """
+    Logged in driver of the pool
+    """
+
+    def __init__(self, key, driver, home_url, cookies):
+        """
+        Args:
+            key (tuple): Console URL and user the driver is logged in as
+            driver (WebDriver): The driver
+            home_url (str): URL of the page opened after the login
+            cookies (list): Cookies of the login session
+
+        """
+        self.key = key
+        self.driver = driver
+        self.home_url = home_url
+        self.cookies = cookies
+        self.uses = 1
+
+
+def is_healthy(driver):
+    """
+    Args:
+        driver (WebDriver): The driver
+
+    Returns:
+        bool: True if the browser responds to the driver commands
+
+    """
+    try:
+        driver.window_handles
+        driver.execute_script("return document.readyState")
+    except WebDriverException as ex:
+        logger.info(f"Browser is not responding: {ex}")
+        return False
+    return True
+
+
+def quit_driver(driver):
+    """
+    Quit the driver, ignore failures of already crashed browsers
+
+    Args:
+        driver (WebDriver): The driver
+
+    """
+    try:
+        driver.quit()
+    except WebDriverException as ex:
+        logger.warning(f"Failed to quit the browser: {ex}")
+
+
+class BrowserPool(object):
+    """
+    Warm drivers keyed by the console URL and the user
+    """
+
+    def __init__(self, max_uses=DEFAULT_MAX_USES, max_size=DEFAULT_MAX_SIZE):
+        """
+        Args:
+            max_uses (int): Number of tests the driver is used by before it is
+                started again
+            max_size (int): Max number of the drivers kept by the pool, the
+                least recently used one is quit when a new one is started
+
+        """
+        self.max_uses = max_uses
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.timings = []
+        self.recycled = 0
+
+    def acquire(self, key, create, login, validate=None):
+        """
+        Get the logged in driver, reset the warm one or start a new one
+
+        Args:
+            key (tuple): Console URL and user
+            create (callable): Starts a new driver, returns WebDriver
+            login (callable): Logs the new driver in, gets the driver as the
+                argument
+            validate (callable): Gets the driver after the reset, returns
+                False if the session is not logged in anymore
+
+        Returns:
+            WebDriver: The logged in driver
+
+        """
+        start = time.time()
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            reason = self._reset(entry, validate)
+            if reason is None:
+                entry.uses += 1
+                self._record(key, WARM, start)
+                return entry.driver
+            logger.info(f"Starting new browser for {key}: {reason}")
+            self.discard(key)
+            self.recycled += 1
+            start = time.time()
+        while len(self.entries) >= self.max_size:
+            self.discard(next(iter(self.entries)))
+        driver = create()
+        try:
+            login(driver)
+            entry = PooledBrowser(key, driver, driver.current_url, driver.get_cookies())
+        except Exception:
+            quit_driver(driver)
+            raise
+        self.entries[key] = entry
+        self._record(key, COLD, start)
+        return driver
+
+    def _reset(self, entry, validate=None):
+        """
+        Reset the state of the driver left by the previous test
+
+        Args:
+            entry (PooledBrowser): The pooled driver
+            validate (callable): See acquire
+
+        Returns:
+            str: Why the driver can't be reused, None if it was reset
+
+        """
+        if entry.uses >= self.max_uses:
+            return f"used by {entry.uses} tests"
+        if not is_healthy(entry.driver):
+            return "browser is not responding"
+        driver = entry.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get(entry.home_url)
+            cookie_names = {cookie["name"] for cookie in driver.get_cookies()}
+            missing = [c for c in entry.cookies if c["name"] not in cookie_names]
+            if missing:
+                logger.info(f"Restoring {len(missing)} cookies of the login session")
+                for cookie in missing:
+                    driver.add_cookie(cookie)
+                driver.get(entry.home_url)
+            if validate is not None and not validate(driver):
+                return "login session expired"
+        except WebDriverException as ex:
+            return f"reset failed: {ex}"
+        return None
+
+    def _record(self, key, start_type, start):
+        duration = time.time() - start
+        self.timings.append(
+            {"key": key, "start": start_type, "duration": round(duration, 2)}
+        )
+        logger.info(
+            f"{start_type.capitalize()} start of browser for {key}: {duration:.1f}s"
+        )
+
+    def is_pooled(self, driver):
+        """
+        Args:
+            driver (WebDriver): The driver
+
+        Returns:
+            bool: True if the driver is kept by the pool
+
+        """
+        return any(entry.driver is driver for entry in self.entries.values())
+
+    def release(self, driver):
+        """
+        Keep the driver for the next test, or quit it if it's not responding
+
+        Args:
+            driver (WebDriver): The driver closed by the test
+
+        Returns:
+            bool: True if the driver belongs to the pool, kept or quit by it,
+                False if it's not a pooled driver
+
+        """
+        for key, entry in list(self.entries.items()):
+            if entry.driver is driver:
+                if not is_healthy(driver):
+                    self.discard(key)
+                    self.recycled += 1
+                return True
+        return False
+
+    def discard(self, key):
+        """
+        Quit the driver and remove it from the pool
+
+        Args:
+            key (tuple): Console URL and user
+
+        """
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            logger.debug(f"Quitting pooled browser for {key}")
+            quit_driver(entry.driver)
+
+    def close(self):
+        """
+        Quit all the drivers
+        """
+        for key in list(self.entries):
+            self.discard(key)
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Number and average duration in seconds of the cold and warm
+                starts and number of the recycled drivers
+
+        """
+        stats = {"recycled": self.recycled}
+        for start_type in (COLD, WARM):
+            durations = [
+                timing["duration"]
+                for timing in self.timings
+                if timing["start"] == start_type
+            ]
+            stats[start_type] = len(durations)
+            stats[f"{start_type}_avg"] = (
+                round(sum(durations) / len(durations), 2) if durations else 0
+            )
+        return stats
+
+    def log_summary(self):
+        """
+        Log the cold and warm start timings
+        """
+        if self.timings:
+            logger.info(f"Browser pool: {self.get_stats()}")
+
+
+def get_browser_pool(max_uses=DEFAULT_MAX_USES):
+    """
+    Args:
+        max_uses (int): Number of tests a driver is used by, when the pool is
+            created
+
+    Returns:
+        BrowserPool: Pool shared by the process, its drivers are quit at exit
+
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(max_uses=max_uses)
+            atexit.register(close_browser_pool)
+        return _pool
+
+
+def is_pooled_driver(driver):
+    """
+    Args:
+        driver (WebDriver): The driver
+
+    Returns:
+        bool: True if the driver is kept by the pool
+
+    """
+    return _pool is not None and _pool.is_pooled(driver)
+
+
+def close_browser_pool():
+    """
+    Quit all the pooled drivers and log the start timings
+    """
+    if _pool is None:
+        return
+    _pool.log_summary()
+    _pool.close()
@@ -21,7 +21,6 @@ from ocs_ci.ocs.constants import (
 from ocs_ci.ocs.exceptions import IncorrectUiOptionRequested
 from ocs_ci.ocs.node import get_node_names
 from ocs_ci.ocs.ocp import OCP
-from pathlib import Path
 
 from ocs_ci.ocs.ui.base_ui import BaseUI, logger, _crop_screenshot
 from ocs_ci.ocs.ui.odf_topology import TopologyUiStr, OdfTopologyHelper
@@ -91,9 +90,10 @@ class TopologySidebar(BaseUI):
 
         try:
             top_suffix = f"{name_suffix}_top_llm" if name_suffix else "top_llm"
-            self.take_screenshot(name_suffix=top_suffix)
-            screenshots = sorted(Path(self.screenshots_folder).glob("*.png"))
-            screenshot_top = str(screenshots[-1])
+            # the files are read (and cropped) right away, they have to be written now
+            screenshot_top = self.take_screenshot(
+                name_suffix=top_suffix, background=False, dedupe=False
+            )
             if region:
                 _crop_screenshot(screenshot_top, region)
 
@@ -104,9 +104,9 @@ class TopologySidebar(BaseUI):
                 bottom_suffix = (
                     f"{name_suffix}_bottom_llm" if name_suffix else "bottom_llm"
                 )
-                self.take_screenshot(name_suffix=bottom_suffix)
-                screenshots = sorted(Path(self.screenshots_folder).glob("*.png"))
-                screenshot_bottom = str(screenshots[-1])
+                screenshot_bottom = self.take_screenshot(
+                    name_suffix=bottom_suffix, background=False, dedupe=False
+                )
                 if region:
                     _crop_screenshot(screenshot_bottom, region)
                 self.driver.execute_script(SIDEBAR_SCROLL_RESET_JS)
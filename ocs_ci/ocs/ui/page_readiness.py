@@ -0,0 +1,113 @@
+"""
+Page readiness by DOM quiescence.
+
+Waiting for a page by comparing hashes of innerHTML read sleep_time seconds
+apart costs at least one sleep_time (2 s by default) even for a page which is
+already loaded. Instead, a probe is injected into the page by execute_script:
+
+ * MutationObserver records time of the last change of the DOM
+ * XMLHttpRequest and fetch are wrapped to count pending requests
+
+The page is ready when document.readyState is 'complete', no request is
+pending and the DOM didn't change for quiet_period seconds, which is checked
+by cheap polls of the probe state. The probe is installed once per document,
+a navigation replaces the document and the next wait installs it again.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# seconds without DOM mutation for the page to be considered loaded
+DEFAULT_QUIET_PERIOD = 0.5
+# seconds between polls of the probe state
+DEFAULT_POLL_INTERVAL = 0.1
+
+PROBE_JS = """
+if (!window.__ocsciProbe) {
+    var probe = {pending: 0, lastMutation: Date.now()};
+    window.__ocsciProbe = probe;
+    new MutationObserver(function () {
+        probe.lastMutation = Date.now();
+    }).observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        probe.pending++;
+        this.addEventListener('loadend', function () {
+            probe.pending = Math.max(0, probe.pending - 1);
+        });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            probe.pending++;
+            return fetch.apply(this, arguments).finally(function () {
+                probe.pending = Math.max(0, probe.pending - 1);
+            });
+        };
+    }
+}
+var probe = window.__ocsciProbe;
+return [document.readyState, probe.pending, Date.now() - probe.lastMutation];
+"""
+
+
+def get_page_state(driver):
+    """
+    Install the probe unless it is installed and read the state of the page
+
+    Args:
+        driver (WebDriver): Selenium driver
+
+    Returns:
+        tuple: (document.readyState, number of pending requests,
+            milliseconds since the last DOM mutation)
+
+    """
+    ready_state, pending, quiet_ms = driver.execute_script(PROBE_JS)
+    return ready_state, int(pending), int(quiet_ms)
+
+
+def wait_for_quiescence(
+    driver,
+    timeout=10,
+    quiet_period=DEFAULT_QUIET_PERIOD,
+    poll_interval=DEFAULT_POLL_INTERVAL,
+):
+    """
+    Wait until the page is loaded, has no pending requests and its DOM is not
+    changing
+
+    Args:
+        driver (WebDriver): Selenium driver
+        timeout (float): Max time to wait in seconds
+        quiet_period (float): Seconds without DOM mutation required
+        poll_interval (float): Seconds between polls of the page state
+
+    Returns:
+        bool: True if the page became quiescent, False on timeout
+
+    Raises:
+        WebDriverException: If the probe can't be executed in the page
+
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        ready_state, pending, quiet_ms = get_page_state(driver)
+        if (
+            ready_state == "complete"
+            and pending == 0
+            and quiet_ms >= quiet_period * 1000
+        ):
+            return True
+        if time.monotonic() >= deadline:
+            logger.debug(
+                f"Page not quiescent in {timeout}s, readyState: {ready_state}, "
+                f"pending requests: {pending}, last DOM mutation: {quiet_ms}ms ago"
+            )
+            return False
+        time.sleep(poll_interval)
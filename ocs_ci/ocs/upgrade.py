@@ -1,5 +1,4 @@
 import logging
-import time
 
 from packaging.version import parse as parse_version
 
@@ -16,6 +15,7 @@ from ocs_ci.ocs.resources.packagemanifest import (
     get_selector_for_ocs_operator,
 )
 from ocs_ci.ocs.resources.pod import get_noobaa_pods, verify_pods_upgraded
+from ocs_ci.ocs.upgrade_rollout import RolloutVerifier
 from ocs_ci.ocs.resources.storage_cluster import get_osd_count
 from ocs_ci.ocs.utils import get_expected_nb_db_psql_version, setup_ceph_toolbox
 from ocs_ci.utility import version
@@ -237,6 +237,10 @@ class BaseUpgrade(object):
         """
         Verify if all the images of OCS objects got upgraded
 
+        All the components (except NooBaa pods, which have their own verification
+        with retries) are evaluated together against one snapshot of pods per
+        tick, with the same time budget as when verified one after another.
+
         Args:
             old_images (set): set with old images
             upgrade_version (packaging.version.Version): version of OCS
@@ -246,7 +250,8 @@ class BaseUpgrade(object):
         # Get all worker nodes for CSI nodeplugin count (they run on all workers, not just storage-labeled)
         all_worker_nodes = get_worker_nodes(skip_master_nodes=False)
         number_of_all_worker_nodes = len(all_worker_nodes)
-        verify_pods_upgraded(old_images, selector=constants.OCS_OPERATOR_LABEL)
+        rollout = RolloutVerifier(old_images, sequential_budget=True)
+        rollout.add(constants.OCS_OPERATOR_LABEL)
         if not (
             config.ENV_DATA.get("mcg_only_deployment")
             and (
@@ -257,8 +262,7 @@ class BaseUpgrade(object):
                 )
             )
         ):
-            verify_pods_upgraded(old_images, selector=constants.OPERATOR_LABEL)
-        self.verify_noobaa_pods_upgraded(old_images, upgrade_version)
+            rollout.add(constants.OPERATOR_LABEL)
         if not config.ENV_DATA.get("mcg_only_deployment"):
             odf_running_version = version.get_ocs_version_from_csv(
                 only_major_minor=True
@@ -291,22 +295,16 @@ class BaseUpgrade(object):
                 logger.info(
                     f"Label for cephfsplugin and rbdplugin are {csi_cephfsplugin_label} and {csi_rbdplugin_label}"
                 )
-            verify_pods_upgraded(
-                old_images,
-                selector=csi_cephfsplugin_label,
+            rollout.add(
+                csi_cephfsplugin_label,
                 count=count_csi_cephfsplugin_label,
             )
-            verify_pods_upgraded(
-                old_images, selector=csi_cephfsplugin_provisioner_label, count=2
-            )
-            verify_pods_upgraded(
-                old_images,
-                selector=csi_rbdplugin_label,
+            rollout.add(csi_cephfsplugin_provisioner_label, count=2)
+            rollout.add(
+                csi_rbdplugin_label,
                 count=count_csi_rbdplugin_label,
             )
-            verify_pods_upgraded(
-                old_images, selector=csi_rbdplugin_provisioner_label, count=2
-            )
+            rollout.add(csi_rbdplugin_provisioner_label, count=2)
         if not (
             config.DEPLOYMENT.get("external_mode")
             or config.ENV_DATA.get("mcg_only_deployment")
@@ -314,41 +312,35 @@ class BaseUpgrade(object):
             mon_count = 3
             if config.DEPLOYMENT.get("arbiter_deployment"):
                 mon_count = 5
-            verify_pods_upgraded(
-                old_images,
-                selector=constants.MON_APP_LABEL,
+            rollout.add(
+                constants.MON_APP_LABEL,
                 count=mon_count,
                 timeout=820,
             )
             mgr_count = constants.MGR_COUNT_415
             if upgrade_version < parse_version("4.15"):
                 mgr_count = constants.MGR_COUNT
-            verify_pods_upgraded(
-                old_images, selector=constants.MGR_APP_LABEL, count=mgr_count
-            )
+            rollout.add(constants.MGR_APP_LABEL, count=mgr_count)
             osd_timeout = 600 if upgrade_version >= parse_version("4.5") else 750
             osd_count = get_osd_count()
             # In the debugging issue:
             # https://github.com/red-hat-storage/ocs-ci/issues/5031
             # Noticed that it's taking about 1 more minute from previous check till actual
-            # OSD pods getting restarted.
-            # Hence adding sleep here for 120 seconds to be sure, OSD pods upgrade started.
-            logger.info("Waiting for 2 minutes before start checking OSD pods")
-            time.sleep(120)
-            verify_pods_upgraded(
-                old_images,
-                selector=constants.OSD_APP_LABEL,
+            # OSD pods getting restarted. OSD pods with old images are reported as
+            # not upgraded, so instead of sleeping, 120 seconds are added to the
+            # time budget of OSD pods.
+            rollout.add(
+                constants.OSD_APP_LABEL,
                 count=osd_count,
-                timeout=osd_timeout * osd_count,
+                timeout=osd_timeout * osd_count + 120,
             )
-            verify_pods_upgraded(old_images, selector=constants.MDS_APP_LABEL, count=2)
+            rollout.add(constants.MDS_APP_LABEL, count=2)
             if config.ENV_DATA.get("platform") in constants.ON_PREM_PLATFORMS:
                 rgw_count = get_rgw_count(
                     upgrade_version.base_version, True, version_before_upgrade
                 )
-                verify_pods_upgraded(
-                    old_images,
-                    selector=constants.RGW_APP_LABEL,
+                rollout.add(
+                    constants.RGW_APP_LABEL,
                     count=rgw_count,
                 )
         if upgrade_version >= parse_version("4.6"):
@@ -357,14 +349,14 @@ class BaseUpgrade(object):
                 or config.ENV_DATA.get("mcg_only_deployment")
             )
             if not skip_metrics_exporter:
-                verify_pods_upgraded(
-                    old_images, selector=constants.OCS_METRICS_EXPORTER
-                )
+                rollout.add(constants.OCS_METRICS_EXPORTER)
             else:
                 logger.info(
                     "Skipping ocs-metrics-exporter upgrade verification for ODF 4.21 "
                     "external mode deployment due to bug DFBUGS-5811"
                 )
+        rollout.wait()
+        self.verify_noobaa_pods_upgraded(old_images, upgrade_version)
 
     @retry(Exception, tries=3, delay=60, backoff=1)
     def verify_noobaa_pods_upgraded(self, old_images, upgrade_version):
@@ -0,0 +1,274 @@
+"""
+Verification of pod image rollout during upgrade.
+
+RolloutVerifier lists all pods of the namespace once per tick and evaluates
+all registered selectors against the same snapshot: pods matching each
+selector are classified as new (no old image digest), old (only old image
+digests) or mixed, and the selector is considered upgraded when the expected
+number of pods run only new images which are the same across all the pods.
+Progress of all components is logged on every tick.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.cluster_snapshot import match_labels
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    NonUpgradedImagesFoundError,
+    NotAllPodsHaveSameImagesError,
+)
+from ocs_ci.ocs.ocp import OCP, get_images, get_sha256_digest, verify_images_upgraded
+from ocs_ci.utility.utils import check_timeout_reached
+
+log = logging.getLogger(__name__)
+
+ROLLOUT_NEW = "new"
+ROLLOUT_OLD = "old"
+ROLLOUT_MIXED = "mixed"
+
+
+@dataclass
+class RolloutComponent:
+    """
+    Component (pods matching the selector) verified by RolloutVerifier
+    """
+
+    selector: str
+    count: int = 1
+    timeout: int = 720
+    ignore_psql_12_verification: bool = False
+    budget: float = 0.0
+    done: bool = False
+    found: int = 0
+    progress: dict = field(default_factory=dict)
+    error: Exception = None
+
+    @property
+    def info_message(self):
+        return (
+            f"Waiting for {self.count} pods with selector: {self.selector} to be "
+            f"running and upgraded."
+        )
+
+
+def classify_pod_images(old_digests, pod_data):
+    """
+    Classify the pod by digests of its container images
+
+    Args:
+        old_digests (set): Digests of old images
+        pod_data (dict): Pod resource data
+
+    Returns:
+        str: ROLLOUT_NEW, ROLLOUT_OLD or ROLLOUT_MIXED
+
+    """
+    digests = {get_sha256_digest(image) for image in get_images(pod_data).values()}
+    old = digests & old_digests
+    if not old:
+        return ROLLOUT_NEW
+    return ROLLOUT_OLD if old == digests else ROLLOUT_MIXED
+
+
+def verify_same_images(selector, pods_data):
+    """
+    Verify that all the pods run the same images (container image which
+    differs is accepted when it matches the digest of the imageID)
+
+    Args:
+        selector (str): Selector of the pods (used in the error message)
+        pods_data (list): Pod resources data
+
+    Raises:
+        NotAllPodsHaveSameImagesError: If the pods don't have the same images
+
+    """
+    pod_images = {}
+    for pod_data in pods_data:
+        current_pod_images = get_images(pod_data)
+        current_pod_image_ids = get_images(pod_data, image_key="imageID")
+        for container_name, container_image in current_pod_images.items():
+            if container_name not in pod_images:
+                pod_images[container_name] = container_image
+            elif pod_images[container_name] != container_image:
+                current_pod_image_id = current_pod_image_ids.get(container_name)
+                if get_sha256_digest(container_image) == get_sha256_digest(
+                    current_pod_image_id
+                ):
+                    log.info(
+                        f"Container image: {container_image} match with imageID "
+                        f" digest: {current_pod_image_id}"
+                    )
+                else:
+                    raise NotAllPodsHaveSameImagesError(
+                        f"Not all the pods with the selector: {selector} have the same "
+                        f"images! Image for container {container_name} has image {container_image} "
+                        f"which doesn't match with: {pod_images} differ! This means "
+                        "that upgrade hasn't finished to restart all the pods yet! "
+                        "Or it's caused by other discrepancy which needs to be investigated!"
+                        f"ImageID is: {current_pod_image_id}"
+                    )
+
+
+class RolloutVerifier(object):
+    """
+    Verify that pods of several components were upgraded, evaluating all of
+    them against one snapshot of the namespace per tick
+    """
+
+    def __init__(self, old_images, namespace=None, sleep=5, sequential_budget=False):
+        """
+        Args:
+            old_images (set): Set with old images
+            namespace (str): Namespace of the pods, cluster namespace by default
+            sleep (int): Seconds between ticks
+            sequential_budget (bool): If True, timeout of every component is
+                added to the timeouts of previously registered components, so
+                the component has the same time budget as when the components
+                are verified one after another
+
+        """
+        self.old_images = old_images
+        self.old_digests = {get_sha256_digest(image) for image in old_images}
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.sleep = sleep
+        self.sequential_budget = sequential_budget
+        self.components = []
+        self.start_time = None
+
+    def add(
+        self,
+        selector,
+        count=1,
+        timeout=720,
+        ignore_psql_12_verification=False,
+    ):
+        """
+        Register component to verify
+
+        Args:
+            selector (str): Selector (e.g. app=ocs-osd)
+            count (int): Number of resources for selector
+            timeout (int): Timeout in seconds to wait for pods to be upgraded
+            ignore_psql_12_verification (bool): If True, psql 12 image is
+                removed from current images for verification
+
+        Returns:
+            RolloutVerifier: self, to allow chaining
+
+        """
+        budget = timeout
+        if self.sequential_budget and self.components:
+            budget += self.components[-1].budget
+        self.components.append(
+            RolloutComponent(
+                selector=selector,
+                count=count,
+                timeout=timeout,
+                ignore_psql_12_verification=ignore_psql_12_verification,
+                budget=budget,
+            )
+        )
+        return self
+
+    def _evaluate(self, component, pods_data):
+        component.found = len(pods_data)
+        progress = {ROLLOUT_NEW: 0, ROLLOUT_OLD: 0, ROLLOUT_MIXED: 0}
+        for pod_data in pods_data:
+            progress[classify_pod_images(self.old_digests, pod_data)] += 1
+        component.progress = progress
+        component.error = None
+        if component.found != component.count:
+            log.warning(
+                f"Number of found pods {component.found} for selector "
+                f"{component.selector} is not as expected: {component.count}"
+            )
+            return
+        try:
+            for pod_data in pods_data:
+                verify_images_upgraded(
+                    self.old_images, pod_data, component.ignore_psql_12_verification
+                )
+            verify_same_images(component.selector, pods_data)
+        except (NonUpgradedImagesFoundError, NotAllPodsHaveSameImagesError) as ex:
+            log.warning(ex)
+            component.error = ex
+            return
+        component.done = True
+
+    def tick(self):
+        """
+        Take one snapshot of the pods and evaluate all pending components
+
+        Returns:
+            bool: True if all components are upgraded
+
+        """
+        pending = [component for component in self.components if not component.done]
+        try:
+            pods = OCP(kind=constants.POD, namespace=self.namespace).get()["items"]
+        except CommandFailed as ex:
+            log.warning(f"Failed when getting pods in {self.namespace}. Error: {ex}")
+            return False
+        for component in pending:
+            matching = [
+                pod_data
+                for pod_data in pods
+                if match_labels(pod_data["metadata"].get("labels"), component.selector)
+            ]
+            self._evaluate(component, matching)
+        self.log_progress()
+        return all(component.done for component in self.components)
+
+    def get_progress(self):
+        """
+        Returns:
+            dict: Selector -> dict with expected and found pod counts, number
+                of new/old/mixed pods and whether the component is upgraded
+
+        """
+        return {
+            component.selector: {
+                "expected": component.count,
+                "found": component.found,
+                **component.progress,
+                "upgraded": component.done,
+            }
+            for component in self.components
+        }
+
+    def log_progress(self):
+        for selector, progress in self.get_progress().items():
+            state = "upgraded" if progress["upgraded"] else "in progress"
+            log.info(
+                f"Rollout of {selector}: {state}, pods {progress['found']}/"
+                f"{progress['expected']}, new: {progress.get(ROLLOUT_NEW, 0)}, "
+                f"old: {progress.get(ROLLOUT_OLD, 0)}, "
+                f"mixed: {progress.get(ROLLOUT_MIXED, 0)}"
+            )
+
+    def wait(self):
+        """
+        Wait until all components are upgraded
+
+        Raises:
+            TimeoutException: If some component didn't get upgraded till its
+                timeout.
+
+        """
+        self.start_time = time.time()
+        for component in self.components:
+            log.info(f"{component.info_message} Old images: {self.old_images}")
+        while not self.tick():
+            for component in self.components:
+                if not component.done:
+                    check_timeout_reached(
+                        self.start_time,
+                        component.budget,
+                        f"{component.info_message} Old images: {self.old_images}",
+                    )
+            time.sleep(self.sleep)
@@ -27,6 +27,7 @@ from ocs_ci.framework import config as ocsci_config, config
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.external_ceph import RolesContainer, Ceph, CephNode
 from ocs_ci.ocs.clients import WinNode
+from ocs_ci.ocs.event_recorder import export_recorded_events
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     ExternalClusterDetailsException,
@@ -38,6 +39,7 @@ from ocs_ci.ocs.openstack import CephVMNode
 from ocs_ci.ocs.parallel import parallel
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.utility import templating, version
+from ocs_ci.utility.cluster_facts import cluster_fact
 from ocs_ci.utility.prometheus import PrometheusAPI
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
@@ -770,6 +772,7 @@ def get_namespce_name_by_pattern(
     return namespace_list
 
 
+@cluster_fact("rook_image")
 def get_rook_version():
     """
     Get the rook image information from rook-ceph-operator pod
@@ -1270,6 +1273,14 @@ def _collect_ocs_logs(
             f"{cluster_config.ENV_DATA['cluster_name']}",
         )
 
+    try:
+        export_recorded_events(
+            os.path.join(log_dir_path, "recorded_events"),
+            cluster_index=cluster_config.MULTICLUSTER["multicluster_index"],
+        )
+    except Exception as ex:
+        log.warning(f"Failed to export recorded events: {ex}")
+
     if ocs:
         latest_tag = cluster_config.REPORTING.get(
             "ocs_must_gather_latest_tag",
@@ -6,7 +6,7 @@ similar to the KrknWorkloadConfig used in krkn chaos tests.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from ocs_ci.framework import config
 
@@ -151,6 +151,24 @@ class ResiliencyWorkloadConfig:
             "max_concurrent_operations", 3
         )
 
+    def get_background_operations_rates(self) -> Optional[Dict[str, float]]:
+        """
+        Get target rates of background operations in operations per minute.
+
+        Returns:
+            dict: Operation type -> ops/min, None if rates are not configured
+        """
+        return self.get_background_operations_config().get("operation_rates")
+
+    def get_background_operations_max_queued(self) -> int:
+        """
+        Get maximum number of background operations waiting for a free worker.
+
+        Returns:
+            int: Maximum queued operations (default: 0)
+        """
+        return self.get_background_operations_config().get("max_queued_operations", 0)
+
     def get_enabled_background_operations(self) -> List[str]:
         """
         Get list of enabled background operation types.
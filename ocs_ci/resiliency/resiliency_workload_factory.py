@@ -107,6 +107,8 @@ class ResiliencyWorkloadOps:
                 enabled_operations=enabled_operations if enabled_operations else None,
                 operation_interval=workload_config.get_background_operations_interval(),
                 max_concurrent_operations=workload_config.get_background_operations_max_concurrent(),
+                operation_rates=workload_config.get_background_operations_rates(),
+                max_queued_operations=workload_config.get_background_operations_max_queued(),
             )
             self.background_cluster_ops.start()
 
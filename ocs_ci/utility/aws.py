@@ -15,6 +15,12 @@ from botocore.exceptions import (
     EndpointConnectionError,
 )
 
+from ocs_ci.utility.aws_cleanup import (
+    AWSCleanupEngine,
+    DEFAULT_MAX_WORKERS as DEFAULT_CLEANUP_WORKERS,
+    LIST_PAGE_SIZE,
+    paginate,
+)
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import exec_cmd, get_infra_id
 from ocs_ci.framework import config
@@ -1286,11 +1292,12 @@ class AWS(object):
             list : of all cloudformation stacks
 
         """
-        all_stacks = []
-        stack_description = self.cf_client.describe_stacks()
-        for stack in stack_description["Stacks"]:
-            all_stacks.append(stack["StackName"])
-        return all_stacks
+        return [
+            stack["StackName"]
+            for stack in paginate(
+                self.cf_client.describe_stacks, ["Stacks"], {"NextToken": "NextToken"}
+            )
+        ]
 
     def create_stack(self, s3_url, index, params_list, capabilities):
         """
@@ -2059,7 +2066,14 @@ class AWS(object):
                ]
 
         """
-        return self.s3_client.list_buckets()["Buckets"]
+        return list(
+            paginate(
+                self.s3_client.list_buckets,
+                ["Buckets"],
+                {"ContinuationToken": "ContinuationToken"},
+                MaxBuckets=LIST_PAGE_SIZE,
+            )
+        )
 
     def get_buckets_to_delete(self, bucket_prefix, hours):
         """
@@ -2112,23 +2126,34 @@ class AWS(object):
                 return bucket_prefixes[bucket_prefix]
         return hours
 
+    def get_cleanup_engine(self, max_workers=DEFAULT_CLEANUP_WORKERS, report=None):
+        """
+        Get the engine for parallel deletion of buckets and stacks
+
+        Args:
+            max_workers (int): Max number of buckets or stacks deleted at once
+            report (CleanupReport): Report to record the results into
+
+        Returns:
+            AWSCleanupEngine: Cleanup engine of the region
+
+        """
+        return AWSCleanupEngine(
+            region_name=self._region_name, max_workers=max_workers, report=report
+        )
+
     def delete_objects_in_bucket(self, bucket):
         """
-        Delete objects in a bucket
+        Delete all objects, object versions and delete markers in a bucket,
+        by DeleteObjects requests of up to 1000 keys
 
         Args:
             bucket (str): Name of the bucket to delete objects
 
         """
-        # List all objects within the bucket
-        response = self.s3_client.list_objects_v2(Bucket=bucket)
-
-        # Delete each object within the bucket
-        if "Contents" in response:
-            for obj in response["Contents"]:
-                object_key = obj["Key"]
-                self.s3_client.delete_object(Bucket=bucket, Key=object_key)
-                logger.info(f"Deleted object: {object_key}")
+        deleted = self.get_cleanup_engine().empty_bucket(bucket)
+        if deleted:
+            logger.info(f"Deleted {deleted} objects in bucket {bucket}")
         else:
             logger.info(f"No objects found in bucket {bucket}")
 
@@ -2147,16 +2172,24 @@ class AWS(object):
         self.s3_client.delete_bucket(Bucket=bucket)
         logger.info(f"Deleted bucket {bucket}")
 
-    def delete_buckets(self, buckets):
+    def delete_buckets(self, buckets, max_workers=DEFAULT_CLEANUP_WORKERS):
         """
-        Delete the buckets
+        Delete the buckets concurrently, all the buckets are tried before
+        the failure is raised
 
         Args:
             buckets (list): List of buckets to delete
+            max_workers (int): Max number of buckets deleted at once
+
+        Raises:
+            ResourceNotDeleted: If any of the buckets failed to be deleted
 
         """
-        for each_bucket in buckets:
-            self.delete_bucket(bucket=each_bucket)
+        failed = self.get_cleanup_engine(max_workers=max_workers).delete_buckets(
+            buckets
+        )
+        if failed:
+            raise exceptions.ResourceNotDeleted(f"Failed to delete buckets: {failed}")
 
     def create_iam_role(self, role_name, description, document):
         """
@@ -2858,9 +2891,8 @@ def delete_cluster_buckets(cluster_name):
     """
     region = config.ENV_DATA["region"]
     base_domain = config.ENV_DATA["base_domain"]
-    s3_client = boto3.client("s3", region_name=region)
-    buckets = s3_client.list_buckets()["Buckets"]
-    bucket_names = [bucket["Name"] for bucket in buckets]
+    engine = AWSCleanupEngine(region_name=region)
+    bucket_names = [bucket["Name"] for bucket in engine.list_buckets()]
     logger.debug("Found buckets: %s", bucket_names)
 
     # patterns for mcg target bucket, image-registry buckets and bucket created
@@ -2872,20 +2904,18 @@ def delete_cluster_buckets(cluster_name):
         f"{cluster_name}-(\\w+)-oidc",
         f"{cluster_name}-(\\d{{8}})",
     ]
+    filtered_buckets = []
     for pattern in patterns:
         r = re.compile(pattern)
-        filtered_buckets = list(filter(r.search, bucket_names))
-        logger.info(f"Found buckets: {filtered_buckets}")
-        s3_resource = boto3.resource("s3", region_name=region)
-        for bucket_name in filtered_buckets:
-            logger.info("Deleting all files in bucket %s", bucket_name)
-            try:
-                bucket = s3_resource.Bucket(bucket_name)
-                bucket.objects.delete()
-                logger.info("Deleting bucket %s", bucket_name)
-                bucket.delete()
-            except ClientError as e:
-                logger.error(e)
+        filtered_buckets += [
+            bucket_name
+            for bucket_name in filter(r.search, bucket_names)
+            if bucket_name not in filtered_buckets
+        ]
+    logger.info(f"Found buckets: {filtered_buckets}")
+    failed = engine.delete_buckets(filtered_buckets)
+    if failed:
+        logger.error(f"Failed to delete buckets: {failed}")
 
 
 def get_stack_name_from_instance_dict(instance_dict):
@@ -0,0 +1,487 @@
+"""
+Cleanup engine for leftover AWS resources (S3 buckets and CloudFormation
+stacks) of CI accounts.
+
+ * every listing is fully paginated (ListBuckets, ListObjectVersions,
+   DescribeStacks), nothing is left behind because of the page size
+ * bucket content, including object versions and delete markers, is deleted
+   by DeleteObjects requests of up to 1000 keys
+ * buckets and stacks are deleted concurrently with bounded parallelism, the
+   clients have connection pools of the matching size
+ * calls failing on throttling (SlowDown, Throttling, RequestLimitExceeded,
+   ...) or transient errors are retried with exponential backoff and jitter
+ * the result of every resource is recorded in CleanupReport
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import botocore.config
+from botocore.exceptions import BotoCoreError, ClientError, ConnectionError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+# concurrent DeleteObjects requests of one bucket
+DEFAULT_BATCH_WORKERS = 4
+# max number of keys of one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+LIST_PAGE_SIZE = 1000
+MAX_ATTEMPTS = 8
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+STACK_DELETE_WAIT_DELAY = 30
+STACK_DELETE_WAIT_ATTEMPTS = 120
+
+RETRYABLE_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "SlowDown",
+    "ServiceUnavailable",
+    "InternalError",
+    "RequestTimeout",
+    "OperationAborted",
+}
+
+
+def is_retryable_error(error):
+    """
+    Args:
+        error (Exception): Exception raised by the boto3 call
+
+    Returns:
+        bool: True if the call failed on throttling or a transient error
+
+    """
+    if isinstance(error, ConnectionError):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+    code = error.response.get("Error", {}).get("Code")
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in RETRYABLE_ERROR_CODES or status in (429, 500, 502, 503, 504)
+
+
+def call_with_backoff(func, *args, attempts=MAX_ATTEMPTS, **kwargs):
+    """
+    Call the boto3 function, retry on throttling and transient errors with
+    exponential backoff and full jitter
+
+    Args:
+        func (callable): boto3 client method
+        args (tuple): Positional arguments of the function
+        attempts (int): Max number of calls
+        kwargs (dict): Keyword arguments of the function
+
+    Returns:
+        object: Result of the function
+
+    Raises:
+        ClientError: If the call failed on other than retryable error or the
+            attempts were exhausted
+
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except (ClientError, ConnectionError) as e:
+            if attempt == attempts or not is_retryable_error(e):
+                raise
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+            logger.warning(
+                f"{getattr(func, '__name__', func)} failed ({e}), retrying in "
+                f"{delay:.1f}s, attempt {attempt} of {attempts}"
+            )
+            time.sleep(delay)
+
+
+def paginate(func, result_keys, tokens, **kwargs):
+    """
+    Iterate over the items of all the pages of the listing. The pages are
+    requested one by one with backoff, so a throttled page is requested again
+    instead of ending the listing.
+
+    Args:
+        func (callable): boto3 client method of the listing
+        result_keys (list): Keys of the items in the page
+        tokens (dict): Key of the continuation token in the response -> key
+            of the token in the request
+        kwargs (dict): Arguments of the listing
+
+    Yields:
+        dict: Item of the listing
+
+    """
+    while True:
+        page = call_with_backoff(func, **kwargs)
+        for result_key in result_keys:
+            yield from page.get(result_key, [])
+        next_tokens = {
+            request_key: page[response_key]
+            for response_key, request_key in tokens.items()
+            if page.get(response_key)
+        }
+        if not next_tokens or page.get("IsTruncated") is False:
+            return
+        kwargs.update(next_tokens)
+
+
+class CleanupReport(object):
+    """
+    Thread-safe per-resource report of the cleanup
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._lock = threading.Lock()
+
+    def add(self, resource_type, name, status, seconds=0, error=None, **details):
+        """
+        Record the result of the resource
+
+        Args:
+            resource_type (str): Type of the resource, e.g. 'bucket' or 'stack'
+            name (str): Name of the resource
+            status (str): 'deleted', 'failed' or 'skipped'
+            seconds (float): Time spent by the resource
+            error (str): Error of the failed resource
+            details (dict): Other details, e.g. number of deleted objects
+
+        """
+        entry = {
+            "resource_type": resource_type,
+            "name": name,
+            "status": status,
+            "seconds": round(seconds, 3),
+        }
+        if error:
+            entry["error"] = error
+        entry.update(details)
+        with self._lock:
+            self.entries.append(entry)
+
+    def get_failed(self, resource_type=None):
+        """
+        Args:
+            resource_type (str): Type of the resources, all if None
+
+        Returns:
+            list: Names of the failed resources
+
+        """
+        with self._lock:
+            return [
+                entry["name"]
+                for entry in self.entries
+                if entry["status"] == "failed"
+                and resource_type in (None, entry["resource_type"])
+            ]
+
+    def get_summary(self):
+        """
+        Returns:
+            dict: resource type -> status -> number of resources
+
+        """
+        summary = {}
+        with self._lock:
+            for entry in self.entries:
+                statuses = summary.setdefault(entry["resource_type"], {})
+                statuses[entry["status"]] = statuses.get(entry["status"], 0) + 1
+        return summary
+
+    def write(self, path):
+        """
+        Write the report as JSON
+
+        Args:
+            path (str): Path of the report file
+
+        """
+        with self._lock:
+            data = {"summary": None, "resources": list(self.entries)}
+        data["summary"] = self.get_summary()
+        with open(path, "w") as report_file:
+            json.dump(data, report_file, indent=2)
+        logger.info(f"Cleanup report written to {path}: {data['summary']}")
+
+
+class AWSCleanupEngine(object):
+    """
+    Parallel deletion of S3 buckets and CloudFormation stacks
+    """
+
+    def __init__(
+        self,
+        region_name=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        batch_workers=DEFAULT_BATCH_WORKERS,
+        report=None,
+    ):
+        """
+        Args:
+            region_name (str): Name of the AWS region
+            max_workers (int): Max number of buckets or stacks deleted at once
+            batch_workers (int): Max number of concurrent DeleteObjects
+                requests of one bucket
+            report (CleanupReport): Report to record the results into, new
+                one if None
+
+        """
+        self.region_name = region_name
+        self.max_workers = max(1, max_workers)
+        self.batch_workers = max(1, batch_workers)
+        self.report = report or CleanupReport()
+        client_config = botocore.config.Config(
+            max_pool_connections=self.max_workers * self.batch_workers + 1,
+            # throttling is handled by call_with_backoff
+            retries={"max_attempts": 1, "mode": "standard"},
+        )
+        session = boto3.session.Session()
+        self.s3_client = session.client(
+            "s3", region_name=region_name, config=client_config
+        )
+        self.cf_client = session.client(
+            "cloudformation", region_name=region_name, config=client_config
+        )
+
+    def _run(self, func, items):
+        items = list(items)
+        if not items:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items))
+        ) as executor:
+            list(executor.map(func, items))
+
+    def list_buckets(self):
+        """
+        Returns:
+            list: Buckets (dicts with Name and CreationDate)
+
+        """
+        return list(
+            paginate(
+                self.s3_client.list_buckets,
+                ["Buckets"],
+                {"ContinuationToken": "ContinuationToken"},
+                MaxBuckets=LIST_PAGE_SIZE,
+            )
+        )
+
+    def iter_object_batches(self, bucket):
+        """
+        Iterate over batches of all the object versions and delete markers of
+        the bucket, for buckets without versioning every object has version
+        'null'
+
+        Args:
+            bucket (str): Name of the bucket
+
+        Yields:
+            list: Up to DELETE_BATCH_SIZE dicts with Key and VersionId
+
+        """
+        batch = []
+        items = paginate(
+            self.s3_client.list_object_versions,
+            ["Versions", "DeleteMarkers"],
+            {"NextKeyMarker": "KeyMarker", "NextVersionIdMarker": "VersionIdMarker"},
+            Bucket=bucket,
+            MaxKeys=LIST_PAGE_SIZE,
+        )
+        for item in items:
+            batch.append({"Key": item["Key"], "VersionId": item["VersionId"]})
+            if len(batch) == DELETE_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def delete_object_batch(self, bucket, batch):
+        """
+        Delete the objects by one DeleteObjects request
+
+        Args:
+            bucket (str): Name of the bucket
+            batch (list): Dicts with Key and VersionId
+
+        Returns:
+            int: Number of deleted objects
+
+        Raises:
+            ClientError: If any of the objects was not deleted
+
+        """
+        response = call_with_backoff(
+            self.s3_client.delete_objects,
+            Bucket=bucket,
+            Delete={"Objects": batch, "Quiet": True},
+        )
+        errors = response.get("Errors", [])
+        if errors:
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": errors[0].get("Code"),
+                        "Message": f"{len(errors)} objects of bucket {bucket} "
+                        f"not deleted, e.g. {errors[0]}",
+                    }
+                },
+                "DeleteObjects",
+            )
+        return len(batch)
+
+    def empty_bucket(self, bucket):
+        """
+        Delete all the objects, object versions and delete markers of the
+        bucket
+
+        Args:
+            bucket (str): Name of the bucket
+
+        Returns:
+            int: Number of deleted objects
+
+        """
+        with ThreadPoolExecutor(max_workers=self.batch_workers) as executor:
+            futures = [
+                executor.submit(self.delete_object_batch, bucket, batch)
+                for batch in self.iter_object_batches(bucket)
+            ]
+        deleted = sum(future.result() for future in futures if not future.exception())
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            raise errors[0]
+        return deleted
+
+    def delete_bucket(self, bucket):
+        """
+        Delete the bucket with all its content, the result is recorded in the
+        report
+
+        Args:
+            bucket (str): Name of the bucket
+
+        Returns:
+            bool: True if the bucket was deleted or doesn't exist
+
+        """
+        start = time.monotonic()
+        deleted = 0
+        try:
+            deleted = self.empty_bucket(bucket)
+            call_with_backoff(self.s3_client.delete_bucket, Bucket=bucket)
+        except (ClientError, BotoCoreError) as e:
+            if (
+                isinstance(e, ClientError)
+                and e.response.get("Error", {}).get("Code") == "NoSuchBucket"
+            ):
+                self.report.add("bucket", bucket, "skipped", error="NoSuchBucket")
+                return True
+            logger.error(f"Failed to delete bucket {bucket}: {e}")
+            self.report.add(
+                "bucket",
+                bucket,
+                "failed",
+                time.monotonic() - start,
+                error=str(e),
+                objects=deleted,
+            )
+            return False
+        logger.info(f"Deleted bucket {bucket} with {deleted} objects")
+        self.report.add(
+            "bucket", bucket, "deleted", time.monotonic() - start, objects=deleted
+        )
+        return True
+
+    def delete_buckets(self, buckets):
+        """
+        Delete the buckets concurrently
+
+        Args:
+            buckets (list): Names of the buckets
+
+        Returns:
+            list: Names of the buckets which failed to be deleted
+
+        """
+        buckets = list(buckets)
+        logger.info(f"Deleting {len(buckets)} buckets")
+        self._run(self.delete_bucket, buckets)
+        failed = set(self.report.get_failed("bucket"))
+        return [bucket for bucket in buckets if bucket in failed]
+
+    def list_stacks(self):
+        """
+        Returns:
+            list: Names of all the stacks
+
+        """
+        return [
+            stack["StackName"]
+            for stack in paginate(
+                self.cf_client.describe_stacks, ["Stacks"], {"NextToken": "NextToken"}
+            )
+        ]
+
+    def delete_stack(self, stack_name, wait=True):
+        """
+        Delete the stack, the result is recorded in the report
+
+        Args:
+            stack_name (str): Name of the stack
+            wait (bool): True to wait until the stack is deleted
+
+        Returns:
+            bool: True if the stack was deleted
+
+        """
+        start = time.monotonic()
+        try:
+            call_with_backoff(self.cf_client.delete_stack, StackName=stack_name)
+            if wait:
+                self.cf_client.get_waiter("stack_delete_complete").wait(
+                    StackName=stack_name,
+                    WaiterConfig={
+                        "Delay": STACK_DELETE_WAIT_DELAY,
+                        "MaxAttempts": STACK_DELETE_WAIT_ATTEMPTS,
+                    },
+                )
+        except (ClientError, BotoCoreError) as e:
+            logger.error(f"Failed to delete stack {stack_name}: {e}")
+            self.report.add(
+                "stack", stack_name, "failed", time.monotonic() - start, error=str(e)
+            )
+            return False
+        logger.info(f"Deleted stack {stack_name}")
+        self.report.add("stack", stack_name, "deleted", time.monotonic() - start)
+        return True
+
+    def delete_stacks(self, stack_names, wait=True):
+        """
+        Delete the stacks concurrently
+
+        Args:
+            stack_names (list): Names of the stacks
+            wait (bool): True to wait until the stacks are deleted
+
+        Returns:
+            list: Names of the stacks which failed to be deleted
+
+        """
+        stack_names = list(stack_names)
+        logger.info(f"Deleting {len(stack_names)} stacks")
+        self._run(lambda stack_name: self.delete_stack(stack_name, wait), stack_names)
+        failed = set(self.report.get_failed("stack"))
+        return [stack_name for stack_name in stack_names if stack_name in failed]
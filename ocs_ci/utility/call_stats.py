@@ -0,0 +1,386 @@
+"""
+Per-test accounting of external calls.
+
+Every external call done through the framework hot paths (exec_cmd,
+OCP.exec_oc_cmd, OCP.exec_oc_debug_cmd, Pod.exec_ceph_cmd, PrometheusAPI.get)
+and every TimeoutSampler sleep is measured and attributed to the currently
+running test and its phase (setup, call, teardown). Count, cumulative and max
+latency, bytes of output and parse time are kept per command family, e.g.
+'oc:get Pod', 'ceph:ceph osd tree' or 'exec:oc exec'. CPU time of the
+framework process (all its threads) is accounted per test phase as well,
+which is the framework overhead when the commands are replayed (see
+ocs_ci/utility/exec_transport.py).
+
+Calls are measured on several layers, e.g. 'oc:get Pod' (including parsing
+of the output) wraps 'exec:oc get' (the subprocess). Only the leaf layers
+(LEAF_LAYERS) are summed into the time spent in external calls, so nested
+calls are not counted twice. Time of the leaf calls is also attributed to the
+nearest test or fixture function from the tests directory, so the fixtures
+and helpers dominating the runtime can be found.
+
+At the end of the session the ranked report is saved as JSON into the log
+directory and added into the summary of the HTML report.
+"""
+
+import json
+import logging
+import os
+import shlex
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+CALL_STATS_FILE = "call_stats.json"
+LEAF_LAYERS = ("exec", "sleep", "prometheus")
+# options followed by a value which is not part of the command family
+OPTIONS_WITH_VALUE = (
+    "--kubeconfig",
+    "-n",
+    "--namespace",
+    "-c",
+    "--container",
+    "--context",
+    "--cluster",
+)
+# oc verbs followed by a name of the pod or node instead of a kind
+VERBS_WITHOUT_KIND = ("exec", "rsh", "debug", "logs", "rsync", "cp", "adm")
+TESTS_DIR = f"{os.sep}tests{os.sep}"
+SESSION = "<session>"
+
+
+def get_command_family(command, words=2):
+    """
+    Get family of the command: the first words of the command without
+    options (and their values)
+
+    Args:
+        command (str or list): Command
+        words (int): Max number of words of the family
+
+    Returns:
+        str: Command family, e.g. 'oc get' or 'get Pod'
+
+    """
+    if isinstance(command, str):
+        try:
+            command = shlex.split(command)
+        except ValueError:
+            command = command.split()
+    family = []
+    skip_value = False
+    for token in command:
+        if skip_value:
+            skip_value = False
+            continue
+        if token.startswith("-"):
+            skip_value = token in OPTIONS_WITH_VALUE
+            continue
+        family.append(os.path.basename(token) if not family else token)
+        if len(family) >= words or token in VERBS_WITHOUT_KIND:
+            break
+    return " ".join(family)
+
+
+def get_caller():
+    """
+    Returns:
+        str: 'file:function' of the nearest test or fixture function from
+            the tests directory on the stack, None if there is no such frame
+
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if TESTS_DIR in filename and "ocs_ci" + os.sep not in filename:
+            return f"{os.path.basename(filename)}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class CallRecord(object):
+    """
+    Measurement of one call, the caller can fill the output size and the time
+    spent by parsing of the output
+    """
+
+    __slots__ = ("family", "output_bytes", "parse_time")
+
+    def __init__(self, family):
+        self.family = family
+        self.output_bytes = 0
+        self.parse_time = 0.0
+
+    @contextmanager
+    def parsing(self):
+        """
+        Measure parsing of the output
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_time += time.perf_counter() - start
+
+
+class CallStats(object):
+    """
+    Thread-safe accounting of external calls per test, phase and family
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled (bool): If False, nothing is recorded
+
+        """
+        self.enabled = enabled
+        self.nodeid = None
+        self.phase = None
+        # (nodeid, phase, family) -> [count, total, max, bytes, parse time]
+        self._stats = {}
+        # (nodeid, caller) -> [count, total]
+        self._callers = {}
+        # (nodeid, phase) -> CPU time of the process
+        self._cpu = {}
+        self._cpu_start = None
+        self._lock = threading.Lock()
+
+    def set_context(self, nodeid=None, phase=None):
+        """
+        Set the test and phase the following calls are attributed to, CPU
+        time of the process spent in the previous phase is accounted to it
+
+        Args:
+            nodeid (str): Node id of the test, None outside of tests
+            phase (str): setup, call or teardown
+
+        """
+        now = time.process_time()
+        if self.enabled and self.nodeid is not None and self._cpu_start is not None:
+            with self._lock:
+                key = (self.nodeid, self.phase)
+                self._cpu[key] = self._cpu.get(key, 0.0) + now - self._cpu_start
+        self._cpu_start = now
+        self.nodeid = nodeid
+        self.phase = phase
+
+    @contextmanager
+    def measure(self, layer, command=None, words=2, family=None):
+        """
+        Measure the call done in the context
+
+        Args:
+            layer (str): Layer of the call (exec, oc, ceph, oc_debug, sleep,
+                prometheus)
+            command (str or list): Command, used to get the family
+            words (int): Max number of words of the command family
+            family (str): Family used instead of the one from command
+
+        Yields:
+            CallRecord: Record to fill output size and parse time into
+
+        """
+        if not self.enabled:
+            yield CallRecord(None)
+            return
+        if family is None:
+            family = get_command_family(command, words) if command else ""
+        record = CallRecord(f"{layer}:{family}")
+        caller = get_caller() if layer in LEAF_LAYERS else None
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self.record(
+                record.family,
+                time.perf_counter() - start,
+                record.output_bytes,
+                record.parse_time,
+                caller,
+            )
+
+    def record(self, family, duration, output_bytes=0, parse_time=0.0, caller=None):
+        """
+        Record one call
+
+        Args:
+            family (str): 'layer:family' of the call
+            duration (float): Duration in seconds
+            output_bytes (int): Size of the output
+            parse_time (float): Seconds spent by parsing of the output
+            caller (str): Test or fixture function doing the call
+
+        """
+        nodeid = self.nodeid or SESSION
+        with self._lock:
+            stats = self._stats.setdefault(
+                (nodeid, self.phase, family), [0, 0.0, 0.0, 0, 0.0]
+            )
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+            stats[3] += output_bytes
+            stats[4] += parse_time
+            if caller:
+                caller_stats = self._callers.setdefault((nodeid, caller), [0, 0.0])
+                caller_stats[0] += 1
+                caller_stats[1] += duration
+
+    @staticmethod
+    def _family_stats(family, stats):
+        count, total, max_time, output_bytes, parse_time = stats
+        return {
+            "family": family,
+            "count": count,
+            "total": round(total, 3),
+            "max": round(max_time, 3),
+            "bytes": output_bytes,
+            "parse_time": round(parse_time, 3),
+        }
+
+    @staticmethod
+    def _merge(target, stats):
+        target[0] += stats[0]
+        target[1] += stats[1]
+        target[2] = max(target[2], stats[2])
+        target[3] += stats[3]
+        target[4] += stats[4]
+
+    def get_report(self, top=None):
+        """
+        Get the ranked report
+
+        Args:
+            top (int): Max number of tests, families and callers per test in
+                the report, all if None
+
+        Returns:
+            dict: 'tests' (per test: leaf time per phase, CPU time of the
+                framework process per phase, families and top callers),
+                'suites' (per test module) and 'families' (whole session),
+                all sorted by the time spent in external calls
+
+        """
+        with self._lock:
+            stats = {key: list(value) for key, value in self._stats.items()}
+            callers = dict(self._callers)
+            cpu = dict(self._cpu)
+        tests = {}
+
+        def get_test(nodeid):
+            return tests.setdefault(
+                nodeid, {"nodeid": nodeid, "phases": {}, "cpu": {}, "families": {}}
+            )
+
+        for (nodeid, phase), value in cpu.items():
+            get_test(nodeid)["cpu"][phase] = round(value, 3)
+        for (nodeid, phase, family), values in stats.items():
+            test = get_test(nodeid)
+            self._merge(
+                test["families"].setdefault(family, [0, 0.0, 0.0, 0, 0.0]), values
+            )
+            if family.split(":", 1)[0] in LEAF_LAYERS:
+                test["phases"][phase or SESSION] = (
+                    test["phases"].get(phase or SESSION, 0.0) + values[1]
+                )
+        suites = {}
+        families = {}
+        for nodeid, test in tests.items():
+            suite = suites.setdefault(
+                nodeid.split("::")[0], {"suite": nodeid.split("::")[0], "tests": 0}
+            )
+            suite["tests"] += 1
+            for family, values in test["families"].items():
+                self._merge(
+                    suite.setdefault("families", {}).setdefault(
+                        family, [0, 0.0, 0.0, 0, 0.0]
+                    ),
+                    values,
+                )
+                self._merge(families.setdefault(family, [0, 0.0, 0.0, 0, 0.0]), values)
+            test["total"] = round(sum(test["phases"].values()), 3)
+            test["cpu_total"] = round(sum(test["cpu"].values()), 3)
+            test["phases"] = {
+                phase: round(value, 3) for phase, value in test["phases"].items()
+            }
+            suite["total"] = round(suite.get("total", 0.0) + test["total"], 3)
+            suite["cpu_total"] = round(
+                suite.get("cpu_total", 0.0) + test["cpu_total"], 3
+            )
+            test["callers"] = sorted(
+                (
+                    {"caller": caller, "count": count, "total": round(total, 3)}
+                    for (caller_nodeid, caller), (count, total) in callers.items()
+                    if caller_nodeid == nodeid
+                ),
+                key=lambda item: item["total"],
+                reverse=True,
+            )[:top]
+
+        def ranked(items):
+            return sorted(items, key=lambda item: item["total"], reverse=True)[:top]
+
+        def ranked_families(family_stats):
+            return ranked(
+                self._family_stats(family, values)
+                for family, values in family_stats.items()
+            )
+
+        for item in list(tests.values()) + list(suites.values()):
+            item["families"] = ranked_families(item.get("families", {}))
+        return {
+            "tests": ranked(tests.values()),
+            "suites": ranked(suites.values()),
+            "families": ranked_families(families),
+        }
+
+    def save(self, path):
+        """
+        Save the full report as JSON
+
+        Args:
+            path (str): Path of the JSON file
+
+        """
+        with open(path, "w") as fd:
+            json.dump(self.get_report(), fd, indent=2)
+        log.info(f"Report of external calls saved to {path}")
+
+
+_call_stats = CallStats(enabled=False)
+
+
+def get_call_stats():
+    """
+    Returns:
+        CallStats: Accounting of the current session
+
+    """
+    return _call_stats
+
+
+def reset_call_stats(enabled=True):
+    """
+    Start new accounting for the session
+
+    Args:
+        enabled (bool): If False, nothing is recorded
+
+    Returns:
+        CallStats: The new accounting
+
+    """
+    global _call_stats
+    _call_stats = CallStats(enabled=enabled)
+    return _call_stats
+
+
+def measure(layer, command=None, words=2, family=None):
+    """
+    Measure the call with accounting of the current session, see
+    CallStats.measure
+    """
+    return _call_stats.measure(layer, command, words=words, family=family)
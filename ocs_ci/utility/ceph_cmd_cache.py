@@ -0,0 +1,387 @@
+"""
+Short lived cache of results of read-only Ceph commands.
+
+Several helpers issue the same read-only Ceph queries (ceph status, ceph osd
+tree, ceph df, ...) within a few seconds and each of them resolves the
+toolbox pod again. Results of allowlisted commands are cached with per
+command TTL and the whole cache is dropped whenever a command which may
+change the cluster state is executed through exec_cmd (e.g. 'oc delete',
+'ceph osd set noout').
+
+Every 'oc rsh' or 'oc exec' which doesn't run a Ceph command is considered
+mutating, as it may write data. Changes done without exec_cmd are not
+tracked: writes by boto3 or the kubernetes client, stop and start of the
+nodes by the cloud APIs, etc.
+
+The cache is disabled by default, it's enabled by RUN['ceph_cmd_cache']. Use
+ceph_cmd_cache_bypass() context manager or use_cache=False argument of
+Pod.exec_ceph_cmd when fresh data are needed.
+"""
+
+import copy
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from ocs_ci.framework import config
+
+log = logging.getLogger(__name__)
+
+# Allowlist of cacheable Ceph commands with TTL in seconds
+CEPH_CMD_CACHE_TTL = {
+    "ceph status": 5,
+    "ceph -s": 5,
+    "ceph health": 5,
+    "ceph health detail": 5,
+    "ceph osd tree": 10,
+    "ceph df": 10,
+    "ceph df detail": 10,
+    "ceph osd df": 10,
+    "ceph osd df tree": 10,
+    "ceph osd dump": 10,
+    "ceph pg dump pgs_brief": 5,
+    "ceph mon dump": 10,
+    "ceph mgr dump": 10,
+    "ceph balancer status": 10,
+    "ceph versions": 30,
+}
+TOOLS_POD_CACHE_TTL = 30
+
+# oc subcommands which never change the cluster state
+OC_READ_ONLY_VERBS = {
+    "api-resources",
+    "api-versions",
+    "cluster-info",
+    "cp",
+    "describe",
+    "explain",
+    "extract",
+    "get",
+    "logs",
+    "plugin",
+    "version",
+    "wait",
+    "whoami",
+}
+OC_READ_ONLY_ADM_VERBS = {"inspect", "must-gather", "top"}
+OC_FLAGS_WITH_VALUE = {"--kubeconfig", "-n", "--namespace", "--context", "--as"}
+
+# Words which make a Ceph command mutating
+CEPH_MUTATING_WORDS = {
+    "add",
+    "apply",
+    "archive",
+    "archive-all",
+    "create",
+    "deep-scrub",
+    "delete",
+    "destroy",
+    "disable",
+    "down",
+    "enable",
+    "fail",
+    "in",
+    "kill",
+    "mksnap",
+    "out",
+    "pause",
+    "purge",
+    "redeploy",
+    "remove",
+    "rename",
+    "repair",
+    "reset",
+    "resize",
+    "restart",
+    "reweight",
+    "rm",
+    "rmsnap",
+    "scrub",
+    "set",
+    "start",
+    "stop",
+    "tell",
+    "unpause",
+    "unset",
+}
+CEPH_BINARIES = {"ceph", "rados", "rbd", "radosgw-admin"}
+
+_thread_local = threading.local()
+
+
+def normalize_ceph_cmd(ceph_cmd):
+    """
+    Normalize Ceph command, output format options and extra whitespaces are
+    removed
+
+    Args:
+        ceph_cmd (str or list): Ceph command
+
+    Returns:
+        str: Normalized command
+
+    """
+    tokens = ceph_cmd.split() if isinstance(ceph_cmd, str) else list(ceph_cmd)
+    normalized = []
+    skip_next = False
+    for token in tokens:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in ("--format", "-f"):
+            skip_next = True
+            continue
+        if token.startswith("--format="):
+            continue
+        normalized.append(token)
+    return " ".join(normalized)
+
+
+def get_ceph_cmd_ttl(ceph_cmd):
+    """
+    Args:
+        ceph_cmd (str): Ceph command
+
+    Returns:
+        int: TTL of the command result, None if the command is not cacheable
+
+    """
+    return CEPH_CMD_CACHE_TTL.get(normalize_ceph_cmd(ceph_cmd))
+
+
+def is_mutating_ceph_cmd(tokens):
+    """
+    Check whether the Ceph command may change state of the cluster
+
+    Args:
+        tokens (list): Tokens of the command (starting with ceph binary)
+
+    Returns:
+        bool: True if the command is not known to be read-only
+
+    """
+    if normalize_ceph_cmd(tokens) in CEPH_CMD_CACHE_TTL:
+        return False
+    for token in tokens[1:]:
+        word = token.lower()
+        if word in CEPH_MUTATING_WORDS or re.match(r"^(set|rm)-", word):
+            return True
+    return False
+
+
+def is_mutating_cmd(cmd):
+    """
+    Check whether the command executed through exec_cmd may change state
+    of the cluster (only oc and Ceph commands are considered, commands
+    executed in the pods are mutating unless they are read-only Ceph
+    commands)
+
+    Args:
+        cmd (str or list): Command
+
+    Returns:
+        bool: True if the command may change state of the cluster
+
+    """
+    tokens = cmd.split() if isinstance(cmd, str) else [str(token) for token in cmd]
+    if not tokens:
+        return False
+    binary = tokens[0].rsplit("/", 1)[-1]
+    if binary in CEPH_BINARIES:
+        return is_mutating_ceph_cmd(tokens)
+    if binary not in ("oc", "kubectl"):
+        return False
+    args = []
+    skip_next = False
+    for token in tokens[1:]:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in OC_FLAGS_WITH_VALUE:
+            skip_next = True
+            continue
+        if not args and token.startswith("-"):
+            continue
+        args.append(token)
+    if not args:
+        return False
+    verb = args[0]
+    if verb in ("rsh", "exec"):
+        # the command may be passed to the pod as a single (quoted) argument
+        words = re.sub(r"[\'\";]", " ", " ".join(args)).split()
+        for index, token in enumerate(words):
+            if token.rsplit("/", 1)[-1] in CEPH_BINARIES:
+                return is_mutating_ceph_cmd(words[index:])
+        # IO tools (fio, dd, ...) running in the pods change the usage
+        return True
+    if verb == "adm":
+        return len(args) < 2 or args[1] not in OC_READ_ONLY_ADM_VERBS
+    return verb not in OC_READ_ONLY_VERBS
+
+
+class CephCommandCache(object):
+    """
+    Thread-safe cache of command results with per entry expiration
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """
+        Get cached value
+
+        Args:
+            key (tuple): Cache key
+
+        Returns:
+            tuple: (True, value) on cache hit, (False, None) otherwise
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return True, entry[1]
+            self._entries.pop(key, None)
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, ttl, generation=None):
+        """
+        Cache the value
+
+        Args:
+            key (tuple): Cache key
+            value (object): Value to cache
+            ttl (float): Time to live in seconds
+            generation (int): Generation of the cache when the value was
+                computed, the value is not stored if the cache was invalidated
+                in the meantime
+
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, reason=None):
+        """
+        Drop all cached entries
+
+        Args:
+            reason (str): Reason logged in debug log
+
+        """
+        with self._lock:
+            self.generation += 1
+            if self._entries:
+                log.debug(f"Invalidating Ceph command cache: {reason}")
+                self.invalidations += 1
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Number of hits, misses, invalidations and cached entries
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
+
+
+_cache = CephCommandCache()
+
+
+def get_ceph_cmd_cache():
+    """
+    Returns:
+        CephCommandCache: Global cache instance
+
+    """
+    return _cache
+
+
+def is_ceph_cmd_cache_enabled():
+    """
+    Returns:
+        bool: True if the cache is enabled in config and not bypassed in the
+            current thread
+
+    """
+    if getattr(_thread_local, "bypass", 0):
+        return False
+    return bool(config.RUN.get("ceph_cmd_cache", False))
+
+
+@contextmanager
+def ceph_cmd_cache_bypass():
+    """
+    Context manager for code which needs fresh results of Ceph commands,
+    cached results are neither used nor stored in the current thread
+    """
+    _thread_local.bypass = getattr(_thread_local, "bypass", 0) + 1
+    try:
+        yield
+    finally:
+        _thread_local.bypass -= 1
+
+
+def notify_command(cmd):
+    """
+    Invalidate the cache if the command may change state of the cluster,
+    called for every command executed through exec_cmd
+
+    Args:
+        cmd (str or list): Executed command
+
+    """
+    try:
+        mutating = is_mutating_cmd(cmd)
+    except Exception:
+        mutating = True
+    if mutating:
+        _cache.invalidate(reason=cmd if isinstance(cmd, str) else " ".join(cmd))
+
+
+def cached_call(key, ttl, func, *args, copy_result=True, **kwargs):
+    """
+    Return cached result of the function or call it and cache the result.
+
+    Args:
+        key (tuple): Cache key
+        ttl (float): Time to live of the result, None disables caching
+        func (callable): Function producing the result
+        copy_result (bool): Deep copy cached results, so callers can't modify
+            them
+        *args: Arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        object: Result of the function
+
+    """
+    if ttl is None or not is_ceph_cmd_cache_enabled():
+        return func(*args, **kwargs)
+    found, value = _cache.get(key)
+    if found:
+        log.debug(f"Using cached result for {key}")
+        return copy.deepcopy(value) if copy_result else value
+    generation = _cache.generation
+    value = func(*args, **kwargs)
+    _cache.put(
+        key, copy.deepcopy(value) if copy_result else value, ttl, generation=generation
+    )
+    return value
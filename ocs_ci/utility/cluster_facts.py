@@ -0,0 +1,317 @@
+"""
+Cache of facts about the tested clusters.
+
+Versions (OCP, ODF build, Ceph, Rook, CSI images) and capabilities (platform,
+deployment type, arbiter/stretch, encryption, KMS, LSO, number of OSDs) are
+looked up by skip markers, reporting, fixtures and helpers many times during
+the session, while they change only by deployment, upgrade or scaling of the
+cluster. Functions decorated by cluster_fact resolve the fact once per
+cluster context and serve it from memory afterwards.
+
+The facts are invalidated:
+
+ * explicitly by invalidate_cluster_facts, called after deployment and
+   upgrade steps
+ * by notify_command for every mutating command executed through exec_cmd
+   which targets resources the facts are derived from (e.g. 'oc adm upgrade',
+   'oc patch storagecluster', 'oc patch subscription')
+
+The cache is enabled by RUN['cluster_facts_cache'], use
+cluster_facts_bypass() context manager when fresh data are needed.
+"""
+
+import copy
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+
+from ocs_ci.framework import config
+from ocs_ci.utility.ceph_cmd_cache import is_mutating_cmd
+
+log = logging.getLogger(__name__)
+
+# Mutating commands mentioning these words invalidate the facts
+INVALIDATING_WORDS = {
+    "catalogsource",
+    "clusterserviceversion",
+    "clusterversion",
+    "csv",
+    "installplan",
+    "storagecluster",
+    "storageclusters",
+    "subscription",
+    "subscriptions",
+    "upgrade",
+}
+
+_thread_local = threading.local()
+
+
+class ClusterFacts(object):
+    """
+    Thread-safe cache of the facts of one cluster
+    """
+
+    def __init__(self):
+        self._facts = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """
+        Args:
+            key (tuple): Name of the fact and arguments of its function
+
+        Returns:
+            tuple: (True, value) if the fact is known, (False, None) otherwise
+
+        """
+        with self._lock:
+            if key in self._facts:
+                self.hits += 1
+                return True, self._facts[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, generation):
+        """
+        Store the fact, unless the facts were invalidated since the
+        generation
+
+        Args:
+            key (tuple): Name of the fact and arguments of its function
+            value (object): Value of the fact
+            generation (int): Generation when the value was looked up
+
+        """
+        with self._lock:
+            if generation == self.generation:
+                self._facts[key] = value
+
+    def invalidate(self, reason=None):
+        """
+        Forget all the facts
+
+        Args:
+            reason (str): Reason logged in debug log
+
+        """
+        with self._lock:
+            self.generation += 1
+            if self._facts:
+                log.debug(f"Invalidating cluster facts: {reason}")
+                self.invalidations += 1
+            self._facts.clear()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Number of hits, misses, invalidations and known facts
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "facts": len(self._facts),
+            }
+
+
+_facts = {}
+_facts_lock = threading.Lock()
+
+
+def get_cluster_facts_cache(cluster_index=None):
+    """
+    Args:
+        cluster_index (int): Index of the cluster context, the current one if
+            None
+
+    Returns:
+        ClusterFacts: Facts of the cluster
+
+    """
+    if cluster_index is None:
+        cluster_index = config.cur_index
+    with _facts_lock:
+        if cluster_index not in _facts:
+            _facts[cluster_index] = ClusterFacts()
+        return _facts[cluster_index]
+
+
+def is_cluster_facts_cache_enabled():
+    """
+    Returns:
+        bool: True if the cache is enabled in config and not bypassed in the
+            current thread
+
+    """
+    if getattr(_thread_local, "bypass", 0):
+        return False
+    return bool(config.RUN.get("cluster_facts_cache", True))
+
+
+@contextmanager
+def cluster_facts_bypass():
+    """
+    Context manager for code which needs fresh facts, cached facts are
+    neither used nor stored in the current thread
+    """
+    _thread_local.bypass = getattr(_thread_local, "bypass", 0) + 1
+    try:
+        yield
+    finally:
+        _thread_local.bypass -= 1
+
+
+def invalidate_cluster_facts(reason=None, cluster_index=None):
+    """
+    Forget the facts, e.g. after deployment or upgrade of the cluster
+
+    Args:
+        reason (str): Reason logged in debug log
+        cluster_index (int): Index of the cluster context, all the clusters
+            if None
+
+    """
+    with _facts_lock:
+        caches = (
+            list(_facts.values())
+            if cluster_index is None
+            else [_facts.get(cluster_index)]
+        )
+    for cache in caches:
+        if cache is not None:
+            cache.invalidate(reason)
+
+
+def notify_command(cmd):
+    """
+    Invalidate the facts if the command may change versions or capabilities
+    of the cluster, called for every command executed through exec_cmd
+
+    Args:
+        cmd (str or list): Executed command
+
+    """
+    tokens = cmd.split() if isinstance(cmd, str) else [str(token) for token in cmd]
+    words = {token.lower().split("/")[0].split(".")[0] for token in tokens}
+    if not words & INVALIDATING_WORDS:
+        return
+    try:
+        mutating = is_mutating_cmd(tokens)
+    except Exception:
+        mutating = True
+    if mutating:
+        invalidate_cluster_facts(reason=" ".join(tokens))
+
+
+def cluster_fact(name):
+    """
+    Decorator caching result of the function as a fact of the current cluster,
+    the fact is cached separately for every combination of arguments. Empty
+    results (None, '', {}, ...) are not cached, exceptions are propagated.
+
+    Args:
+        name (str): Name of the fact
+
+    Returns:
+        callable: Decorator
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_cluster_facts_cache_enabled():
+                return func(*args, **kwargs)
+            cache = get_cluster_facts_cache()
+            key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                found, value = cache.get(key)
+            except TypeError:
+                # not hashable arguments
+                return func(*args, **kwargs)
+            if found:
+                log.debug(f"Using cached cluster fact {name}")
+                return copy.deepcopy(value)
+            generation = cache.generation
+            value = func(*args, **kwargs)
+            if value or value in (0, False):
+                cache.put(key, copy.deepcopy(value), generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@cluster_fact("storage_cluster")
+def get_storage_cluster_facts():
+    """
+    Capabilities of the cluster given by the StorageCluster, looked up by one
+    read of the resource
+
+    Returns:
+        dict: external_mode, arbiter (stretch cluster), flexible_scaling,
+            cluster_wide_encryption, storageclass_encryption, kms and
+            osd_count
+
+    Raises:
+        CommandFailed: If the StorageCluster doesn't exist
+
+    """
+    # importing here to avoid circular imports
+    from ocs_ci.ocs.resources.storage_cluster import get_storage_cluster
+
+    storage_cluster = get_storage_cluster().get()["items"][0]
+    spec = storage_cluster.get("spec", {})
+    external_mode = bool(spec.get("externalStorage", {}).get("enable"))
+    encryption = spec.get("encryption", {})
+    return {
+        "external_mode": external_mode,
+        "arbiter": bool(spec.get("arbiter", {}).get("enable")),
+        "flexible_scaling": bool(spec.get("flexibleScaling"))
+        and storage_cluster.get("status", {}).get("failureDomain") == "host",
+        "cluster_wide_encryption": bool(
+            encryption.get("clusterWide") or encryption.get("enable")
+        ),
+        "storageclass_encryption": bool(encryption.get("storageClass")),
+        "kms": bool(encryption.get("kms", {}).get("enable")),
+        "osd_count": (
+            0
+            if external_mode
+            else sum(
+                int(device_set["count"]) * int(device_set["replica"])
+                for device_set in spec.get("storageDeviceSets", [])
+            )
+        ),
+    }
+
+
+def get_cluster_facts():
+    """
+    Versions and capabilities of the current cluster
+
+    Returns:
+        dict: platform, deployment_type, lso, ocp_version, ocs_build, and the
+            StorageCluster facts (see get_storage_cluster_facts)
+
+    """
+    # importing here to avoid circular imports
+    from ocs_ci.utility.utils import get_ocs_build_number, get_running_ocp_version
+
+    facts = {
+        "platform": config.ENV_DATA.get("platform"),
+        "deployment_type": config.ENV_DATA.get("deployment_type"),
+        "lso": bool(config.DEPLOYMENT.get("local_storage", False)),
+        "ocp_version": get_running_ocp_version(),
+        "ocs_build": get_ocs_build_number(),
+    }
+    facts.update(get_storage_cluster_facts())
+    return facts
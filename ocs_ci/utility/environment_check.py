@@ -1,10 +1,22 @@
 """
 Util for environment check before and after test to compare and find stale
 leftovers
+
+Resources of the well known kinds (RESOURCE_APIS) are kept in per-kind
+indexes keyed by UID, which hold only the metadata needed by the check. The
+index is built by a paginated list of the kind and carried forward between
+the checks: large indexes are updated by the changes since the last seen
+resourceVersion (a short watch), only if the resourceVersion expired the kind
+is listed again. Other kinds are listed fully every time.
 """
 
 import copy
+import json
 import logging
+import shlex
+import threading
+from urllib.parse import quote
+
 import yaml
 from gevent.threadpool import ThreadPoolExecutor
 from ocs_ci.framework import config
@@ -12,6 +24,199 @@ from ocs_ci.ocs import ocp, defaults, constants, exceptions
 
 log = logging.getLogger(__name__)
 
+# lower case kind -> (API path of the list of all the resources, kind)
+RESOURCE_APIS = {
+    "pod": ("/api/v1/pods", constants.POD),
+    "storageclass": ("/apis/storage.k8s.io/v1/storageclasses", constants.STORAGECLASS),
+    "persistentvolume": ("/api/v1/persistentvolumes", constants.PV),
+    "persistentvolumeclaim": ("/api/v1/persistentvolumeclaims", constants.PVC),
+    "namespace": ("/api/v1/namespaces", constants.NAMESPACE),
+    "volumesnapshot": (
+        "/apis/snapshot.storage.k8s.io/v1/volumesnapshots",
+        "VolumeSnapshot",
+    ),
+    "cephfilesystem": ("/apis/ceph.rook.io/v1/cephfilesystems", "CephFilesystem"),
+    "cephblockpool": ("/apis/ceph.rook.io/v1/cephblockpools", constants.CEPHBLOCKPOOL),
+}
+# metadata kept in the index, used by the filters and the leftovers report
+INDEXED_METADATA = (
+    "name",
+    "generateName",
+    "namespace",
+    "uid",
+    "labels",
+    "ownerReferences",
+    "creationTimestamp",
+    "deletionTimestamp",
+)
+LIST_PAGE_SIZE = 500
+# smaller indexes are listed again, which is faster than waiting for the watch
+INCREMENTAL_MIN_ITEMS = 500
+WATCH_TIMEOUT = 1
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_item_key(item):
+    """
+    Args:
+        item (dict): Resource
+
+    Returns:
+        str: Identity of the resource in the leftover check: generateName if
+            set (e.g. pods recreated by their controller), name otherwise
+
+    """
+    metadata = item.get("metadata")
+    return metadata.get("generateName", metadata.get("name"))
+
+
+def get_indexed_item(kind, item):
+    """
+    Args:
+        kind (str): Kind of the resource
+        item (dict): Resource from the API
+
+    Returns:
+        dict: Resource with the metadata used by the leftover check only
+
+    """
+    metadata = item.get("metadata", {})
+    indexed = {
+        "kind": kind,
+        "metadata": {key: metadata[key] for key in INDEXED_METADATA if key in metadata},
+    }
+    if kind == constants.PV:
+        claim_ref = item.get("spec", {}).get("claimRef")
+        indexed["spec"] = {"claimRef": claim_ref} if claim_ref else {}
+    return indexed
+
+
+class ResourceIndex(object):
+    """
+    Metadata of all the resources of one kind keyed by UID
+    """
+
+    def __init__(self, kind, api_path, incremental_min_items=INCREMENTAL_MIN_ITEMS):
+        """
+        Args:
+            kind (str): Kind of the resources
+            api_path (str): API path of the list of all the resources
+            incremental_min_items (int): Min number of resources for which the
+                index is updated by the changes instead of a new list
+
+        """
+        self.kind = kind
+        self.api_path = api_path
+        self.incremental_min_items = incremental_min_items
+        self.items = {}
+        self.resource_version = None
+        self.relists = 0
+        self.incremental_updates = 0
+        self._lock = threading.Lock()
+
+    def _get_raw(self, path):
+        return ocp.OCP().exec_oc_cmd(
+            f"get --raw {shlex.quote(path)}", out_yaml_format=False
+        )
+
+    def relist(self):
+        """
+        Build the index by a paginated list of the resources
+        """
+        items = {}
+        continue_token = None
+        while True:
+            query = f"limit={LIST_PAGE_SIZE}"
+            if continue_token:
+                query += f"&continue={quote(continue_token)}"
+            data = json.loads(self._get_raw(f"{self.api_path}?{query}"))
+            for item in data.get("items") or []:
+                items[item["metadata"]["uid"]] = get_indexed_item(self.kind, item)
+            continue_token = data["metadata"].get("continue")
+            if not continue_token:
+                break
+        self.items = items
+        self.resource_version = data["metadata"]["resourceVersion"]
+        self.relists += 1
+
+    def apply_changes(self):
+        """
+        Update the index by the changes since the last seen resourceVersion
+
+        Returns:
+            bool: False if the resourceVersion expired and the index has to
+                be listed again
+
+        """
+        output = self._get_raw(
+            f"{self.api_path}?watch=1&resourceVersion={self.resource_version}"
+            f"&timeoutSeconds={WATCH_TIMEOUT}&allowWatchBookmarks=true"
+        )
+        changes = 0
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            item = event.get("object") or {}
+            if event.get("type") == "ERROR":
+                log.debug(f"Watch of {self.kind} failed: {item.get('message')}")
+                return False
+            metadata = item.get("metadata", {})
+            if event.get("type") in ("ADDED", "MODIFIED"):
+                self.items[metadata["uid"]] = get_indexed_item(self.kind, item)
+                changes += 1
+            elif event.get("type") == "DELETED":
+                self.items.pop(metadata.get("uid"), None)
+                changes += 1
+            self.resource_version = metadata.get(
+                "resourceVersion", self.resource_version
+            )
+        self.incremental_updates += 1
+        log.debug(f"{changes} changes of {self.kind} applied to the index")
+        return True
+
+    def get_items(self):
+        """
+        Returns:
+            list: Current resources of the kind with their indexed metadata
+
+        """
+        with self._lock:
+            updated = False
+            if (
+                self.resource_version is not None
+                and len(self.items) >= self.incremental_min_items
+            ):
+                try:
+                    updated = self.apply_changes()
+                except (exceptions.CommandFailed, ValueError) as ex:
+                    log.debug(f"Incremental update of {self.kind} failed: {ex}")
+            if not updated:
+                self.relist()
+            return list(self.items.values())
+
+
+def get_resource_index(kind):
+    """
+    Args:
+        kind (str): Kind of the resources
+
+    Returns:
+        ResourceIndex: Index of the kind on the current cluster, None if the
+            kind is not indexed
+
+    """
+    api = RESOURCE_APIS.get(kind.lower())
+    if api is None or not config.RUN.get("leftover_check_indexed", True):
+        return None
+    key = (config.cur_index, kind.lower())
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = ResourceIndex(api[1], api[0])
+        return _indexes[key]
+
 
 def compare_dicts(before, after):
     """
@@ -29,32 +234,12 @@ def compare_dicts(before, after):
         log.debug("compare_dicts: both before and after are None")
         return None
 
-    added = []
-    removed = []
-    uid_before = [
-        uid.get("metadata").get("generateName", uid.get("metadata").get("name"))
-        for uid in before
-    ]
-    uid_after = [
-        uid.get("metadata").get("generateName", uid.get("metadata").get("name"))
-        for uid in after
-    ]
-    diff_added = [val for val in uid_after if val not in uid_before]
-    diff_removed = [val for val in uid_before if val not in uid_after]
-    if diff_added:
-        added = [
-            val
-            for val in after
-            if val.get("metadata").get("generateName", val.get("metadata").get("name"))
-            in [v for v in diff_added]
-        ]
-    if diff_removed:
-        removed = [
-            val
-            for val in before
-            if val.get("metadata").get("generateName", val.get("metadata").get("name"))
-            in [v for v in diff_removed]
-        ]
+    before = before or []
+    after = after or []
+    keys_before = {get_item_key(item) for item in before}
+    keys_after = {get_item_key(item) for item in after}
+    added = [item for item in after if get_item_key(item) not in keys_before]
+    removed = [item for item in before if get_item_key(item) not in keys_after]
     return [added, removed]
 
 
@@ -72,7 +257,11 @@ def assign_get_values(
         exclude_labels (list): App labels to ignore leftovers
         exclude_job_owned_pods (bool): If True, exclude pods owned by Jobs
     """
-    items = kind.get(all_namespaces=True)["items"]
+    index = get_resource_index(kind.kind)
+    if index is not None:
+        items = index.get_items()
+    else:
+        items = kind.get(all_namespaces=True)["items"]
     items_filtered = []
     for item in items:
         ns = item.get("metadata", {}).get("namespace")
@@ -0,0 +1,221 @@
+"""
+Benchmark of the framework overhead on recorded flows.
+
+Representative flows (deployment verification, PVC scale checks, upgrade
+checks) are recorded once against a live cluster with all their commands
+(see ocs_ci/utility/exec_transport.py). The benchmark replays the recorded
+responses without any cluster and reports CPU time spent by the framework
+itself (YAML parsing, log filtering, table parsing, retry logic, ...) per
+flow.
+
+Examples::
+
+    exec-benchmark record deployment_verification verify.jsonl.gz \\
+        --cluster-path ~/clusters/my-cluster --ocsci-conf conf/my.yaml
+    exec-benchmark run verify.jsonl.gz pvc_scale.jsonl.gz --repeat 5
+
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import statistics
+import time
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.exec_transport import (
+    ExecReplayer,
+    apply_config_snapshot,
+    get_config_snapshot,
+    recording,
+    set_transport,
+)
+from ocs_ci.utility.framework.initialization import load_config
+
+log = logging.getLogger(__name__)
+
+
+def pvc_scale_flow():
+    """
+    Checks done by PVC scale tests: all PVCs of the cluster are listed and
+    status of every bound PVC is read from the 'oc get' table output
+    """
+    pvcs = OCP(kind=constants.PVC).get(all_namespaces=True)["items"]
+    for pvc in pvcs:
+        if pvc.get("status", {}).get("phase") != constants.STATUS_BOUND:
+            continue
+        metadata = pvc["metadata"]
+        OCP(kind=constants.PVC, namespace=metadata["namespace"]).get_resource(
+            metadata["name"], "STATUS"
+        )
+
+
+FLOWS = {
+    "deployment_verification": (
+        "ocs_ci.ocs.resources.storage_cluster:verify_storage_cluster"
+    ),
+    "pvc_scale": "ocs_ci.utility.exec_benchmark:pvc_scale_flow",
+    "upgrade_checks": (
+        "ocs_ci.ocs.resources.storage_cluster:verify_storage_cluster_images"
+    ),
+}
+
+
+def get_flow(flow):
+    """
+    Args:
+        flow (str): Name of the flow from FLOWS or 'module:function'
+
+    Returns:
+        callable: Function running the flow
+
+    """
+    module_name, _, func_name = FLOWS.get(flow, flow).partition(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def record_flow(flow, archive):
+    """
+    Run the flow against the cluster and record all its commands
+
+    Args:
+        flow (str): Name of the flow from FLOWS or 'module:function'
+        archive (str): Path of the archive
+
+    """
+    func = get_flow(flow)
+    metadata = {"flow": flow, "config": get_config_snapshot()}
+    with recording(archive, metadata) as recorder:
+        func()
+    log.info(f"Flow {flow} recorded with {recorder.count} commands into {archive}")
+
+
+def benchmark_flow(archive, flow=None, repeat=3, use_latency=False):
+    """
+    Replay the recorded flow and measure the framework CPU time
+
+    Args:
+        archive (str): Path of the archive
+        flow (str): Flow to run, the recorded one if not specified
+        repeat (int): Number of runs
+        use_latency (bool): Keep the recorded latencies of the commands
+
+    Returns:
+        dict: Results of the flow: CPU and wall time (min, mean) in seconds,
+            number of recorded commands and replay hits, family matches and
+            misses of the last run
+
+    """
+    replayer = ExecReplayer(archive, use_latency=use_latency)
+    flow = flow or replayer.metadata.get("flow")
+    apply_config_snapshot(replayer.metadata)
+    func = get_flow(flow)
+    cpu_times = []
+    wall_times = []
+    set_transport(replayer)
+    try:
+        for _ in range(repeat):
+            replayer.rewind()
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            func()
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+    finally:
+        set_transport(None)
+    return {
+        "flow": flow,
+        "archive": archive,
+        "commands": len(replayer.records),
+        "cpu_min": round(min(cpu_times), 4),
+        "cpu_mean": round(statistics.mean(cpu_times), 4),
+        "wall_min": round(min(wall_times), 4),
+        "wall_mean": round(statistics.mean(wall_times), 4),
+        "hits": replayer.hits,
+        "fuzzy_hits": replayer.fuzzy_hits,
+        "misses": replayer.misses,
+    }
+
+
+def format_results(results):
+    """
+    Args:
+        results (list): Results of benchmark_flow
+
+    Returns:
+        str: Table with the results
+
+    """
+    lines = [
+        f"{'flow':30} {'commands':>8} {'cpu min':>9} {'cpu mean':>9} "
+        f"{'wall mean':>9} {'misses':>6}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['flow']:30} {result['commands']:>8} {result['cpu_min']:>9.4f} "
+            f"{result['cpu_mean']:>9.4f} {result['wall_mean']:>9.4f} "
+            f"{result['misses']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def init_arg_parser():
+    """
+    Init argument parser.
+
+    Returns:
+        object: Parsed arguments
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Record flows and benchmark the framework overhead on them"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record = subparsers.add_parser("record", help="Record flow against the cluster")
+    record.add_argument("flow", help=f"One of {', '.join(FLOWS)} or 'module:function'")
+    record.add_argument("archive", help="Path of the archive (.jsonl.gz)")
+    record.add_argument(
+        "--cluster-path", required=True, help="Path to the cluster directory"
+    )
+    record.add_argument(
+        "--ocsci-conf", action="append", default=[], help="ocs-ci config file"
+    )
+    run = subparsers.add_parser("run", help="Benchmark the recorded flows")
+    run.add_argument("archives", nargs="+", help="Paths of the archives")
+    run.add_argument("--repeat", type=int, default=3, help="Number of runs")
+    run.add_argument(
+        "--latency",
+        action="store_true",
+        help="Keep the recorded latencies of the commands",
+    )
+    run.add_argument("--output", help="Save the results as JSON into this file")
+    return parser.parse_args()
+
+
+def main():
+    """
+    Main function
+    """
+    args = init_arg_parser()
+    logging.basicConfig(level=logging.WARNING)
+    if args.command == "record":
+        load_config(args.ocsci_conf)
+        config.ENV_DATA["cluster_path"] = os.path.expanduser(args.cluster_path)
+        record_flow(args.flow, args.archive)
+        return
+    results = [
+        benchmark_flow(archive, repeat=args.repeat, use_latency=args.latency)
+        for archive in args.archives
+    ]
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w") as fd:
+            json.dump(results, fd, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""
+Record/replay transport of the commands executed by exec_cmd.
+
+All the commands of the framework (exec_cmd, run_cmd, OCP.exec_oc_cmd,
+Pod.exec_cmd_on_pod, Pod.exec_ceph_cmd, ...) end in exec_cmd, which runs the
+process through the active transport:
+
+ * ExecRecorder runs the command and appends the command, return code,
+   stdout, stderr and latency into a gzipped JSON lines archive
+ * ExecReplayer serves the recorded responses without running anything,
+   optionally with the original latencies
+
+Secrets passed to exec_cmd are masked in the recorded commands and outputs,
+the replayed commands are masked the same way before the matching.
+
+Recorded commands are matched by the command line without the kubeconfig
+option. Responses of repeated commands are served in the recorded order (the
+last one is served again when all were consumed). Commands which don't match
+exactly (e.g. containing randomly generated resource names) get the next not
+served response of the same command family, so replay of a flow stays
+deterministic.
+
+The first line of the archive is a header with the metadata of the recording
+(flow name, relevant parts of the config).
+"""
+
+import gzip
+import json
+import logging
+import shlex
+import subprocess
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import ExecReplayMissError
+from ocs_ci.utility.call_stats import get_call_stats, get_command_family
+
+log = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+# config sections stored in the archive header (AUTH is left out on purpose)
+SNAPSHOT_SECTIONS = ("DEPLOYMENT", "ENV_DATA", "RUN", "UPGRADE", "COMPONENTS")
+# options whose values differ between the machines or clusters
+IGNORED_OPTIONS = ("--kubeconfig",)
+
+_transport = None
+
+
+def normalize_command(cmd):
+    """
+    Get the key of the command used for matching of the recorded responses
+
+    Args:
+        cmd (str or list): Command
+
+    Returns:
+        str: Command line without the ignored options
+
+    """
+    if isinstance(cmd, str):
+        try:
+            cmd = shlex.split(cmd)
+        except ValueError:
+            return cmd
+    tokens = []
+    skip_value = False
+    for token in cmd:
+        if skip_value:
+            skip_value = False
+            continue
+        if token in IGNORED_OPTIONS:
+            skip_value = True
+            continue
+        if token.split("=", 1)[0] in IGNORED_OPTIONS:
+            continue
+        tokens.append(str(token))
+    return shlex.join(tokens)
+
+
+def get_config_snapshot():
+    """
+    Returns:
+        dict: Config sections of the current cluster stored with the recording,
+            so the recorded flow can be replayed with the same config
+
+    """
+    return {section: getattr(config, section) for section in SNAPSHOT_SECTIONS}
+
+
+def apply_config_snapshot(metadata):
+    """
+    Update the config with the snapshot stored in the archive header
+
+    Args:
+        metadata (dict): Header of the archive
+
+    """
+    snapshot = metadata.get("config")
+    if snapshot:
+        config.update(
+            {
+                section: snapshot[section]
+                for section in SNAPSHOT_SECTIONS
+                if section in snapshot
+            }
+        )
+
+
+def encode_output(data):
+    """
+    Args:
+        data (bytes or str): Output of the process
+
+    Returns:
+        str: Output stored in the archive
+
+    """
+    if isinstance(data, bytes):
+        return data.decode("utf-8", "surrogateescape")
+    return data or ""
+
+
+class ExecRecorder(object):
+    """
+    Transport running the commands and recording their results
+    """
+
+    def __init__(self, path, metadata=None):
+        """
+        Args:
+            path (str): Path of the archive (gzipped JSON lines)
+            metadata (dict): Metadata stored in the header of the archive
+
+        """
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt")
+        header = {"version": ARCHIVE_VERSION, "created": time.time()}
+        header.update(metadata or {})
+        self._file.write(json.dumps(header, default=str) + "\n")
+
+    def run(self, cmd, secrets=None, **kwargs):
+        """
+        Run the command with subprocess.run and record the result
+
+        Args:
+            cmd (str or list): Command
+            secrets (list): Secrets masked in the recorded command and outputs
+            kwargs (dict): Arguments of subprocess.run
+
+        Returns:
+            CompletedProcess: Result of the command
+
+        """
+        # importing here to avoid circular imports
+        from ocs_ci.utility.utils import mask_secrets
+
+        start = time.perf_counter()
+        completed_process = subprocess.run(cmd, **kwargs)
+        record = {
+            "cmd": normalize_command(mask_secrets(cmd, secrets)),
+            "rc": completed_process.returncode,
+            "out": mask_secrets(encode_output(completed_process.stdout), secrets),
+            "err": mask_secrets(encode_output(completed_process.stderr), secrets),
+            "lat": round(time.perf_counter() - start, 4),
+            "test": get_call_stats().nodeid,
+        }
+        with self._lock:
+            self._file.write(json.dumps(record) + "\n")
+            self.count += 1
+        return completed_process
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+                log.info(f"Recorded {self.count} commands into {self.path}")
+
+
+class ExecReplayer(object):
+    """
+    Transport serving recorded responses instead of running the commands
+    """
+
+    def __init__(self, path, use_latency=False, latency_factor=1.0, test=None):
+        """
+        Args:
+            path (str): Path of the archive
+            use_latency (bool): Sleep for the recorded latency of the command
+            latency_factor (float): Multiplier of the recorded latencies
+            test (str): Replay only the commands recorded during this test
+                (node id)
+
+        """
+        self.path = path
+        self.use_latency = use_latency
+        self.latency_factor = latency_factor
+        self.metadata = {}
+        self.records = []
+        with gzip.open(path, "rt") as fd:
+            for line_number, line in enumerate(fd):
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if line_number == 0 and "version" in data:
+                    self.metadata = data
+                elif test is None or data.get("test") == test:
+                    self.records.append(data)
+        self._lock = threading.Lock()
+        self.rewind()
+
+    def rewind(self):
+        """
+        Start serving the responses from the beginning
+        """
+        with self._lock:
+            self.hits = 0
+            self.fuzzy_hits = 0
+            self.misses = 0
+            self._served = set()
+            self._by_cmd = defaultdict(deque)
+            self._by_family = defaultdict(deque)
+            self._last = {}
+            for index, record in enumerate(self.records):
+                self._by_cmd[record["cmd"]].append(index)
+                self._by_family[get_command_family(record["cmd"], 3)].append(index)
+
+    def _next(self, queue):
+        while queue and queue[0] in self._served:
+            queue.popleft()
+        if queue:
+            index = queue.popleft()
+            self._served.add(index)
+            return index
+        return None
+
+    def _find(self, key):
+        with self._lock:
+            index = self._next(self._by_cmd.get(key, deque()))
+            if index is None and key in self._last:
+                index = self._last[key]
+            if index is not None:
+                self.hits += 1
+            else:
+                index = self._next(
+                    self._by_family.get(get_command_family(key, 3), deque())
+                )
+                if index is None:
+                    self.misses += 1
+                    return None
+                self.fuzzy_hits += 1
+            self._last[key] = index
+            return self.records[index]
+
+    def run(self, cmd, secrets=None, **kwargs):
+        """
+        Serve the recorded response of the command
+
+        Args:
+            cmd (str or list): Command
+            secrets (list): Secrets masked in the command, as they were when
+                it was recorded
+            kwargs (dict): Arguments of subprocess.run, text mode is respected
+
+        Returns:
+            CompletedProcess: Recorded result of the command
+
+        Raises:
+            ExecReplayMissError: If no response was recorded for the command
+
+        """
+        # importing here to avoid circular imports
+        from ocs_ci.utility.utils import mask_secrets
+
+        key = normalize_command(mask_secrets(cmd, secrets))
+        record = self._find(key)
+        if record is None:
+            raise ExecReplayMissError(f"No recorded response for command: {key}")
+        if self.use_latency and record["lat"]:
+            time.sleep(record["lat"] * self.latency_factor)
+        stdout, stderr = record["out"], record["err"]
+        if not (kwargs.get("text") or kwargs.get("universal_newlines")):
+            stdout = stdout.encode("utf-8", "surrogateescape")
+            stderr = stderr.encode("utf-8", "surrogateescape")
+        return subprocess.CompletedProcess(cmd, record["rc"], stdout, stderr)
+
+    def close(self):
+        log.info(
+            f"Replayed commands from {self.path}: {self.hits} hits, "
+            f"{self.fuzzy_hits} family matches, {self.misses} misses"
+        )
+
+
+def get_transport():
+    """
+    Returns:
+        ExecRecorder|ExecReplayer: Active transport, None if the commands are
+            executed directly
+
+    """
+    return _transport
+
+
+def set_transport(transport):
+    """
+    Set the transport used by exec_cmd, the previous one is closed
+
+    Args:
+        transport (ExecRecorder|ExecReplayer): Transport, None to execute the
+            commands directly
+
+    """
+    global _transport
+    previous, _transport = _transport, transport
+    if previous is not None and previous is not transport:
+        previous.close()
+
+
+def run_process(cmd, secrets=None, **kwargs):
+    """
+    Run the command through the active transport
+
+    Args:
+        cmd (str or list): Command
+        secrets (list): Secrets masked in the recorded command and outputs
+        kwargs (dict): Arguments of subprocess.run
+
+    Returns:
+        CompletedProcess: Result of the command
+
+    """
+    if _transport is None:
+        return subprocess.run(cmd, **kwargs)
+    return _transport.run(cmd, secrets=secrets, **kwargs)
+
+
+def start_configured_transport():
+    """
+    Activate the transport configured by RUN['exec_replay_file'] or
+    RUN['exec_record_file'], no-op if a transport is already active
+
+    Returns:
+        ExecRecorder|ExecReplayer: Active transport, None if not configured
+
+    """
+    if _transport is not None:
+        return _transport
+    replay_file = config.RUN.get("exec_replay_file")
+    record_file = config.RUN.get("exec_record_file")
+    if replay_file:
+        log.info(f"Replaying executed commands from {replay_file}")
+        set_transport(
+            ExecReplayer(replay_file, use_latency=config.RUN.get("exec_replay_latency"))
+        )
+    elif record_file:
+        log.info(f"Recording executed commands into {record_file}")
+        set_transport(ExecRecorder(record_file, {"config": get_config_snapshot()}))
+    return _transport
+
+
+@contextmanager
+def recording(path, metadata=None):
+    """
+    Record the commands executed in the context
+
+    Args:
+        path (str): Path of the archive
+        metadata (dict): Metadata stored in the header of the archive
+
+    Yields:
+        ExecRecorder: The recorder
+
+    """
+    recorder = ExecRecorder(path, metadata)
+    set_transport(recorder)
+    try:
+        yield recorder
+    finally:
+        set_transport(None)
+
+
+@contextmanager
+def replaying(path, use_latency=False, latency_factor=1.0, test=None):
+    """
+    Serve the commands executed in the context from the archive
+
+    Args:
+        path (str): Path of the archive
+        use_latency (bool): Sleep for the recorded latencies
+        latency_factor (float): Multiplier of the recorded latencies
+        test (str): Replay only the commands recorded during this test
+
+    Yields:
+        ExecReplayer: The replayer
+
+    """
+    replayer = ExecReplayer(path, use_latency, latency_factor, test)
+    set_transport(replayer)
+    try:
+        yield replayer
+    finally:
+        set_transport(None)
@@ -9,7 +9,7 @@ import os
 import time
 
 from ocs_ci import framework
-from ocs_ci.framework import config
+from ocs_ci.framework import config, log_pipeline
 from ocs_ci.framework.exceptions import ClusterNameNotProvidedError
 from ocs_ci.ocs import constants
 from ocs_ci.ocs.constants import OCP_VERSION_CONF_DIR
@@ -114,7 +114,11 @@ class BaseInitializer:
 
         log_file = os.path.join(sub_log_dir, "logs")
 
-        file_handler = logging.FileHandler(log_file)
+        log_writer = log_pipeline.start_configured_log_pipeline(sub_log_dir)
+        if log_writer:
+            file_handler = log_pipeline.AsyncFileHandler(log_file, log_writer)
+        else:
+            file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(log_formatter)
         file_handler.setLevel(log_level)
         root_logger.addHandler(file_handler)
@@ -125,7 +129,7 @@ class BaseInitializer:
         root_logger.addHandler(console_handler)
 
         logger.info("Logging initialized")
-        logger.info(f"Log file configured: {log_file}")
+        logger.info(f"Log file configured: {file_handler.baseFilename}")
 
     def set_cluster_connection(self) -> None:
         """
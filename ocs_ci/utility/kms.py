@@ -6,6 +6,7 @@ currently supported KMSs: Vault and HPCS
 
 import logging
 import os
+import time
 
 import requests
 import json
@@ -36,8 +37,9 @@ from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
 )
 from ocs_ci.helpers import helpers
-from ocs_ci.ocs.resources import storage_cluster
 from ocs_ci.utility import templating, version
+from ocs_ci.utility.cluster_facts import get_storage_cluster_facts
+from ocs_ci.utility.vault_client import close_vault_clients, get_vault_client
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     download_file,
@@ -135,6 +137,8 @@ class Vault(KMS):
         self.vault_kube_auth_role = constants.VAULT_KUBERNETES_AUTH_ROLE
         self.vault_kube_auth_namespace = None
         self.vault_cwd_kms_sa_name = constants.VAULT_CWD_KMS_SA_NAME
+        # KMS ID -> VAULT_BACKEND_PATH from csi-kms-connection-details
+        self.csi_kms_backend_paths = {}
 
     @property
     def vault_path_token(self):
@@ -252,6 +256,15 @@ class Vault(KMS):
             bool: True if exists else False
 
         """
+        if use_vault_http_client():
+            parent_namespace = (
+                constants.VAULT_HCP_NAMESPACE
+                if config.ENV_DATA.get("vault_hcp")
+                else None
+            )
+            return get_vault_client().namespace_exists(
+                vault_namespace, namespace=parent_namespace
+            )
         if config.ENV_DATA.get("vault_hcp"):
             cmd = f"vault namespace lookup -namespace={constants.VAULT_HCP_NAMESPACE} {vault_namespace}"
         else:
@@ -276,6 +289,8 @@ class Vault(KMS):
             bool: True if exists else False
 
         """
+        if use_vault_http_client():
+            return get_vault_client().backend_path_exists(backend_path)
         cmd = "vault secrets list --format=json"
         out = subprocess.check_output(shlex.split(cmd))
         json_out = json.loads(out)
@@ -807,6 +822,20 @@ class Vault(KMS):
             vault_namespace (str): Namespace in Vault, if exists, where the backend path is created
         """
 
+        if use_vault_http_client():
+            client = get_vault_client()
+            client.disable_backend_path(
+                self.vault_backend_path, namespace=vault_namespace
+            )
+            # Check if path doesn't appear in the list
+            if client.backend_path_exists(
+                self.vault_backend_path, namespace=vault_namespace
+            ):
+                raise KMSResourceCleaneupError(
+                    f"Path {self.vault_backend_path} not deleted"
+                )
+            logger.info(f"Vault path {self.vault_backend_path} deleted")
+            return
         if vault_namespace:
             cmd = f"vault secrets disable -namespace={vault_namespace} {self.vault_backend_path}"
         else:
@@ -883,6 +912,8 @@ class Vault(KMS):
                 f"Namespace {self.vault_namespace} deletion failed"
             )
         logger.info(f"Vault namespace {self.vault_namespace} deleted")
+        # sessions of the deleted namespace are not usable anymore
+        close_vault_clients()
 
     def get_vault_namespace(self):
         """
@@ -1336,6 +1367,9 @@ class Vault(KMS):
         Returns:
             str: The VAULT_BACKEND_PATH for the given KMS ID, or None if not found
         """
+        # the ConfigMap is read again only for an unknown KMS ID
+        if kms_id in self.csi_kms_backend_paths:
+            return self.csi_kms_backend_paths[kms_id]
         cm_obj = ocp.OCP(
             kind="ConfigMap",
             namespace=config.ENV_DATA["cluster_namespace"],
@@ -1349,10 +1383,17 @@ class Vault(KMS):
 
         cm_data = cm_obj.get(constants.VAULT_KMS_CSI_CONNECTION_DETAILS).get("data", {})
 
+        for cm_kms_id, value in cm_data.items():
+            try:
+                self.csi_kms_backend_paths[cm_kms_id] = json.loads(value).get(
+                    "VAULT_BACKEND_PATH"
+                )
+            except (ValueError, AttributeError):
+                logger.debug(f"KMS ID '{cm_kms_id}' has no JSON connection details")
+
         # Look for the specific KMS ID in the ConfigMap
-        if kms_id in cm_data:
-            json_out = json.loads(cm_data[kms_id])
-            backend_path = json_out.get("VAULT_BACKEND_PATH")
+        if kms_id in self.csi_kms_backend_paths:
+            backend_path = self.csi_kms_backend_paths[kms_id]
             logger.info(
                 f"Found VAULT_BACKEND_PATH '{backend_path}' for KMS ID '{kms_id}'"
             )
@@ -1361,20 +1402,19 @@ class Vault(KMS):
         logger.warning(f"KMS ID '{kms_id}' not found in ConfigMap")
         return None
 
-    def get_pv_secret(self, device_handle, kms_id=None):
+    def get_pv_backend_path(self, kms_id=None):
         """
-        Get secret stored in the vault KMS for the given device_handle
+        Get the Vault backend path of the PV secrets
 
         Args:
-            device_handle (str): PV device handle string
             kms_id (str, optional): The encryption KMS ID from PV volumeAttributes.
                                    If provided, uses the backend path specific to this KMS ID.
                                    If not provided, falls back to the default backend path.
 
         Returns:
-            secret (str): passphrase stored in the vault KMS for given device handle.
+            str: Vault backend path
         """
-        # Determine which backend path to use
+        backend_path = None
         if kms_id:
             backend_path = self.get_vault_backend_path_for_kms_id(kms_id)
             if not backend_path:
@@ -1382,9 +1422,6 @@ class Vault(KMS):
                     f"Could not find backend path for KMS ID '{kms_id}', "
                     "falling back to default"
                 )
-                backend_path = None
-        else:
-            backend_path = None
 
         # Fall back to default backend path if not found
         if not backend_path:
@@ -1393,33 +1430,86 @@ class Vault(KMS):
                     resource_configmap=constants.VAULT_KMS_CSI_CONNECTION_DETAILS
                 )
             backend_path = self.csi_vault_backend_path
+        return backend_path
 
-        cmd = f"vault kv get -format=json {backend_path}/{device_handle}"
-        out = subprocess.check_output(shlex.split(cmd))
-        json_out = json.loads(out)
+    def get_pv_secret(self, device_handle, kms_id=None):
+        """
+        Get secret stored in the vault KMS for the given device_handle
 
-        def find_passphrase(obj):
-            """
-            Recursively searches for the 'passphrase' key in the JSON object.
-            """
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == "passphrase":
-                        return value
-                    elif isinstance(value, dict) or isinstance(value, list):
-                        result = find_passphrase(value)
-                        if result:
-                            return result
-            elif isinstance(obj, list):
-                for item in obj:
-                    result = find_passphrase(item)
-                    if result:
-                        return result
-            return None
+        Args:
+            device_handle (str): PV device handle string
+            kms_id (str, optional): The encryption KMS ID from PV volumeAttributes.
+                                   If provided, uses the backend path specific to this KMS ID.
+                                   If not provided, falls back to the default backend path.
+
+        Returns:
+            secret (str): passphrase stored in the vault KMS for given device handle.
+
+        Raises:
+            VaultOperationError: If the secret doesn't exist (CalledProcessError
+                with the vault CLI)
+        """
+        backend_path = self.get_pv_backend_path(kms_id)
+
+        if use_vault_http_client():
+            json_out = get_vault_client().read_secret(backend_path, device_handle)
+            if json_out is None:
+                raise VaultOperationError(
+                    f"Secret {backend_path}/{device_handle} not found in Vault"
+                )
+        else:
+            cmd = f"vault kv get -format=json {backend_path}/{device_handle}"
+            out = subprocess.check_output(shlex.split(cmd))
+            json_out = json.loads(out)
 
-        secret = find_passphrase(json_out)
+        return find_passphrase(json_out)
 
-        return secret
+    def get_pv_secrets(self, device_handles, kms_id=None):
+        """
+        Get secrets stored in the vault KMS for the device handles, read
+        concurrently over the pooled connections
+
+        Args:
+            device_handles (list): PV device handle strings
+            kms_id (str, optional): The encryption KMS ID from PV volumeAttributes
+
+        Returns:
+            dict: Device handle -> passphrase, None if the secret doesn't exist
+        """
+        backend_path = self.get_pv_backend_path(kms_id)
+        if not use_vault_http_client():
+            secrets = {}
+            for device_handle in device_handles:
+                try:
+                    secrets[device_handle] = self.get_pv_secret(device_handle, kms_id)
+                except CalledProcessError:
+                    secrets[device_handle] = None
+            return secrets
+        return {
+            device_handle: find_passphrase(json_out) if json_out else None
+            for device_handle, json_out in get_vault_client()
+            .read_secrets(backend_path, device_handles)
+            .items()
+        }
+
+    def verify_keys_present(self, keys, backend_path=None):
+        """
+        Check the keys are present in the backend path by one list of the
+        path, e.g. the device handles of the PVs or the names of the OSD PVCs
+
+        Args:
+            keys (list): Keys to check
+            backend_path (str): Vault backend path, the backend path of this
+                deployment if None
+
+        Returns:
+            dict: Key -> True if present
+        """
+        if not backend_path:
+            if not self.vault_backend_path:
+                self.get_vault_backend_path()
+            backend_path = self.vault_backend_path
+        return verify_keys_present_in_path(keys, backend_path)
 
     def get_osd_secret(self, device_handle):
         """Fetch the OSD encryption key for the given device handle from Vault.
@@ -1436,6 +1526,36 @@ class Vault(KMS):
 
         return fetch_osd_secret_from_vault(device_handle, self.vault_backend_path)
 
+    def get_osd_secrets(self, device_handles):
+        """Fetch the OSD encryption keys for the device handles from Vault,
+        read concurrently over the pooled connections.
+
+        Args:
+            device_handles (list): The device handles of the OSDs.
+
+        Returns:
+            dict: Device handle -> OSD encryption secret, None if not found.
+        """
+        if not self.vault_backend_path:
+            self.get_vault_backend_path()
+        if not use_vault_http_client():
+            return {
+                device_handle: fetch_osd_secret_from_vault(
+                    device_handle, self.vault_backend_path
+                )
+                for device_handle in device_handles
+            }
+        secret_keys = {
+            f"rook-ceph-osd-encryption-key-{device_handle}": device_handle
+            for device_handle in device_handles
+        }
+        return {
+            secret_keys[secret_key]: get_osd_secret_from_response(json_out, secret_key)
+            for secret_key, json_out in get_vault_client()
+            .read_secrets(self.vault_backend_path, secret_keys)
+            .items()
+        }
+
     def get_noobaa_secret(self):
         """Fetches the NooBaa backend secret from the Vault.
 
@@ -1468,6 +1588,11 @@ class HPCS(KMS):
         # default and only supported deploy mode for HPCS
         self.hpcs_deploy_mode = "external"
         self.kmsid = None
+        # IBM IAM access token reused until it expires and the session
+        # keeping the connections to the IBM endpoints
+        self.access_token = None
+        self.access_token_expiration = 0
+        self.session = requests.Session()
 
     def deploy(self):
         """
@@ -1625,13 +1750,16 @@ class HPCS(KMS):
         Return:
             (str): access token for authentication with IBM endpoints
         """
+        # the token is valid for an hour, reuse it until shortly before expiry
+        if self.access_token and time.time() < self.access_token_expiration - 300:
+            return self.access_token
         # decode service api key
         api_key = base64.b64decode(self.ibm_kp_service_api_key).decode()
         payload = {
             "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
             "apikey": api_key,
         }
-        r = requests.post(
+        r = self.session.post(
             self.ibm_kp_token_url,
             headers={"content-type": "application/x-www-form-urlencoded"},
             data=payload,
@@ -1639,28 +1767,53 @@ class HPCS(KMS):
             timeout=120,
         )
         assert r.ok, f"Couldn't get access token! StatusCode: {r.status_code}."
-        return "Bearer " + r.json()["access_token"]
+        token_info = r.json()
+        self.access_token = "Bearer " + token_info["access_token"]
+        self.access_token_expiration = token_info.get("expiration", 0)
+        return self.access_token
 
-    def list_hpcs_keys(self):
+    def list_hpcs_keys(self, limit=200):
         """
         This function lists the keys present in a HPCS instance
 
+        Args:
+            limit (int): number of keys listed by one request
+
         Return:
             (list): list of keys in a HPCS instance
         """
-        access_token = self.get_token_for_ibm_api_key()
-        r = requests.get(
-            f"{self.ibm_kp_base_url}" + "/api/v2/keys",
-            headers={
-                "accept": "application/vnd.ibm.kms.key+json",
-                "bluemix-instance": self.ibm_kp_service_instance_id,
-                "authorization": access_token,
-            },
-            verify=True,
-            timeout=120,
-        )
-        assert r.ok, f"Couldn't list HPCS keys! StatusCode: {r.status_code}."
-        return r.json()["resources"]
+        keys = []
+        while True:
+            r = self.session.get(
+                f"{self.ibm_kp_base_url}" + "/api/v2/keys",
+                headers={
+                    "accept": "application/vnd.ibm.kms.key+json",
+                    "bluemix-instance": self.ibm_kp_service_instance_id,
+                    "authorization": self.get_token_for_ibm_api_key(),
+                },
+                params={"limit": limit, "offset": len(keys)},
+                verify=True,
+                timeout=120,
+            )
+            assert r.ok, f"Couldn't list HPCS keys! StatusCode: {r.status_code}."
+            resources = r.json().get("resources", [])
+            keys.extend(resources)
+            if len(resources) < limit:
+                return keys
+
+    def verify_keys_present(self, keys):
+        """
+        Check the keys are present in the HPCS instance by one list of the
+        keys, a key is present if it is contained in the name of a HPCS key
+
+        Args:
+            keys (list): Keys to check, e.g. names of the OSD PVCs
+
+        Returns:
+            dict: Key -> True if present
+        """
+        key_names = [hpcs_key["name"] for hpcs_key in self.list_hpcs_keys()]
+        return {key: any(key in name for name in key_names) for key in keys}
 
     def validate_external_hpcs(self):
         """
@@ -1677,17 +1830,16 @@ class HPCS(KMS):
 
         """
         self.gather_init_hpcs_conf()
-        kvlist = self.list_hpcs_keys()
         # Check osd keys are present
-        osds = pod.get_osd_pods()
-        for osd in osds:
-            pvc = (
-                osd.get()
-                .get("metadata")
-                .get("labels")
-                .get(constants.CEPH_ROOK_IO_PVC_LABEL)
-            )
-            if any(pvc in k["name"] for k in kvlist):
+        osd_pvcs = [
+            osd.get()
+            .get("metadata")
+            .get("labels")
+            .get(constants.CEPH_ROOK_IO_PVC_LABEL)
+            for osd in pod.get_osd_pods()
+        ]
+        for pvc, present in self.verify_keys_present(osd_pvcs).items():
+            if present:
                 logger.info(f"HPCS: Found key for {pvc}")
             else:
                 logger.error(f"HPCS: Key not found for {pvc}")
@@ -1914,17 +2066,37 @@ class KMIP(KMS):
         """
         key_id_list = []
         total = None
-        while len(key_id_list) != total:
+        while total is None or len(key_id_list) < total:
             cmd = f"ksctl keys list --limit {limit} --skip {len(key_id_list)}"
             out = subprocess.check_output(shlex.split(cmd))
             json_out = json.loads(out)
             total = json_out["total"]
             if total == 0:
                 raise NotFoundError("No keys found")
-            else:
-                for key in json_out["resources"]:
-                    key_id_list.append(key["id"])
-                return key_id_list
+            if not json_out["resources"]:
+                break
+            for key in json_out["resources"]:
+                key_id_list.append(key["id"])
+        return key_id_list
+
+    def verify_keys_exist_in_ciphertrust(self, key_ids, limit=1000):
+        """
+        Check the keys are present in CipherTrust Manager by listing all the
+        keys instead of one 'ksctl keys get' per key
+
+        Args:
+            key_ids (list): IDs of the keys to be checked for
+            limit (int): number of keys listed by one command
+
+        Returns:
+            dict: Key ID -> True, if the key exists in CipherTrust Manager
+
+        """
+        try:
+            existing_ids = set(self.get_key_list_ciphertrust(limit=limit))
+        except NotFoundError:
+            existing_ids = set()
+        return {key_id: key_id in existing_ids for key_id in key_ids}
 
     def get_osd_key_ids(self):
         """
@@ -1991,7 +2163,7 @@ class KMIP(KMS):
         # Wait for NooBaa to be ready before loading keys
         MCG.wait_for_ready_status(timeout=600)
         # Loading key list after gathering OSD pods to avoid mismatch.
-        key_id_list = self.get_key_list_ciphertrust()
+        key_id_list = self.get_key_list_ciphertrust(limit=1000)
         if all(id in key_id_list for id in osd_key_ids):
             logger.info("KMIP: All OSD keys found in CipherTrust Manager")
         else:
@@ -2437,15 +2609,48 @@ def is_kms_enabled(dont_raise=False):
         (bool): True if KMS is configured else False
 
     """
-    cluster = storage_cluster.get_storage_cluster()
     logger.info("Checking if StorageCluster has configured KMS encryption")
-    resource_get = cluster.get(dont_raise=dont_raise)
-    if resource_get:
-        resource = resource_get["items"][0]
-        encryption = (
-            resource.get("spec").get("encryption", {}).get("kms", {}).get("enable")
-        )
-        return bool(encryption)
+    try:
+        return get_storage_cluster_facts()["kms"]
+    except (CommandFailed, IndexError):
+        if not dont_raise:
+            raise
+
+
+def use_vault_http_client():
+    """
+    Returns:
+        bool: True if Vault is accessed by the pooled HTTP client instead of
+            the vault CLI
+
+    """
+    return bool(config.RUN.get("vault_http_client", True))
+
+
+def find_passphrase(obj):
+    """
+    Recursively searches for the 'passphrase' key in the JSON object.
+
+    Args:
+        obj (dict or list): Secret as returned by 'vault kv get -format=json'
+
+    Returns:
+        str: The passphrase, None if not found
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "passphrase":
+                return value
+            elif isinstance(value, dict) or isinstance(value, list):
+                result = find_passphrase(value)
+                if result:
+                    return result
+    elif isinstance(obj, list):
+        for item in obj:
+            result = find_passphrase(item)
+            if result:
+                return result
+    return None
 
 
 def vault_kv_list(path):
@@ -2459,6 +2664,8 @@ def vault_kv_list(path):
         list: of kv present in the path
 
     """
+    if use_vault_http_client():
+        return get_vault_client().list_keys(path)
     cmd = f"vault kv list -format=json {path}"
     out = subprocess.check_output(shlex.split(cmd))
     json_out = json.loads(out)
@@ -2486,6 +2693,24 @@ def is_key_present_in_path(key, path):
         return False
 
 
+def verify_keys_present_in_path(keys, path):
+    """
+    Check the keys are present in the backend Path by one list of the path
+
+    Args:
+        keys (list): Names of the keys, e.g. device handles of the PVs
+        path (str): Vault backend path name
+
+    Returns:
+        dict: Key -> True if the key is present in the backend path
+    """
+    try:
+        kvlist = vault_kv_list(path=path)
+    except CalledProcessError:
+        kvlist = []
+    return {key: any(key in k for k in kvlist) for key in keys}
+
+
 def get_encryption_kmsid():
     """
     Get encryption kmsid from 'csi-kms-connection-details'
@@ -2649,6 +2874,16 @@ def fetch_osd_secret_from_vault(device_handle, vault_backend_path):
 
     secret_key = f"rook-ceph-osd-encryption-key-{device_handle}"
 
+    if use_vault_http_client():
+        logger.info(
+            f"Getting OSD secrets from vault : {vault_backend_path}/{secret_key}"
+        )
+        json_out = get_vault_client().read_secret(vault_backend_path, secret_key)
+        if json_out is None:
+            logger.error(f"Secret {vault_backend_path}/{secret_key} not found in Vault")
+            return None
+        return get_osd_secret_from_response(json_out, secret_key)
+
     # Construct the Vault command
     cmd = f"vault kv get -format=json {vault_backend_path}/{secret_key}"
 
@@ -2662,18 +2897,7 @@ def fetch_osd_secret_from_vault(device_handle, vault_backend_path):
         # Parse the JSON response
         json_out = json.loads(out)
 
-        # Retrieve the secret
-        data_section = json_out.get("data", {})
-        secret = data_section.get("data", {}).get(
-            secret_key, data_section.get(secret_key)
-        )
-
-        if not secret:
-            raise UnexpectedBehaviour(
-                f"Secret for key '{secret_key}' not found in Vault response."
-            )
-
-        return secret
+        return get_osd_secret_from_response(json_out, secret_key)
     except subprocess.CalledProcessError as e:
         logger.error(f"Error executing Vault command: {e.output.strip()}")
     except json.JSONDecodeError as e:
@@ -2682,6 +2906,32 @@ def fetch_osd_secret_from_vault(device_handle, vault_backend_path):
     return None
 
 
+def get_osd_secret_from_response(json_out, secret_key):
+    """Get the OSD encryption key from the Vault response.
+
+    Args:
+        json_out (dict): Secret as returned by 'vault kv get -format=json'
+        secret_key (str): Name of the secret.
+
+    Returns:
+        str: The OSD encryption secret, None if the response is None.
+
+    Raises:
+        UnexpectedBehaviour : If the secret key is not found in the Vault response.
+    """
+    if json_out is None:
+        return None
+    data_section = json_out.get("data", {})
+    secret = data_section.get("data", {}).get(secret_key, data_section.get(secret_key))
+
+    if not secret:
+        raise UnexpectedBehaviour(
+            f"Secret for key '{secret_key}' not found in Vault response."
+        )
+
+    return secret
+
+
 def fetch_noobaa_secret_from_vault(vault_backend_path):
     """Fetches the NooBaa backend secret from the Vault.
 
@@ -2700,13 +2950,23 @@ def fetch_noobaa_secret_from_vault(vault_backend_path):
     try:
         logger.info(f"Getting NooBaa secrets from vault : {cmd}")
 
-        # Execute the command and capture the output
-        out = subprocess.check_output(
-            shlex.split(cmd), stderr=subprocess.STDOUT, text=True
-        )
+        if use_vault_http_client():
+            json_out = get_vault_client().read_secret(
+                vault_backend_path, constants.NOOBAA_BACKEND_SECRET
+            )
+            if json_out is None:
+                logger.error(
+                    f"Secret {constants.NOOBAA_BACKEND_SECRET} not found in Vault"
+                )
+                return (None, None)
+        else:
+            # Execute the command and capture the output
+            out = subprocess.check_output(
+                shlex.split(cmd), stderr=subprocess.STDOUT, text=True
+            )
 
-        # Parse the JSON response
-        json_out = json.loads(out)
+            # Parse the JSON response
+            json_out = json.loads(out)
 
         # Retrieve the secret
         data_section = json_out.get("data", {}).get("data", json_out.get("data", {}))
@@ -0,0 +1,465 @@
+"""
+Collection of directories from pods to the local file system.
+
+Files are not copied one by one by 'oc rsh cat' (one exec per file, text
+only): the collector lists the directory by one exec, selects the files
+locally (include/exclude patterns, size caps, files already collected by a
+previous attempt) and streams them as one compressed tar archive by a second
+exec, which is extracted on the fly. Content is copied byte for byte and sizes
+of the extracted files are verified against the listing, optionally with
+sha256 checksums (one more exec).
+
+Pods without tar get the selected files by one exec per file, still binary
+safe.
+
+Example::
+
+    result = collect_pod_directory(
+        pod_obj, "/mnt/output", "/tmp/output", exclude=["*.tmp"],
+        max_file_size=100 * 1024**2,
+    )
+
+"""
+
+import fnmatch
+import hashlib
+import logging
+import os
+import shlex
+import subprocess
+import tarfile
+import threading
+import time
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.utils import exec_cmd
+
+log = logging.getLogger(__name__)
+
+NO_DIRECTORY = "NO_DIRECTORY"
+TAR_AVAILABLE = "TAR_AVAILABLE"
+# extraction filter rejecting absolute paths, links out of the target, ...
+EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def get_pod_exec_cmd(pod_obj, script, container=None):
+    """
+    Args:
+        pod_obj (Pod): Pod object
+        script (str): Shell script to run in the pod
+        container (str): Name of the container, the default one if None
+
+    Returns:
+        list: oc command running the script in the pod with stdin attached
+
+    """
+    cmd = ["oc", "-n", pod_obj.namespace, "exec", "-i", pod_obj.name]
+    if container:
+        cmd += ["-c", container]
+    return cmd + ["--", "sh", "-c", script]
+
+
+def get_exec_env():
+    """
+    Returns:
+        dict: Environment of the oc commands, with the kubeconfig of the
+            current cluster
+
+    """
+    env = os.environ.copy()
+    kubeconfig = config.RUN.get("kubeconfig")
+    if kubeconfig:
+        env["KUBECONFIG"] = kubeconfig
+    return env
+
+
+def list_pod_directory(pod_obj, remote_dir, recursive=True, container=None):
+    """
+    List regular files of the directory in the pod by one exec
+
+    Args:
+        pod_obj (Pod): Pod object
+        remote_dir (str): Directory in the pod
+        recursive (bool): List subdirectories as well
+        container (str): Name of the container
+
+    Returns:
+        tuple: dict of relative path -> (size, mtime) or None if the directory
+            doesn't exist, and bool whether tar is available in the pod
+
+    """
+    depth = "" if recursive else "-maxdepth 1 "
+    script = (
+        f"cd {shlex.quote(remote_dir)} 2>/dev/null || {{ echo {NO_DIRECTORY}; exit 0; }}; "
+        f"command -v tar >/dev/null 2>&1 && echo {TAR_AVAILABLE}; "
+        f"find . {depth}-type f -exec stat -c '%s %Y %n' {{}} + 2>/dev/null; true"
+    )
+    output = exec_cmd(
+        get_pod_exec_cmd(pod_obj, script, container), timeout=600
+    ).stdout.decode(errors="replace")
+    files = {}
+    tar_available = False
+    for line in output.splitlines():
+        if line == NO_DIRECTORY:
+            return None, False
+        if line == TAR_AVAILABLE:
+            tar_available = True
+            continue
+        size, mtime, path = (line.split(" ", 2) + ["", ""])[:3]
+        if not path.startswith("./") or not size.isdigit():
+            continue
+        files[path[2:]] = (int(size), int(mtime) if mtime.isdigit() else 0)
+    return files, tar_available
+
+
+def select_files(
+    files,
+    local_dir,
+    include=None,
+    exclude=None,
+    max_file_size=None,
+    max_total_size=None,
+    resume=True,
+):
+    """
+    Select files for the collection
+
+    Args:
+        files (dict): Relative path -> (size, mtime) from list_pod_directory
+        local_dir (str): Local target directory
+        include (list): Glob patterns of relative paths, all files if None
+        exclude (list): Glob patterns of relative paths to skip
+        max_file_size (int): Skip files bigger than this number of bytes
+        max_total_size (int): Stop selecting when this number of bytes is
+            reached
+        resume (bool): Skip files already present locally with the same size
+            and modification time
+
+    Returns:
+        dict: 'selected' (list of relative paths), 'excluded', 'resumed',
+            'oversized' and 'over_limit' (lists of relative paths)
+
+    """
+    result = {
+        "selected": [],
+        "excluded": [],
+        "resumed": [],
+        "oversized": [],
+        "over_limit": [],
+    }
+    total_size = 0
+    for path in sorted(files):
+        size, mtime = files[path]
+        if "\n" in path:
+            result["excluded"].append(path)
+            continue
+        if include and not any(fnmatch.fnmatch(path, pattern) for pattern in include):
+            result["excluded"].append(path)
+            continue
+        if exclude and any(fnmatch.fnmatch(path, pattern) for pattern in exclude):
+            result["excluded"].append(path)
+            continue
+        if max_file_size is not None and size > max_file_size:
+            result["oversized"].append(path)
+            continue
+        local_path = os.path.join(local_dir, path)
+        if resume and os.path.isfile(local_path):
+            stat = os.stat(local_path)
+            if stat.st_size == size and int(stat.st_mtime) == mtime:
+                result["resumed"].append(path)
+                continue
+        if max_total_size is not None and total_size + size > max_total_size:
+            result["over_limit"].append(path)
+            continue
+        total_size += size
+        result["selected"].append(path)
+    return result
+
+
+def _write_stdin(stream, data):
+    try:
+        stream.write(data)
+    except (BrokenPipeError, ValueError):
+        pass
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
+
+
+def stream_tar(pod_obj, remote_dir, local_dir, paths, timeout, container=None):
+    """
+    Stream the files as one gzip compressed tar archive from the pod and
+    extract it on the fly
+
+    Args:
+        pod_obj (Pod): Pod object
+        remote_dir (str): Directory in the pod
+        local_dir (str): Local target directory
+        paths (list): Relative paths of the files
+        timeout (int): Timeout of the transfer in seconds
+        container (str): Name of the container
+
+    Returns:
+        list: Relative paths of the extracted files
+
+    Raises:
+        CommandFailed: If the transfer failed or timed out
+
+    """
+    script = f"cd {shlex.quote(remote_dir)} && tar -czf - -T -"
+    cmd = get_pod_exec_cmd(pod_obj, script, container)
+    log.info(f"Streaming {len(paths)} files from {pod_obj.name}:{remote_dir}")
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=get_exec_env(),
+    )
+    # tar reads the names while writing the archive, feed them from a thread
+    stdin_writer = threading.Thread(
+        target=_write_stdin,
+        args=(process.stdin, "".join(f"{path}\n" for path in paths).encode()),
+        daemon=True,
+    )
+    stdin_writer.start()
+    stderr = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr.append(process.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    expected = set(paths)
+    extracted = []
+    try:
+        with tarfile.open(fileobj=process.stdout, mode="r|gz") as archive:
+            for member in archive:
+                name = os.path.normpath(member.name)
+                if not member.isfile() or name not in expected:
+                    log.warning(f"Skipping unexpected archive member {member.name}")
+                    continue
+                member.name = name
+                archive.extract(member, local_dir, **EXTRACT_KWARGS)
+                extracted.append(name)
+    except tarfile.TarError as ex:
+        process.kill()
+        raise CommandFailed(f"Failed to extract archive from {pod_obj.name}: {ex}")
+    finally:
+        timer.cancel()
+        returncode = process.wait()
+        stderr_reader.join()
+        stdin_writer.join()
+    if timed_out.is_set():
+        raise CommandFailed(
+            f"Transfer from {pod_obj.name} was killed after {timeout} seconds"
+        )
+    if returncode:
+        # tar fails when a file disappeared, the rest of the archive is valid
+        log.warning(
+            f"tar in {pod_obj.name} finished with {returncode}: "
+            f"{b''.join(stderr).decode(errors='replace').strip()}"
+        )
+    return extracted
+
+
+def copy_files(pod_obj, remote_dir, local_dir, paths, timeout, container=None):
+    """
+    Copy the files by one exec per file, for pods without tar. The output of
+    'cat' is written into the local file as is, it is not decoded or logged.
+
+    Args:
+        pod_obj (Pod): Pod object
+        remote_dir (str): Directory in the pod
+        local_dir (str): Local target directory
+        paths (list): Relative paths of the files
+        timeout (int): Timeout of one file in seconds
+        container (str): Name of the container
+
+    Returns:
+        list: Relative paths of the copied files
+
+    """
+    copied = []
+    env = get_exec_env()
+    for path in paths:
+        remote_path = shlex.quote(os.path.join(remote_dir, path))
+        cmd = get_pod_exec_cmd(pod_obj, f"cat {remote_path}", container)
+        local_path = os.path.join(local_dir, path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        try:
+            with open(local_path, "wb") as fd:
+                completed_process = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=fd,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                    timeout=timeout,
+                )
+            error = (
+                completed_process.stderr.decode(errors="replace").strip()
+                if completed_process.returncode
+                else None
+            )
+        except subprocess.TimeoutExpired:
+            error = f"timed out after {timeout} seconds"
+        if error is not None:
+            log.warning(f"Failed to copy {path} from {pod_obj.name}: {error}")
+            os.remove(local_path)
+            continue
+        copied.append(path)
+    return copied
+
+
+def get_remote_checksums(pod_obj, remote_dir, paths, container=None):
+    """
+    Args:
+        pod_obj (Pod): Pod object
+        remote_dir (str): Directory in the pod
+        paths (list): Relative paths of the files
+        container (str): Name of the container
+
+    Returns:
+        dict: Relative path -> sha256 hex digest
+
+    """
+    script = f"cd {shlex.quote(remote_dir)} && xargs -d '\\n' sha256sum"
+    output = exec_cmd(
+        get_pod_exec_cmd(pod_obj, script, container),
+        input="".join(f"{path}\n" for path in paths).encode(),
+        ignore_error=True,
+        timeout=3600,
+    ).stdout.decode(errors="replace")
+    checksums = {}
+    for line in output.splitlines():
+        digest, _, path = line.partition("  ")
+        checksums[path] = digest
+    return checksums
+
+
+def get_local_checksum(path):
+    """
+    Args:
+        path (str): Path of the local file
+
+    Returns:
+        str: sha256 hex digest of the file
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fd:
+        for chunk in iter(lambda: fd.read(1024**2), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def collect_pod_directory(
+    pod_obj,
+    remote_dir,
+    local_dir,
+    include=None,
+    exclude=None,
+    max_file_size=None,
+    max_total_size=None,
+    recursive=True,
+    resume=True,
+    verify_checksums=False,
+    timeout=3600,
+    container=None,
+):
+    """
+    Collect files of the directory in the pod into the local directory
+
+    Args:
+        pod_obj (Pod): Pod object
+        remote_dir (str): Directory in the pod
+        local_dir (str): Local target directory, created if needed
+        include (list): Glob patterns of relative paths, all files if None
+        exclude (list): Glob patterns of relative paths to skip
+        max_file_size (int): Skip files bigger than this number of bytes
+        max_total_size (int): Collect up to this number of bytes
+        recursive (bool): Collect subdirectories as well
+        resume (bool): Skip files collected by a previous attempt (same size
+            and modification time)
+        verify_checksums (bool): Compare sha256 checksums of the collected
+            files with the files in the pod
+        timeout (int): Timeout of the transfer in seconds
+        container (str): Name of the container
+
+    Returns:
+        dict: Result of the collection: 'found' (None if the directory
+            doesn't exist), 'collected' (list of relative paths), 'bytes',
+            'seconds', 'mismatched' (files changed during the collection or
+            with different checksums), 'missing' (selected files not
+            collected) and the selection lists from select_files
+
+    """
+    start = time.perf_counter()
+    files, tar_available = list_pod_directory(pod_obj, remote_dir, recursive, container)
+    if files is None:
+        log.info(f"Directory {remote_dir} not found in pod {pod_obj.name}")
+    selection = select_files(
+        files or {}, local_dir, include, exclude, max_file_size, max_total_size, resume
+    )
+    result = {"found": None if files is None else len(files)}
+    result.update(selection)
+    paths = selection["selected"]
+    os.makedirs(local_dir, exist_ok=True)
+    if paths and tar_available:
+        collected = stream_tar(
+            pod_obj, remote_dir, local_dir, paths, timeout, container
+        )
+    elif paths:
+        log.info(f"tar not available in {pod_obj.name}, copying files one by one")
+        collected = copy_files(
+            pod_obj, remote_dir, local_dir, paths, timeout, container
+        )
+    else:
+        collected = []
+
+    mismatched = []
+    collected_bytes = 0
+    for path in collected:
+        size = os.path.getsize(os.path.join(local_dir, path))
+        collected_bytes += size
+        if size != files[path][0]:
+            mismatched.append(path)
+    if verify_checksums and collected:
+        remote_checksums = get_remote_checksums(
+            pod_obj, remote_dir, collected, container
+        )
+        for path in collected:
+            local_checksum = get_local_checksum(os.path.join(local_dir, path))
+            if remote_checksums.get(path) != local_checksum and path not in mismatched:
+                mismatched.append(path)
+    collected_set = set(collected)
+    result.update(
+        collected=collected,
+        bytes=collected_bytes,
+        seconds=round(time.perf_counter() - start, 3),
+        mismatched=mismatched,
+        missing=[path for path in paths if path not in collected_set],
+    )
+    log.info(
+        f"Collected {len(collected)} files ({collected_bytes} bytes) from "
+        f"{pod_obj.name}:{remote_dir} to {local_dir} in {result['seconds']}s, "
+        f"{len(result['resumed'])} already collected, {len(result['excluded'])} "
+        f"excluded, {len(result['oversized']) + len(result['over_limit'])} over "
+        f"the size limits, {len(result['missing'])} missing"
+    )
+    if mismatched:
+        log.warning(
+            f"{len(mismatched)} files changed during the collection or differ: "
+            f"{mismatched[:10]}"
+        )
+    return result
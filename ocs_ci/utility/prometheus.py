@@ -12,6 +12,7 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.exceptions import AlertingError, AuthError, NoThreadingLockUsedError
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility import call_stats
 from ocs_ci.utility.ssl_certs import get_root_ca_cert
 from ocs_ci.utility.utils import TimeoutIterator
 
@@ -633,12 +634,18 @@ class PrometheusAPI(object):
         logger.debug(f"verify={self._cacert}")
         logger.debug(f"params={payload}")
 
+        def prometheus_get(*args, **kwargs):
+            with call_stats.measure("prometheus", family=resource) as call:
+                response = requests.get(*args, **kwargs)
+                call.output_bytes = len(response.content or b"")
+            return response
+
         if timeout:
             with self._cluster_context():
                 for sample_response in TimeoutIterator(
                     timeout=timeout,
                     sleep=15,
-                    func=requests.get,
+                    func=prometheus_get,
                     func_kwargs={
                         "url": self._endpoint + pattern,
                         "headers": headers,
@@ -666,7 +673,7 @@ class PrometheusAPI(object):
             return response
         else:
             with self._cluster_context():
-                response = requests.get(
+                response = prometheus_get(
                     self._endpoint + pattern,
                     headers=headers,
                     verify=self._cacert,
@@ -0,0 +1,346 @@
+"""
+Structured store of the test results used for the email reporting.
+
+Outcome of every test (durations of the phases, squads, polarion id, skip
+reason, skips caused by Ceph health check, memory stats) is recorded when
+the reports of the test phases are created and every update is appended as
+one JSON line to the results file in the log directory. The email report is
+rendered directly from the store with a jinja template instead of loading
+and rewriting the whole pytest-html report.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+
+from jinja2 import Environment, FileSystemLoader
+from psutil._common import bytes2human
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+
+log = logging.getLogger(__name__)
+
+RESULTS_FILE = "test_results.jsonl"
+EMAIL_REPORT_TEMPLATE = "email_report.html.j2"
+CEPH_HEALTH_SKIP_REASON = "Ceph health check failed at setup"
+UNASSIGNED_SQUAD = "UNASSIGNED"
+OUTCOMES = ("passed", "skipped", "failed", "error", "xfailed", "xpassed")
+
+
+@dataclass
+class ResultRecord:
+    """
+    Result of one test
+    """
+
+    nodeid: str
+    outcome: str = ""
+    description: str = ""
+    squads: list = field(default_factory=list)
+    polarion_id: str = None
+    durations: dict = field(default_factory=dict)
+    skip_reason: str = None
+    skipped_on_ceph_health: bool = False
+    log_file: str = None
+    memory: dict = None
+
+    @property
+    def duration(self):
+        return round(sum(self.durations.values()), 2)
+
+    @property
+    def failed(self):
+        return self.outcome in ("failed", "error")
+
+
+def get_report_outcome(report, previous=""):
+    """
+    Get outcome of the test after the report of one of its phases
+
+    Args:
+        report (TestReport): Report of the test phase
+        previous (str): Outcome of the test after the previous phases
+
+    Returns:
+        str: One of OUTCOMES
+
+    """
+    xfail = hasattr(report, "wasxfail")
+    if report.when == "call":
+        if report.skipped:
+            return "xfailed" if xfail else "skipped"
+        if report.failed:
+            return "failed"
+        return "xpassed" if xfail else "passed"
+    if report.failed:
+        return previous if previous == "failed" else "error"
+    if report.skipped:
+        return "skipped"
+    return previous
+
+
+def get_skip_reason(report):
+    """
+    Args:
+        report (TestReport): Report of the skipped test phase
+
+    Returns:
+        str: Reason of the skip
+
+    """
+    try:
+        reason = report.longrepr[2]
+    except TypeError:
+        return "--unknown--"
+    if reason.startswith("Skipped:"):
+        reason = reason[len("Skipped:") :]
+    return reason.strip()
+
+
+class ResultStore(object):
+    """
+    Incrementally updated store of the test results
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Path of the JSON lines file where the results are
+                appended, results are kept only in memory if not set
+
+        """
+        self.path = path
+        self.results = {}
+        self._lock = threading.Lock()
+
+    def _save(self, record):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "a") as fd:
+                fd.write(json.dumps(asdict(record), default=str) + "\n")
+        except OSError as ex:
+            log.warning(f"Failed to save test result to {self.path}: {ex}")
+            self.path = None
+
+    def _get_record(self, nodeid):
+        if nodeid not in self.results:
+            self.results[nodeid] = ResultRecord(nodeid=nodeid)
+        return self.results[nodeid]
+
+    def record_report(self, report, item=None):
+        """
+        Update the result of the test by the report of one of its phases
+
+        Args:
+            report (TestReport): Report of the test phase
+            item (Item): Test item, used to get the polarion id
+
+        """
+        with self._lock:
+            record = self._get_record(report.nodeid)
+            record.durations[report.when] = round(report.duration, 2)
+            record.outcome = get_report_outcome(report, record.outcome)
+            if report.skipped and not hasattr(report, "wasxfail"):
+                record.skip_reason = get_skip_reason(report)
+                record.skipped_on_ceph_health = (
+                    record.skip_reason == CEPH_HEALTH_SKIP_REASON
+                )
+            record.description = getattr(report, "description", record.description)
+            if not record.squads:
+                record.squads = [
+                    key[:-6].capitalize() for key in report.keywords if "_squad" in key
+                ]
+            if item is not None and record.polarion_id is None:
+                marker = item.get_closest_marker(name="polarion_id")
+                if marker and marker.args:
+                    record.polarion_id = marker.args[0]
+            for handler in logging.getLogger().handlers:
+                if isinstance(handler, logging.FileHandler):
+                    record.log_file = handler.baseFilename
+                    break
+            self._save(record)
+
+    def record_memory(self, nodeid, peak_ram, peak_vms, ram_leak):
+        """
+        Add memory stats of the test
+
+        Args:
+            nodeid (str): Node id of the test
+            peak_ram (int): Peak total RAM consumed (Bytes)
+            peak_vms (int): Peak total VMS consumed (Bytes)
+            ram_leak (int): RAM leaked during the test (Bytes)
+
+        """
+        with self._lock:
+            record = self._get_record(nodeid)
+            record.memory = {
+                "peak_ram": int(peak_ram),
+                "peak_vms": int(peak_vms),
+                "ram_leak": int(ram_leak),
+            }
+            self._save(record)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load the results saved by the store, the last line of every test wins
+
+        Args:
+            path (str): Path of the results file
+
+        Returns:
+            ResultStore: Store with the loaded results (not appending to the file)
+
+        """
+        store = cls()
+        with open(path) as fd:
+            for line in fd:
+                if line.strip():
+                    data = json.loads(line)
+                    store.results[data["nodeid"]] = ResultRecord(**data)
+        return store
+
+    def get_summary(self):
+        """
+        Returns:
+            dict: Number of tests per outcome, 'total', 'duration' (seconds)
+                and 'skipped_on_ceph_health'
+
+        """
+        summary = {outcome: 0 for outcome in OUTCOMES}
+        for record in self.results.values():
+            summary[record.outcome] = summary.get(record.outcome, 0) + 1
+        summary["total"] = len(self.results)
+        summary["duration"] = round(
+            sum(record.duration for record in self.results.values()), 2
+        )
+        summary["skipped_on_ceph_health"] = sum(
+            record.skipped_on_ceph_health for record in self.results.values()
+        )
+        return summary
+
+    def get_squad_analysis(self):
+        """
+        Returns:
+            tuple: failed (dict: squad -> list of node ids) and skipped
+                (dict: squad -> list of (node id, reason) tuples)
+
+        """
+        failed = {}
+        skipped = {}
+        for record in self.results.values():
+            for squad in record.squads or [UNASSIGNED_SQUAD]:
+                if record.failed:
+                    failed.setdefault(squad, []).append(record.nodeid)
+                elif record.outcome == "skipped":
+                    skipped.setdefault(squad, []).append(
+                        (record.nodeid, record.skip_reason)
+                    )
+        return failed, skipped
+
+    def get_time_report(self, top=None):
+        """
+        Args:
+            top (int): Number of the most time consuming tests, all if None
+
+        Returns:
+            list: (node id, durations with 'total') tuples sorted by the
+                total time
+
+        """
+        data = [
+            (record.nodeid, {**record.durations, "total": record.duration})
+            for record in self.results.values()
+        ]
+        data.sort(key=lambda item: item[1]["total"], reverse=True)
+        return data[:top] if top else data
+
+
+def get_log_url(log_file):
+    """
+    Args:
+        log_file (str): Local path of the log file
+
+    Returns:
+        str: Link to the log file, logs_url is used instead of the log
+            directory when configured
+
+    """
+    logs_url = config.RUN.get("logs_url")
+    if not log_file or not logs_url:
+        return log_file
+    return log_file.replace(os.path.expanduser(config.RUN.get("log_dir")), logs_url)
+
+
+def render_email_report(store, metadata=None, squad_analysis=False, mg_notice=None):
+    """
+    Render the html report for the email from the results store
+
+    Args:
+        store (ResultStore): Store with the results
+        metadata (dict): Environment of the run (pytest-metadata)
+        squad_analysis (bool): Include failures and skips per squad
+        mg_notice (str): Notice about failed must gather collections
+
+    Returns:
+        str: Html of the report
+
+    """
+    env = Environment(
+        loader=FileSystemLoader(constants.HTML_REPORT_TEMPLATE_DIR), autoescape=True
+    )
+    env.filters["bytes2human"] = bytes2human
+    env.filters["log_url"] = get_log_url
+    summary = store.get_summary()
+    skips_ratio = config.RUN.get("skipped_on_ceph_health_ratio") or 0
+    failed, skipped = store.get_squad_analysis() if squad_analysis else ({}, {})
+    results = sorted(
+        store.results.values(),
+        key=lambda record: (not record.failed, record.outcome != "skipped"),
+    )
+    return env.get_template(EMAIL_REPORT_TEMPLATE).render(
+        summary=summary,
+        skips_ratio=skips_ratio * 100,
+        metadata=metadata or {},
+        mg_notice=mg_notice,
+        sorted_data=store.get_time_report(top=5),
+        failed=failed,
+        skipped=skipped,
+        skipped_msg=config.RUN.get("display_skipped_msg_in_email"),
+        squad_colors=[color.lower() for color in constants.SQUADS],
+        results=results,
+        memory=[record for record in store.results.values() if record.memory],
+        show_links=bool(config.RUN.get("logs_url")),
+    )
+
+
+_result_store = ResultStore()
+
+
+def get_result_store():
+    """
+    Returns:
+        ResultStore: Store of the current test session
+
+    """
+    return _result_store
+
+
+def reset_result_store(path=None):
+    """
+    Create new store for the test session
+
+    Args:
+        path (str): Path of the results file
+
+    Returns:
+        ResultStore: The new store
+
+    """
+    global _result_store
+    _result_store = ResultStore(path)
+    return _result_store
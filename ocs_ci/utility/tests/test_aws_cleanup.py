@@ -0,0 +1,133 @@
+# -*- coding: utf8 -*-
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ocs_ci.utility import aws_cleanup
+
+moto = pytest.importorskip("moto")
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    # small pages and batches to exercise the pagination
+    monkeypatch.setattr(aws_cleanup, "LIST_PAGE_SIZE", 7)
+    monkeypatch.setattr(aws_cleanup, "DELETE_BATCH_SIZE", 10)
+    monkeypatch.setattr(aws_cleanup, "STACK_DELETE_WAIT_DELAY", 1)
+    with moto.mock_aws():
+        yield aws_cleanup.AWSCleanupEngine(region_name="us-east-1", max_workers=3)
+
+
+def test_delete_buckets(engine, tmp_path):
+    s3 = engine.s3_client
+    for index in range(3):
+        s3.create_bucket(Bucket=f"bucket-{index}")
+    s3.put_bucket_versioning(
+        Bucket="bucket-0", VersioningConfiguration={"Status": "Enabled"}
+    )
+    for index in range(25):
+        s3.put_object(Bucket="bucket-0", Key=f"obj-{index}", Body=b"v1")
+        s3.put_object(Bucket="bucket-0", Key=f"obj-{index}", Body=b"v2")
+    for index in range(5):
+        s3.delete_object(Bucket="bucket-0", Key=f"obj-{index}")
+    s3.put_object(Bucket="bucket-1", Key="obj", Body=b"data")
+    assert len(engine.list_buckets()) == 3
+
+    failed = engine.delete_buckets(["bucket-0", "bucket-1", "bucket-2", "missing"])
+    assert failed == []
+    assert engine.list_buckets() == []
+    objects = {
+        entry["name"]: entry.get("objects")
+        for entry in engine.report.entries
+        if entry["status"] == "deleted"
+    }
+    # 2 versions of 25 objects and 5 delete markers
+    assert objects == {"bucket-0": 55, "bucket-1": 1, "bucket-2": 0}
+    assert engine.report.get_summary() == {"bucket": {"deleted": 3, "skipped": 1}}
+    report_path = tmp_path / "report.json"
+    engine.report.write(str(report_path))
+    assert len(json.loads(report_path.read_text())["resources"]) == 4
+
+
+class FakeCloudFormation(object):
+    """
+    CloudFormation client paging the stacks by 5, moto's CloudFormation
+    backend needs newer pyparsing than ocs-ci pins
+    """
+
+    def __init__(self, stack_names, failing=()):
+        self.stacks = list(stack_names)
+        self.failing = set(failing)
+
+    def describe_stacks(self, NextToken=None):
+        start = int(NextToken or 0)
+        page = {
+            "Stacks": [{"StackName": name} for name in self.stacks[start : start + 5]]
+        }
+        if start + 5 < len(self.stacks):
+            page["NextToken"] = str(start + 5)
+        return page
+
+    def delete_stack(self, StackName):
+        if StackName in self.failing:
+            raise ClientError(
+                {"Error": {"Code": "ValidationError", "Message": "protected"}},
+                "DeleteStack",
+            )
+        self.stacks.remove(StackName)
+
+    def get_waiter(self, name):
+        assert name == "stack_delete_complete"
+        fake = self
+
+        class Waiter(object):
+            def wait(self, StackName, WaiterConfig):
+                assert StackName not in fake.stacks
+
+        return Waiter()
+
+
+def test_delete_stacks(engine):
+    stack_names = [f"stack-{index}" for index in range(12)]
+    engine.cf_client = FakeCloudFormation(stack_names, failing=["stack-3"])
+    assert engine.list_stacks() == stack_names
+    assert engine.delete_stacks(stack_names) == ["stack-3"]
+    assert engine.list_stacks() == ["stack-3"]
+    assert engine.report.get_summary() == {"stack": {"deleted": 11, "failed": 1}}
+
+
+def test_call_with_backoff(monkeypatch):
+    monkeypatch.setattr(aws_cleanup.time, "sleep", lambda delay: None)
+    calls = []
+
+    def throttled(code):
+        calls.append(code)
+        if len(calls) < 3:
+            raise ClientError({"Error": {"Code": code}}, "ListBuckets")
+        return "ok"
+
+    assert aws_cleanup.call_with_backoff(throttled, "SlowDown") == "ok"
+    assert len(calls) == 3
+    calls.clear()
+    with pytest.raises(ClientError):
+        aws_cleanup.call_with_backoff(throttled, "AccessDenied")
+    assert len(calls) == 1
+
+
+def test_aws_delete_buckets_raises_on_failure(engine, monkeypatch):
+    from ocs_ci.ocs.exceptions import ResourceNotDeleted
+    from ocs_ci.utility.aws import AWS
+
+    engine.s3_client.create_bucket(Bucket="bucket-0")
+    aws = AWS(region_name="us-east-1")
+    monkeypatch.setattr(aws, "get_cleanup_engine", lambda max_workers: engine)
+    aws.delete_buckets(["bucket-0", "missing"])
+    assert engine.list_buckets() == []
+
+    monkeypatch.setattr(engine, "delete_buckets", lambda buckets: ["bucket-1"])
+    with pytest.raises(ResourceNotDeleted, match="bucket-1"):
+        aws.delete_buckets(["bucket-1"])
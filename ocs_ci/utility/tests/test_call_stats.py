@@ -0,0 +1,79 @@
+# -*- coding: utf8 -*-
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.utility import call_stats, utils
+from ocs_ci.utility.call_stats import get_command_family
+
+
+@pytest.fixture
+def stats():
+    original = call_stats.get_call_stats()
+    yield call_stats.reset_call_stats()
+    call_stats._call_stats = original
+
+
+def test_command_family():
+    assert (
+        get_command_family(["oc", "--kubeconfig", "/kc", "-n", "ns", "get", "Pod"], 3)
+        == "oc get Pod"
+    )
+    assert get_command_family("/usr/bin/oc exec -n ns tools -- ceph", 3) == "oc exec"
+    assert get_command_family("get Pod -o yaml --selector=app=x") == "get Pod"
+    assert get_command_family("ceph osd tree --format json", 3) == "ceph osd tree"
+
+
+def test_calls_are_attributed_to_test_and_phase(stats, tmp_path):
+    stats.set_context("tests/test_a.py::test_one", "setup")
+    with stats.measure("oc", "get Pod -o yaml") as call:
+        with stats.measure("exec", ["oc", "-n", "ns", "get", "Pod"]) as exec_call:
+            exec_call.output_bytes = 100
+        call.output_bytes = 100
+        with call.parsing():
+            pass
+    stats.set_context("tests/test_a.py::test_one", "call")
+    stats.record("sleep:check_pods", 5.0, caller="test_a.py:test_one")
+    stats.record("exec:oc get", 1.0, caller="conftest.py:pvc_factory")
+    stats.set_context("tests/test_b.py::test_two", "teardown")
+    stats.record("exec:oc delete", 2.0)
+
+    report = stats.get_report()
+    first, second = report["tests"]
+    assert first["nodeid"] == "tests/test_a.py::test_one"
+    assert set(first["phases"]) == {"setup", "call"}
+    assert first["phases"]["call"] == 6.0
+    families = {family["family"]: family for family in first["families"]}
+    assert families["oc:get Pod"]["bytes"] == 100
+    assert families["exec:oc get"]["count"] == 2
+    assert [caller["caller"] for caller in first["callers"]] == [
+        "test_a.py:test_one",
+        "conftest.py:pvc_factory",
+    ]
+    assert second["total"] == 2.0
+    assert [suite["suite"] for suite in report["suites"]] == [
+        "tests/test_a.py",
+        "tests/test_b.py",
+    ]
+
+    stats.save(str(tmp_path / "call_stats.json"))
+    with open(tmp_path / "call_stats.json") as fd:
+        assert json.load(fd)["families"][0]["family"] == "sleep:check_pods"
+
+
+def test_exec_cmd_and_sampler_are_measured(stats):
+    stats.set_context("tests/test_a.py::test_one", "call")
+    utils.exec_cmd("echo hello")
+    with patch.object(utils.time, "sleep"):
+        for attempt, _ in enumerate(utils.TimeoutSampler(10, 1, lambda: False)):
+            if attempt:
+                break
+    families = {family["family"]: family for family in stats.get_report()["families"]}
+    assert families["exec:echo hello"]["bytes"] == len("hello\n")
+    assert families["sleep:<lambda>"]["count"] == 1
+
+    with call_stats.reset_call_stats(enabled=False).measure("exec", "oc get"):
+        pass
+    assert not call_stats.get_call_stats().get_report()["tests"]
@@ -0,0 +1,105 @@
+# -*- coding: utf8 -*-
+
+from unittest.mock import Mock
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.utility import ceph_cmd_cache
+from ocs_ci.utility.ceph_cmd_cache import (
+    cached_call,
+    ceph_cmd_cache_bypass,
+    get_ceph_cmd_ttl,
+    is_mutating_cmd,
+    notify_command,
+)
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch):
+    monkeypatch.setitem(config.RUN, "ceph_cmd_cache", True)
+    ceph_cmd_cache.get_ceph_cmd_cache().invalidate()
+    yield
+    ceph_cmd_cache.get_ceph_cmd_cache().invalidate()
+
+
+def test_allowlist():
+    assert get_ceph_cmd_ttl("ceph  osd tree") == 10
+    assert get_ceph_cmd_ttl("ceph status --format json-pretty") == 5
+    assert get_ceph_cmd_ttl("ceph osd pool ls") is None
+
+
+@pytest.mark.parametrize(
+    "cmd, mutating",
+    [
+        ("oc get pods -n openshift-storage", False),
+        ("oc --kubeconfig /tmp/kc -n ns describe pod x", False),
+        ("oc delete pod rook-ceph-osd-0-abc", True),
+        ("oc -n ns patch storagecluster x --type merge -p {}", True),
+        ("oc adm must-gather --dest-dir=/tmp", False),
+        ("oc adm drain node-1", True),
+        ("oc rsh rook-ceph-tools-123 ceph status --format json", False),
+        ("oc rsh rook-ceph-tools-123 ceph osd set noout", True),
+        ("oc rsh rook-ceph-tools-123 ceph osd pool get rbd size", False),
+        ("oc exec tools -- bash -c 'ceph osd out 1'", True),
+        ("oc rsh tools ceph osd set-full-ratio 0.9", True),
+        (["oc", "rsh", "app-pod", "fio", "--name=x"], True),
+        ("oc -n test exec app-pod -- dd if=/dev/zero of=/mnt/file", True),
+        ("ls -l", False),
+    ],
+)
+def test_is_mutating_cmd(cmd, mutating):
+    assert is_mutating_cmd(cmd) == mutating
+
+
+def test_cached_call_and_invalidation(cache_enabled):
+    func = Mock(side_effect=lambda: {"health": "HEALTH_OK"})
+    result = cached_call(("key",), 60, func)
+    result["health"] = "modified"
+    assert cached_call(("key",), 60, func) == {"health": "HEALTH_OK"}
+    assert func.call_count == 1
+
+    notify_command("oc get pods")
+    cached_call(("key",), 60, func)
+    assert func.call_count == 1
+
+    notify_command("oc delete pod x")
+    cached_call(("key",), 60, func)
+    assert func.call_count == 2
+
+    with ceph_cmd_cache_bypass():
+        cached_call(("key",), 60, func)
+    assert func.call_count == 3
+
+
+def test_result_computed_during_invalidation_is_not_cached(cache_enabled):
+    def func():
+        notify_command("oc rsh tools ceph osd set noout")
+        return "stale"
+
+    cached_call(("key",), 60, func)
+    found, _ = ceph_cmd_cache.get_ceph_cmd_cache().get(("key",))
+    assert not found
+
+
+def test_tools_pod_lookup_cached_per_wait(cache_enabled, monkeypatch):
+    from ocs_ci.ocs.resources import pod
+
+    tools_pod = {
+        "kind": "Pod",
+        "metadata": {"name": "rook-ceph-tools-1", "namespace": "openshift-storage"},
+        "spec": {"containers": [{"name": "tools"}]},
+    }
+    lookup = Mock(return_value=(tools_pod, ""))
+    monkeypatch.setattr(pod, "_get_ceph_tools_pod_data", lookup)
+    monkeypatch.setattr(pod, "update_container_with_proxy_env", lambda data: None)
+
+    first = pod.get_ceph_tools_pod()
+    first.pod_data["metadata"]["name"] = "modified"
+    second = pod.get_ceph_tools_pod()
+    assert second is not first
+    assert second.name == "rook-ceph-tools-1"
+    assert lookup.call_count == 1
+    # waiting for the Running pod is not served by the lookup without wait
+    pod.get_ceph_tools_pod(wait=True)
+    assert lookup.call_count == 2
@@ -0,0 +1,69 @@
+# -*- coding: utf8 -*-
+
+from ocs_ci.framework import config
+from ocs_ci.utility import cluster_facts
+
+
+def test_cluster_fact_cached_per_cluster_until_invalidated(monkeypatch):
+    calls = []
+
+    @cluster_facts.cluster_fact("test_version")
+    def get_version(separator="."):
+        calls.append(separator)
+        return separator.join(["4", str(len(calls))])
+
+    @cluster_facts.cluster_fact("test_empty")
+    def get_empty():
+        calls.append("empty")
+        return ""
+
+    monkeypatch.setattr(config, "cur_index", 0)
+    cluster_facts.invalidate_cluster_facts()
+    assert get_version() == get_version() == "4.1"
+    assert get_version("_") == "4_2"
+    assert get_empty() == get_empty() == ""
+    assert calls == [".", "_", "empty", "empty"]
+
+    # every cluster context has its own facts
+    cluster_facts.get_cluster_facts_cache(1)
+    cluster_facts.invalidate_cluster_facts(cluster_index=1)
+    assert get_version() == "4.1"
+
+    # read-only commands and commands not related to the facts keep them
+    cluster_facts.notify_command("oc get storagecluster -o yaml")
+    cluster_facts.notify_command("oc -n test patch pvc pvc-1 -p {}")
+    assert get_version() == "4.1"
+    cluster_facts.notify_command(
+        "oc -n openshift-storage patch storagecluster/ocs-storagecluster -p {}"
+    )
+    assert get_version() == "4.5"
+    with cluster_facts.cluster_facts_bypass():
+        assert get_version() == "4.6"
+    assert get_version() == "4.5"
+    stats = cluster_facts.get_cluster_facts_cache().get_stats()
+    assert stats["invalidations"] >= 1
+    cluster_facts.invalidate_cluster_facts()
+
+
+def test_ocp_upgrade_wait_does_not_cache_rollout_version(monkeypatch):
+    from ocs_ci.ocs import ocp
+
+    versions = iter(["4.18", "4.18", "4.19", "4.19"])
+
+    @cluster_facts.cluster_fact("test_ocp_version")
+    def get_version():
+        return next(versions)
+
+    def confirm_version(target_version, cluster_operator):
+        # looked up while the operators are rolled out
+        return get_version() == target_version
+
+    monkeypatch.setattr(config, "cur_index", 0)
+    monkeypatch.setattr(ocp, "get_all_cluster_operators", lambda: ["aro", "dns"])
+    monkeypatch.setattr(ocp, "confirm_cluster_operator_version", confirm_version)
+    monkeypatch.setattr(ocp.TimeoutSampler, "_sleep", lambda self, interval: None)
+    cluster_facts.invalidate_cluster_facts()
+    assert get_version() == "4.18"
+    ocp.check_cluster_operator_versions("4.19", operator_upgrade_timeout=60)
+    assert get_version() == "4.19"
+    assert get_version() == "4.19"
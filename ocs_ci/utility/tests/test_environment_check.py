@@ -0,0 +1,80 @@
+# -*- coding: utf8 -*-
+
+import json
+
+from ocs_ci.utility.environment_check import ResourceIndex, compare_dicts
+
+
+def pod(name, uid, resource_version="1", generate_name=None):
+    metadata = {
+        "name": name,
+        "namespace": "test",
+        "uid": uid,
+        "resourceVersion": resource_version,
+        "annotations": {"big": "x" * 100},
+    }
+    if generate_name:
+        metadata["generateName"] = generate_name
+    return {"kind": "Pod", "metadata": metadata, "spec": {"containers": []}}
+
+
+class FakeApi(object):
+    def __init__(self, pages, events=None):
+        self.pages = pages
+        self.events = events
+        self.paths = []
+
+    def __call__(self, path):
+        self.paths.append(path)
+        if "watch=1" in path:
+            return "\n".join(json.dumps(event) for event in self.events)
+        page = self.pages[len([p for p in self.paths if "limit=" in p]) - 1]
+        return json.dumps(page)
+
+
+def test_resource_index_relist_and_incremental_update():
+    api = FakeApi(
+        pages=[
+            {"metadata": {"continue": "a b"}, "items": [pod("p1", "u1")]},
+            {"metadata": {"resourceVersion": "10"}, "items": [pod("p2", "u2")]},
+        ],
+        events=[
+            {"type": "ADDED", "object": pod("p3", "u3", "11")},
+            {"type": "DELETED", "object": pod("p1", "u1", "12")},
+            {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "13"}}},
+        ],
+    )
+    index = ResourceIndex("Pod", "/api/v1/pods", incremental_min_items=2)
+    index._get_raw = api
+    items = index.get_items()
+    assert api.paths == [
+        "/api/v1/pods?limit=500",
+        "/api/v1/pods?limit=500&continue=a%20b",
+    ]
+    assert sorted(item["metadata"]["name"] for item in items) == ["p1", "p2"]
+    # only the metadata needed by the check are kept
+    assert items[0] == {
+        "kind": "Pod",
+        "metadata": {"name": "p1", "namespace": "test", "uid": "u1"},
+    }
+
+    items = index.get_items()
+    assert api.paths[-1].startswith("/api/v1/pods?watch=1&resourceVersion=10&")
+    assert sorted(item["metadata"]["name"] for item in items) == ["p2", "p3"]
+    assert index.resource_version == "13"
+    assert (index.relists, index.incremental_updates) == (1, 1)
+
+    # expired resourceVersion leads to a new list
+    api.events = [{"type": "ERROR", "object": {"code": 410, "message": "gone"}}]
+    api.pages.append({"metadata": {"resourceVersion": "20"}, "items": []})
+    assert index.get_items() == []
+    assert (index.relists, index.resource_version) == (2, "20")
+
+
+def test_compare_dicts():
+    before = [pod("keep", "u1"), pod("gone", "u2"), pod("web-1", "u3", None, "web-")]
+    after = [pod("keep", "u1"), pod("web-2", "u4", None, "web-"), pod("new", "u5")]
+    added, removed = compare_dicts(before, after)
+    assert [item["metadata"]["name"] for item in added] == ["new"]
+    assert [item["metadata"]["name"] for item in removed] == ["gone"]
+    assert compare_dicts(None, None) is None
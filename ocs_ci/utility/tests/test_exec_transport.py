@@ -0,0 +1,67 @@
+# -*- coding: utf8 -*-
+
+import gzip
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ocs_ci.ocs.exceptions import ExecReplayMissError
+from ocs_ci.utility import exec_transport
+from ocs_ci.utility.exec_benchmark import benchmark_flow, record_flow
+from ocs_ci.utility.utils import exec_cmd, run_cmd
+
+
+def flow():
+    run_cmd("echo --kubeconfig /tmp/kc first")
+    run_cmd(f"echo get pvc pvc-{next(flow.names)}")
+    run_cmd("echo --kubeconfig /tmp/kc first")
+
+
+def test_record_and_replay(tmp_path):
+    archive = str(tmp_path / "flow.jsonl.gz")
+    flow.names = iter(range(100))
+    record_flow("ocs_ci.utility.tests.test_exec_transport:flow", archive)
+
+    with patch.object(subprocess, "run") as subprocess_run:
+        with exec_transport.replaying(archive) as replayer:
+            assert replayer.metadata["flow"].endswith(":flow")
+            assert [record["cmd"] for record in replayer.records] == [
+                "echo first",
+                "echo get pvc pvc-0",
+                "echo first",
+            ]
+            # kubeconfig path is ignored when matching the recorded commands
+            first = "--kubeconfig /tmp/kc first\n"
+            assert run_cmd("echo --kubeconfig /other/kc first") == first
+            # not recorded command gets response of the same command family
+            assert run_cmd("echo get pvc pvc-1") == "get pvc pvc-0\n"
+            assert exec_cmd("echo first").stdout == first.encode()
+            # the last response of the command is served again when consumed
+            assert run_cmd("echo first") == first
+            with pytest.raises(ExecReplayMissError):
+                run_cmd("ls /")
+            assert (replayer.hits, replayer.fuzzy_hits, replayer.misses) == (3, 1, 1)
+        subprocess_run.assert_not_called()
+    assert exec_transport.get_transport() is None
+
+    result = benchmark_flow(archive, repeat=2)
+    assert result["commands"] == 3
+    assert result["misses"] == 0
+    assert result["cpu_min"] > 0
+
+
+def test_recorded_secrets_are_masked(tmp_path):
+    archive = str(tmp_path / "secrets.jsonl.gz")
+    with exec_transport.recording(archive):
+        exec_cmd("echo --token s3cr3t", secrets=["s3cr3t"])
+    with gzip.open(archive, "rt") as fd:
+        recorded = fd.read()
+    assert "s3cr3t" not in recorded
+    assert "*****" in recorded
+
+    with exec_transport.replaying(archive) as replayer:
+        assert exec_cmd("echo --token s3cr3t", secrets=["s3cr3t"]).stdout == (
+            b"--token *****\n"
+        )
+        assert replayer.hits == 1
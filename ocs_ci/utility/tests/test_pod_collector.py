@@ -0,0 +1,71 @@
+# -*- coding: utf8 -*-
+
+from types import SimpleNamespace
+
+from ocs_ci.utility import pod_collector
+
+
+def local_exec_cmd(pod_obj, script, container=None):
+    return ["sh", "-c", script]
+
+
+def test_collect_pod_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr(pod_collector, "get_pod_exec_cmd", local_exec_cmd)
+    pod_obj = SimpleNamespace(name="stress-pod", namespace="test")
+    remote_dir = tmp_path / "remote dir"
+    (remote_dir / "pod-1" / "hang_markers").mkdir(parents=True)
+    binary = bytes(range(256)) * 10
+    (remote_dir / "pod-1" / "data.bin").write_bytes(binary)
+    (remote_dir / "pod-1" / "hang_markers" / "HANG_DETECTED_1.json").write_text("{}")
+    (remote_dir / "pod-1" / "scratch.tmp").write_text("skip")
+    (remote_dir / "big.log").write_bytes(b"x" * 10000)
+    local_dir = tmp_path / "local"
+
+    result = pod_collector.collect_pod_directory(
+        pod_obj,
+        str(remote_dir),
+        str(local_dir),
+        exclude=["*.tmp"],
+        max_file_size=5000,
+        verify_checksums=True,
+    )
+    assert result["found"] == 4
+    assert sorted(result["collected"]) == [
+        "pod-1/data.bin",
+        "pod-1/hang_markers/HANG_DETECTED_1.json",
+    ]
+    assert result["excluded"] == ["pod-1/scratch.tmp"]
+    assert result["oversized"] == ["big.log"]
+    assert result["mismatched"] == result["missing"] == []
+    assert (local_dir / "pod-1" / "data.bin").read_bytes() == binary
+
+    # files collected by the previous attempt are skipped
+    result = pod_collector.collect_pod_directory(
+        pod_obj, str(remote_dir), str(local_dir), include=["pod-1/*"]
+    )
+    assert result["collected"] == ["pod-1/scratch.tmp"]
+    assert len(result["resumed"]) == 2
+
+    result = pod_collector.collect_pod_directory(
+        pod_obj, str(tmp_path / "missing"), str(local_dir)
+    )
+    assert result["found"] is None
+    assert result["collected"] == []
+
+
+def test_copy_files_without_tar(monkeypatch, tmp_path):
+    monkeypatch.setattr(pod_collector, "get_pod_exec_cmd", local_exec_cmd)
+    pod_obj = SimpleNamespace(name="stress-pod", namespace="test")
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    # not valid UTF-8
+    binary = b"\xff\xfe\x00\x80" * 1000
+    (remote_dir / "data.bin").write_bytes(binary)
+    local_dir = tmp_path / "local"
+
+    copied = pod_collector.copy_files(
+        pod_obj, str(remote_dir), str(local_dir), ["data.bin", "missing"], 60
+    )
+    assert copied == ["data.bin"]
+    assert (local_dir / "data.bin").read_bytes() == binary
+    assert not (local_dir / "missing").exists()
@@ -0,0 +1,83 @@
+# -*- coding: utf8 -*-
+
+from types import SimpleNamespace
+
+from ocs_ci.utility.result_store import ResultStore, render_email_report
+
+
+def make_report(nodeid, when, outcome, duration=1.0, keywords=(), longrepr=None):
+    return SimpleNamespace(
+        nodeid=nodeid,
+        when=when,
+        duration=duration,
+        passed=outcome == "passed",
+        failed=outcome == "failed",
+        skipped=outcome == "skipped",
+        keywords={key: 1 for key in keywords},
+        longrepr=longrepr,
+        description="Test description",
+    )
+
+
+def record_test(store, nodeid, phases, keywords=(), longrepr=None):
+    for when, outcome in phases:
+        store.record_report(
+            make_report(nodeid, when, outcome, keywords=keywords, longrepr=longrepr)
+        )
+
+
+def test_store_outcomes_and_render(tmp_path):
+    results_file = tmp_path / "results.jsonl"
+    store = ResultStore(str(results_file))
+    record_test(
+        store,
+        "tests/test_a.py::test_pass",
+        [("setup", "passed"), ("call", "passed"), ("teardown", "passed")],
+        keywords=("green_squad",),
+    )
+    record_test(
+        store,
+        "tests/test_a.py::test_fail",
+        [("setup", "passed"), ("call", "failed"), ("teardown", "passed")],
+        keywords=("green_squad",),
+    )
+    record_test(
+        store,
+        "tests/test_a.py::test_teardown_error",
+        [("setup", "passed"), ("call", "passed"), ("teardown", "failed")],
+    )
+    record_test(
+        store,
+        "tests/test_a.py::test_skip",
+        [("setup", "skipped"), ("teardown", "passed")],
+        longrepr=("test_a.py", 1, "Skipped: Ceph health check failed at setup"),
+    )
+    store.record_memory("tests/test_a.py::test_pass", 2**30, 2**31, 0)
+
+    summary = store.get_summary()
+    assert summary["total"] == 4
+    assert (summary["passed"], summary["failed"], summary["error"]) == (1, 1, 1)
+    assert summary["skipped"] == summary["skipped_on_ceph_health"] == 1
+    assert summary["duration"] == 11
+    failed, skipped = store.get_squad_analysis()
+    assert failed == {
+        "Green": ["tests/test_a.py::test_fail"],
+        "UNASSIGNED": ["tests/test_a.py::test_teardown_error"],
+    }
+    assert skipped == {
+        "UNASSIGNED": [
+            ("tests/test_a.py::test_skip", "Ceph health check failed at setup")
+        ]
+    }
+
+    loaded = ResultStore.load(str(results_file))
+    assert loaded.get_summary() == summary
+    assert loaded.results["tests/test_a.py::test_pass"].memory["peak_ram"] == 2**30
+
+    html = render_email_report(
+        loaded, metadata={"OCS operator": "4.99"}, squad_analysis=True
+    )
+    assert "OCS-CI RESULTS" in html
+    assert "Squad Analysis" in html
+    assert "1.0G" in html
+    assert "4.99" in html
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import threading
 import time
 
 import pytest
@@ -411,3 +412,44 @@ def test_ts_float_sleep_logged_correctly(caplog):
     assert sleep_records
     for rec in sleep_records:
         assert "0.5 seconds" in rec.getMessage()
+
+
+def test_ts_adaptive_sleep(caplog):
+    """
+    Adaptive scheduling starts with the initial interval growing up to sleep
+    and the statistics of the sampler are kept.
+    """
+    caplog.set_level(logging.DEBUG)
+    sampler = TimeoutSampler(2, 0.4, lambda: 1).adaptive_sleep(initial=0.1, jitter=0)
+    with pytest.raises(TimeoutExpiredError):
+        for _ in sampler:
+            pass
+    intervals = [
+        r.args[0] for r in caplog.records if "Going to sleep" in r.getMessage()
+    ]
+    assert intervals[:4] == [0.1, 0.2, 0.4, 0.4]
+    stats = sampler.get_stats()
+    assert stats["attempts"] == len(intervals)
+    assert 1.6 < stats["sleep_time"] < 2.6
+    assert stats["func_time"] < 0.5
+
+
+def test_ts_wake_on_event():
+    """
+    Sampler registered to an event source resamples immediately when woken
+    up and unregisters itself when the iteration ends.
+    """
+    listeners = []
+    sampler = TimeoutSampler(30, 10, lambda: len(listeners)).wake_on(
+        listeners.append, listeners.remove
+    )
+    timer = threading.Timer(0.2, lambda: listeners[0]("transition"))
+    timer.start()
+    start = time.time()
+    for attempt, _ in enumerate(sampler):
+        if attempt:
+            break
+    assert time.time() - start < 5
+    assert sampler.last_result == 1
+    assert sampler.wakeups == 1
+    assert listeners == []
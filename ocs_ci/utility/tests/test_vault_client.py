@@ -0,0 +1,134 @@
+# -*- coding: utf8 -*-
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ocs_ci.ocs.exceptions import VaultOperationError
+from ocs_ci.utility import vault_client
+
+TOKEN = "root"
+
+
+class FakeVaultHandler(BaseHTTPRequestHandler):
+    """
+    Minimal dev-mode Vault with kv v1 and kv v2 secrets engines
+    """
+
+    mounts = {}
+    secrets = {}
+    namespaces = {"team-a"}
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code, body=None):
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_request(self):
+        FakeVaultHandler.requests.append((self.command, self.path))
+        if self.headers.get("X-Vault-Token") != TOKEN:
+            return self.reply(403, {"errors": ["permission denied"]})
+        path = self.path.split("?")[0][len("/v1/") :]
+        if path == "sys/mounts":
+            return self.reply(200, {"data": self.mounts})
+        if path.startswith("sys/mounts/") and self.command == "DELETE":
+            self.mounts.pop(f"{path[len('sys/mounts/'):]}/", None)
+            return self.reply(204)
+        if path.startswith("sys/namespaces/"):
+            name = path[len("sys/namespaces/") :]
+            if name in self.namespaces:
+                return self.reply(200, {"data": {"path": f"{name}/"}})
+            return self.reply(404, {"errors": []})
+        mount, _, rest = path.partition("/")
+        if f"{mount}/" not in self.mounts:
+            return self.reply(404, {"errors": []})
+        if self.mounts[f"{mount}/"]["options"]["version"] == "2":
+            operation, _, rest = rest.partition("/")
+        if self.command == "LIST":
+            keys = [key for (m, key) in self.secrets if m == mount]
+            if not keys:
+                return self.reply(404, {"errors": []})
+            return self.reply(200, {"data": {"keys": keys}})
+        secret = self.secrets.get((mount, rest))
+        if secret is None:
+            return self.reply(404, {"errors": []})
+        if self.mounts[f"{mount}/"]["options"]["version"] == "2":
+            return self.reply(200, {"data": {"data": secret, "metadata": {}}})
+        return self.reply(200, {"data": secret})
+
+    do_GET = do_DELETE = do_LIST = handle_request
+
+
+@pytest.fixture
+def vault_address():
+    FakeVaultHandler.mounts = {
+        "ocs/": {"type": "kv", "options": {"version": "1"}},
+        "csi-v2/": {"type": "kv", "options": {"version": "2"}},
+    }
+    FakeVaultHandler.secrets = {
+        ("ocs", "rook-ceph-osd-encryption-key-ocs-deviceset-0"): {
+            "rook-ceph-osd-encryption-key-ocs-deviceset-0": "osd-key-0"
+        },
+        ("csi-v2", "0001-pvc-a"): {"passphrase": "pass-a"},
+        ("csi-v2", "0001-pvc-b"): {"passphrase": "pass-b"},
+    }
+    FakeVaultHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeVaultHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    vault_client.close_vault_clients()
+
+
+def test_batched_reads_and_lists(vault_address):
+    client = vault_client.VaultClient(vault_address, TOKEN)
+    secrets = client.read_secrets("csi-v2", ["0001-pvc-a", "0001-pvc-b", "missing"])
+    assert secrets["0001-pvc-a"]["data"]["data"] == {"passphrase": "pass-a"}
+    assert secrets["missing"] is None
+    osd_secret = client.read_secret(
+        "ocs", "rook-ceph-osd-encryption-key-ocs-deviceset-0"
+    )
+    assert osd_secret["data"] == {
+        "rook-ceph-osd-encryption-key-ocs-deviceset-0": "osd-key-0"
+    }
+    assert client.verify_keys_present("csi-v2", ["pvc-a", "pvc-c"]) == {
+        "pvc-a": True,
+        "pvc-c": False,
+    }
+    # mounts are listed once and served from the cache
+    mount_lists = [r for r in FakeVaultHandler.requests if r[1] == "/v1/sys/mounts"]
+    assert len(mount_lists) == 1
+    assert client.list_keys("unknown") == []
+    assert ("LIST", "/v1/csi-v2/metadata") in FakeVaultHandler.requests
+    assert client.namespace_exists("team-a")
+    assert not client.namespace_exists("team-b")
+
+
+def test_backend_path_and_errors(vault_address):
+    client = vault_client.VaultClient(vault_address, TOKEN)
+    assert client.backend_path_exists("ocs")
+    client.disable_backend_path("ocs")
+    assert not client.backend_path_exists("ocs")
+    with pytest.raises(VaultOperationError, match="403"):
+        vault_client.VaultClient(vault_address, "wrong").list_keys("csi-v2")
+
+
+def test_clients_are_shared(vault_address, monkeypatch):
+    monkeypatch.setenv("VAULT_ADDR", vault_address)
+    monkeypatch.setenv("VAULT_TOKEN", TOKEN)
+    monkeypatch.delenv("VAULT_NAMESPACE", raising=False)
+    client = vault_client.get_vault_client()
+    assert vault_client.get_vault_client() is client
+    assert vault_client.get_vault_client(namespace="team-a") is not client
+    assert client.session.headers.get("X-Vault-Namespace") is None
@@ -0,0 +1,101 @@
+# -*- coding: utf8 -*-
+
+import threading
+
+import pytest
+
+from ocs_ci.utility.verification_graph import (
+    CHECK_FAILED,
+    CHECK_PASSED,
+    CHECK_SKIPPED,
+    VerificationGraph,
+)
+
+
+def test_independent_checks_run_concurrently():
+    """
+    Read-only checks without dependencies have to run at the same time.
+    """
+    barrier = threading.Barrier(3, timeout=10)
+    graph = VerificationGraph("test")
+    for i in range(3):
+        graph.add(f"check {i}", barrier.wait)
+    report = graph.run()
+    assert report.passed
+    assert [res.status for res in report.results] == [CHECK_PASSED] * 3
+
+
+def test_dependencies_are_respected():
+    """
+    Check is started only after all its dependencies finished.
+    """
+    executed = []
+    graph = VerificationGraph("test")
+    graph.add("a", lambda: executed.append("a"))
+    graph.add("b", lambda: executed.append("b"), depends_on=["a"])
+    graph.add("c", lambda: executed.append("c"), depends_on=["a", "b"])
+    graph.run()
+    assert executed == ["a", "b", "c"]
+
+
+def test_first_failure_in_registration_order_is_raised():
+    """
+    The error of the first registered failed check is re-raised and checks
+    depending on it are skipped.
+    """
+
+    def fail(msg):
+        def _fail():
+            raise AssertionError(msg)
+
+        return _fail
+
+    graph = VerificationGraph("test")
+    graph.add("first", fail("first failure"))
+    graph.add("second", fail("second failure"))
+    graph.add("dependent", lambda: None, depends_on=["first"])
+    report = graph.run()
+    statuses = {res.name: res.status for res in report.results}
+    assert statuses == {
+        "first": CHECK_FAILED,
+        "second": CHECK_FAILED,
+        "dependent": CHECK_SKIPPED,
+    }
+    with pytest.raises(AssertionError, match="first failure"):
+        report.raise_first_failure()
+
+
+def test_exclusive_check_runs_alone():
+    """
+    Exclusive check never overlaps with other checks.
+    """
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def check(name):
+        def _check():
+            with lock:
+                active.append(name)
+                if "exclusive" in active and len(active) > 1:
+                    overlaps.append(list(active))
+            with lock:
+                active.remove(name)
+
+        return _check
+
+    graph = VerificationGraph("test")
+    for i in range(4):
+        graph.add(f"check {i}", check(f"check {i}"))
+    graph.add("exclusive", check("exclusive"), exclusive=True)
+    for i in range(4, 8):
+        graph.add(f"check {i}", check(f"check {i}"))
+    report = graph.run()
+    assert report.passed
+    assert not overlaps
+
+
+def test_unknown_dependency():
+    graph = VerificationGraph("test")
+    with pytest.raises(ValueError):
+        graph.add("a", lambda: None, depends_on=["missing"])
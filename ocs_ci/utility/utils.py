@@ -15,6 +15,7 @@ import smtplib
 import socket
 import string
 import subprocess
+import threading
 import time
 import traceback
 from typing import Match, Iterator
@@ -42,9 +43,10 @@ from paramiko.auth_handler import AuthenticationException, SSHException
 from semantic_version import Version
 from tempfile import NamedTemporaryFile, mkdtemp, TemporaryDirectory
 from jinja2 import FileSystemLoader, Environment
-from ocs_ci.framework import config
+from ocs_ci.framework import config, log_pipeline
 from ocs_ci.framework import GlobalVariables as GV
-from ocs_ci.ocs import constants, defaults
+from ocs_ci.utility.result_store import get_result_store, render_email_report
+from ocs_ci.ocs import constants, defaults, health_tracker
 from ocs_ci.utility.yaml_log_filter import filter_verbose_yaml
 from ocs_ci.ocs.exceptions import (
     CephHealthException,
@@ -65,7 +67,13 @@ from ocs_ci.ocs.exceptions import (
     NoRunningCephToolBoxException,
     ClusterNotInSTSModeException,
 )
-from ocs_ci.utility import version as version_module
+from ocs_ci.utility import (
+    call_stats,
+    ceph_cmd_cache,
+    cluster_facts,
+    exec_transport,
+    version as version_module,
+)
 from ocs_ci.utility.flexy import load_cluster_info
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.jira import JiraHelper
@@ -852,15 +860,26 @@ def exec_cmd(
         # stdin is managed internally. Do not inject stdin=PIPE if the caller set stdin.
         if "input" not in kwargs and "stdin" not in kwargs:
             run_kw["stdin"] = subprocess.PIPE
-        completed_process = subprocess.run(cmd, **run_kw, **kwargs)
+        with call_stats.measure("exec", cmd) as call:
+            completed_process = exec_transport.run_process(
+                cmd, secrets=secrets, **run_kw, **kwargs
+            )
+            call.output_bytes = len(completed_process.stdout or "") + len(
+                completed_process.stderr or ""
+            )
     finally:
         if threading_lock and cmd[0] == "oc":
             threading_lock.release()
+        # drop cached results of Ceph commands if the command changed the cluster
+        ceph_cmd_cache.notify_command(cmd)
+        # drop cached versions and capabilities on upgrade, scaling, ...
+        cluster_facts.notify_command(cmd)
     masked_stdout = mask_secrets(completed_process.stdout.decode(), secrets)
     log_stdout = filter_verbose_yaml(masked_stdout)
     truncated_stdout = truncate_long_lines(log_stdout)
     if len(completed_process.stdout) > 0:
         truncated_stdout = truncate_large_base64(truncated_stdout)
+        truncated_stdout = log_pipeline.capture_output(truncated_stdout, masked_stdout)
         log.debug(f"Command stdout: {truncated_stdout}")
     else:
         log.debug("Command stdout is empty")
@@ -2264,9 +2283,25 @@ class TimeoutSampler(object):
     recent value returned by func) and `last_exception` (the exception raised
     by the most recent sample, None if that sample succeeded).
 
+    By default the sampler sleeps `sleep` seconds between the samples. With
+    adaptive scheduling (see `adaptive_sleep`, enabled for all samplers by
+    RUN['adaptive_sampling']) it starts with a short interval which grows
+    exponentially, with random jitter, up to `sleep`. Samplers registered to
+    an event source (see `wake_on`) resample immediately when woken up.
+    Time spent in func and sleeping is available by `get_stats`.
+
+    Examples::
+
+        sampler = TimeoutSampler(300, 30, get_phase, name)
+        sampler.adaptive_sleep(initial=2).wake_on(
+            tracker.add_listener, tracker.remove_listener
+        )
+        sampler.wait_for_func_value("Ready")
+
     Args:
         timeout (int): Timeout in seconds
-        sleep (int): Sleep interval in seconds
+        sleep (int): Sleep interval in seconds, the max interval with
+            adaptive scheduling
         func (function): The function to sample
         func_args: Arguments for the function
         func_kwargs: Keyword arguments for the function
@@ -2311,6 +2346,21 @@ class TimeoutSampler(object):
         self.last_exception = None
         # Timestamp of the last INFO-level progress log (for rate limiting)
         self.last_progress_log_time = None
+        # Adaptive scheduling: first interval, its growth factor and max
+        # relative random jitter of the intervals
+        self.adaptive = config.RUN.get("adaptive_sampling", False)
+        self.initial_sleep = 1
+        self.backoff = 2
+        self.jitter = 0.1
+        self._interval = None
+        # Wake-up of the sleep by external events
+        self._wakeup = threading.Event()
+        self._wakeable = False
+        self._wake_sources = []
+        # Statistics: seconds spent in func and sleeping, number of wake-ups
+        self.func_time = 0.0
+        self.sleep_time = 0.0
+        self.wakeups = 0
         # The exception to raise
         self.timeout_exc_cls = TimeoutExpiredError
         # Arguments that will be passed to the exception
@@ -2391,6 +2441,106 @@ class TimeoutSampler(object):
         all_args_string = ", ".join(args + kwargs)
         return f"{self._get_func_name()}({all_args_string})"
 
+    def adaptive_sleep(self, initial=1, backoff=2, jitter=0.1):
+        """
+        Enable adaptive scheduling: the first interval between the samples
+        is `initial` seconds, every next one is `backoff` times longer, up to
+        `sleep` seconds
+
+        Args:
+            initial (float): First interval in seconds
+            backoff (float): Growth factor of the intervals
+            jitter (float): Max random deviation of the intervals, relative to
+                the interval (0.1 for +-10%)
+
+        Returns:
+            TimeoutSampler: The sampler itself
+
+        """
+        self.adaptive = True
+        self.initial_sleep = initial
+        self.backoff = backoff
+        self.jitter = jitter
+        return self
+
+    def wake_on(self, subscribe=None, unsubscribe=None):
+        """
+        Allow waking up the sleep between samples by `wake`. When subscribe
+        is given, `wake` is registered by it as a listener for the time of the
+        iteration, e.g. HealthTracker.add_listener
+
+        Args:
+            subscribe (callable): Function registering the listener
+            unsubscribe (callable): Function removing the listener
+
+        Returns:
+            TimeoutSampler: The sampler itself
+
+        """
+        self._wakeable = True
+        if subscribe is not None:
+            self._wake_sources.append((subscribe, unsubscribe))
+        return self
+
+    def wake(self, *args, **kwargs):
+        """
+        Interrupt the current sleep (or skip the next one) and sample
+        immediately, safe to call from other threads. Arguments passed by
+        event sources are ignored.
+        """
+        self._wakeup.set()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Number of attempts, seconds spent in func and sleeping and
+                number of wake-ups by events
+
+        """
+        return {
+            "attempts": self.attempt,
+            "func_time": round(self.func_time, 3),
+            "sleep_time": round(self.sleep_time, 3),
+            "wakeups": self.wakeups,
+        }
+
+    def _next_interval(self):
+        """
+        Returns:
+            float: Seconds to sleep before the next sample
+
+        """
+        if not self.adaptive:
+            return self.sleep
+        if self._interval is None:
+            self._interval = min(self.initial_sleep, self.sleep)
+        else:
+            self._interval = min(self._interval * self.backoff, self.sleep)
+        interval = self._interval
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return round(min(interval, self.sleep), 3)
+
+    def _sleep(self, interval):
+        """
+        Sleep before the next sample, the sleep ends early when woken up
+
+        Args:
+            interval (float): Seconds to sleep
+
+        """
+        start = time.perf_counter()
+        with call_stats.measure("sleep", family=self._get_func_name()):
+            if not self._wakeable:
+                time.sleep(interval)
+            elif self._wakeup.wait(interval):
+                self._wakeup.clear()
+                self.wakeups += 1
+                # something changed, sample often again
+                self._interval = None
+                log.debug("Woken up before next iteration")
+        self.sleep_time += time.perf_counter() - start
+
     def _log_progress(self):
         """
         Log an INFO-level progress message at most once per
@@ -2413,6 +2563,16 @@ class TimeoutSampler(object):
         self.last_progress_log_time = now
 
     def __iter__(self):
+        for subscribe, _ in self._wake_sources:
+            subscribe(self.wake)
+        try:
+            yield from self._sample()
+        finally:
+            for _, unsubscribe in self._wake_sources:
+                if unsubscribe is not None:
+                    unsubscribe(self.wake)
+
+    def _sample(self):
         if self.start_time is None:
             self.start_time = time.time()
         while True:
@@ -2421,7 +2581,11 @@ class TimeoutSampler(object):
                 self._raise_timeout()
             self.attempt += 1
             try:
-                result = self.func(*self.func_args, **self.func_kwargs)
+                func_start = time.perf_counter()
+                try:
+                    result = self.func(*self.func_args, **self.func_kwargs)
+                finally:
+                    self.func_time += time.perf_counter() - func_start
                 self.last_result = result
                 self._has_result = True
                 self.last_exception = None
@@ -2451,8 +2615,9 @@ class TimeoutSampler(object):
             if self.timeout <= (time.time() - self.start_time):
                 self._raise_timeout()
             self._log_progress()
-            log.debug("Going to sleep for %s seconds before next iteration", self.sleep)
-            time.sleep(self.sleep)
+            interval = self._next_interval()
+            log.debug("Going to sleep for %s seconds before next iteration", interval)
+            self._sleep(interval)
 
     def wait_for_func_value(self, value):
         """
@@ -2903,16 +3068,27 @@ def add_mem_stats(soup):
         )
 
 
-def add_info_about_mg_skips(soup):
+def get_mg_skips_notice():
+    """
+    Returns:
+        str: Notice about failed must gather collections, None if none failed
+
+    """
     from ocs_ci.ocs import utils
 
     if utils.mg_fail_count:
-        failed_mg_text = soup.new_tag("b")
-        failed_mg_text.string = (
+        return (
             f"Must Gather collection has failed: {utils.mg_fail_count} times!"
             f" Execution has skipped MG collection: {utils.mg_skip_count} times!"
             " Please check why this has happened!"
         )
+
+
+def add_info_about_mg_skips(soup):
+    notice = get_mg_skips_notice()
+    if notice:
+        failed_mg_text = soup.new_tag("b")
+        failed_mg_text.string = notice
         main_header = soup.find("h1")
         main_header.insert_after(failed_mg_text)
 
@@ -2959,19 +3135,32 @@ def email_reports(session):
     msg["From"] = sender
     msg["To"] = ", ".join(recipients)
 
-    html = config.RUN["cli_params"]["--html"]
-    with open(os.path.expanduser(html)) as fd:
-        html_data = fd.read()
-    soup = BeautifulSoup(html_data, "html.parser")
-
-    parse_html_for_email(soup)
-    if config.RUN["cli_params"].get("squad_analysis"):
-        add_squad_analysis_to_email(session, soup)
-    move_summary_to_top(soup)
-    add_info_about_mg_skips(soup)
-    add_time_report_to_email(session, soup)
-    part1 = MIMEText(soup.decode(formatter="minimal"), "html")
-    add_mem_stats(soup)
+    result_store = get_result_store()
+    if result_store.results:
+        # render directly from the results recorded during the run
+        part1 = MIMEText(
+            render_email_report(
+                result_store,
+                metadata=getattr(session.config, "_metadata", None),
+                squad_analysis=config.RUN["cli_params"].get("squad_analysis"),
+                mg_notice=get_mg_skips_notice(),
+            ),
+            "html",
+        )
+    else:
+        html = config.RUN["cli_params"]["--html"]
+        with open(os.path.expanduser(html)) as fd:
+            html_data = fd.read()
+        soup = BeautifulSoup(html_data, "html.parser")
+
+        parse_html_for_email(soup)
+        if config.RUN["cli_params"].get("squad_analysis"):
+            add_squad_analysis_to_email(session, soup)
+        move_summary_to_top(soup)
+        add_info_about_mg_skips(soup)
+        add_time_report_to_email(session, soup)
+        part1 = MIMEText(soup.decode(formatter="minimal"), "html")
+        add_mem_stats(soup)
     msg.attach(part1)
     try:
         s = smtplib.SMTP(config.REPORTING["email"]["smtp_server"])
@@ -3003,6 +3192,7 @@ def save_reports():
         log.exception("Failed save reports to logs directory")
 
 
+@cluster_facts.cluster_fact("cluster_version_info")
 def get_cluster_version_info():
     """
     Gets the complete cluster version information
@@ -3019,6 +3209,7 @@ def get_cluster_version_info():
     return cluster_version_info
 
 
+@cluster_facts.cluster_fact("ocs_build_number")
 def get_ocs_build_number():
     """
     Gets the build number for ocs operator
@@ -3101,6 +3292,7 @@ def get_cluster_image():
     return get_cluster_version_info()["status"]["desired"]["image"]
 
 
+@cluster_facts.cluster_fact("ceph_version")
 def get_ceph_version():
     """
     Gets the ceph version
@@ -3117,6 +3309,7 @@ def get_ceph_version():
     return re.split(r"ceph version ", ceph_version["version"])[1]
 
 
+@cluster_facts.cluster_fact("rook_version")
 def get_rook_version():
     """
     Gets the rook version
@@ -3133,6 +3326,7 @@ def get_rook_version():
     return rook_versions["rook"]
 
 
+@cluster_facts.cluster_fact("csi_versions")
 def get_csi_versions():
     """
     Gets the CSI related version information
@@ -3210,6 +3404,7 @@ def get_ocp_version(seperator=None):
     return char.join([str(version.major), str(version.minor)])
 
 
+@cluster_facts.cluster_fact("running_ocp_version")
 def get_running_ocp_version(separator=None, kubeconfig=None):
     """
     Get current running ocp version
@@ -3803,6 +3998,7 @@ def ceph_health_check(
     fix_ceph_health=False,
     update_jira=True,
     no_exception_if_jira_issue_updated=False,
+    max_age=None,
 ):
     """
     Args:
@@ -3815,6 +4011,9 @@ def ceph_health_check(
         update_jira (bool): If True, it will update the Jira issue with comment and MG logs
         no_exception_if_jira_issue_updated (bool): If True, it will not raise an exception if the Jira issue is updated
             and ceph health is recovered. Applicable only if fix_ceph_health is True.
+        max_age (float): If set, HEALTH_OK tracked by the background health
+            tracker not older than max_age seconds is accepted without
+            running the command (see ocs_ci/ocs/health_tracker.py)
     Returns:
         bool: ceph_health_check_base return value with default retries of 20,
             delay of 30 seconds if default values are not changed via args.
@@ -3833,7 +4032,11 @@ def ceph_health_check(
         delay=delay,
         backoff=1,
     )(ceph_health_check_base)(
-        namespace, fix_ceph_health, update_jira, no_exception_if_jira_issue_updated
+        namespace,
+        fix_ceph_health,
+        update_jira,
+        no_exception_if_jira_issue_updated,
+        max_age,
     )
 
 
@@ -3842,6 +4045,7 @@ def ceph_health_check_base(
     fix_ceph_health=False,
     update_jira=True,
     no_exception_if_jira_issue_updated=False,
+    max_age=None,
 ):
     """
     Exec `ceph health` cmd on tools pod to determine health of cluster.
@@ -3854,6 +4058,9 @@ def ceph_health_check_base(
         update_jira (bool): If True, it will update the Jira issue with comment and MG logs
         no_exception_if_jira_issue_updated (bool): If True, it will not raise an exception if the Jira issue is updated
             and ceph health is recovered. Applicable only if fix_ceph_health is True.
+        max_age (float): If set, HEALTH_OK tracked by the background health
+            tracker not older than max_age seconds is accepted, the command is
+            executed when the tracked state is stale or not healthy
 
     Raises:
         CephHealthException: If the ceph health returned is not HEALTH_OK
@@ -3865,7 +4072,13 @@ def ceph_health_check_base(
 
     """
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
-    health = run_ceph_health_cmd(namespace, detail=True)
+    health = health_tracker.get_tracked_health(
+        health_tracker.CEPH, namespace=namespace, max_age=max_age
+    )
+    if health and health.startswith("HEALTH_OK"):
+        log.debug("Using Ceph health from the health tracker")
+    else:
+        health = run_ceph_health_cmd(namespace, detail=True)
 
     if health.strip().startswith("HEALTH_OK"):
         if health.strip() != "HEALTH_OK":
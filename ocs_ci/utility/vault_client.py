@@ -0,0 +1,370 @@
+"""
+HTTP client of the Vault API with connection reuse.
+
+Every 'vault' CLI call forks a process, makes a new TLS handshake and looks
+up the token, which adds up when encryption tests verify one key per PV or
+OSD. VaultClient talks to the same HTTP API the CLI uses over one
+requests.Session per address, token and Vault namespace, so the connections
+stay open between the calls, and supports batched operations:
+
+ * all the keys under a backend path by one LIST, see verify_keys_present
+ * many secrets read concurrently over the pooled connections, see
+   read_secrets
+
+The client is configured from the same environment variables as the CLI
+(VAULT_ADDR, VAULT_TOKEN, VAULT_NAMESPACE, VAULT_CACERT, VAULT_CLIENT_CERT,
+VAULT_CLIENT_KEY and VAULT_SKIP_VERIFY) which Vault.update_vault_env_vars
+sets up, and it returns the responses in the same format as the
+'vault ... -format=json' commands.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ocs_ci.ocs.exceptions import VaultOperationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 30
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def find_mount(mounts, path):
+    """
+    Args:
+        mounts (dict): Secrets engines, see VaultClient.list_mounts
+        path (str): Path of a secret
+
+    Returns:
+        str: Path of the secrets engine of the secret, e.g. 'ocs/', None if
+            the path is not under any of the secrets engines
+
+    """
+    return max(
+        (mount for mount in mounts if f"{path}/".startswith(mount)),
+        key=len,
+        default=None,
+    )
+
+
+class VaultClient(object):
+    """
+    Client of the Vault HTTP API for one address, token and namespace
+    """
+
+    def __init__(
+        self,
+        address,
+        token,
+        namespace=None,
+        ca_cert=None,
+        client_cert=None,
+        client_key=None,
+        verify=True,
+        timeout=DEFAULT_TIMEOUT,
+        max_workers=DEFAULT_MAX_WORKERS,
+    ):
+        """
+        Args:
+            address (str): Address of Vault, e.g. https://vault:8200
+            token (str): Vault token
+            namespace (str): Vault namespace of the requests
+            ca_cert (str): Path to the CA certificate of the server
+            client_cert (str): Path to the client certificate
+            client_key (str): Path to the key of the client certificate
+            verify (bool): False to skip verification of the server certificate
+            timeout (int): Timeout of one request in seconds
+            max_workers (int): Max number of concurrent requests of the batched
+                operations, also the size of the connection pool
+
+        """
+        self.address = address.rstrip("/")
+        self.namespace = namespace
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.requests = 0
+        self.session = requests.Session()
+        self.session.headers["X-Vault-Token"] = token
+        if namespace:
+            self.session.headers["X-Vault-Namespace"] = namespace
+        self.session.verify = (ca_cert or True) if verify else False
+        if client_cert:
+            self.session.cert = (client_cert, client_key) if client_key else client_cert
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._mounts = None
+
+    def request(self, method, path, namespace=None, **kwargs):
+        """
+        Send the request to the Vault API
+
+        Args:
+            method (str): HTTP method, or LIST
+            path (str): Path of the API without the /v1/ prefix
+            namespace (str): Vault namespace of this request, the namespace of
+                the client if None
+            kwargs (dict): Other arguments of requests.Session.request
+
+        Returns:
+            dict: Response, None if the path doesn't exist
+
+        Raises:
+            VaultOperationError: If the request failed
+
+        """
+        headers = kwargs.pop("headers", {})
+        if namespace is not None:
+            headers["X-Vault-Namespace"] = namespace
+        self.requests += 1
+        try:
+            response = self.session.request(
+                method,
+                f"{self.address}/v1/{path.strip('/')}",
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs,
+            )
+        except requests.RequestException as ex:
+            raise VaultOperationError(f"Vault request {method} {path} failed: {ex}")
+        if response.status_code == 404:
+            return None
+        if not response.ok:
+            raise VaultOperationError(
+                f"Vault request {method} {path} failed with "
+                f"{response.status_code}: {response.text}"
+            )
+        return response.json() if response.content else {}
+
+    def list_mounts(self, namespace=None, refresh=False):
+        """
+        Args:
+            namespace (str): Vault namespace, the namespace of the client if
+                None
+            refresh (bool): True to list the mounts again, the mounts of the
+                namespace of the client are cached
+
+        Returns:
+            dict: Path of the secrets engine -> its config, the same as
+                'vault secrets list -format=json'
+
+        """
+        if namespace is None and self._mounts is not None and not refresh:
+            return self._mounts
+        response = self.request("GET", "sys/mounts", namespace=namespace) or {}
+        mounts = response.get("data", response)
+        if namespace is None:
+            self._mounts = mounts
+        return mounts
+
+    def backend_path_exists(self, backend_path, namespace=None):
+        """
+        Args:
+            backend_path (str): Name of the backend path
+            namespace (str): Vault namespace, the namespace of the client if
+                None
+
+        Returns:
+            bool: True if a secrets engine path contains the backend path
+
+        """
+        return any(
+            backend_path in path
+            for path in self.list_mounts(namespace=namespace, refresh=True)
+        )
+
+    def disable_backend_path(self, backend_path, namespace=None):
+        """
+        Disable the secrets engine, the same as 'vault secrets disable'
+
+        Args:
+            backend_path (str): Name of the backend path
+            namespace (str): Vault namespace, the namespace of the client if
+                None
+
+        """
+        self.request("DELETE", f"sys/mounts/{backend_path}", namespace=namespace)
+        if namespace is None:
+            self._mounts = None
+
+    def namespace_exists(self, vault_namespace, namespace=None):
+        """
+        Args:
+            vault_namespace (str): Name of the Vault namespace
+            namespace (str): Parent Vault namespace, the namespace of the
+                client if None
+
+        Returns:
+            bool: True if the Vault namespace exists
+
+        """
+        return (
+            self.request(
+                "GET", f"sys/namespaces/{vault_namespace}", namespace=namespace
+            )
+            is not None
+        )
+
+    def _get_kv_path(self, path, operation):
+        """
+        Args:
+            path (str): Path of the secret under the backend path
+            operation (str): 'data' to read, 'metadata' to list
+
+        Returns:
+            str: API path of the secret, with the operation inserted after the
+                mount for kv version 2 secrets engines
+
+        """
+        path = path.strip("/")
+        mounts = self.list_mounts()
+        mount = find_mount(mounts, path)
+        if mount is None:
+            # the mount may have been created after the mounts were cached
+            mounts = self.list_mounts(refresh=True)
+            mount = find_mount(mounts, path)
+        if mount is None:
+            return path
+        version = str((mounts[mount].get("options") or {}).get("version", "1"))
+        if version != "2":
+            return path
+        return f"{mount}{operation}/{path[len(mount):]}".rstrip("/")
+
+    def list_keys(self, path):
+        """
+        Args:
+            path (str): Backend path
+
+        Returns:
+            list: Keys under the path, the same as 'vault kv list', empty if
+                the path doesn't exist
+
+        """
+        response = self.request("LIST", self._get_kv_path(path, "metadata"))
+        if not response:
+            return []
+        return response.get("data", {}).get("keys", [])
+
+    def read_secret(self, path, key):
+        """
+        Args:
+            path (str): Backend path
+            key (str): Name of the secret
+
+        Returns:
+            dict: The secret in the format of 'vault kv get -format=json', None
+                if it doesn't exist
+
+        """
+        return self.request("GET", self._get_kv_path(f"{path}/{key}", "data"))
+
+    def read_secrets(self, path, keys):
+        """
+        Read the secrets concurrently over the pooled connections
+
+        Args:
+            path (str): Backend path
+            keys (list): Names of the secrets
+
+        Returns:
+            dict: Name of the secret -> the secret (see read_secret) or None if
+                it doesn't exist
+
+        Raises:
+            VaultOperationError: The first failure, after all the reads finished
+
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        # resolve the mount once, not by every thread
+        self.list_mounts()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as ex:
+            futures = {key: ex.submit(self.read_secret, path, key) for key in keys}
+        return {key: future.result() for key, future in futures.items()}
+
+    def verify_keys_present(self, path, keys):
+        """
+        Check the keys are present in the backend path by one LIST, a key is
+        present if it is contained in the name of a secret, as by
+        kms.is_key_present_in_path
+
+        Args:
+            path (str): Backend path
+            keys (list): Keys, e.g. device handles of PVs or names of OSD PVCs
+
+        Returns:
+            dict: Key -> True if present
+
+        """
+        secrets = self.list_keys(path)
+        return {key: any(key in secret for secret in secrets) for key in keys}
+
+    def close(self):
+        """
+        Close the connections of the client
+        """
+        self.session.close()
+
+
+def get_vault_client(address=None, token=None, namespace=None):
+    """
+    Get the client shared by all the callers with the same address, token and
+    namespace
+
+    Args:
+        address (str): Address of Vault, VAULT_ADDR if None
+        token (str): Vault token, VAULT_TOKEN if None
+        namespace (str): Vault namespace, VAULT_NAMESPACE if None
+
+    Returns:
+        VaultClient: The client
+
+    Raises:
+        VaultOperationError: If the address or the token is not known
+
+    """
+    address = address or os.environ.get("VAULT_ADDR")
+    token = token or os.environ.get("VAULT_TOKEN")
+    if namespace is None:
+        namespace = os.environ.get("VAULT_NAMESPACE") or None
+    if not address or not token:
+        raise VaultOperationError("Vault address and token are not configured")
+    ca_cert = os.environ.get("VAULT_CACERT")
+    client_cert = os.environ.get("VAULT_CLIENT_CERT")
+    client_key = os.environ.get("VAULT_CLIENT_KEY")
+    skip_verify = os.environ.get("VAULT_SKIP_VERIFY", "").lower() in ("1", "true")
+    key = (address, token, namespace, ca_cert, client_cert, client_key, skip_verify)
+    with _clients_lock:
+        if key not in _clients:
+            logger.debug(f"Creating Vault client for {address}, namespace {namespace}")
+            _clients[key] = VaultClient(
+                address,
+                token,
+                namespace=namespace,
+                ca_cert=ca_cert,
+                client_cert=client_cert,
+                client_key=client_key,
+                verify=not skip_verify,
+            )
+        return _clients[key]
+
+
+def close_vault_clients():
+    """
+    Close all the clients, e.g. when the token or the Vault namespace is
+    removed
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,256 @@
+"""
+Dependency graph runner for verification checks.
+
+Checks are registered with their dependencies and executed in topological
+order. Read-only checks whose dependencies are satisfied run concurrently in a
+thread pool, checks marked as exclusive run alone. Every check is timed and
+the outcome is collected in a VerificationReport.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+log = logging.getLogger(__name__)
+
+CHECK_PASSED = "passed"
+CHECK_FAILED = "failed"
+CHECK_SKIPPED = "skipped"
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class CheckResult:
+    """
+    Outcome of a single check executed by VerificationGraph
+    """
+
+    name: str
+    status: str
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    order: int = 0
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: JSON serializable representation of the result
+
+        """
+        return {
+            "name": self.name,
+            "status": self.status,
+            "duration": round(self.duration, 3),
+            "error": repr(self.error) if self.error else None,
+        }
+
+
+@dataclass
+class VerificationReport:
+    """
+    Structured report of a VerificationGraph run
+    """
+
+    name: str
+    results: list = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def failed(self):
+        """
+        Returns:
+            list: CheckResult objects of failed checks in registration order
+
+        """
+        return sorted(
+            (res for res in self.results if res.status == CHECK_FAILED),
+            key=lambda res: res.order,
+        )
+
+    @property
+    def passed(self):
+        return not self.failed
+
+    def merge(self, other):
+        """
+        Append results of another report to this one
+
+        Args:
+            other (VerificationReport): Report to merge
+
+        """
+        offset = len(self.results)
+        for res in other.results:
+            res.order += offset
+            self.results.append(res)
+        self.duration += other.duration
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: JSON serializable representation of the report
+
+        """
+        return {
+            "name": self.name,
+            "duration": round(self.duration, 3),
+            "checks": [res.to_dict() for res in self.results],
+        }
+
+    def log_summary(self):
+        """
+        Log per check durations, slowest checks first
+        """
+        lines = [
+            f"{res.name:<60} {res.status:<8} {res.duration:8.2f}s"
+            for res in sorted(self.results, key=lambda res: -res.duration)
+        ]
+        log.info(
+            f"{self.name} finished in {self.duration:.2f}s, "
+            f"{len(self.results)} checks, {len(self.failed)} failed:\n"
+            + "\n".join(lines)
+        )
+
+    def raise_first_failure(self):
+        """
+        Re-raise the exception of the first failed check (in registration
+        order), so the caller sees the same error as with sequential execution.
+        """
+        failed = self.failed
+        if failed:
+            raise failed[0].error
+
+
+@dataclass
+class _Check:
+    name: str
+    func: Callable
+    depends_on: tuple
+    exclusive: bool
+    order: int
+
+
+class VerificationGraph(object):
+    """
+    DAG of verification checks
+
+    Example:
+        graph = VerificationGraph("install verification")
+        graph.add("pods", check_pods)
+        graph.add("storage classes", check_scs)
+        graph.add("osd distribution", check_osds, depends_on=["pods"])
+        report = graph.run()
+        report.raise_first_failure()
+
+    """
+
+    def __init__(self, name, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            name (str): Name of the graph used in the report
+            max_workers (int): Maximal number of checks running concurrently
+
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self._checks = {}
+
+    def add(self, name, func, depends_on=None, exclusive=False):
+        """
+        Register check in the graph
+
+        Args:
+            name (str): Unique name of the check
+            func (callable): Function without arguments performing the check,
+                the check fails when the function raises
+            depends_on (list): Names of checks which have to pass before this
+                check is started
+            exclusive (bool): If True, the check is not read-only and it will
+                not run concurrently with any other check
+
+        Raises:
+            ValueError: In case of duplicate name or unknown dependency
+
+        """
+        if name in self._checks:
+            raise ValueError(f"Check {name} is already registered in {self.name}")
+        depends_on = tuple(depends_on or ())
+        unknown = [dep for dep in depends_on if dep not in self._checks]
+        if unknown:
+            raise ValueError(f"Check {name} depends on unknown checks {unknown}")
+        self._checks[name] = _Check(
+            name, func, depends_on, exclusive, order=len(self._checks)
+        )
+
+    def __contains__(self, name):
+        return name in self._checks
+
+    def __len__(self):
+        return len(self._checks)
+
+    def _run_check(self, check):
+        start = time.time()
+        try:
+            check.func()
+        except BaseException as ex:
+            log.error(f"Check {check.name} failed: {ex!r}")
+            return CheckResult(
+                check.name, CHECK_FAILED, time.time() - start, ex, check.order
+            )
+        return CheckResult(
+            check.name, CHECK_PASSED, time.time() - start, order=check.order
+        )
+
+    def run(self):
+        """
+        Execute all registered checks. Checks depending on a failed check are
+        skipped, all independent checks are still executed.
+
+        Returns:
+            VerificationReport: Report with result of every check
+
+        """
+        report = VerificationReport(self.name)
+        start = time.time()
+        pending = dict(self._checks)
+        results = {}
+        running = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="verification"
+        ) as executor:
+            while pending or running:
+                for check in list(pending.values()):
+                    dep_status = [
+                        results[dep].status if dep in results else None
+                        for dep in check.depends_on
+                    ]
+                    if any(
+                        status in (CHECK_FAILED, CHECK_SKIPPED) for status in dep_status
+                    ):
+                        log.warning(f"Skipping check {check.name}, dependency failed")
+                        results[check.name] = CheckResult(
+                            check.name, CHECK_SKIPPED, order=check.order
+                        )
+                        del pending[check.name]
+                        continue
+                    if None in dep_status:
+                        continue
+                    exclusive_running = any(c.exclusive for c in running.values())
+                    if exclusive_running or (check.exclusive and running):
+                        continue
+                    del pending[check.name]
+                    running[executor.submit(self._run_check, check)] = check
+                    if check.exclusive:
+                        break
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    check = running.pop(future)
+                    results[check.name] = future.result()
+        report.results = sorted(results.values(), key=lambda res: res.order)
+        report.duration = time.time() - start
+        return report
@@ -52,7 +52,15 @@ from ocs_ci.helpers.odf_cli import ODFCliRunner
 
 from ocs_ci.helpers.proxy import update_container_with_proxy_env
 from ocs_ci.helpers.virtctl import get_virtctl_tool
-from ocs_ci.ocs import constants, defaults, fio_artefacts, node, ocp, platform_nodes
+from ocs_ci.ocs import (
+    constants,
+    defaults,
+    fio_artefacts,
+    health_tracker,
+    node,
+    ocp,
+    platform_nodes,
+)
 from ocs_ci.ocs.constants import (
     RECLAIMSPACE_SCHEDULE_ANNOTATION,
     KEYROTATION_SCHEDULE_ANNOTATION,
@@ -79,6 +87,7 @@ from ocs_ci.ocs.dr.dr_workload import (
     BusyboxDiscoveredApps,
     CnvWorkloadDiscoveredApps,
 )
+from ocs_ci.ocs.event_recorder import start_event_recorder, stop_event_recorders
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     TimeoutExpiredError,
@@ -107,6 +116,7 @@ from ocs_ci.ocs.resources.keda import KEDA
 from ocs_ci.ocs.resources.mcg_replication_policy import AwsLogBasedReplicationPolicy
 from ocs_ci.ocs.resources.mockup_bucket_logger import MockupBucketLogger
 from ocs_ci.ocs.scale_lib import FioPodScale
+from ocs_ci.ocs.teardown_engine import TeardownEngine
 from ocs_ci.ocs import utils
 from ocs_ci.ocs.resources.deployment import Deployment
 from ocs_ci.ocs.resources.job import get_job_obj
@@ -848,6 +858,62 @@ def secret_factory_fixture(request):
     return factory
 
 
+@pytest.fixture(scope="session", autouse=True)
+def record_cluster_events(request, cluster):
+    """
+    Record Kubernetes events of the cluster namespace on all clusters for the
+    whole session (enabled by RUN['record_events']). Recorded events are
+    exported together with collected OCS logs.
+    """
+    if not ocsci_config.RUN.get("record_events"):
+        return
+    if ocsci_config.RUN["cli_params"].get("teardown"):
+        log.info("Skipping recording of events for teardown.")
+        return
+    for index in range(ocsci_config.nclusters):
+        cluster_config = ocsci_config.clusters[index]
+        start_event_recorder(
+            [cluster_config.ENV_DATA["cluster_namespace"]], cluster_index=index
+        )
+    request.addfinalizer(stop_event_recorders)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def track_cluster_health(request, cluster):
+    """
+    Follow Ceph, NooBaa and StorageCluster health of all storage clusters in
+    background for the whole session (enabled by RUN['health_tracker']), the
+    health_checker fixture uses the tracked state instead of running the
+    checks for every test.
+    """
+    if not ocsci_config.RUN.get("health_tracker"):
+        return
+    if ocsci_config.RUN["cli_params"].get("teardown") or ocsci_config.RUN[
+        "cli_params"
+    ].get("dev_mode"):
+        log.info("Skipping health tracking for teardown or development mode.")
+        return
+    acm_index = (
+        ocsci_config.get_active_acm_index() if ocsci_config.multicluster else None
+    )
+    for index in range(ocsci_config.nclusters):
+        cluster_config = ocsci_config.clusters[index]
+        if index == acm_index or cluster_config.ENV_DATA.get("mcg_only_deployment"):
+            continue
+        components = [health_tracker.CEPH, health_tracker.STORAGECLUSTER]
+        if not (
+            cluster_config.DEPLOYMENT.get("external_mode")
+            or cluster_config.COMPONENTS.get("disable_noobaa")
+        ):
+            components.append(health_tracker.NOOBAA)
+        health_tracker.start_health_tracker(
+            cluster_index=index,
+            interval=ocsci_config.RUN.get("health_tracker_interval", 10),
+            components=components,
+        )
+    request.addfinalizer(health_tracker.stop_health_trackers)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def log_ocs_version(cluster):
     """
@@ -1533,9 +1599,9 @@ def delete_projects(instances):
         except Exception:
             # we don't want any problem to disrupt the teardown itself
             log.exception("Failed to get events for project %s", instance.namespace)
+    if instances:
         ocp.switch_to_default_rook_cluster_project()
-        instance.delete(resource_name=instance.namespace)
-        instance.wait_for_delete(instance.namespace, timeout=300)
+        TeardownEngine(timeout=300).add(instances).run()
 
 
 @pytest.fixture(scope="class")
@@ -1658,8 +1724,6 @@ def pvc_factory_fixture(request, project_factory):
         """
         _switch_context_helper(request)
 
-        pv_objs = []
-
         # Wait for volumes to detach before PVC deletion for encrypted volumes.
         # For encrypted volumes, deleting PVCs too early can remove the secret
         # before detachment, causing volume deletion errors.
@@ -1676,26 +1740,9 @@ def pvc_factory_fixture(request, project_factory):
             )
             helpers.wait_for_volume_detachment(pvc_objs=encrypted_pvcs, timeout=180)
 
-        # Get PV form PVC instances and delete PVCs
-        for instance in instances:
-            if not instance.is_deleted:
-                pv_objs.append(instance.backed_pv_obj)
-                instance.delete()
-                instance.ocp.wait_for_delete(instance.name)
-
-        # Wait for PVs to delete
-        # If they have ReclaimPolicy set to Retain then change to Delete
-        for pv_obj in pv_objs:
-            if (
-                pv_obj.data.get("spec", {}).get("persistentVolumeReclaimPolicy")
-                == constants.RECLAIM_POLICY_RETAIN
-                and pv_obj is not None
-            ):
-                helpers.wait_for_resource_state(pv_obj, constants.STATUS_RELEASED)
-                patch_param = '{"spec":{"persistentVolumeReclaimPolicy":"Delete"}}'
-                pv_obj.ocp.patch(resource_name=pv_obj.name, params=patch_param)
-
-            pv_obj.ocp.wait_for_delete(resource_name=pv_obj.name, timeout=180)
+        # Delete PVCs in bulk and wait for their PVs to delete, PVs with
+        # ReclaimPolicy set to Retain are changed to Delete once released
+        TeardownEngine(timeout=180).add(non_deleted_instances).run()
 
     request.addfinalizer(finalizer)
     return factory
@@ -1825,9 +1872,7 @@ def pod_factory_fixture(request, pvc_factory):
         """
         _switch_context_helper(request)
 
-        for instance in instances:
-            instance.delete()
-            instance.ocp.wait_for_delete(instance.name)
+        TeardownEngine().add(instances).run()
 
     request.addfinalizer(finalizer)
     return factory
@@ -2283,6 +2328,9 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
             return
 
     node = request.node
+    # health followed by the background health tracker (if running) is used
+    # when not older than this
+    tracked_max_age = ocsci_config.RUN.get("health_tracker_max_age")
 
     # Skip health check if the test is marked as 'Resiliency' or 'Chaos'
     skip_markers = ["resiliency", "chaos"]
@@ -2313,7 +2361,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
             return
 
         namespace = ocsci_config.ENV_DATA["cluster_namespace"]
-        noobaa_phase = get_noobaa_phase(namespace)
+        noobaa_phase = get_noobaa_phase(namespace, max_age=tracked_max_age)
 
         if noobaa_phase is None:
             return
@@ -2330,7 +2378,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                 constants.NOOBAA_HEALTH_CHECK_DELAY,
             )
             time.sleep(constants.NOOBAA_HEALTH_CHECK_DELAY)
-            noobaa_phase = get_noobaa_phase(namespace)
+            noobaa_phase = get_noobaa_phase(namespace, max_age=tracked_max_age)
             if noobaa_phase is None or noobaa_phase == constants.STATUS_READY:
                 ocsci_config.RUN.pop("noobaa_not_ready_at_setup", None)
                 return
@@ -2369,6 +2417,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                         fix_ceph_health=True,
                         update_jira=True,
                         no_exception_if_jira_issue_updated=True,
+                        max_age=tracked_max_age,
                     )
                     log.info("Ceph health check passed at teardown!")
                     if ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
@@ -2382,7 +2431,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                         "external_mode"
                     ) and not ocsci_config.COMPONENTS.get("disable_noobaa"):
                         namespace = ocsci_config.ENV_DATA["cluster_namespace"]
-                        nb_phase = get_noobaa_phase(namespace)
+                        nb_phase = get_noobaa_phase(namespace, max_age=tracked_max_age)
                         nb_was_broken = bool(
                             ocsci_config.RUN.get("noobaa_not_ready_at_setup")
                         )
@@ -2450,7 +2499,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
         ):
             log.info("Checking for Ceph Health OK ")
             namespace = ocsci_config.ENV_DATA["cluster_namespace"]
-            sc_phase = get_storage_cluster_phase(namespace)
+            sc_phase = get_storage_cluster_phase(namespace, max_age=tracked_max_age)
             if sc_phase is not None:
                 log.info("StorageCluster phase: %s", sc_phase)
             external_multi_storagecluster_status = False
@@ -2462,6 +2511,7 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                     fix_ceph_health=True,
                     update_jira=True,
                     no_exception_if_jira_issue_updated=True,
+                    max_age=tracked_max_age,
                 )
                 if not ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
                     if status:
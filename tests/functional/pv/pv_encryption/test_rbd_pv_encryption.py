@@ -163,11 +163,13 @@ class TestRbdPvEncryption(ManageTest):
             vol_handle = pv_obj.get().get("spec").get("csi").get("volumeHandle")
             vol_handles.append(vol_handle)
 
-            if kms_provider == constants.VAULT_KMS_PROVIDER:
-                # Check if encryption key is created in Vault
-                if kms.is_key_present_in_path(
-                    key=vol_handle, path=self.kms.vault_backend_path
-                ):
+        if kms_provider == constants.VAULT_KMS_PROVIDER:
+            # Check if encryption keys are created in Vault
+            keys_present = kms.verify_keys_present_in_path(
+                keys=vol_handles, path=self.kms.vault_backend_path
+            )
+            for pvc_obj, vol_handle in zip(pvc_objs, vol_handles):
+                if keys_present[vol_handle]:
                     log.info(f"Vault: Found key for {pvc_obj.name}")
                 else:
                     raise ResourceNotFoundError(
@@ -210,10 +212,11 @@ class TestRbdPvEncryption(ManageTest):
             if kv_version == "v1" or Version.coerce(
                 config.ENV_DATA["ocs_version"]
             ) >= Version.coerce("4.9"):
+                keys_present = kms.verify_keys_present_in_path(
+                    keys=vol_handles, path=self.kms.vault_backend_path
+                )
                 for vol_handle in vol_handles:
-                    if not kms.is_key_present_in_path(
-                        key=vol_handle, path=self.kms.vault_backend_path
-                    ):
+                    if not keys_present[vol_handle]:
                         log.info(f"Vault: Key deleted for {vol_handle}")
                     else:
                         raise KMSResourceCleaneupError(